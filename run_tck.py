@@ -41,6 +41,9 @@ It explains the differences between test types and helps you choose what to run.
 4. CHECK FEATURES: Run feature tests for completeness assessment
    → Purely informational, no action required
 
+5. MEASURE PERFORMANCE: Run performance tests against latency SLOs
+   → Separate performance score, tune SLOs to your deployment
+
 Usage:
     ./run_tck.py --sut-url http://localhost:9999 --category mandatory
     ./run_tck.py --sut-url http://localhost:9999 --category all
@@ -48,21 +51,25 @@ Usage:
     ./run_tck.py --sut-url http://localhost:9999 --explain
 """
 
+import shutil
 import subprocess
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List
 import json
 import os
 from dotenv import load_dotenv
 
+from tck.category_session import category_for_nodeid, format_category_selection
+from tck.config import TRUTHY_ENV_VALUES
+from tck.duration_history import DurationHistory, nodeid_file, parse_shard
+from tck.result_sink import aggregate_result_records, iter_result_records
+
 # Define the directory for all generated reports
 REPORTS_DIR = Path("reports")
 
-# Truthy values for environment variable checking
-TRUTHY_ENV_VALUES = {"1", "true", "yes"}
-
 
 def normalize_transports(transports: str) -> "List[str]":
     """Normalize transport names from comma-separated string to canonical list.
@@ -145,6 +152,14 @@ def explain_test_categories():
     print("   Example: ./run_tck.py --sut-url http://localhost:9999 --category features")
     print()
 
+    print("⏱️  PERFORMANCE TESTS")
+    print("   Purpose: Measure per-method latency and throughput against SLO thresholds")
+    print("   Impact:  Always optional (separate performance score)")
+    print("   Tests:   3 tests (SendMessage, GetTask, ListTasks on every declared transport)")
+    print("   Files:   tests/optional/performance/")
+    print("   Example: ./run_tck.py --sut-url http://localhost:9999 --category performance")
+    print()
+
     print("=" * 80)
     print("📋 QUICK DECISION GUIDE")
     print("=" * 80)
@@ -166,89 +181,158 @@ def explain_test_categories():
     print("=" * 80)
 
 
-def run_test_category(
+# Map categories to pytest selections
+CATEGORY_CONFIGS = {
+    "mandatory": {
+        "path": "tests/mandatory/",
+        "markers": "mandatory or mandatory_protocol",
+        "description": "Mandatory A2A compliance tests",
+    },
+    "capabilities": {
+        "path": "tests/optional/capabilities/",
+        "markers": None,  # Run all tests in this directory for now
+        "description": "Capability declaration validation tests",
+    },
+    "transport-equivalence": {
+        "path": "tests/optional/multi_transport/",
+        "markers": "transport_equivalence",
+        "description": "A2A v0.3.0 multi-transport functional equivalence tests",
+    },
+    "quality": {
+        "path": "tests/optional/quality/",
+        "markers": None,  # Run all tests in this directory for now
+        "description": "Implementation quality and robustness tests",
+    },
+    "features": {
+        "path": "tests/optional/features/",
+        "markers": None,  # Run all tests in this directory for now
+        "description": "Optional feature and utility tests",
+    },
+    "performance": {
+        "path": "tests/optional/performance/",
+        "markers": "performance",
+        "description": "Per-method latency and throughput SLO tests",
+    },
+}
+
+# Categories whose tests use every declared transport themselves: with several transports
+# they run once across all of them instead of once per transport
+COMBINED_CATEGORIES = ["transport-equivalence", "performance"]
+
+# Test files that depend on the SUT's shared task store (e.g. tasks/list totals and
+# pagination over "all tasks"). When runs execute concurrently these are split out of
+# their category and executed in a serialized lane with no other run in flight.
+STATEFUL_TEST_PATHS = [
+    "tests/mandatory/protocol/test_tasks_list_method.py",
+]
+
+# Persistent run cache used by --incremental (see tck/run_cache.py)
+RUN_CACHE_PATH = Path(".tck_cache") / "run_cache.sqlite"
+
+# Test duration history used for longest-first scheduling and --shard (see tck/duration_history.py)
+DURATION_HISTORY_PATH = Path(".tck_cache") / "durations.sqlite"
+
+# Frozen copy of the duration history that concurrent replica shards plan from
+DURATION_PLAN_PATH = Path(".tck_cache") / "durations.plan.sqlite"
+
+# Agent Card captured by single-session runs, reused instead of fetching it again
+AGENT_CARD_SNAPSHOT = REPORTS_DIR / "agent_card.json"
+
+# Exchange archive options of tck.exchange_archive, set by --capture/--replay or the environment
+EXCHANGE_ARCHIVE_ENV = {"--tck-capture": "A2A_TCK_CAPTURE", "--tck-replay": "A2A_TCK_REPLAY"}
+
+# Enables tck.call_timings in every pytest process, set by --call-timings or the environment
+CALL_TIMINGS_ENV = "A2A_TCK_CALL_TIMINGS"
+
+# pytest exit code when no tests were collected (e.g. a split run whose marker filter matched nothing)
+PYTEST_NO_TESTS_COLLECTED = 5
+
+
+def category_markers(category: str, transports: str = None) -> str:
+    """Marker expression selecting a category's tests for the given transports."""
+    markers = CATEGORY_CONFIGS[category]["markers"]
+
+    # Adjust selection for transport-specific runs
+    if category == "mandatory" and transports:
+        norm = normalize_transports(transports)
+        # If jsonrpc is requested, include JSON-RPC compliance tests
+        if "jsonrpc" in norm:
+            markers += " or mandatory_jsonrpc"
+
+    return markers
+
+
+def build_test_command(
     category: str,
     sut_url: str,
     verbose: bool = False,
     verbose_log: bool = False,
     generate_report: bool = False,
-    json_report: str = None,
+    results_file: str = None,
     transport_strategy: str = None,
     enable_equivalence_testing: bool = None,
     transports: str = None,
-):
-    """Run a specific test category."""
-
-    # Map categories to pytest commands
-    category_configs = {
-        "mandatory": {
-            "path": "tests/mandatory/",
-            "markers": "mandatory or mandatory_protocol",
-            "description": "Mandatory A2A compliance tests",
-        },
-        "capabilities": {
-            "path": "tests/optional/capabilities/",
-            "markers": None,  # Run all tests in this directory for now
-            "description": "Capability declaration validation tests",
-        },
-        "transport-equivalence": {
-            "path": "tests/optional/multi_transport/",
-            "markers": "transport_equivalence",
-            "description": "A2A v0.3.0 multi-transport functional equivalence tests",
-        },
-        "quality": {
-            "path": "tests/optional/quality/",
-            "markers": None,  # Run all tests in this directory for now
-            "description": "Implementation quality and robustness tests",
-        },
-        "features": {
-            "path": "tests/optional/features/",
-            "markers": None,  # Run all tests in this directory for now
-            "description": "Optional feature and utility tests",
-        },
-    }
+    paths: List[str] = None,
+    ignore_paths: List[str] = None,
+    report_suffix: str = None,
+    session_categories: List[str] = None,
+    incremental: bool = False,
+    shard: str = None,
+    shard_history: str = None,
+) -> List[str]:
+    """Build the pytest command line for a test category.
 
-    if category not in category_configs:
-        print(f"❌ Unknown category: {category}")
-        print(f"Available: {', '.join(category_configs.keys())}")
-        return 1
-
-    config = category_configs[category]
-
-    print("=" * 70)
-    print(f"🚀 Running {category.upper()} tests")
-    print(f"Description: {config['description']}")
-    print("=" * 70)
-    print()
-
-    # Adjust selection for transport-specific runs
-    effective_path = config["path"]
-    effective_markers = config["markers"]
+    Args:
+        category: Category name (key of CATEGORY_CONFIGS)
+        results_file: Optional JSONL results file name (in REPORTS_DIR) for the tck.result_sink plugin
+        paths: Optional explicit test paths overriding the category directory
+        ignore_paths: Optional test paths to exclude from the category directory
+        report_suffix: Optional suffix for the HTML report name (keeps concurrent runs apart)
+        session_categories: Optional categories to run together in one pytest session;
+            each keeps its own marker selection via the tck.category_session plugin
+            and ``category`` only names the HTML report
+        incremental: Reuse unchanged passing results from the run cache (tck.run_cache)
+        shard: Optional ``i/N`` shard of the duration-balanced test files to run (tck.duration_history)
+        shard_history: Optional frozen duration history to plan the shard from
 
-    if category == "mandatory" and transports:
-        norm = normalize_transports(transports)
-        # If jsonrpc is requested, include JSON-RPC compliance tests
-        if "jsonrpc" in norm:
-            effective_markers += " or mandatory_jsonrpc"
+    Returns:
+        The pytest command as an argument list
+    """
+    if session_categories:
+        effective_paths = [CATEGORY_CONFIGS[name]["path"] for name in session_categories]
+        effective_markers = None
+    else:
+        effective_paths = paths or [CATEGORY_CONFIGS[category]["path"]]
+        effective_markers = category_markers(category, transports)
 
     # Build pytest command
     cmd = [
         sys.executable,
         "-m",
         "pytest",
-        effective_path,
+        *effective_paths,
         f"--sut-url={sut_url}",
         "--test-scope=all",  # Bypass old core marking system
         "--tb=short",
     ]
 
+    for ignore_path in ignore_paths or []:
+        cmd.append(f"--ignore={ignore_path}")
+
+    if session_categories:
+        cmd.extend(["-p", "tck.category_session"])
+        for name in session_categories:
+            selection = format_category_selection(
+                name, CATEGORY_CONFIGS[name]["path"], category_markers(name, transports)
+            )
+            cmd.extend(["--tck-category", selection])
+
     # Create reports directory if it doesn't exist
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Add JSON report if requested
-    if json_report:
-        json_report_path = REPORTS_DIR / json_report
-        cmd.extend(["--json-report", f"--json-report-file={json_report_path}"])
+    # Stream per-test result records if requested
+    if results_file:
+        cmd.extend(["-p", "tck.result_sink", "--tck-results-jsonl", str(REPORTS_DIR / results_file)])
 
     # Only add marker filtering if markers are specified
     if effective_markers:
@@ -262,7 +346,8 @@ def run_test_category(
         cmd.append("-q")  # Quiet output
 
     if generate_report:
-        report_path = REPORTS_DIR / f"{category}_test_report.html"
+        report_name = f"{category}_{report_suffix}" if report_suffix else category
+        report_path = REPORTS_DIR / f"{report_name}_test_report.html"
         cmd.extend([f"--html={report_path}", "--self-contained-html"])
 
     # Add A2A v0.3.0 transport configuration options
@@ -278,6 +363,71 @@ def run_test_category(
     if enable_equivalence_testing is True:
         cmd.append("--enable-equivalence-testing")
 
+    if incremental:
+        cmd.extend(["-p", "tck.run_cache", "--tck-run-cache", str(RUN_CACHE_PATH), "--tck-incremental"])
+
+    # Always record durations so later runs can be scheduled and sharded by them
+    cmd.extend(["-p", "tck.duration_history", "--tck-duration-history", str(DURATION_HISTORY_PATH)])
+    if shard:
+        cmd.extend(["--tck-shard", shard, "--tck-longest-first"])
+        if shard_history:
+            cmd.extend(["--tck-shard-history", shard_history])
+
+    # Record the SUT exchanges, or replay them without a live SUT
+    for option, env_var in EXCHANGE_ARCHIVE_ENV.items():
+        if os.getenv(env_var):
+            cmd.extend(["-p", "tck.exchange_archive", option, os.environ[env_var]])
+            break
+
+    # Attach a per-call timing breakdown of the SUT exchanges to each test's report
+    if os.getenv(CALL_TIMINGS_ENV, "").lower() in ("1", "true", "yes"):
+        cmd.extend(["-p", "tck.call_timings", "--tck-call-timings"])
+
+    return cmd
+
+
+def run_test_category(
+    category: str,
+    sut_url: str,
+    verbose: bool = False,
+    verbose_log: bool = False,
+    generate_report: bool = False,
+    results_file: str = None,
+    transport_strategy: str = None,
+    enable_equivalence_testing: bool = None,
+    transports: str = None,
+    incremental: bool = False,
+    shard: str = None,
+):
+    """Run a specific test category."""
+
+    if category not in CATEGORY_CONFIGS:
+        print(f"❌ Unknown category: {category}")
+        print(f"Available: {', '.join(CATEGORY_CONFIGS.keys())}")
+        return 1
+
+    config = CATEGORY_CONFIGS[category]
+
+    print("=" * 70)
+    print(f"🚀 Running {category.upper()} tests")
+    print(f"Description: {config['description']}")
+    print("=" * 70)
+    print()
+
+    cmd = build_test_command(
+        category,
+        sut_url,
+        verbose,
+        verbose_log,
+        generate_report,
+        results_file,
+        transport_strategy,
+        enable_equivalence_testing,
+        transports,
+        incremental=incremental,
+        shard=shard,
+    )
+
     print(f"Command: {' '.join(cmd)}")
     print()
 
@@ -286,6 +436,430 @@ def run_test_category(
     return result.returncode
 
 
+def result_names(category: str, transports: str, multi: bool, combined: bool):
+    """Result key and JSON report name for a category run, as used by the sequential runner.
+
+    Args:
+        category: Category name
+        transports: Transports value passed to the run (None for no --transports flag)
+        multi: Whether the sweep covers more than one transport
+        combined: Whether the category runs once across all transports together
+
+    Returns:
+        Tuple of (result key, results file name)
+    """
+    result_key = f"{category}:{transports}" if multi and not combined else category
+    if transports and not (multi and combined):
+        result_report = f"{category}_{transports}_results.jsonl"
+    else:
+        result_report = f"{category}_results.jsonl"
+    return result_key, result_report
+
+
+def plan_category_runs(categories: List[str], transports: List[str], combined_categories: List[str] = None) -> List[Dict]:
+    """Plan the pytest invocations needed to cover categories x transports.
+
+    Every (category, transport) pair becomes one result key whose results file name matches
+    what the sequential runner produces. Categories whose directory contains a stateful test
+    file are split: the bulk goes to the parallel lane, the stateful files to the serial lane.
+
+    Args:
+        categories: Categories to run once per transport
+        transports: Canonical transport names (an empty list means "no --transports flag")
+        combined_categories: Categories to run once across all transports together
+
+    Returns:
+        List of run specs (dicts with key, category, transports, paths, ignore_paths,
+        results_file, result_key, result_report and lane)
+    """
+    runs = []
+    targets = [(category, tr) for category in categories for tr in (transports or [None])]
+    if combined_categories:
+        targets.extend((category, ",".join(transports) if transports else None) for category in combined_categories)
+
+    multi = len(transports) > 1
+    for category, tr in targets:
+        combined = category in (combined_categories or [])
+        result_key, result_report = result_names(category, tr, multi, combined)
+
+        category_path = CATEGORY_CONFIGS[category]["path"]
+        stateful = [p for p in STATEFUL_TEST_PATHS if p.startswith(category_path) and Path(p).exists()]
+        base = {"category": category, "transports": tr, "result_key": result_key, "result_report": result_report}
+
+        if not stateful:
+            runs.append({**base, "key": result_key, "paths": None, "ignore_paths": None,
+                         "results_file": result_report, "lane": "parallel"})
+            continue
+
+        stem = result_report[: -len(".jsonl")]
+        runs.append({**base, "key": f"{result_key}:parallel", "paths": None, "ignore_paths": stateful,
+                     "results_file": f"{stem}.parallel.jsonl", "lane": "parallel"})
+        runs.append({**base, "key": f"{result_key}:serial", "paths": stateful, "ignore_paths": None,
+                     "results_file": f"{stem}.serial.jsonl", "lane": "serial"})
+
+    return runs
+
+
+def snapshot_duration_history() -> Path:
+    """Freeze the duration history so concurrently started shards compute the same plan."""
+    DURATION_PLAN_PATH.parent.mkdir(parents=True, exist_ok=True)
+    if DURATION_PLAN_PATH.exists():
+        DURATION_PLAN_PATH.unlink()
+    if DURATION_HISTORY_PATH.exists():
+        shutil.copyfile(DURATION_HISTORY_PATH, DURATION_PLAN_PATH)
+    else:
+        DurationHistory(DURATION_PLAN_PATH).close()
+    return DURATION_PLAN_PATH
+
+
+def plan_replica_runs(runs: List[Dict], sut_urls: List[str]) -> List[Dict]:
+    """Spread planned runs across identical SUT replicas.
+
+    Every parallel-lane run is split into one duration-balanced shard per replica, each
+    shard running against its own replica (and so with its own pytest process and
+    TransportManager). Serial-lane runs depend on the SUT's shared state and stay
+    pinned to the first replica. All parts keep their run's result key, so their
+    results merge back into one report per category.
+
+    Args:
+        runs: Run specs from plan_category_runs()
+        sut_urls: Replica URLs; the first one also serves the serial lane
+
+    Returns:
+        Run specs with sut_url (and, for shards, shard and shard_history) set
+    """
+    shard_history = str(snapshot_duration_history())
+    count = len(sut_urls)
+    replica_runs = []
+    for run in runs:
+        if run["lane"] == "serial":
+            replica_runs.append({**run, "sut_url": sut_urls[0]})
+            continue
+
+        stem = run["results_file"][: -len(".jsonl")]
+        for index, url in enumerate(sut_urls, 1):
+            replica_runs.append({
+                **run,
+                "key": f"{run['key']}@{index}",
+                "results_file": f"{stem}.replica{index}.jsonl",
+                "sut_url": url,
+                "shard": f"{index}/{count}",
+                "shard_history": shard_history,
+            })
+
+    return replica_runs
+
+
+def _execute_run(run: Dict, cmd: List[str]) -> int:
+    """Run one planned pytest invocation, capturing its output to a per-run log file."""
+    log_path = REPORTS_DIR / f"{run['results_file'][: -len('.jsonl')]}.log"
+    with open(log_path, "w") as log_file:
+        result = subprocess.run(cmd, stdout=log_file, stderr=subprocess.STDOUT)
+    run["log"] = log_path
+    return result.returncode
+
+
+def order_runs_longest_first(runs: List[Dict]) -> List[Dict]:
+    """Order planned runs by their recorded test durations, longest first.
+
+    Starting the slowest runs first keeps one long run from starting last and
+    finishing well after the rest of the pool. Runs without history keep their
+    planned order.
+    """
+    if not DURATION_HISTORY_PATH.exists():
+        return runs
+
+    history = DurationHistory(DURATION_HISTORY_PATH)
+    try:
+        estimates = {}
+        for run in runs:
+            transports = ",".join(sorted(normalize_transports(run["transports"]))) if run["transports"] else ""
+            paths = run["paths"] or [CATEGORY_CONFIGS[run["category"]]["path"]]
+            ignored = run["ignore_paths"] or []
+            estimates[run["key"]] = sum(
+                duration
+                for nodeid, duration in history.durations(transports).items()
+                if any(nodeid.startswith(path) for path in paths) and nodeid_file(nodeid) not in ignored
+            )
+    finally:
+        history.close()
+
+    return sorted(runs, key=lambda run: -estimates[run["key"]])
+
+
+def run_scheduled(runs: List[Dict], jobs: int, command_factory) -> Dict[str, int]:
+    """Execute planned runs on a bounded pool of concurrent pytest processes.
+
+    Parallel-lane runs execute with at most ``jobs`` pytest processes alive at once. The
+    serial lane runs afterwards, one run at a time, so tests that rely on the SUT's shared
+    task store never observe tasks created by concurrently running categories.
+
+    Args:
+        runs: Run specs from plan_category_runs()
+        jobs: Maximum number of concurrent pytest processes
+        command_factory: Callable building the pytest command for a run spec
+
+    Returns:
+        Mapping of run key to pytest exit code
+    """
+    exit_codes: Dict[str, int] = {}
+    parallel_runs = [run for run in runs if run["lane"] == "parallel"]
+    serial_runs = [run for run in runs if run["lane"] == "serial"]
+
+    def report(run: Dict, code: int, lane: str):
+        status = "✅" if code in (0, PYTEST_NO_TESTS_COLLECTED) else "❌"
+        print(f"{status} [{lane}] {run['key']} finished with exit code {code} (log: {run['log']})")
+
+    print(f"⚡ Scheduling {len(parallel_runs)} parallel run(s) on {jobs} worker(s), {len(serial_runs)} serialized run(s)")
+    print()
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(_execute_run, run, command_factory(run)): run for run in parallel_runs}
+        for future in as_completed(futures):
+            run = futures[future]
+            exit_codes[run["key"]] = future.result()
+            report(run, exit_codes[run["key"]], "parallel")
+
+    for run in serial_runs:
+        exit_codes[run["key"]] = _execute_run(run, command_factory(run))
+        report(run, exit_codes[run["key"]], "serial")
+
+    print()
+    return exit_codes
+
+
+def combine_exit_codes(codes: List[int]) -> int:
+    """Combine exit codes of runs that together cover one category.
+
+    A split run that collected nothing does not fail the category as long as another part ran.
+    """
+    meaningful = [code for code in codes if code != PYTEST_NO_TESTS_COLLECTED]
+    if not meaningful:
+        return PYTEST_NO_TESTS_COLLECTED
+    return max(meaningful)
+
+
+def merge_result_files(result_files: List[Path], output_file: Path) -> None:
+    """Concatenate JSONL results files line by line into a single results file."""
+    with open(output_file, "w") as out:
+        for result_file in result_files:
+            if not result_file.exists():
+                continue
+            with open(result_file, "r") as f:
+                for line in f:
+                    out.write(line)
+
+
+def run_planned_categories(
+    runs: List[Dict],
+    jobs: int,
+    sut_url: str,
+    verbose: bool = False,
+    verbose_log: bool = False,
+    generate_report: bool = False,
+    transport_strategy: str = None,
+    enable_equivalence_testing: bool = None,
+    incremental: bool = False,
+    shard: str = None,
+):
+    """Run planned category runs concurrently and merge their reports per result key.
+
+    Runs carrying their own sut_url/shard (see plan_replica_runs) use those instead of
+    the sweep-wide values.
+
+    Returns:
+        Tuple of (exit codes by result key, statistics by result key)
+    """
+
+    def command_factory(run: Dict) -> List[str]:
+        return build_test_command(
+            run["category"],
+            run.get("sut_url", sut_url),
+            verbose,
+            verbose_log,
+            generate_report,
+            run["results_file"],
+            transport_strategy,
+            enable_equivalence_testing,
+            run["transports"],
+            paths=run["paths"],
+            ignore_paths=run["ignore_paths"],
+            report_suffix=run["key"].replace(":", "_").replace("@", "_"),
+            incremental=incremental,
+            shard=run.get("shard", shard),
+            shard_history=run.get("shard_history"),
+        )
+
+    exit_codes = run_scheduled(order_runs_longest_first(runs), jobs, command_factory)
+
+    results = {}
+    statistics = {}
+    for result_key in dict.fromkeys(run["result_key"] for run in runs):
+        parts = [run for run in runs if run["result_key"] == result_key]
+        results[result_key] = combine_exit_codes([exit_codes[run["key"]] for run in parts])
+
+        result_report = REPORTS_DIR / parts[0]["result_report"]
+        if len(parts) > 1:
+            part_files = [REPORTS_DIR / run["results_file"] for run in parts]
+            merge_result_files(part_files, result_report)
+            for part_file in part_files:
+                if part_file.exists():
+                    part_file.unlink()
+        statistics[result_key] = collect_test_results_from_jsonl(result_report, parts[0]["category"])
+
+    return results, statistics
+
+
+def plan_category_sessions(
+    categories: List[str], transports: List[str], combined_categories: List[str] = None
+) -> List[Dict]:
+    """Plan single-process pytest sessions covering categories x transports.
+
+    The transport scope (--transports) applies to a whole pytest session, so categories
+    run once per transport share one session per transport, and combined categories share
+    one further session across all transports. Result keys and report names match
+    plan_category_runs().
+
+    Args:
+        categories: Categories to run once per transport
+        transports: Canonical transport names (an empty list means "no --transports flag")
+        combined_categories: Categories to run once across all transports together
+
+    Returns:
+        List of session specs (dicts with key, transports, results_file and categories,
+        a list of dicts with category, result_key and result_report)
+    """
+    multi = len(transports) > 1
+    groups = [(categories, tr, False) for tr in (transports or [None])]
+    if combined_categories:
+        groups.append((combined_categories, ",".join(transports) if transports else None, True))
+
+    sessions = []
+    for group, tr, combined in groups:
+        if not group:
+            continue
+        key = "session" if combined or not tr else f"session:{tr}"
+        members = []
+        for category in group:
+            result_key, result_report = result_names(category, tr, multi, combined)
+            members.append({"category": category, "result_key": result_key, "result_report": result_report})
+        sessions.append({
+            "key": key,
+            "transports": tr,
+            "results_file": f"{key.replace(':', '_')}_results.jsonl",
+            "categories": members,
+        })
+
+    return sessions
+
+
+def partition_result_file(session_results: Path, category_results: Dict[str, Path]) -> None:
+    """Split a session's JSONL results file into one results file per category.
+
+    Records are streamed to the category whose test path their node id falls under.
+
+    Args:
+        session_results: Results file written by the session
+        category_results: Mapping of category name to the results file to write
+    """
+    paths = {category: CATEGORY_CONFIGS[category]["path"] for category in category_results}
+    outputs = {category: open(path, "w") for category, path in category_results.items()}
+    try:
+        if session_results.exists():
+            for record in iter_result_records(session_results):
+                category = category_for_nodeid(record.get("nodeid", ""), paths)
+                if category is not None:
+                    outputs[category].write(json.dumps(record, separators=(",", ":")) + "\n")
+    finally:
+        for output in outputs.values():
+            output.close()
+
+
+def run_category_sessions(
+    sessions: List[Dict],
+    sut_url: str,
+    verbose: bool = False,
+    verbose_log: bool = False,
+    generate_report: bool = False,
+    transport_strategy: str = None,
+    enable_equivalence_testing: bool = None,
+    incremental: bool = False,
+    shard: str = None,
+):
+    """Run planned sessions one after another and partition their reports per category.
+
+    Each session is a single pytest process, so imports, Agent Card discovery and
+    transport connections are set up once per session rather than once per category.
+    The Agent Card fetched by the session is written to AGENT_CARD_SNAPSHOT.
+
+    Returns:
+        Tuple of (exit codes by result key, statistics by result key)
+    """
+    results = {}
+    statistics = {}
+
+    # Never hand a previous sweep's Agent Card to the compliance report
+    if AGENT_CARD_SNAPSHOT.exists():
+        AGENT_CARD_SNAPSHOT.unlink()
+
+    for i, session in enumerate(sessions, 1):
+        names = [member["category"] for member in session["categories"]]
+        label = f" [{session['transports']}]" if session["transports"] else ""
+        print("=" * 80)
+        print(f"🧵 SESSION {i}/{len(sessions)}{label}: {', '.join(names)}")
+        print("=" * 80)
+        print()
+
+        cmd = build_test_command(
+            session["key"].replace(":", "_"),
+            sut_url,
+            verbose,
+            verbose_log,
+            generate_report,
+            session["results_file"],
+            transport_strategy,
+            enable_equivalence_testing,
+            session["transports"],
+            session_categories=names,
+            incremental=incremental,
+            shard=shard,
+        )
+        cmd.extend(["--agent-card-output", str(AGENT_CARD_SNAPSHOT)])
+
+        print(f"Command: {' '.join(cmd)}")
+        print()
+        session_exit = subprocess.run(cmd).returncode
+
+        session_results = REPORTS_DIR / session["results_file"]
+        partition_result_file(
+            session_results,
+            {member["category"]: REPORTS_DIR / member["result_report"] for member in session["categories"]},
+        )
+        if session_results.exists():
+            session_results.unlink()
+
+        for member in session["categories"]:
+            stats = collect_test_results_from_jsonl(REPORTS_DIR / member["result_report"], member["category"])
+            statistics[member["result_key"]] = stats
+            # Interrupted/internal/usage errors affect every category in the session
+            if session_exit not in (0, 1, PYTEST_NO_TESTS_COLLECTED):
+                results[member["result_key"]] = session_exit
+            elif stats.get("failed", 0):
+                results[member["result_key"]] = 1
+            elif stats.get("total", 0) == 0:
+                # Another shard may hold all of this category's tests
+                results[member["result_key"]] = 0 if shard else PYTEST_NO_TESTS_COLLECTED
+            else:
+                results[member["result_key"]] = 0
+
+        print()
+        print(f"✅ SESSION {i}/{len(sessions)} COMPLETED")
+        print(f"Exit code: {session_exit}")
+        print()
+
+    return results, statistics
+
+
 def run_all_categories(
     sut_url: str,
     verbose: bool = False,
@@ -295,14 +869,36 @@ def run_all_categories(
     transport_strategy: str = None,
     enable_equivalence_testing: bool = None,
     transports: str = None,
+    jobs: int = 1,
+    single_session: bool = False,
+    incremental: bool = False,
+    shard: str = None,
+    replica_urls: List[str] = None,
 ):
     """Run all test categories in recommended order.
 
     If multiple transports are specified, run single-client categories per transport,
-    then run transport-equivalence once across all specified transports.
+    then run transport-equivalence and performance once across all specified transports.
+
+    With jobs > 1 the category x transport runs execute concurrently on a bounded pool
+    of pytest processes (see run_scheduled); results and summary are unchanged.
+
+    With single_session the categories run together in one pytest session per transport
+    (see run_category_sessions) and the session results are partitioned per category;
+    results and summary are unchanged.
+
+    With incremental, tests that passed last time with unchanged inputs are reported from
+    the run cache instead of being executed again.
+
+    With shard ("i/N"), every category runs only its share of N duration-balanced
+    shards of test files (see tck/duration_history.py).
+
+    With several replica_urls (identical SUT replicas, requires jobs > 1), each
+    category's parallel-safe tests are sharded across the replicas and stateful tests
+    stay on the first replica (see plan_replica_runs); results merge per category.
     """
 
-    categories = ["mandatory", "capabilities", "transport-equivalence", "quality", "features"]
+    categories = ["mandatory", "capabilities", "transport-equivalence", "quality", "features", "performance"]
     results = {}
     detailed_results = {}
     category_statistics = {}  # Store test statistics for final summary
@@ -315,8 +911,53 @@ def run_all_categories(
 
     multi_transports = normalize_transports(transports) if transports else []
 
-    if multi_transports and len(multi_transports) > 1:
-        # Run single-client categories per transport (exclude transport-equivalence here)
+    if jobs > 1 or single_session:
+        if multi_transports and len(multi_transports) > 1:
+            planned = (["mandatory", "capabilities", "quality", "features"], multi_transports, COMBINED_CATEGORIES)
+        else:
+            planned = (categories, [transports] if transports else [])
+
+        if single_session:
+            results, statistics = run_category_sessions(
+                plan_category_sessions(*planned),
+                sut_url,
+                verbose,
+                verbose_log,
+                generate_report,
+                transport_strategy,
+                enable_equivalence_testing,
+                incremental,
+                shard,
+            )
+        else:
+            runs = plan_category_runs(*planned)
+            if replica_urls and len(replica_urls) > 1:
+                runs = plan_replica_runs(runs, replica_urls)
+            results, statistics = run_planned_categories(
+                runs,
+                jobs,
+                sut_url,
+                verbose,
+                verbose_log,
+                generate_report,
+                transport_strategy,
+                enable_equivalence_testing,
+                incremental,
+                shard,
+            )
+        # Aggregate multi-transport stats per category
+        for result_key, stats in statistics.items():
+            category = result_key.split(":", 1)[0]
+            if category not in category_statistics:
+                category_statistics[category] = {"total": 0, "passed": 0, "failed": 0, "skipped": 0, "xfailed": 0, "error": 0}
+            for key in ["total", "passed", "failed", "skipped", "xfailed", "error"]:
+                category_statistics[category][key] += stats.get(key, 0)
+
+        if multi_transports and len(multi_transports) > 1:
+            return results
+
+    elif multi_transports and len(multi_transports) > 1:
+        # Run single-client categories per transport (combined categories run afterwards)
         single_categories = ["mandatory", "capabilities", "quality", "features"]
         for tr in multi_transports:
             print("=" * 80)
@@ -328,8 +969,8 @@ def run_all_categories(
                 print(f"📍 [{tr}] STEP {j}/{len(single_categories)}: Running {category} tests...")
                 print()
 
-                # Generate per-transport JSON report name for statistics collection
-                json_report_file = f"{category}_{tr}_results.json"
+                # Generate per-transport results file name for statistics collection
+                results_file = f"{category}_{tr}_results.jsonl"
 
                 exit_code = run_test_category(
                     category,
@@ -337,16 +978,17 @@ def run_all_categories(
                     verbose,
                     verbose_log,
                     generate_report,
-                    json_report_file,  # This ensures JSON reports are always generated for statistics
+                    results_file,  # This ensures results are always recorded for statistics
                     transport_strategy,
                     enable_equivalence_testing,
                     tr,
+                    incremental,
+                    shard,
                 )
                 results[f"{category}:{tr}"] = exit_code
                 
-                # Collect detailed statistics from JSON report
-                json_path = REPORTS_DIR / json_report_file
-                stats = collect_test_results_from_json(json_path, category)
+                # Collect detailed statistics from the results file
+                stats = collect_test_results_from_jsonl(REPORTS_DIR / results_file, category)
                 # Aggregate multi-transport stats for the category
                 if category not in category_statistics:
                     category_statistics[category] = {"total": 0, "passed": 0, "failed": 0, "skipped": 0, "xfailed": 0, "error": 0}
@@ -359,91 +1001,101 @@ def run_all_categories(
                     print("─" * 80)
                     print()
 
-        # After per-transport runs, run transport-equivalence once across all specified transports
-        print("=" * 80)
-        print("🚀 Running TRANSPORT-EQUIVALENCE tests across required transports")
-        print("=" * 80)
-        print()
-        te_exit = run_test_category(
-            "transport-equivalence",
-            sut_url,
-            verbose,
-            verbose_log,
-            generate_report,
-            "transport-equivalence_results.json",  # Always generate JSON for statistics
-            transport_strategy,
-            enable_equivalence_testing,
-            ",".join(multi_transports),
-        )
-        results["transport-equivalence"] = te_exit
-        
-        # Collect transport-equivalence statistics
-        json_path = REPORTS_DIR / "transport-equivalence_results.json"
-        stats = collect_test_results_from_json(json_path, "transport-equivalence")
-        category_statistics["transport-equivalence"] = {
-            "total": stats.get("total", 0),
-            "passed": stats.get("passed", 0), 
-            "failed": stats.get("failed", 0),
-            "skipped": stats.get("skipped", 0),
-            "xfailed": stats.get("xfailed", 0),
-            "error": stats.get("error", 0)  # Actual errors from JSON report
-        }
+        # After per-transport runs, run the combined categories once across all specified transports
+        for category in COMBINED_CATEGORIES:
+            print("=" * 80)
+            print(f"🚀 Running {category.upper()} tests across required transports")
+            print("=" * 80)
+            print()
+            results_file = f"{category}_results.jsonl"
+            results[category] = run_test_category(
+                category,
+                sut_url,
+                verbose,
+                verbose_log,
+                generate_report,
+                results_file,  # Always record results for statistics
+                transport_strategy,
+                enable_equivalence_testing,
+                ",".join(multi_transports),
+                incremental,
+                shard,
+            )
+
+            # Collect combined category statistics
+            stats = collect_test_results_from_jsonl(REPORTS_DIR / results_file, category)
+            category_statistics[category] = {
+                "total": stats.get("total", 0),
+                "passed": stats.get("passed", 0),
+                "failed": stats.get("failed", 0),
+                "skipped": stats.get("skipped", 0),
+                "xfailed": stats.get("xfailed", 0),
+                "error": stats.get("error", 0)  # Actual errors from JSON report
+            }
 
         return results
 
-    # Default: single pass with (zero or one) transports value
-    for i, category in enumerate(categories, 1):
-        print(f"📍 STEP {i}/5: Running {category} tests...")
-        print()
+    else:
+        # Default: single pass with (zero or one) transports value
+        for i, category in enumerate(categories, 1):
+            print(f"📍 STEP {i}/{len(categories)}: Running {category} tests...")
+            print()
 
-        # Generate JSON report for this category for statistics collection
-        if transports:
-            json_report_file = f"{category}_{transports}_results.json"
-        else:
-            json_report_file = f"{category}_results.json"
+            # Record results for this category for statistics collection
+            results_file = result_names(category, transports, False, False)[1]
 
-        exit_code = run_test_category(
-            category,
-            sut_url,
-            verbose,
-            verbose_log,
-            generate_report,
-            json_report_file,  # Always generate JSON for statistics
-            transport_strategy,
-            enable_equivalence_testing,
-            transports,
-        )
-        results[category] = exit_code
+            exit_code = run_test_category(
+                category,
+                sut_url,
+                verbose,
+                verbose_log,
+                generate_report,
+                results_file,  # Always record results for statistics
+                transport_strategy,
+                enable_equivalence_testing,
+                transports,
+                incremental,
+                shard,
+            )
+            results[category] = exit_code
         
-        # Collect detailed statistics from JSON report
-        json_path = REPORTS_DIR / json_report_file
-        stats = collect_test_results_from_json(json_path, category)
-        category_statistics[category] = {
-            "total": stats.get("total", 0),
-            "passed": stats.get("passed", 0),
-            "failed": stats.get("failed", 0),
-            "skipped": stats.get("skipped", 0),
-            "xfailed": stats.get("xfailed", 0),
-            "error": stats.get("error", 0)  # Actual errors from JSON report
-        }
-
-        print()
-        print(f"✅ {category.upper()} TESTS COMPLETED")
-        print(f"Exit code: {exit_code}")
-        print()
+            # Collect detailed statistics from the results file
+            stats = collect_test_results_from_jsonl(REPORTS_DIR / results_file, category)
+            category_statistics[category] = {
+                "total": stats.get("total", 0),
+                "passed": stats.get("passed", 0),
+                "failed": stats.get("failed", 0),
+                "skipped": stats.get("skipped", 0),
+                "xfailed": stats.get("xfailed", 0),
+                "error": stats.get("error", 0)  # Actual errors from JSON report
+            }
 
-        if i < len(categories):
-            print("─" * 80)
+            print()
+            print(f"✅ {category.upper()} TESTS COMPLETED")
+            print(f"Exit code: {exit_code}")
             print()
 
+            if i < len(categories):
+                print("─" * 80)
+                print()
+
     # Generate compliance report if requested
     if compliance_report:
         try:
-            from util_scripts.generate_compliance_report import ComplianceReportGenerator
+            from util_scripts.generate_compliance_report import ComplianceReportGenerator, load_results_from_jsonl
             from util_scripts.compliance_levels import generate_compliance_summary
 
-            # Get agent card data
-            agent_card = get_agent_card_data(sut_url)
+            # Stream the per-category results recorded by this run
+            detailed_results = load_results_from_jsonl(
+                {category: REPORTS_DIR / result_names(category, transports, False, False)[1] for category in categories}
+            )
+
+            # Get agent card data (a single-session run already captured it)
+            if single_session and AGENT_CARD_SNAPSHOT.exists():
+                with open(AGENT_CARD_SNAPSHOT, "r") as f:
+                    agent_card = json.load(f)
+            else:
+                agent_card = get_agent_card_data(sut_url)
 
             # Calculate compliance metrics
             mandatory_rate = calculate_success_rate(detailed_results.get("mandatory", {}))
@@ -469,6 +1121,8 @@ def run_all_categories(
             print(f"📊 Compliance report generated: {compliance_report_path}")
             print(f"🏆 Compliance level: {compliance_summary['current_level']['badge']}")
             print(f"📈 Overall score: {compliance_summary['overall_score']:.1f}%")
+            if report["summary"]["performance_score"] is not None:
+                print(f"⏱️  Performance score: {report['summary']['performance_score']:.1f}% of method/transport SLOs met")
             print()
 
             # Clean up temporary JSON files only if they weren't part of the compliance report
@@ -491,6 +1145,7 @@ def run_all_categories(
     transport_equivalence_passed = results["transport-equivalence"] == 0
     quality_passed = results["quality"] == 0
     features_passed = results["features"] == 0
+    performance_passed = results["performance"] == 0
 
     # Get statistics for display
     mandatory_stats = format_test_statistics(category_statistics.get("mandatory", {}))
@@ -498,12 +1153,14 @@ def run_all_categories(
     transport_equivalence_stats = format_test_statistics(category_statistics.get("transport-equivalence", {}))
     quality_stats = format_test_statistics(category_statistics.get("quality", {}))
     features_stats = format_test_statistics(category_statistics.get("features", {}))
+    performance_stats = format_test_statistics(category_statistics.get("performance", {}))
 
     print(f"🔴 Mandatory Tests:           {'✅ PASSED' if mandatory_passed else '❌ FAILED'} ({mandatory_stats})")
     print(f"🔄 Capability Tests:          {'✅ PASSED' if capabilities_passed else '❌ FAILED'} ({capabilities_stats})")
     print(f"🚀 Transport Equivalence:     {'✅ PASSED' if transport_equivalence_passed else '❌ FAILED'} ({transport_equivalence_stats})")
     print(f"🛡️  Quality Tests:             {'✅ PASSED' if quality_passed else '⚠️  ISSUES'} ({quality_stats})")
     print(f"🎨 Feature Tests:             {'✅ PASSED' if features_passed else 'ℹ️  INCOMPLETE'} ({features_stats})")
+    print(f"⏱️  Performance Tests:         {'✅ PASSED' if performance_passed else '⚠️  SLO MISSES'} ({performance_stats})")
     print()
 
     # Overall assessment
@@ -540,70 +1197,33 @@ def run_all_categories(
     print()
     print("=" * 80)
 
-    # Clean up temporary JSON files used for statistics (if not compliance reporting)
+    # Clean up temporary results files used for statistics (if not compliance reporting)
     if not compliance_report:
         for category in categories:
-            if transports:
-                json_file = REPORTS_DIR / f"{category}_{transports}_results.json"
-            else:
-                json_file = REPORTS_DIR / f"{category}_results.json"
-            if json_file.exists():
+            results_file = REPORTS_DIR / result_names(category, transports, False, False)[1]
+            if results_file.exists():
                 try:
-                    json_file.unlink()
+                    results_file.unlink()
                 except:
                     pass  # Ignore cleanup errors
+        if AGENT_CARD_SNAPSHOT.exists():
+            AGENT_CARD_SNAPSHOT.unlink()
 
     return results
 
 
-def collect_test_results_from_json(json_file: Path, category: str) -> Dict:
-    """Collect detailed test results from pytest JSON report."""
+def collect_test_results_from_jsonl(results_file: Path, category: str) -> Dict:
+    """Collect detailed test results by streaming a JSONL results file (see tck.result_sink)."""
     try:
-        if not json_file.exists():
-            print(f"Warning: JSON report file {json_file} not found - using fallback statistics")
+        if not results_file.exists():
+            print(f"Warning: Results file {results_file} not found - using fallback statistics")
             # Return minimal structure for fallback
             return {"total": 1, "passed": 0, "failed": 1, "skipped": 0, "xfailed": 0, "error": 0, "tests": {}}
 
-        with open(json_file, "r") as f:
-            report_data = json.load(f)
-
-        # Parse pytest-json-report format
-        summary = report_data.get("summary", {})
-        tests = report_data.get("tests", [])
-
-        # Extract summary statistics from pytest-json-report format
-        total = summary.get("total", 0)
-        passed = summary.get("passed", 0)
-        failed = summary.get("failed", 0)  # Regular test failures
-        error = summary.get("error", 0)    # Setup/teardown errors
-        skipped = summary.get("skipped", 0)
-        
-        # Count xfailed from individual test results since it's not in summary
-        xfailed = 0
-        for test in tests:
-            if test.get("outcome") == "xfailed":
-                xfailed += 1
-        
-        # Combine failed and error into one "failed" category for our purposes
-        total_failed = failed + error
-
-        # Parse individual test results
-        test_details = {}
-        for test in tests:
-            test_name = test.get("nodeid", "").split("::")[-1]  # Get just the test function name
-            outcome = test.get("outcome", "unknown").upper()
-
-            test_details[test_name] = {
-                "outcome": outcome,
-                "duration": test.get("duration", 0),
-                "error_message": test.get("call", {}).get("longrepr", "") if outcome == "FAILED" else None,
-                "markers": [marker.get("name", "") for marker in test.get("markers", [])],
-            }
-
-        return {"total": total, "passed": passed, "failed": total_failed, "skipped": skipped, "xfailed": xfailed, "error": error, "tests": test_details}
+        return aggregate_result_records(iter_result_records(results_file))
 
     except Exception as e:
-        print(f"Warning: Could not parse JSON report {json_file}: {e}")
+        print(f"Warning: Could not read results file {results_file}: {e}")
         # Fallback to basic data based on file existence
         return {
             "total": 1,
@@ -660,7 +1280,16 @@ def calculate_success_rate(results: Dict) -> float:
 
 
 def get_agent_card_data(sut_url: str) -> Dict:
-    """Get agent card data from the SUT."""
+    """Get agent card data from the SUT (or from the exchange archive being replayed)."""
+    replay_path = os.getenv(EXCHANGE_ARCHIVE_ENV["--tck-replay"])
+    if replay_path and Path(replay_path).exists():
+        from tck.transport.capture import ExchangeArchive
+
+        archive = ExchangeArchive(Path(replay_path))
+        try:
+            return archive.info("agent_card") or {}
+        finally:
+            archive.close()
     try:
         from tck.sut_client import SUTClient
         from tck.agent_card_utils import fetch_agent_card
@@ -708,21 +1337,51 @@ Examples:
   # Strict mode - fail CI on quality/features failures (useful for internal projects)
   ./run_tck.py --sut-url http://localhost:9999 --category all --quality-required --features-required
 
+  # Run category/transport combinations concurrently on 4 pytest processes
+  ./run_tck.py --sut-url http://localhost:9999 --category all --transports "jsonrpc,grpc,rest" --jobs 4
+
+  # Run all categories in one pytest session (one Agent Card fetch, one set of connections)
+  ./run_tck.py --sut-url http://localhost:9999 --category all --single-session
+
+  # Rerun only tests that failed last time or whose inputs changed
+  ./run_tck.py --sut-url http://localhost:9999 --category all --incremental
+
+  # Run the second of four duration-balanced shards (e.g. one CI matrix job)
+  ./run_tck.py --sut-url http://localhost:9999 --category all --shard 2/4
+
+  # Spread one sweep across three identical SUT replicas
+  ./run_tck.py --sut-url http://localhost:9999,http://localhost:9998,http://localhost:9997 --category all
+
+  # Record a run against a SUT, then re-run the validators against the recording offline
+  ./run_tck.py --sut-url http://localhost:9999 --category all --capture reports/exchanges.sqlite
+  ./run_tck.py --sut-url http://localhost:9999 --category all --replay reports/exchanges.sqlite
+
+  # Break every SUT call down into connect/TLS/TTFB/transfer/TCK time in the test reports
+  ./run_tck.py --sut-url http://localhost:9999 --category quality --call-timings
+
+  # Check per-method p50/p95/p99 latency and throughput against SLOs (tighter p95 for all methods)
+  A2A_PERF_SLO='{"default": {"p95_ms": 500}}' ./run_tck.py --sut-url http://localhost:9999 --category performance
+
 Categories:
   mandatory             - Core A2A compliance (MUST pass)
   capabilities          - Declared capability validation (conditional mandatory)
   transport-equivalence - Multi-transport functional equivalence (conditional mandatory)
   quality               - Production readiness assessment (optional)
   features              - Optional feature validation (informational)
+  performance           - Per-method latency and throughput SLOs (optional)
   all                   - All categories in recommended order
         """,
     )
 
-    parser.add_argument("--sut-url", help="URL of the SUT's A2A JSON-RPC endpoint")
+    parser.add_argument(
+        "--sut-url",
+        help="URL of the SUT's A2A JSON-RPC endpoint. A comma-separated list of identical SUT replicas "
+        "spreads parallel-safe tests across them (stateful tests stay on the first URL)",
+    )
 
     parser.add_argument(
         "--category",
-        choices=["mandatory", "capabilities", "transport-equivalence", "quality", "features", "all"],
+        choices=["mandatory", "capabilities", "transport-equivalence", "quality", "features", "performance", "all"],
         help="Test category to run",
     )
 
@@ -774,6 +1433,64 @@ Categories:
         help="Treat feature tests as required (fail CI on feature failures). Can also set A2A_TCK_FAIL_ON_FEATURES=1",
     )
 
+    parser.add_argument(
+        "--performance-required",
+        action="store_true",
+        help="Treat performance tests as required (fail CI on SLO misses). Can also set A2A_TCK_FAIL_ON_PERFORMANCE=1",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run category/transport test runs concurrently on up to N pytest processes (default: 1, sequential). "
+        "Tests that depend on shared SUT task state still run in a serialized lane.",
+    )
+
+    parser.add_argument(
+        "--single-session",
+        action="store_true",
+        help="With --category all, run every category in a single pytest session (one per transport when "
+        "several are given) so imports, Agent Card discovery and connections are reused across categories",
+    )
+
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Rerun only tests that failed last time or whose inputs (Agent Card, test files, transports) "
+        f"changed; unchanged passing tests are reported from the run cache ({RUN_CACHE_PATH})",
+    )
+
+    parser.add_argument(
+        "--shard",
+        metavar="i/N",
+        help="Run only shard i of N, splitting each category's test files into shards balanced by "
+        f"recorded test durations ({DURATION_HISTORY_PATH}); all shards must share the same history",
+    )
+
+    parser.add_argument(
+        "--capture",
+        metavar="PATH",
+        help="Record every request and response exchanged with the SUT in this archive "
+        "(tck/exchange_archive.py); can also set A2A_TCK_CAPTURE",
+    )
+
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        help="Re-run the tests against an archive written by --capture instead of a live SUT; "
+        "can also set A2A_TCK_REPLAY",
+    )
+
+    parser.add_argument(
+        "--call-timings",
+        action="store_true",
+        help="Time every SUT call phase by phase (connect, TLS, time to first byte, transfer, TCK processing) "
+        "and attach the timings to each test's report (tck/call_timings.py); can also set A2A_TCK_CALL_TIMINGS=1",
+    )
+
     args = parser.parse_args()
 
     if args.explain:
@@ -790,6 +1507,49 @@ Categories:
         print("Use --explain to understand categories")
         sys.exit(1)
 
+    if args.jobs < 1:
+        print("❌ Error: --jobs must be at least 1")
+        sys.exit(1)
+
+    # Several comma-separated URLs are identical SUT replicas; the first one is the primary
+    sut_urls = [url.strip() for url in args.sut_url.split(",") if url.strip()]
+    args.sut_url = sut_urls[0]
+    if len(sut_urls) > 1:
+        if args.single_session or args.shard:
+            print("❌ Error: multiple --sut-url replicas cannot be combined with --single-session or --shard")
+            sys.exit(1)
+        # Replica shards only help when they run at the same time
+        args.jobs = max(args.jobs, len(sut_urls))
+
+    if args.shard:
+        try:
+            parse_shard(args.shard)
+        except ValueError as e:
+            print(f"❌ Error: --shard: {e}")
+            sys.exit(1)
+
+    if args.capture and args.replay:
+        print("❌ Error: --capture and --replay cannot be combined")
+        sys.exit(1)
+    if args.replay and not Path(args.replay).exists():
+        print(f"❌ Error: --replay: archive not found: {args.replay}")
+        sys.exit(1)
+    # Passed on to every pytest process through the environment (see build_test_command)
+    if args.capture:
+        os.environ[EXCHANGE_ARCHIVE_ENV["--tck-capture"]] = str(Path(args.capture).resolve())
+    if args.replay:
+        os.environ[EXCHANGE_ARCHIVE_ENV["--tck-replay"]] = str(Path(args.replay).resolve())
+    if args.call_timings:
+        os.environ[CALL_TIMINGS_ENV] = "1"
+
+    if args.single_session and args.jobs > 1:
+        print("❌ Error: --single-session cannot be combined with --jobs")
+        sys.exit(1)
+
+    if args.single_session and args.category != "all":
+        print("❌ Error: --single-session requires --category all")
+        sys.exit(1)
+
     # Validate test directories exist
     if not Path("tests").exists():
         print("❌ Error: tests/ directory not found")
@@ -812,6 +1572,11 @@ Categories:
             args.transport_strategy,
             args.enable_equivalence_testing,
             args.transports,
+            args.jobs,
+            args.single_session,
+            args.incremental,
+            args.shard,
+            sut_urls,
         )
         # Exit with failure if mandatory, capabilities, or transport-equivalence failed
         # Handle both single-transport keys ("mandatory") and multi-transport keys ("mandatory:jsonrpc")
@@ -821,10 +1586,11 @@ Categories:
         # Determine which categories are critical (fail CI on failure)
         critical_categories = ["mandatory", "capabilities", "transport-equivalence"]
 
-        # Check optional categories (quality/features) via CLI flags or environment variables
+        # Check optional categories (quality/features/performance) via CLI flags or environment variables
         optional_categories_to_check = {
             "quality": (args.quality_required, "A2A_TCK_FAIL_ON_QUALITY"),
             "features": (args.features_required, "A2A_TCK_FAIL_ON_FEATURES"),
+            "performance": (args.performance_required, "A2A_TCK_FAIL_ON_PERFORMANCE"),
         }
         for category, (flag, env_var) in optional_categories_to_check.items():
             if flag or os.getenv(env_var, "").lower() in TRUTHY_ENV_VALUES:
@@ -844,13 +1610,51 @@ Categories:
         # If multiple transports provided and category is single-client, fan out per transport
         multi_transports = normalize_transports(args.transports) if args.transports else []
 
-        if multi_transports and len(multi_transports) > 1 and args.category != "transport-equivalence":
+        if len(sut_urls) > 1:
+            print("=" * 80)
+            print(f"🔁 Running category '{args.category}' across {len(sut_urls)} SUT replicas")
+            print("=" * 80)
+            print()
+
+            combined = args.category in COMBINED_CATEGORIES
+            runs = plan_category_runs(
+                [] if combined else [args.category], multi_transports, [args.category] if combined else None
+            )
+            results, _ = run_planned_categories(
+                plan_replica_runs(runs, sut_urls),
+                args.jobs,
+                args.sut_url,
+                args.verbose,
+                args.verbose_log,
+                args.report,
+                args.transport_strategy,
+                args.enable_equivalence_testing,
+                args.incremental,
+            )
+            sys.exit(0 if all(code == 0 for code in results.values()) else 1)
+
+        if multi_transports and len(multi_transports) > 1 and args.category not in COMBINED_CATEGORIES:
             print("=" * 80)
             print(f"🔁 Running category '{args.category}' per transport: {', '.join(multi_transports)}")
             print("=" * 80)
             print()
 
             aggregate_ok = True
+            if args.jobs > 1:
+                results, _ = run_planned_categories(
+                    plan_category_runs([args.category], multi_transports),
+                    args.jobs,
+                    args.sut_url,
+                    args.verbose,
+                    args.verbose_log,
+                    args.report,
+                    args.transport_strategy,
+                    args.enable_equivalence_testing,
+                    args.incremental,
+                    args.shard,
+                )
+                sys.exit(0 if all(code == 0 for code in results.values()) else 1)
+
             for tr in multi_transports:
                 print(f"➡️  [{tr}] Running {args.category}...")
                 code = run_test_category(
@@ -863,6 +1667,8 @@ Categories:
                     args.transport_strategy,
                     args.enable_equivalence_testing,
                     tr,
+                    args.incremental,
+                    args.shard,
                 )
                 print(f"⬅️  [{tr}] Exit code: {code}")
                 print()
@@ -870,7 +1676,7 @@ Categories:
                     aggregate_ok = False
             sys.exit(0 if aggregate_ok else 1)
         else:
-            # Single transport or transport-equivalence: single run
+            # Single transport or a combined category (transport-equivalence, performance): single run
             exit_code = run_test_category(
                 args.category,
                 args.sut_url,
@@ -881,6 +1687,8 @@ Categories:
                 args.transport_strategy,
                 args.enable_equivalence_testing,
                 args.transports,
+                args.incremental,
+                args.shard,
             )
             sys.exit(exit_code)
 
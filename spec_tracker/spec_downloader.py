@@ -6,11 +6,13 @@ Downloads the latest specification files from GitHub.
 import requests
 import json
 import logging
-import time
 from datetime import datetime
 from pathlib import Path
 from typing import Tuple, Optional
 
+import tck.config  # noqa: F401  (must be imported before the transport modules)
+from tck.transport.retry_policy import RetryPolicy
+
 logger = logging.getLogger(__name__)
 
 
@@ -61,27 +63,17 @@ class SpecDownloader:
                 raise
 
     def _download_with_retry(self, url: str, description: str, is_json: bool = True, max_retries: int = 3):
-        """Download with exponential backoff retry logic."""
-        for attempt in range(max_retries):
-            try:
-                logger.info(f"Downloading {description} from {url} (attempt {attempt + 1}/{max_retries})")
-                response = requests.get(url, timeout=30)
-                response.raise_for_status()
-
-                if is_json:
-                    return response.json()
-                else:
-                    return response.text
-
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    logger.error(f"Failed to download {description} after {max_retries} attempts: {e}")
-                    raise
-                else:
-                    # Exponential backoff: 1s, 2s, 4s
-                    wait_time = 2**attempt
-                    logger.warning(f"Download attempt {attempt + 1} failed: {e}. Retrying in {wait_time}s...")
-                    time.sleep(wait_time)
+        """Download with the TCK's retry policy: exponential backoff (1s, 2s, ...) on network errors and HTTP errors."""
+
+        def download():
+            logger.info(f"Downloading {description} from {url}")
+            response = requests.get(url, timeout=30)
+            response.raise_for_status()
+            return response
+
+        policy = RetryPolicy(max_attempts=max_retries, base_delay=1.0, max_delay=4.0)
+        response = policy.run(download, retry_on=(requests.RequestException,), description=f"Downloading {description}")
+        return response.json() if is_json else response.text
 
     def _cache_specs(self, json_data: dict, md_content: str):
         """Save downloaded specs to cache with timestamps."""
@@ -13,14 +13,19 @@ import logging
 import urllib.parse
 from typing import Any, Dict, List, Optional, Set, Union, cast
 
+import httpx
 import requests
 
 from tck.transport.base_client import TransportType
+from tck.transport.http_pool import pooled_client
+from tck.transport.retry_policy import get_retry_policy
 
 logger = logging.getLogger(__name__)
 
 
-def fetch_agent_card(sut_base_url: str, session: requests.Session) -> Optional[Dict[str, Any]]:
+def fetch_agent_card(
+    sut_base_url: str, session: Optional[Union[httpx.Client, requests.Session]] = None
+) -> Optional[Dict[str, Any]]:
     """
     Retrieve the Agent Card JSON from the SUT.
 
@@ -29,13 +34,17 @@ def fetch_agent_card(sut_base_url: str, session: requests.Session) -> Optional[D
 
     Args:
         sut_base_url: The base URL of the SUT
-        session: A requests.Session object to use for making the request
+        session: HTTP client (httpx.Client or requests.Session) to use for making the request;
+                 defaults to a client on the shared connection pool
 
     Returns:
         The parsed Agent Card JSON as a dictionary, or None if it cannot be retrieved or parsed
 
     Specification Reference: A2A Protocol v0.3.0 §5.3 - Recommended Location
     """
+    if session is None:
+        session = pooled_client(follow_redirects=True)
+
     # Parse the base URL to determine the host
     parsed_url = urllib.parse.urlparse(sut_base_url)
     base_domain = f"{parsed_url.scheme}://{parsed_url.netloc}"
@@ -51,7 +60,12 @@ def fetch_agent_card(sut_base_url: str, session: requests.Session) -> Optional[D
             agent_card_url = urllib.parse.urljoin(base_domain, url_path)
             logger.info(f"Fetching Agent Card from {agent_card_url} ({version} location)")
 
-            response = session.get(agent_card_url, timeout=10)
+            # Fetching the card is idempotent: retry it through a SUT that is still starting up
+            response = get_retry_policy().run(
+                lambda: session.get(agent_card_url, timeout=10),
+                retry_on=(httpx.TransportError, requests.ConnectionError, requests.Timeout),
+                description=f"Fetching Agent Card from {agent_card_url}",
+            )
             response.raise_for_status()
 
             try:
@@ -62,7 +76,7 @@ def fetch_agent_card(sut_base_url: str, session: requests.Session) -> Optional[D
                 logger.error(f"Failed to parse Agent Card JSON from {agent_card_url}: {e}")
                 continue  # Try next location
 
-        except requests.RequestException as e:
+        except (httpx.HTTPError, requests.RequestException) as e:
             logger.info(f"Agent Card not found at {version} location ({url_path}): {e}")
             continue  # Try next location
 
@@ -0,0 +1,119 @@
+"""
+Per-call timing breakdown of SUT exchanges in the test reports.
+
+A pytest plugin around tck.transport.timing: with ``--tck-call-timings`` every call
+the transport clients make to the SUT is timed phase by phase (connect, TLS, time to
+first byte, transfer, and the TCK's own parsing/validation/conversion), and the calls
+of each test are attached to its report:
+
+- as a "SUT call timings" report section, shown with the failure output, so a failed
+  timing-sensitive test tells whether the SUT, the network or the TCK was slow;
+- as the ``call_timings`` user property (a list of dicts, durations in milliseconds),
+  which ends up in JUnit XML, pytest-json-report and the tck.result_sink records.
+
+The terminal summary adds the share of each phase over the whole session.
+
+Usage:
+    pytest -p tck.call_timings --tck-call-timings --sut-url ... --transports jsonrpc
+"""
+
+from typing import Any, Dict, List
+
+import pytest
+
+import tck.config  # noqa: F401  (must be imported before the transport modules)
+from tck.histogram import LatencyHistogram
+from tck.result_sink import CALL_TIMINGS_PROPERTY
+from tck.transport import timing as call_timing
+from tck.transport.timing import PHASES, CallTiming, CallTimingCollector
+
+
+def format_call_timings(timings: List[Dict[str, Any]]) -> str:
+    """
+    Render call timings (CallTiming.to_dict) as a fixed-width table.
+
+    Args:
+        timings: Call timings of a test
+
+    Returns:
+        The table, one line per call, durations in milliseconds
+    """
+    header = f"{'transport':<9} {'method / operation':<48} {'tries':>5} {'total':>9}" + "".join(f" {p:>9}" for p in PHASES)
+    lines = [header]
+    for t in timings:
+        name = f"{t['method']} {t['operation']}" if t.get("method") else t["operation"]
+        phases = "".join(f" {t[f'{p}_ms']:>9.1f}" if f"{p}_ms" in t else f" {'-':>9}" for p in PHASES)
+        lines.append(f"{t['transport']:<9} {name[:48]:<48} {t['attempts']:>5} {t['total_ms']:>9.1f}{phases}")
+    return "\n".join(lines)
+
+
+class CallTimingsPlugin:
+    """pytest plugin attaching the timings of each test's SUT calls to its reports."""
+
+    def __init__(self, collector: CallTimingCollector):
+        self.collector = collector
+        self.calls = 0
+        self._phase_totals = dict.fromkeys(PHASES, 0.0)
+        self._total = 0.0
+        self._durations = LatencyHistogram()
+
+    def _account(self, timings: List[CallTiming]) -> None:
+        for t in timings:
+            self.calls += 1
+            self._total += t.total
+            self._durations.record(t.total)
+            for phase, seconds in t.phases.items():
+                self._phase_totals[phase] += seconds
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        timings = self.collector.drain()
+        if not timings:
+            return
+        self._account(timings)
+        report = outcome.get_result()
+        records = [t.to_dict() for t in timings]
+        report.sections.append((f"SUT call timings ({report.when}, ms)", format_call_timings(records)))
+        # One property per test, extended by each phase; the report was built with a copy of the item's properties
+        for name, value in item.user_properties:
+            if name == CALL_TIMINGS_PROPERTY:
+                value.extend(records)
+                break
+        else:
+            item.user_properties.append((CALL_TIMINGS_PROPERTY, records))
+        report.user_properties = list(item.user_properties)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.calls:
+            return
+        shares = ", ".join(
+            f"{phase} {seconds * 1000:.0f}ms ({seconds / self._total:.0%})"
+            for phase, seconds in self._phase_totals.items()
+            if seconds and self._total
+        )
+        p50, p99 = self._durations.percentiles((50, 99))
+        terminalreporter.write_line(
+            f"tck call timings: {self.calls} SUT call(s), {self._total:.2f}s total "
+            f"(p50 {p50 * 1000:.1f}ms, p99 {p99 * 1000:.1f}ms, ±{self._durations.relative_error:.1%}): {shares}"
+        )
+
+    def pytest_unconfigure(self, config):
+        call_timing.stop_call_timing()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("tck-call-timings", "TCK per-call timing breakdown")
+    group.addoption(
+        "--tck-call-timings",
+        action="store_true",
+        default=False,
+        help="Time every SUT call phase by phase and attach the timings to each test's report",
+    )
+
+
+def pytest_configure(config):
+    if not config.getoption("--tck-call-timings"):
+        return
+    plugin = CallTimingsPlugin(call_timing.start_call_timing())
+    config.pluginmanager.register(plugin, "tck_call_timings_plugin")
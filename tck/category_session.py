@@ -0,0 +1,113 @@
+"""
+Multi-category session plugin for the A2A TCK.
+
+Lets run_tck.py run several test categories in a single pytest session so that
+interpreter startup, transport imports, Agent Card discovery and transport
+connections are paid once per sweep instead of once per category.
+
+Each category is registered with ``--tck-category`` as ``NAME=PATH`` or
+``NAME=PATH:MARKER|MARKER``. A collected test belongs to the category whose
+path contains it and is kept only if it carries one of that category's markers
+(categories without markers keep every test under their path), mirroring the
+per-category ``pytest PATH -m "a or b"`` invocations.
+
+Usage:
+    pytest -p tck.category_session tests/mandatory/ tests/optional/quality/ \\
+        --tck-category "mandatory=tests/mandatory/:mandatory|mandatory_protocol" \\
+        --tck-category "quality=tests/optional/quality/"
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+
+def parse_category_selection(value: str) -> Tuple[str, str, List[str]]:
+    """
+    Parse a ``--tck-category`` value.
+
+    Args:
+        value: ``NAME=PATH`` or ``NAME=PATH:MARKER|MARKER``
+
+    Returns:
+        Tuple of (category name, path, marker names)
+    """
+    name, _, selection = value.partition("=")
+    if not name or not selection:
+        raise pytest.UsageError(f"Invalid --tck-category value '{value}', expected NAME=PATH[:MARKER|MARKER]")
+    path, _, markers = selection.partition(":")
+    return name, path, [m for m in markers.split("|") if m]
+
+
+def format_category_selection(name: str, path: str, markers: Optional[str]) -> str:
+    """
+    Build a ``--tck-category`` value from a category's path and ``-m`` expression.
+
+    Category marker expressions in the runner are plain ``or`` lists of marker names.
+    """
+    if not markers:
+        return f"{name}={path}"
+    names = [m.strip() for m in markers.split(" or ")]
+    return f"{name}={path}:{'|'.join(names)}"
+
+
+def category_for_nodeid(nodeid: str, categories: Dict[str, str]) -> Optional[str]:
+    """
+    Find the category whose path contains a test node id.
+
+    Args:
+        nodeid: pytest node id (e.g. ``tests/mandatory/protocol/test_x.py::test_y``)
+        categories: Mapping of category name to test path
+
+    Returns:
+        Category name, or None if no category path contains the test
+    """
+    file_path = Path(nodeid.split("::", 1)[0]).as_posix()
+    best = None
+    for name, path in categories.items():
+        prefix = Path(path).as_posix().rstrip("/")
+        if file_path == prefix or file_path.startswith(prefix + "/"):
+            # Prefer the most specific path if category paths nest
+            if best is None or len(prefix) > len(Path(categories[best]).as_posix().rstrip("/")):
+                best = name
+    return best
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--tck-category",
+        action="append",
+        default=[],
+        help="Register a category for a multi-category session: NAME=PATH[:MARKER|MARKER]",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    selections = [parse_category_selection(v) for v in config.getoption("--tck-category")]
+    if not selections:
+        return
+
+    paths = {name: path for name, path, _ in selections}
+    markers = {name: names for name, _, names in selections}
+
+    selected, deselected = [], []
+    for item in items:
+        category = category_for_nodeid(item.nodeid, paths)
+        if category is None:
+            deselected.append(item)
+            continue
+        wanted = markers[category]
+        # Match marker names only, as -m does (item.keywords also holds node names)
+        if wanted and not {marker.name for marker in item.iter_markers()}.intersection(wanted):
+            deselected.append(item)
+            continue
+        selected.append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+    logger.debug(f"Multi-category session selected {len(selected)} tests across {len(paths)} categories")
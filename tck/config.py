@@ -10,12 +10,16 @@ Specification Reference: A2A Protocol v0.3.0 §3.4 - Transport Configuration
 
 import os
 import base64
+import copy
 import json
 import logging
 
-from typing import Optional, Dict, List
+from typing import Any, Callable, Optional, Dict, List, Tuple
 from tck.transport.base_client import TransportType
 
+# Values of a boolean environment variable that mean true (any other value means false)
+TRUTHY_ENV_VALUES = frozenset({"1", "true", "yes", "on"})
+
 # These will be set by pytest via conftest.py
 _sut_url: Optional[str] = None
 _test_scope: str = "core"
@@ -335,7 +339,7 @@ def get_enable_transport_equivalence_testing() -> bool:
     # Check environment variable override
     env_enabled = os.getenv("A2A_ENABLE_EQUIVALENCE_TESTING")
     if env_enabled is not None:
-        return env_enabled.lower() in ("true", "1", "yes", "on")
+        return env_enabled.lower() in TRUTHY_ENV_VALUES
     return _enable_transport_equivalence_testing
 
 
@@ -363,6 +367,405 @@ def get_transport_capabilities() -> Dict[str, bool]:
     }
 
 
+# Option groups below: a set_*_config function updates the options it is given, and the
+# get_*_config function returns them with their environment variable overrides applied
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable (see TRUTHY_ENV_VALUES)."""
+    return value.lower() in TRUTHY_ENV_VALUES
+
+
+def _update_options(options: Dict[str, Any], **values: Any) -> None:
+    """Set options of a group; options passed as None keep their current value."""
+    for key, value in values.items():
+        if value is not None:
+            options[key] = value
+
+
+def _with_env_overrides(
+    options: Dict[str, Any], overrides: Tuple[Tuple[str, str, Callable[[str], Any]], ...]
+) -> Dict[str, Any]:
+    """
+    Copy of an option group with environment variable overrides applied.
+
+    Args:
+        options: Current options of the group
+        overrides: (option, environment variable, parser) of each overridable option; a
+            variable that is unset or empty is ignored, one that does not parse is logged and ignored
+    """
+    options = copy.deepcopy(options)
+    for key, env_var, cast in overrides:
+        value = os.getenv(env_var)
+        if value:
+            try:
+                options[key] = cast(value)
+            except ValueError:
+                logging.getLogger(__name__).warning(f"Ignoring invalid {env_var}={value!r}")
+    return options
+
+
+# HTTP connection pool configuration (shared by all HTTP-based clients)
+
+_DEFAULT_HTTP_POOL_CONFIG: Dict[str, Optional[float]] = {
+    "max_connections": 100,
+    "max_keepalive_connections": 20,
+    "keepalive_expiry": 30.0,
+}
+_http_pool_config: Dict[str, Optional[float]] = dict(_DEFAULT_HTTP_POOL_CONFIG)
+
+
+def set_http_pool_config(
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+):
+    """
+    Set HTTP connection pool limits.
+
+    Takes effect for pools created afterwards (see tck.transport.http_pool).
+
+    Args:
+        max_connections: Maximum number of open connections
+        max_keepalive_connections: Maximum number of idle keep-alive connections
+        keepalive_expiry: Seconds an idle keep-alive connection is kept open
+    """
+    _update_options(
+        _http_pool_config,
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def get_http_pool_config() -> Dict[str, Optional[float]]:
+    """
+    Get HTTP connection pool limits.
+
+    Supports the following environment variable overrides:
+    - A2A_HTTP_MAX_CONNECTIONS
+    - A2A_HTTP_MAX_KEEPALIVE_CONNECTIONS
+    - A2A_HTTP_KEEPALIVE_EXPIRY (seconds)
+
+    Returns:
+        Dictionary with max_connections, max_keepalive_connections and keepalive_expiry
+    """
+    return _with_env_overrides(
+        _http_pool_config,
+        (
+            ("max_connections", "A2A_HTTP_MAX_CONNECTIONS", int),
+            ("max_keepalive_connections", "A2A_HTTP_MAX_KEEPALIVE_CONNECTIONS", int),
+            ("keepalive_expiry", "A2A_HTTP_KEEPALIVE_EXPIRY", float),
+        ),
+    )
+
+
+# gRPC channel configuration (keepalive and message size limits of the shared channels)
+
+_DEFAULT_GRPC_CHANNEL_CONFIG: Dict[str, int] = {
+    # Servers reject keepalive pings more frequent than every 5 minutes by default
+    "keepalive_time_ms": 300000,
+    "keepalive_timeout_ms": 20000,
+    "keepalive_permit_without_calls": 0,
+    "max_message_size": 16 * 1024 * 1024,
+}
+
+_SIZE_UNITS = {"KB": 1024, "MB": 1024 * 1024, "GB": 1024 * 1024 * 1024, "B": 1}
+
+
+def _parse_size(value: str) -> int:
+    """Parse a byte size such as '4194304', '4MB' or '512KB'."""
+    value = str(value).strip().upper()
+    for unit, factor in _SIZE_UNITS.items():
+        if value.endswith(unit):
+            return int(float(value[: -len(unit)].strip()) * factor)
+    return int(value)
+
+
+def get_grpc_channel_options() -> List[Tuple[str, int]]:
+    """
+    Get gRPC channel options for the shared sync and aio channels.
+
+    Defaults can be overridden through the gRPC transport-specific configuration
+    (set_transport_specific_config or A2A_GRPC_* environment variables):
+    - keepalive_time_ms, keepalive_timeout_ms, keepalive_permit_without_calls
+    - max_message_size (bytes, or with a KB/MB/GB suffix, e.g. A2A_GRPC_MAX_MESSAGE_SIZE=4MB)
+
+    Returns:
+        List of (option name, value) tuples for grpc.*_channel(options=...)
+    """
+    channel_config = dict(_DEFAULT_GRPC_CHANNEL_CONFIG)
+    for key, value in get_transport_specific_config(TransportType.GRPC).items():
+        if key in channel_config:
+            try:
+                channel_config[key] = _parse_size(value) if key == "max_message_size" else int(value)
+            except ValueError:
+                logging.getLogger(__name__).warning(f"Ignoring invalid gRPC channel setting {key}={value!r}")
+
+    return [
+        ("grpc.keepalive_time_ms", channel_config["keepalive_time_ms"]),
+        ("grpc.keepalive_timeout_ms", channel_config["keepalive_timeout_ms"]),
+        ("grpc.keepalive_permit_without_calls", channel_config["keepalive_permit_without_calls"]),
+        ("grpc.max_send_message_length", channel_config["max_message_size"]),
+        ("grpc.max_receive_message_length", channel_config["max_message_size"]),
+    ]
+
+
+# Wire logging configuration (see tck.transport.wire_log)
+
+_DEFAULT_WIRE_LOG_CONFIG: Dict[str, object] = {
+    # Level of the "tck.wire" logger (None: the TCK log level); OFF disables wire logging
+    "level": None,
+    # Bodies longer than this are truncated in wire log records
+    "max_body_bytes": 4096,
+    # Records logged in full per second before sampling starts
+    "sample_after": 200,
+    # Beyond sample_after, one record in sample_every is logged
+    "sample_every": 100,
+}
+_wire_log_config: Dict[str, object] = dict(_DEFAULT_WIRE_LOG_CONFIG)
+
+
+def set_wire_log_config(
+    level: Optional[str] = None,
+    max_body_bytes: Optional[int] = None,
+    sample_after: Optional[int] = None,
+    sample_every: Optional[int] = None,
+):
+    """
+    Set wire logging options.
+
+    Takes effect the next time wire logging is set up (see logging_config.setup_logging).
+
+    Args:
+        level: Level of the "tck.wire" logger (e.g. "INFO", "WARNING" or "OFF")
+        max_body_bytes: Maximum logged size of a request or response body
+        sample_after: Records per second logged in full before sampling starts
+        sample_every: Log one record in this many once sampling has started
+    """
+    _update_options(
+        _wire_log_config,
+        level=level,
+        max_body_bytes=max_body_bytes,
+        sample_after=sample_after,
+        sample_every=sample_every,
+    )
+
+
+def get_wire_log_config() -> Dict[str, object]:
+    """
+    Get wire logging options.
+
+    Supports the following environment variable overrides:
+    - A2A_WIRE_LOG_LEVEL (a logging level name, or OFF)
+    - A2A_WIRE_LOG_MAX_BODY (bytes, or with a KB/MB/GB suffix, e.g. 16KB)
+    - A2A_WIRE_LOG_SAMPLE_AFTER
+    - A2A_WIRE_LOG_SAMPLE_EVERY
+
+    Returns:
+        Dictionary with level, max_body_bytes, sample_after and sample_every
+    """
+    return _with_env_overrides(
+        _wire_log_config,
+        (
+            ("level", "A2A_WIRE_LOG_LEVEL", str.upper),
+            ("max_body_bytes", "A2A_WIRE_LOG_MAX_BODY", _parse_size),
+            ("sample_after", "A2A_WIRE_LOG_SAMPLE_AFTER", int),
+            ("sample_every", "A2A_WIRE_LOG_SAMPLE_EVERY", int),
+        ),
+    )
+
+
+# Retry and circuit-breaker policy of all transports (see tck.transport.retry_policy)
+
+_DEFAULT_RETRY_CONFIG: Dict[str, float] = {
+    # Attempts per idempotent call, including the first (1 disables retries)
+    "max_attempts": 3,
+    # Backoff bound before the first retry, doubled for each further retry (seconds)
+    "base_delay": 0.25,
+    # Upper bound of any backoff (seconds)
+    "max_delay": 4.0,
+    # Consecutive unreachable calls that open an endpoint's circuit (0 disables the breaker)
+    "breaker_threshold": 5,
+    # Seconds an open circuit waits before letting a probe call through
+    "breaker_reset": 30.0,
+}
+_retry_config: Dict[str, float] = dict(_DEFAULT_RETRY_CONFIG)
+
+
+def set_retry_config(
+    max_attempts: Optional[int] = None,
+    base_delay: Optional[float] = None,
+    max_delay: Optional[float] = None,
+    breaker_threshold: Optional[int] = None,
+    breaker_reset: Optional[float] = None,
+):
+    """
+    Set the retry and circuit-breaker policy.
+
+    Takes effect for policies built afterwards (see tck.transport.retry_policy.reset_retry_policy).
+
+    Args:
+        max_attempts: Attempts per idempotent call, including the first
+        base_delay: Backoff bound before the first retry, in seconds
+        max_delay: Upper bound of any backoff, in seconds
+        breaker_threshold: Consecutive unreachable calls that open a circuit (0 disables it)
+        breaker_reset: Seconds before an open circuit lets a probe call through
+    """
+    _update_options(
+        _retry_config,
+        max_attempts=max_attempts,
+        base_delay=base_delay,
+        max_delay=max_delay,
+        breaker_threshold=breaker_threshold,
+        breaker_reset=breaker_reset,
+    )
+
+
+def get_retry_config() -> Dict[str, float]:
+    """
+    Get the retry and circuit-breaker policy.
+
+    Supports the following environment variable overrides:
+    - A2A_RETRY_MAX_ATTEMPTS
+    - A2A_RETRY_BASE_DELAY (seconds)
+    - A2A_RETRY_MAX_DELAY (seconds)
+    - A2A_CIRCUIT_BREAKER_THRESHOLD (0 disables the circuit breaker)
+    - A2A_CIRCUIT_BREAKER_RESET (seconds)
+
+    Returns:
+        Dictionary with max_attempts, base_delay, max_delay, breaker_threshold and breaker_reset
+    """
+    return _with_env_overrides(
+        _retry_config,
+        (
+            ("max_attempts", "A2A_RETRY_MAX_ATTEMPTS", int),
+            ("base_delay", "A2A_RETRY_BASE_DELAY", float),
+            ("max_delay", "A2A_RETRY_MAX_DELAY", float),
+            ("breaker_threshold", "A2A_CIRCUIT_BREAKER_THRESHOLD", int),
+            ("breaker_reset", "A2A_CIRCUIT_BREAKER_RESET", float),
+        ),
+    )
+
+
+# Endpoint probing at session start (see TransportManager.probe_endpoints)
+
+_DEFAULT_ENDPOINT_PROBE_CONFIG: Dict[str, Any] = {
+    # Probe every declared interface before the first test
+    "enabled": True,
+    # Bound of the whole probing phase; all interfaces are probed concurrently (seconds)
+    "budget": 5.0,
+}
+_endpoint_probe_config: Dict[str, Any] = dict(_DEFAULT_ENDPOINT_PROBE_CONFIG)
+
+
+def set_endpoint_probe_config(enabled: Optional[bool] = None, budget: Optional[float] = None):
+    """
+    Set endpoint probing.
+
+    Args:
+        enabled: Whether the declared interfaces are probed at session start
+        budget: Bound of the whole probing phase, in seconds
+    """
+    _update_options(_endpoint_probe_config, enabled=enabled, budget=budget)
+
+
+def get_endpoint_probe_config() -> Dict[str, Any]:
+    """
+    Get endpoint probing settings.
+
+    Supports the following environment variable overrides:
+    - A2A_ENDPOINT_PROBE (true/false)
+    - A2A_ENDPOINT_PROBE_BUDGET (seconds)
+
+    Returns:
+        Dictionary with enabled and budget
+    """
+    return _with_env_overrides(
+        _endpoint_probe_config,
+        (
+            ("enabled", "A2A_ENDPOINT_PROBE", _parse_bool),
+            ("budget", "A2A_ENDPOINT_PROBE_BUDGET", float),
+        ),
+    )
+
+
+# Performance category: calls per method and latency SLOs (see tck.performance)
+
+_DEFAULT_PERFORMANCE_CONFIG: Dict[str, Any] = {
+    # Measured calls per A2A method and transport
+    "iterations": 50,
+    # Unmeasured calls made first to warm connections and caches
+    "warmup": 3,
+    # SLO thresholds per A2A method (client method name); "default" applies to every method,
+    # method entries override it key by key. Latencies in milliseconds, throughput in calls/s.
+    "slo": {
+        "default": {
+            "p50_ms": 250.0,
+            "p95_ms": 1000.0,
+            "p99_ms": 2000.0,
+            "max_ms": None,
+            "min_throughput": None,
+            # Share of calls that may fail
+            "max_error_rate": 0.01,
+        },
+        # Sending a message runs the agent, so it gets more room than task lookups
+        "send_message": {"p50_ms": 1000.0, "p95_ms": 3000.0, "p99_ms": 5000.0},
+        # The first streamed event can also wait for the agent
+        "send_streaming_message": {"p50_ms": 1000.0, "p95_ms": 3000.0, "p99_ms": 5000.0},
+    },
+}
+_performance_config: Dict[str, Any] = copy.deepcopy(_DEFAULT_PERFORMANCE_CONFIG)
+
+
+def set_performance_config(
+    iterations: Optional[int] = None,
+    warmup: Optional[int] = None,
+    slo: Optional[Dict[str, Dict[str, Optional[float]]]] = None,
+):
+    """
+    Set the performance category's workload and SLOs.
+
+    Args:
+        iterations: Measured calls per A2A method and transport
+        warmup: Unmeasured calls made before measuring
+        slo: SLO thresholds per method ("default" or a client method name), merged key by key
+            into the current ones; a threshold set to None is not checked
+    """
+    _update_options(_performance_config, iterations=iterations, warmup=warmup)
+    for method, thresholds in (slo or {}).items():
+        _performance_config["slo"].setdefault(method, {}).update(thresholds)
+
+
+def get_performance_config() -> Dict[str, Any]:
+    """
+    Get the performance category's workload and SLOs.
+
+    Supports the following environment variable overrides:
+    - A2A_PERF_ITERATIONS
+    - A2A_PERF_WARMUP
+    - A2A_PERF_SLO (JSON object of thresholds per method, e.g. '{"default": {"p95_ms": 500}}')
+
+    Returns:
+        Dictionary with iterations, warmup and slo
+    """
+    perf_config = _with_env_overrides(
+        _performance_config,
+        (
+            ("iterations", "A2A_PERF_ITERATIONS", int),
+            ("warmup", "A2A_PERF_WARMUP", int),
+        ),
+    )
+    slo_json = os.getenv("A2A_PERF_SLO")
+    if slo_json:
+        try:
+            for method, thresholds in json.loads(slo_json).items():
+                perf_config["slo"].setdefault(method, {}).update(thresholds)
+        except (json.JSONDecodeError, AttributeError) as e:
+            logging.getLogger(__name__).warning(f"Ignoring invalid A2A_PERF_SLO: {e}")
+    return perf_config
+
+
 def _parse_transport_from_env(transport_str: str) -> Optional[TransportType]:
     """
     Parse transport type from environment variable string.
@@ -410,7 +813,8 @@ def reset_transport_config():
     """
     global _transport_selection_strategy, _preferred_transport
     global _disabled_transports, _required_transports, _transport_specific_config
-    global _enable_transport_equivalence_testing, _auth_headers
+    global _enable_transport_equivalence_testing, _auth_headers, _http_pool_config, _wire_log_config, _retry_config
+    global _endpoint_probe_config, _performance_config
 
     _transport_selection_strategy = "agent_preferred"
     _preferred_transport = None
@@ -419,3 +823,8 @@ def reset_transport_config():
     _transport_specific_config = {}
     _enable_transport_equivalence_testing = True
     _auth_headers = None
+    _http_pool_config = dict(_DEFAULT_HTTP_POOL_CONFIG)
+    _wire_log_config = dict(_DEFAULT_WIRE_LOG_CONFIG)
+    _retry_config = dict(_DEFAULT_RETRY_CONFIG)
+    _endpoint_probe_config = dict(_DEFAULT_ENDPOINT_PROBE_CONFIG)
+    _performance_config = copy.deepcopy(_DEFAULT_PERFORMANCE_CONFIG)
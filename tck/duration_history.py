@@ -0,0 +1,292 @@
+"""
+Test duration history and duration-aware scheduling for the A2A TCK.
+
+A pytest plugin that records how long every test took (setup, call and teardown)
+in a local SQLite store, and uses that history to:
+
+- split a run into balanced shards (``--tck-shard i/N``): test files are assigned
+  longest-first to the currently lightest shard, so the slow streaming, resilience
+  and TLS files are spread across shards instead of landing together;
+- order the selected tests longest-first (``--tck-longest-first``).
+
+Scheduling works on whole test files: tests in a file keep their relative order and
+always run in the same shard, so module-scoped fixtures and tests that build on
+state created earlier in the same file are unaffected. Tests without history are
+estimated with the mean recorded duration. Shard assignment is deterministic for a
+given history file, so every shard of a CI matrix must use the same history.
+Concurrent shards on one machine pass a frozen copy with ``--tck-shard-history``
+so that durations recorded by shards that finish early cannot change the plan of
+shards that start later.
+
+Usage:
+    pytest -p tck.duration_history --tck-duration-history .tck_cache/durations.sqlite --tck-shard 2/4 ...
+"""
+
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from tck.run_cache import REUSED_PROPERTY
+
+logger = logging.getLogger(__name__)
+
+# Estimated duration (seconds) of a test when no history exists at all
+DEFAULT_TEST_DURATION = 1.0
+
+# Number of most recent runs a test's recorded duration effectively averages over
+HISTORY_WINDOW = 10
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """
+    Parse a shard specification.
+
+    Args:
+        value: ``i/N`` with 1 <= i <= N
+
+    Returns:
+        Tuple of (shard index, shard count)
+
+    Raises:
+        ValueError: If the specification is malformed or out of range
+    """
+    index, sep, count = value.partition("/")
+    if not sep or not index.strip().isdigit() or not count.strip().isdigit():
+        raise ValueError(f"Invalid shard '{value}', expected i/N (e.g. 1/4)")
+    index, count = int(index), int(count)
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{value}', index must be between 1 and N")
+    return index, count
+
+
+def nodeid_file(nodeid: str) -> str:
+    """Test file part of a pytest node id."""
+    return nodeid.split("::", 1)[0]
+
+
+def estimate_durations(nodeids: List[str], history: Dict[str, float]) -> Dict[str, float]:
+    """
+    Estimate test durations from history.
+
+    Args:
+        nodeids: Node ids to estimate
+        history: Recorded durations by node id
+
+    Returns:
+        Mapping of node id to estimated duration in seconds
+    """
+    default = sum(history.values()) / len(history) if history else DEFAULT_TEST_DURATION
+    return {nodeid: history.get(nodeid, default) for nodeid in nodeids}
+
+
+def plan_shards(unit_durations: Dict[str, float], shard_count: int) -> List[List[str]]:
+    """
+    Split scheduling units into balanced shards (longest processing time first).
+
+    Args:
+        unit_durations: Estimated duration by unit (e.g. test file)
+        shard_count: Number of shards
+
+    Returns:
+        List of shards, each a list of units ordered longest-first
+    """
+    shards: List[List[str]] = [[] for _ in range(shard_count)]
+    loads = [0.0] * shard_count
+    # Sort by duration, then name, so every shard computes the same plan
+    for unit in sorted(unit_durations, key=lambda u: (-unit_durations[u], u)):
+        lightest = min(range(shard_count), key=lambda i: (loads[i], i))
+        shards[lightest].append(unit)
+        loads[lightest] += unit_durations[unit]
+    return shards
+
+
+class DurationHistory:
+    """SQLite-backed store of recent test durations keyed by node id and transport set."""
+
+    def __init__(self, path: Path):
+        """
+        Open (or create) the duration history database.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Concurrent pytest processes wait for each other's write transactions
+        self._conn = sqlite3.connect(str(self.path), timeout=30)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS test_durations ("
+                "nodeid TEXT NOT NULL, transports TEXT NOT NULL, duration REAL NOT NULL, "
+                "samples INTEGER NOT NULL, updated_at REAL NOT NULL, PRIMARY KEY (nodeid, transports))"
+            )
+
+    def durations(self, transports: str) -> Dict[str, float]:
+        """
+        Get recorded durations for a transport set.
+
+        Returns:
+            Mapping of node id to duration in seconds
+        """
+        rows = self._conn.execute("SELECT nodeid, duration FROM test_durations WHERE transports = ?", (transports,))
+        return dict(rows.fetchall())
+
+    def record(self, transports: str, durations: Dict[str, float]) -> None:
+        """
+        Fold new durations into the history in a single transaction.
+
+        Each stored duration is a running mean over (at most) the last HISTORY_WINDOW runs.
+
+        Args:
+            transports: Transport set the tests ran against
+            durations: Mapping of node id to measured duration in seconds
+        """
+        now = time.time()
+        with self._conn:
+            for nodeid, duration in durations.items():
+                row = self._conn.execute(
+                    "SELECT duration, samples FROM test_durations WHERE nodeid = ? AND transports = ?",
+                    (nodeid, transports),
+                ).fetchone()
+                if row:
+                    samples = min(row[1] + 1, HISTORY_WINDOW)
+                    duration = row[0] + (duration - row[0]) / samples
+                else:
+                    samples = 1
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO test_durations (nodeid, transports, duration, samples, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (nodeid, transports, duration, samples, now),
+                )
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class DurationSchedulerPlugin:
+    """pytest plugin recording test durations and sharding/ordering tests by them."""
+
+    def __init__(
+        self,
+        config,
+        history: Optional[DurationHistory],
+        shard: Optional[Tuple[int, int]],
+        longest_first: bool,
+        plan_history: Optional[DurationHistory] = None,
+    ):
+        self.config = config
+        self.history = history
+        self.plan_history = plan_history or history
+        self.shard = shard
+        self.longest_first = longest_first
+        transports = config.getoption("--transports", default=None) or ""
+        self.transports = ",".join(sorted(t.strip().lower() for t in transports.split(",") if t.strip()))
+        self._durations: Dict[str, float] = {}
+        self._sharded_out = 0
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        if not self.shard and not self.longest_first:
+            return
+
+        history = self.plan_history.durations(self.transports) if self.plan_history else {}
+        estimates = estimate_durations([item.nodeid for item in items], history)
+        file_durations: Dict[str, float] = {}
+        for item in items:
+            path = nodeid_file(item.nodeid)
+            file_durations[path] = file_durations.get(path, 0.0) + estimates[item.nodeid]
+
+        if self.shard:
+            index, count = self.shard
+            selected_files = plan_shards(file_durations, count)[index - 1]
+        else:
+            selected_files = sorted(file_durations, key=lambda f: (-file_durations[f], f))
+
+        rank = {path: position for position, path in enumerate(selected_files)}
+        selected = [item for item in items if nodeid_file(item.nodeid) in rank]
+        deselected = [item for item in items if nodeid_file(item.nodeid) not in rank]
+        if self.longest_first:
+            # Stable sort keeps the original test order within each file
+            selected.sort(key=lambda item: rank[nodeid_file(item.nodeid)])
+
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            self._sharded_out = len(deselected)
+        items[:] = selected
+        if self.shard:
+            logger.info(
+                f"Shard {self.shard[0]}/{self.shard[1]}: {len(selected)} tests in {len(selected_files)} files "
+                f"(estimated {sum(file_durations[f] for f in selected_files):.1f}s)"
+            )
+
+    def pytest_runtest_logreport(self, report):
+        # Results reused from the run cache did not actually run
+        if any(name == REUSED_PROPERTY for name, _ in report.user_properties):
+            return
+        self._durations[report.nodeid] = self._durations.get(report.nodeid, 0.0) + (report.duration or 0.0)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        if self.history:
+            if self._durations:
+                self.history.record(self.transports, self._durations)
+            self.history.close()
+        if self.plan_history and self.plan_history is not self.history:
+            self.plan_history.close()
+        # A shard that received none of this run's tests has nothing to do; that is not an error
+        if self.shard and exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED and self._sharded_out:
+            session.exitstatus = pytest.ExitCode.OK
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("tck-duration-history", "TCK duration history and sharding")
+    group.addoption(
+        "--tck-duration-history",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Record test durations in (and schedule from) this SQLite history file",
+    )
+    group.addoption(
+        "--tck-shard",
+        action="store",
+        default=None,
+        metavar="i/N",
+        help="Run only shard i of N duration-balanced shards of the selected tests",
+    )
+    group.addoption(
+        "--tck-shard-history",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Plan shards from this read-only history snapshot instead of --tck-duration-history",
+    )
+    group.addoption(
+        "--tck-longest-first",
+        action="store_true",
+        default=False,
+        help="Run the selected test files longest-first according to the duration history",
+    )
+
+
+def pytest_configure(config):
+    history_path = config.getoption("--tck-duration-history")
+    shard_value = config.getoption("--tck-shard")
+    longest_first = config.getoption("--tck-longest-first")
+    if not history_path and not shard_value and not longest_first:
+        return
+
+    try:
+        shard = parse_shard(shard_value) if shard_value else None
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+
+    history = DurationHistory(Path(history_path)) if history_path else None
+    plan_history_path = config.getoption("--tck-shard-history")
+    plan_history = DurationHistory(Path(plan_history_path)) if plan_history_path else None
+    plugin = DurationSchedulerPlugin(config, history, shard, longest_first, plan_history)
+    config.pluginmanager.register(plugin, "tck_duration_history_plugin")
@@ -0,0 +1,104 @@
+"""
+Capture and replay of SUT exchanges for offline re-validation.
+
+A pytest plugin around tck.transport.capture:
+
+- ``--tck-capture PATH`` records every request and response exchanged with the SUT by
+  the transport clients (and the Agent Card) in an exchange archive, test by test;
+- ``--tck-replay PATH`` answers the transport clients from such an archive instead of
+  the network, so that changed validators and equivalence checks can be re-run against
+  a recorded session in seconds without a live SUT.
+
+Recordings are kept per transport set. Replay the archive with the same transport set,
+tests and ``--sut-url`` as the capture; a call the archive cannot answer fails its test
+with a ReplayMissError, and the number of such calls is reported at the end. Tests
+that talk to the SUT without a transport client (raw requests/httpx calls) are not
+recorded and still need a live SUT.
+
+Usage:
+    pytest -p tck.exchange_archive --tck-capture reports/exchanges.sqlite --sut-url ... --transports jsonrpc,grpc
+    pytest -p tck.exchange_archive --tck-replay reports/exchanges.sqlite --sut-url ... --transports jsonrpc,grpc
+"""
+
+import logging
+from pathlib import Path
+from typing import Union
+
+import pytest
+
+import tck.config  # noqa: F401  (must be imported before the transport modules)
+from tck.transport import capture
+from tck.transport.capture import ExchangeRecorder, ExchangeReplayer
+
+logger = logging.getLogger(__name__)
+
+
+class ExchangeArchivePlugin:
+    """pytest plugin recording the exchanges of each test, or replaying them."""
+
+    def __init__(self, session: Union[ExchangeRecorder, ExchangeReplayer]):
+        self.session = session
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        # Before any fixture runs, so session fixtures' calls belong to the first test using them
+        self.session.begin_test(item.nodeid)
+
+    @pytest.hookimpl(hookwrapper=True, trylast=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        yield
+        self.session.end_test()
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        if isinstance(self.session, ExchangeRecorder):
+            self.session.end_test()
+            logger.info(f"Captured {self.session.recorded} SUT exchanges in {self.session.archive.path}")
+        else:
+            logger.info(f"Replayed {self.session.replayed} SUT exchanges from {self.session.archive.path}")
+            if self.session.misses:
+                logger.warning(
+                    f"{len(self.session.misses)} calls had no recorded exchange, e.g. {self.session.misses[0]}; "
+                    "re-capture the archive with the same tests and transports"
+                )
+        capture.stop()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("tck-exchange-archive", "TCK capture and replay of SUT exchanges")
+    group.addoption(
+        "--tck-capture",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Record every exchange with the SUT in this archive (tests recorded again are replaced)",
+    )
+    group.addoption(
+        "--tck-replay",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Answer the transport clients from this archive instead of a live SUT",
+    )
+
+
+def pytest_configure(config):
+    capture_path = config.getoption("--tck-capture")
+    replay_path = config.getoption("--tck-replay")
+    if not capture_path and not replay_path:
+        return
+    if capture_path and replay_path:
+        raise pytest.UsageError("--tck-capture and --tck-replay cannot be used together")
+
+    transports = config.getoption("--transports", default=None) or ""
+    transports = ",".join(sorted(t.strip().lower() for t in transports.split(",") if t.strip()))
+    if capture_path:
+        session = capture.start_capture(Path(capture_path), transports)
+    else:
+        try:
+            session = capture.start_replay(Path(replay_path), transports)
+        except FileNotFoundError as e:
+            raise pytest.UsageError(str(e))
+        if not session.archive.count(transports):
+            logger.warning(f"Exchange archive {replay_path} has no recording for transports '{transports}'")
+    config.pluginmanager.register(ExchangeArchivePlugin(session), "tck_exchange_archive_plugin")
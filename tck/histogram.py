@@ -0,0 +1,201 @@
+"""
+Fixed-memory latency histogram with log-linear buckets (HdrHistogram layout).
+
+LatencyHistogram is the TCK's timing primitive wherever many durations are summarized:
+load runs (tck.load), performance measurements (tck.performance) and the session-wide
+call timing summary (tck.call_timings). Durations are recorded in seconds and counted
+in microsecond buckets whose width grows with the value, so every value is kept to
+``significant_digits`` significant digits however many are recorded:
+
+- memory is fixed by the precision and the highest trackable value (about 190KB of
+  counts for the default 3 digits up to one hour), not by the number of samples;
+- record is O(1): a bucket index from the value's bit length and a shift;
+- histograms with the same layout merge by adding counts, and merging loses nothing:
+  the merged histogram equals one that recorded all values (tck.load_workers relies on
+  this to combine worker processes);
+- to_dict/from_dict serialize the non-empty buckets as plain data (JSON, pickling).
+
+Percentiles use the nearest-rank method and report the highest value equivalent to
+the chosen bucket (so a reported latency is never below the one observed), capped by
+the exact maximum recorded. They are therefore approximate: a reported percentile is
+at most ``relative_error`` (0.1% for 3 digits) above the observed value, which is why
+a 20.000ms sample reads as 20.015ms.
+"""
+
+import math
+from array import array
+from typing import Any, Dict, Iterable, List, Optional
+
+# Microseconds per second: the histogram's unit
+_UNIT = 1_000_000
+
+
+class LatencyHistogram:
+    """Counts of durations in log-linear microsecond buckets."""
+
+    __slots__ = (
+        "significant_digits",
+        "highest",
+        "count",
+        "_min",
+        "_max",
+        "_half_count",
+        "_half_magnitude",
+        "_mask",
+        "_counts",
+    )
+
+    def __init__(self, significant_digits: int = 3, highest_seconds: float = 3600.0):
+        """
+        Args:
+            significant_digits: Precision of the recorded values (1 to 5)
+            highest_seconds: Highest trackable duration; longer ones count as this one
+        """
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits must be between 1 and 5")
+        self.significant_digits = significant_digits
+        self.highest = max(2, int(highest_seconds * _UNIT))
+        # Each power-of-two bucket is split into enough linear sub-buckets for the precision
+        magnitude = math.ceil(math.log2(2 * 10**significant_digits))
+        self._half_magnitude = magnitude - 1
+        self._half_count = 1 << self._half_magnitude
+        self._mask = (1 << magnitude) - 1
+        buckets = 1
+        smallest_untrackable = 1 << magnitude
+        while smallest_untrackable <= self.highest:
+            smallest_untrackable <<= 1
+            buckets += 1
+        self._counts = array("Q", bytes(8 * (buckets + 1) * self._half_count))
+        self.count = 0
+        self._min: Optional[int] = None
+        self._max = 0
+
+    def _index(self, micros: int) -> int:
+        bucket = (micros | self._mask).bit_length() - self._half_magnitude - 1
+        sub_bucket = micros >> bucket
+        return ((bucket + 1) << self._half_magnitude) + sub_bucket - self._half_count
+
+    def _highest_equivalent(self, index: int) -> int:
+        """Highest value counted in the bucket at index."""
+        bucket = (index >> self._half_magnitude) - 1
+        sub_bucket = (index & (self._half_count - 1)) + self._half_count
+        if bucket < 0:
+            # The first half-bucket holds single values
+            return sub_bucket - self._half_count
+        return ((sub_bucket + 1) << bucket) - 1
+
+    def record(self, seconds: float, count: int = 1) -> None:
+        """Count a duration (negative ones as 0, those above the highest trackable as that)."""
+        micros = min(max(0, round(seconds * _UNIT)), self.highest)
+        self._counts[self._index(micros)] += count
+        self.count += count
+        if self._min is None or micros < self._min:
+            self._min = micros
+        if micros > self._max:
+            self._max = micros
+
+    def record_all(self, durations: Iterable[float]) -> "LatencyHistogram":
+        """Count every duration; returns the histogram."""
+        for seconds in durations:
+            self.record(seconds)
+        return self
+
+    def _check_layout(self, other: "LatencyHistogram") -> None:
+        if (other.significant_digits, other.highest) != (self.significant_digits, self.highest):
+            raise ValueError("Histograms with different precision or range cannot be merged")
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Add the counts of a histogram with the same layout; returns this histogram."""
+        self._check_layout(other)
+        if not other.count:
+            return self
+        counts = self._counts
+        for index, count in enumerate(other._counts):
+            if count:
+                counts[index] += count
+        self.count += other.count
+        if self._min is None or other._min < self._min:
+            self._min = other._min
+        self._max = max(self._max, other._max)
+        return self
+
+    def copy(self) -> "LatencyHistogram":
+        """An independent histogram with the same counts."""
+        return LatencyHistogram(self.significant_digits, self.highest / _UNIT).merge(self)
+
+    @property
+    def min(self) -> Optional[float]:
+        """Shortest duration recorded, in seconds (None if empty)."""
+        return None if self._min is None else self._min / _UNIT
+
+    @property
+    def max(self) -> Optional[float]:
+        """Longest duration recorded, in seconds (None if empty)."""
+        return self._max / _UNIT if self.count else None
+
+    @property
+    def relative_error(self) -> float:
+        """Bound on how far above the observed value a reported percentile can be, relative to it."""
+        return 10.0**-self.significant_digits
+
+    def percentiles(self, qs: Iterable[float]) -> List[Optional[float]]:
+        """
+        Nearest-rank percentiles, in seconds, in one pass over the buckets.
+
+        Args:
+            qs: Percentiles between 0 and 100
+
+        Returns:
+            One duration per percentile (None if the histogram is empty)
+        """
+        qs = list(qs)
+        if not self.count:
+            return [None] * len(qs)
+        ranks = sorted((max(1, math.ceil(q / 100 * self.count)), i) for i, q in enumerate(qs))
+        values: List[Optional[float]] = [None] * len(qs)
+        seen = 0
+        pending = iter(ranks)
+        rank, position = next(pending)
+        for index, count in enumerate(self._counts):
+            if not count:
+                continue
+            seen += count
+            while seen >= rank:
+                values[position] = min(self._highest_equivalent(index), self._max) / _UNIT
+                try:
+                    rank, position = next(pending)
+                except StopIteration:
+                    return values
+        return values
+
+    def value_at_percentile(self, q: float) -> Optional[float]:
+        """Nearest-rank percentile q (0 to 100), in seconds (None if empty)."""
+        return self.percentiles([q])[0]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The histogram as plain data: its layout and the counts of its non-empty buckets."""
+        return {
+            "significant_digits": self.significant_digits,
+            "highest_us": self.highest,
+            "min_us": self._min,
+            "max_us": self._max,
+            "counts": {index: count for index, count in enumerate(self._counts) if count},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        """Rebuild a histogram from to_dict (JSON turns the bucket indexes into strings; both work)."""
+        histogram = cls(data["significant_digits"], data["highest_us"] / _UNIT)
+        for index, count in data["counts"].items():
+            histogram._counts[int(index)] += count
+            histogram.count += count
+        if histogram.count:
+            histogram._min = data["min_us"]
+            histogram._max = data["max_us"]
+        return histogram
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"LatencyHistogram(count={self.count}, min={self.min}, max={self.max})"
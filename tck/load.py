@@ -0,0 +1,503 @@
+"""
+Open-loop load generation against the SUT at a constant arrival rate.
+
+ConstantRateLoad issues A2A calls (SendMessage, GetTask, ...) through a transport
+client's async API at a fixed target rate: call ``i`` is due at ``start + i / rate``
+and is started then whether or not earlier calls have completed. Each call's latency
+is measured from that intended send time, not from when it actually started, so the
+time a call spends queued behind a slow SUT (or behind the generator itself falling
+behind) is part of its latency. A closed-loop client that waits for each answer
+before sending the next request slows down with the SUT and hides exactly that delay
+(coordinated omission).
+
+The report compares the target rate with the offered rate (calls actually started
+per second) and the achieved rate (successful calls per second), and summarizes
+latencies per operation (see tck.performance.summarize_latencies). Calls arriving
+while ``max_in_flight`` calls are outstanding are dropped and counted rather than
+delayed, which would close the loop again. Calls still running at the end of the
+drain are cancelled and counted as errors, with their latency until then, so the
+slowest calls are not left out of the percentiles either.
+
+Mixed workloads of multi-step scenarios run on the same open loop (see
+tck.load_scenarios), and tck.load_workers spreads either kind of load over several
+processes. Latencies are counted in fixed-memory histograms (tck.histogram), so long
+runs at high rates keep a constant footprint, and the metrics of several workers merge
+without losing precision.
+
+Usage (see util_scripts/load_generator.py):
+    report = asyncio.run(ConstantRateLoad(client, ["send_message", "get_task"], rate=50, duration=60).run())
+"""
+
+import asyncio
+import itertools
+import time
+import uuid
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence
+
+from tck.histogram import LatencyHistogram
+from tck.performance import summarize_latencies
+
+# Webhook of the push notification configs created by load runs
+LOAD_WEBHOOK_URL = "https://example.com/a2a-tck-load-webhook"
+
+
+class LoadState:
+    """
+    State of the calls of a load run, or of one scenario run within it.
+
+    A scenario run's state has the run-wide state as parent: it keeps the tasks, context
+    and push notification config of its own calls, and falls back to the parent's most
+    recent task when it has not created one.
+    """
+
+    def __init__(self, max_tasks: int = 1000, parent: Optional["LoadState"] = None, context_id: Optional[str] = None):
+        self.task_ids: Deque[str] = deque(maxlen=max_tasks)
+        self.parent = parent
+        self.context_id = context_id
+        self.config_id: Optional[str] = None
+
+    def new_message(self) -> Dict[str, Any]:
+        """A new user text message (in the state's context, if any)."""
+        message = {
+            "messageId": f"load-{uuid.uuid4()}",
+            "role": "ROLE_USER",
+            "parts": [{"text": "Load test message"}],
+        }
+        if self.context_id:
+            message["contextId"] = self.context_id
+        return message
+
+    def remember(self, result: Any) -> Any:
+        """Keep the task ID of a SendMessage result for later task calls (here and in the parent)."""
+        if isinstance(result, dict):
+            task = result.get("task", result)
+            if isinstance(task, dict) and task.get("id"):
+                state = self
+                while state is not None:
+                    state.task_ids.append(task["id"])
+                    state = state.parent
+        return result
+
+    def remember_context(self, result: Any) -> None:
+        """Continue in the context of a SendMessage result if the state has none yet."""
+        if self.context_id is None and isinstance(result, dict):
+            task = result.get("task", result)
+            if isinstance(task, dict):
+                self.context_id = task.get("contextId")
+
+    def task_id(self) -> str:
+        """The most recently created task of this state, or else of its parent."""
+        if self.task_ids:
+            return self.task_ids[-1]
+        if self.parent is not None:
+            return self.parent.task_id()
+        raise LookupError("No task has been created yet")
+
+
+def _checked(result: Any) -> Any:
+    """Turn an error returned as a result into an exception, so the call counts as failed."""
+    if isinstance(result, dict) and "error" in result:
+        raise RuntimeError(f"SUT returned an error: {result['error']}")
+    return result
+
+
+# A load operation: an async call on a client, given the run's state
+LoadOperation = Callable[[Any, LoadState], Awaitable[Any]]
+
+
+async def _send_message(client: Any, state: LoadState) -> Any:
+    result = state.remember(_checked(await client.asend_message(state.new_message())))
+    state.remember_context(result)
+    return result
+
+
+async def _send_streaming_message(client: Any, state: LoadState) -> Any:
+    events = 0
+    async for event in client.send_streaming_message(state.new_message()):
+        _checked(event)
+        if events == 0:
+            state.remember(event)
+            state.remember_context(event)
+        events += 1
+    return events
+
+
+async def _get_task(client: Any, state: LoadState) -> Any:
+    return _checked(await client.aget_task(state.task_id()))
+
+
+async def _list_tasks(client: Any, state: LoadState) -> Any:
+    return _checked(await client.alist_tasks(pageSize=10))
+
+
+async def _cancel_task(client: Any, state: LoadState) -> Any:
+    return _checked(await client.acancel_task(state.task_id()))
+
+
+async def _get_extended_agent_card(client: Any, state: LoadState) -> Any:
+    return _checked(await client.aget_extended_agent_card())
+
+
+async def _create_push_notification_config(client: Any, state: LoadState) -> Any:
+    state.config_id = f"load-{uuid.uuid4()}"
+    return _checked(
+        await client.acreate_task_push_notification_config(
+            {"taskId": state.task_id(), "id": state.config_id, "url": LOAD_WEBHOOK_URL}
+        )
+    )
+
+
+def _config_id(state: LoadState) -> str:
+    if state.config_id is None:
+        raise LookupError("No push notification config has been created in this run")
+    return state.config_id
+
+
+async def _get_push_notification_config(client: Any, state: LoadState) -> Any:
+    return _checked(await client.aget_push_notification_config(state.task_id(), _config_id(state)))
+
+
+async def _list_push_notification_configs(client: Any, state: LoadState) -> Any:
+    return _checked(await client.alist_push_notification_configs(state.task_id()))
+
+
+async def _delete_push_notification_config(client: Any, state: LoadState) -> Any:
+    return _checked(await client.adelete_push_notification_config(state.task_id(), _config_id(state)))
+
+
+# Operations a load run can issue, by A2A method (client method name)
+LOAD_OPERATIONS: Dict[str, LoadOperation] = {
+    "send_message": _send_message,
+    "send_streaming_message": _send_streaming_message,
+    "get_task": _get_task,
+    "list_tasks": _list_tasks,
+    "cancel_task": _cancel_task,
+    "get_extended_agent_card": _get_extended_agent_card,
+    "create_task_push_notification_config": _create_push_notification_config,
+    "get_push_notification_config": _get_push_notification_config,
+    "list_push_notification_configs": _list_push_notification_configs,
+    "delete_push_notification_config": _delete_push_notification_config,
+}
+
+# Operations that need an existing task, created before the run starts in case nothing else creates one
+TASK_OPERATIONS = frozenset(LOAD_OPERATIONS) - {
+    "send_message",
+    "send_streaming_message",
+    "list_tasks",
+    "get_extended_agent_card",
+}
+
+
+class _Stats:
+    """Latencies and failures of one operation or scenario during a run."""
+
+    __slots__ = ("latencies", "service_times", "errors", "dropped", "unfinished")
+
+    def __init__(self):
+        self.latencies = LatencyHistogram()
+        self.service_times = LatencyHistogram()
+        self.errors = 0
+        self.dropped = 0
+        # Calls cancelled at the end of the drain; their latencies are lower bounds
+        self.unfinished = 0
+
+
+class LoadMetrics:
+    """Latencies, errors and drops of a load run, by name (operation or scenario)."""
+
+    def __init__(self, names: Sequence[str] = ()):
+        self._stats: Dict[str, _Stats] = {name: _Stats() for name in names}
+
+    def _get(self, name: str) -> _Stats:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = _Stats()
+        return stats
+
+    def record(self, name: str, latency: float, service_time: float) -> None:
+        """Record a successful call: latency from its intended start, service time from its actual start."""
+        stats = self._get(name)
+        stats.latencies.record(latency)
+        stats.service_times.record(service_time)
+
+    def error(self, name: str) -> None:
+        """Record a failed call."""
+        self._get(name).errors += 1
+
+    def cut_off(self, name: str, latency: float, service_time: float) -> None:
+        """Record a call cancelled before it finished, with its latency and service time so far."""
+        stats = self._get(name)
+        stats.latencies.record(latency)
+        stats.service_times.record(service_time)
+        stats.unfinished += 1
+
+    def drop(self, name: str) -> None:
+        """Record an arrival dropped because too many were outstanding."""
+        self._get(name).dropped += 1
+
+    def export(self) -> Dict[str, Dict[str, Any]]:
+        """
+        The metrics as plain data, to send from a worker process to the one merging them.
+
+        Latencies and service times are exported as histograms (LatencyHistogram.to_dict),
+        which merge without losing precision.
+        """
+        return {
+            name: {
+                "latencies": stats.latencies.to_dict(),
+                "service_times": stats.service_times.to_dict(),
+                "errors": stats.errors,
+                "dropped": stats.dropped,
+                "unfinished": stats.unfinished,
+            }
+            for name, stats in self._stats.items()
+        }
+
+    def merge(self, exported: Dict[str, Dict[str, Any]]) -> None:
+        """Add metrics exported by another run (see export)."""
+        for name, data in exported.items():
+            stats = self._get(name)
+            stats.latencies.merge(LatencyHistogram.from_dict(data["latencies"]))
+            stats.service_times.merge(LatencyHistogram.from_dict(data["service_times"]))
+            stats.errors += data["errors"]
+            stats.dropped += data["dropped"]
+            stats.unfinished += data["unfinished"]
+
+    @property
+    def dropped(self) -> int:
+        """Dropped arrivals of all names."""
+        return sum(stats.dropped for stats in self._stats.values())
+
+    def summaries(self, elapsed: float) -> Dict[str, Dict[str, Any]]:
+        """Summary per name (see summary)."""
+        return {name: self.summary(elapsed, [name]) for name in self._stats}
+
+    def summary(self, elapsed: float, names: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Summary of the given names (all by default), see tck.performance.summarize_latencies.
+
+        Summaries also carry service_p50_ms and service_p99_ms, the latencies measured from
+        the actual start, and the numbers of dropped arrivals and of unfinished calls (cut
+        off at the end of the drain: counted as errors, their latency until then included).
+        """
+        stats = [self._stats[name] for name in (self._stats if names is None else names)]
+        latencies, service_times = LatencyHistogram(), LatencyHistogram()
+        for s in stats:
+            latencies.merge(s.latencies)
+            service_times.merge(s.service_times)
+        unfinished = sum(s.unfinished for s in stats)
+        summary = summarize_latencies(latencies, elapsed, sum(s.errors for s in stats), unfinished)
+        service = summarize_latencies(service_times, elapsed)
+        summary["service_p50_ms"] = service["p50_ms"]
+        summary["service_p99_ms"] = service["p99_ms"]
+        summary["dropped"] = sum(s.dropped for s in stats)
+        summary["unfinished"] = unfinished
+        return summary
+
+
+async def timed_call(metrics: LoadMetrics, name: str, call: Awaitable[Any], intended: Optional[float] = None) -> bool:
+    """
+    Await one call and record it under name.
+
+    Args:
+        metrics: Metrics of the run
+        name: Operation the call belongs to
+        call: The call
+        intended: When the call was due (for its latency); defaults to when it started
+
+    Returns:
+        Whether the call succeeded
+    """
+    started = time.perf_counter()
+    try:
+        await call
+    except Exception:
+        metrics.error(name)
+        return False
+    except asyncio.CancelledError:
+        # Cut off at the end of the drain: leaving it out would drop exactly the slowest calls
+        cancelled = time.perf_counter()
+        metrics.cut_off(name, cancelled - (started if intended is None else intended), cancelled - started)
+        raise
+    finished = time.perf_counter()
+    metrics.record(name, finished - (started if intended is None else intended), finished - started)
+    return True
+
+
+async def run_open_loop(
+    rate: float,
+    duration: float,
+    arrival: Callable[[float], Awaitable[Any]],
+    drop: Callable[[], None],
+    max_in_flight: int = 1000,
+    drain_timeout: float = 30.0,
+) -> Dict[str, Any]:
+    """
+    Start ``rate * duration`` arrivals on a fixed schedule, whatever earlier ones are doing.
+
+    Args:
+        rate: Arrivals per second
+        duration: Seconds during which arrivals start
+        arrival: Called with the intended start of an arrival; returns the work to start
+        drop: Called instead of arrival while max_in_flight arrivals are outstanding
+        max_in_flight: Outstanding arrivals above which new ones are dropped
+        drain_timeout: Seconds to wait for outstanding arrivals once all have started
+
+    Returns:
+        Dictionary with issued, unfinished (cancelled after drain_timeout, once they
+        have recorded themselves), offered_rate and elapsed (seconds from the first
+        arrival until all finished)
+    """
+    in_flight = set()
+    issued = 0
+    start = time.perf_counter()
+    for i in range(int(rate * duration)):
+        intended = start + i / rate
+        delay = intended - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if len(in_flight) >= max_in_flight:
+            drop()
+            continue
+        task = asyncio.ensure_future(arrival(intended))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+        issued += 1
+    # The issuing window is the whole duration, unless the generator fell behind it
+    issue_elapsed = max(time.perf_counter() - start, duration)
+
+    unfinished = 0
+    if in_flight:
+        _, pending = await asyncio.wait(set(in_flight), timeout=drain_timeout)
+        unfinished = len(pending)
+        for task in pending:
+            task.cancel()
+        # Let the cancelled arrivals record themselves before the report is made
+        await asyncio.gather(*pending, return_exceptions=True)
+    return {
+        "issued": issued,
+        "unfinished": unfinished,
+        "offered_rate": round(issued / issue_elapsed, 2),
+        "elapsed": time.perf_counter() - start,
+    }
+
+
+class ConstantRateLoad:
+    """Open-loop load of A2A calls at a constant arrival rate."""
+
+    def __init__(
+        self,
+        client: Any,
+        operations: Sequence[str],
+        rate: float,
+        duration: float,
+        max_in_flight: int = 1000,
+        drain_timeout: float = 30.0,
+    ):
+        """
+        Args:
+            client: Transport client (BaseTransportClient) the calls go through
+            operations: Operations (keys of LOAD_OPERATIONS) issued in turn, one per arrival
+            rate: Target arrival rate, in calls per second
+            duration: Seconds during which calls are issued
+            max_in_flight: Outstanding calls above which new arrivals are dropped
+            drain_timeout: Seconds to wait for outstanding calls once all are issued
+        """
+        unknown = [name for name in operations if name not in LOAD_OPERATIONS]
+        if unknown or not operations:
+            raise ValueError(f"Unknown load operations {unknown}; expected some of {sorted(LOAD_OPERATIONS)}")
+        if rate <= 0 or duration <= 0:
+            raise ValueError("rate and duration must be positive")
+        self.client = client
+        self.operations = list(operations)
+        self.rate = rate
+        self.duration = duration
+        self.max_in_flight = max_in_flight
+        self.drain_timeout = drain_timeout
+        self.state = LoadState()
+        self.metrics = LoadMetrics(self.operations)
+
+    async def run(self, before_start: Optional[Callable[[], Awaitable[Any]]] = None) -> Dict[str, Any]:
+        """
+        Issue the calls and wait for them to complete.
+
+        Args:
+            before_start: Awaited once the run is ready, right before the first call is due
+
+        Returns:
+            Dictionary with target_rate, offered_rate, achieved_rate (calls/s), issued,
+            dropped, unfinished, elapsed, the summary of all calls ("all") and one per
+            operation ("operations"), see LoadMetrics.summary
+        """
+        if TASK_OPERATIONS.intersection(self.operations):
+            # Task calls need a task to ask for
+            await _send_message(self.client, self.state)
+        if before_start is not None:
+            await before_start()
+
+        names = itertools.cycle(self.operations)
+
+        def arrival(intended: float) -> Awaitable[bool]:
+            name = next(names)
+            return timed_call(self.metrics, name, LOAD_OPERATIONS[name](self.client, self.state), intended)
+
+        run = await run_open_loop(
+            self.rate,
+            self.duration,
+            arrival,
+            lambda: self.metrics.drop(next(names)),
+            self.max_in_flight,
+            self.drain_timeout,
+        )
+        return self.report(run)
+
+    def export_metrics(self) -> Dict[str, Any]:
+        """The run's metrics as plain data (see LoadMetrics.export)."""
+        return {"operations": self.metrics.export()}
+
+    def merge_metrics(self, exported: Dict[str, Any]) -> None:
+        """Add the metrics of another run of the same load (see export_metrics)."""
+        self.metrics.merge(exported["operations"])
+
+    def report(self, run: Dict[str, Any]) -> Dict[str, Any]:
+        """The report of a run, given the result of run_open_loop (see run)."""
+        overall = self.metrics.summary(run["elapsed"])
+        return {
+            "target_rate": self.rate,
+            "offered_rate": run["offered_rate"],
+            "achieved_rate": overall["throughput"],
+            "issued": run["issued"],
+            "dropped": self.metrics.dropped,
+            "unfinished": run["unfinished"],
+            "elapsed": round(run["elapsed"], 3),
+            "all": overall,
+            "operations": self.metrics.summaries(run["elapsed"]),
+        }
+
+
+def _format_rows(kind: str, rows: List) -> List[str]:
+    # The precision of the histogram percentiles, the same for every row
+    precision = rows[-1][1].get("precision_pct") if rows else None
+    title = f"{kind} (ms, ±{precision:g}%)" if precision is not None else f"{kind} (ms)"
+    lines = [f"{title:<40} {'calls':>7} {'errors':>7} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9} {'svc p99':>9}"]
+    for name, s in rows:
+        latencies = "".join(
+            f" {s[key]:>9.1f}" if s[key] is not None else f" {'-':>9}"
+            for key in ("p50_ms", "p95_ms", "p99_ms", "max_ms", "service_p99_ms")
+        )
+        lines.append(f"{name[:40]:<40} {s['calls']:>7} {s['errors']:>7}{latencies}")
+    return lines
+
+
+def format_load_report(report: Dict[str, Any]) -> str:
+    """Render a load report as fixed-width tables: scenarios (if any), then operations and a total line."""
+    lines = [
+        f"target {report['target_rate']:.1f}/s, offered {report['offered_rate'] or 0:.1f}/s, "
+        f"achieved {report['achieved_rate'] or 0:.1f}/s over {report['elapsed']:.1f}s "
+        f"({report['issued']} issued, {report['dropped']} dropped, {report['unfinished']} unfinished)",
+    ]
+    if "scenarios" in report:
+        lines.extend(_format_rows("scenario", list(report["scenarios"].items())))
+    lines.extend(_format_rows("operation", list(report["operations"].items()) + [("all", report["all"])]))
+    return "\n".join(lines)
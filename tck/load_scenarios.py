@@ -0,0 +1,284 @@
+"""
+Weighted mixed-workload scenarios for load runs.
+
+A scenario file (YAML, see load_scenarios/) describes a traffic mix: scenario runs
+start on an open loop at ``rate`` per second for ``duration`` seconds (see
+tck.load.run_open_loop), and each run picks one scenario by weight and performs its
+steps in order through a transport client, like one user session:
+
+    name: production_mix
+    rate: 20              # scenario runs started per second
+    duration: 60          # seconds
+    scenarios:
+      - name: chat
+        weight: 60
+        context: run      # messages of a run continue one conversation
+        steps:
+          - send_message
+          - op: get_task
+            repeat: 3     # call it 3 times...
+            think: 1.0    # ...pausing 1s after each call
+
+Steps name an operation of tck.load.LOAD_OPERATIONS. ``context`` chooses how messages
+are grouped into conversations: ``run`` (default) continues the context of the run's
+first message, ``scenario`` makes all runs of the scenario share a pool of
+``contexts`` conversations, and ``none`` starts a new one with every message. Task
+and push notification calls use the run's latest task, or the most recently created
+task of the whole load when the run has not created one.
+
+The report has one latency summary per operation and one per scenario. A scenario
+run's latency counts from when it was due, and includes its think times; its first
+call's latency also counts from when the run was due, later calls' from when they
+started.
+"""
+
+import asyncio
+import itertools
+import random
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+import yaml
+
+from tck.load import (
+    LOAD_OPERATIONS,
+    TASK_OPERATIONS,
+    LoadMetrics,
+    LoadState,
+    run_open_loop,
+    timed_call,
+)
+
+CONTEXT_MODES = ("run", "scenario", "none")
+
+
+class ScenarioStep:
+    """One step of a scenario: an operation, called ``repeat`` times with ``think`` seconds after each call."""
+
+    __slots__ = ("operation", "repeat", "think")
+
+    def __init__(self, operation: str, repeat: int = 1, think: float = 0.0):
+        if operation not in LOAD_OPERATIONS:
+            raise ValueError(f"Unknown operation '{operation}'; expected one of {sorted(LOAD_OPERATIONS)}")
+        if repeat < 1 or think < 0:
+            raise ValueError(f"Step '{operation}' needs repeat >= 1 and think >= 0")
+        self.operation = operation
+        self.repeat = repeat
+        self.think = think
+
+
+class LoadScenario:
+    """A weighted sequence of steps, performed as one user session per run."""
+
+    def __init__(self, name: str, weight: float, steps: List[ScenarioStep], context: str = "run", contexts: int = 1):
+        if weight <= 0:
+            raise ValueError(f"Scenario '{name}' needs a positive weight")
+        if not steps:
+            raise ValueError(f"Scenario '{name}' has no steps")
+        if context not in CONTEXT_MODES:
+            raise ValueError(f"Scenario '{name}' has context '{context}'; expected one of {CONTEXT_MODES}")
+        self.name = name
+        self.weight = weight
+        self.steps = steps
+        self.context = context
+        # Shared conversations of context "scenario", filled by the first run using each
+        self._contexts: List[Optional[str]] = [None] * max(1, contexts)
+        self._next_context: Iterator[int] = itertools.cycle(range(len(self._contexts)))
+
+    @property
+    def operations(self) -> List[str]:
+        """Operations the scenario calls, in order."""
+        return [step.operation for step in self.steps]
+
+    def start_run(self, parent: LoadState) -> Tuple[LoadState, Optional[int]]:
+        """State of a new run of the scenario, and the shared conversation slot it uses (if any)."""
+        slot = next(self._next_context) if self.context == "scenario" else None
+        return LoadState(parent=parent, context_id=self._contexts[slot] if slot is not None else None), slot
+
+    def end_run(self, state: LoadState, slot: Optional[int]) -> None:
+        """Keep the conversation a run started, for the next runs sharing its slot."""
+        if slot is not None and self._contexts[slot] is None:
+            self._contexts[slot] = state.context_id
+
+
+class LoadMix:
+    """A traffic mix: weighted scenarios started at a constant rate."""
+
+    def __init__(self, name: str, rate: float, duration: float, scenarios: List[LoadScenario], max_in_flight: int = 1000):
+        if not scenarios:
+            raise ValueError(f"Load mix '{name}' has no scenarios")
+        if rate <= 0 or duration <= 0:
+            raise ValueError(f"Load mix '{name}' needs a positive rate and duration")
+        names = [scenario.name for scenario in scenarios]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Load mix '{name}' has duplicate scenario names")
+        self.name = name
+        self.rate = rate
+        self.duration = duration
+        self.scenarios = scenarios
+        self.max_in_flight = max_in_flight
+
+    def shares(self) -> Dict[str, float]:
+        """Share of runs each scenario gets."""
+        total = sum(scenario.weight for scenario in self.scenarios)
+        return {scenario.name: scenario.weight / total for scenario in self.scenarios}
+
+
+def _parse_step(raw: Union[str, Dict[str, Any]]) -> ScenarioStep:
+    if isinstance(raw, str):
+        return ScenarioStep(raw)
+    if not isinstance(raw, dict) or "op" not in raw:
+        raise ValueError(f"Invalid step {raw!r}: expected an operation name or a mapping with 'op'")
+    unknown = set(raw) - {"op", "repeat", "think"}
+    if unknown:
+        raise ValueError(f"Step '{raw['op']}' has unknown keys {sorted(unknown)}")
+    return ScenarioStep(raw["op"], int(raw.get("repeat", 1)), float(raw.get("think", 0.0)))
+
+
+def parse_load_mix(data: Dict[str, Any]) -> LoadMix:
+    """
+    Build a load mix from a parsed scenario file.
+
+    Raises:
+        ValueError: If the description is invalid
+    """
+    if not isinstance(data, dict):
+        raise ValueError("A load mix must be a mapping")
+    scenarios = []
+    for raw in data.get("scenarios") or []:
+        if not isinstance(raw, dict) or "name" not in raw:
+            raise ValueError(f"Invalid scenario {raw!r}: expected a mapping with a 'name'")
+        scenarios.append(
+            LoadScenario(
+                str(raw["name"]),
+                float(raw.get("weight", 1)),
+                [_parse_step(step) for step in raw.get("steps") or []],
+                raw.get("context", "run"),
+                int(raw.get("contexts", 1)),
+            )
+        )
+    return LoadMix(
+        str(data.get("name", "load")),
+        float(data.get("rate", 10)),
+        float(data.get("duration", 30)),
+        scenarios,
+        int(data.get("max_in_flight", 1000)),
+    )
+
+
+def load_mix_file(path: Union[str, Path]) -> LoadMix:
+    """
+    Read a load mix from a YAML scenario file.
+
+    Raises:
+        ValueError: If the file is not valid YAML or not a valid load mix
+    """
+    with open(path, "r") as f:
+        try:
+            data = yaml.safe_load(f)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML in {path}: {e}") from e
+    return parse_load_mix(data)
+
+
+class ScenarioLoad:
+    """Open-loop load of weighted scenario runs."""
+
+    def __init__(self, client: Any, mix: LoadMix, seed: Optional[int] = None, drain_timeout: float = 30.0):
+        """
+        Args:
+            client: Transport client (BaseTransportClient) the calls go through
+            mix: The traffic mix
+            seed: Seed of the scenario choice, for repeatable mixes
+            drain_timeout: Seconds to wait for outstanding runs once all have started
+        """
+        self.client = client
+        self.mix = mix
+        self.drain_timeout = drain_timeout
+        self.state = LoadState()
+        self.operation_metrics = LoadMetrics()
+        self.scenario_metrics = LoadMetrics([scenario.name for scenario in mix.scenarios])
+        self._random = random.Random(seed)
+
+    def _choose(self) -> LoadScenario:
+        return self._random.choices(self.mix.scenarios, weights=[s.weight for s in self.mix.scenarios])[0]
+
+    async def _perform(self, scenario: LoadScenario, intended: float) -> None:
+        state, slot = scenario.start_run(self.state)
+        due: Optional[float] = intended
+        try:
+            for step in scenario.steps:
+                for _ in range(step.repeat):
+                    if scenario.context == "none":
+                        state.context_id = None
+                    if not await timed_call(
+                        self.operation_metrics, step.operation, LOAD_OPERATIONS[step.operation](self.client, state), due
+                    ):
+                        raise RuntimeError(f"{step.operation} failed")
+                    due = None
+                    if step.think:
+                        await asyncio.sleep(step.think)
+        finally:
+            scenario.end_run(state, slot)
+
+    async def run(self, before_start: Optional[Callable[[], Awaitable[Any]]] = None) -> Dict[str, Any]:
+        """
+        Start the scenario runs and wait for them to complete.
+
+        Args:
+            before_start: Awaited once the load is ready, right before the first run is due
+
+        Returns:
+            Dictionary with name, target_rate, offered_rate, achieved_rate (runs/s), issued,
+            dropped, unfinished, elapsed, the summary of all calls ("all"), one per operation
+            ("operations") and one per scenario ("scenarios", with its share of the runs),
+            see LoadMetrics.summary
+        """
+        if any(TASK_OPERATIONS.intersection(scenario.operations) for scenario in self.mix.scenarios):
+            # Runs that do not create a task use the most recent one
+            await LOAD_OPERATIONS["send_message"](self.client, self.state)
+        if before_start is not None:
+            await before_start()
+
+        def arrival(intended: float):
+            scenario = self._choose()
+            return timed_call(self.scenario_metrics, scenario.name, self._perform(scenario, intended), intended)
+
+        run = await run_open_loop(
+            self.mix.rate,
+            self.mix.duration,
+            arrival,
+            lambda: self.scenario_metrics.drop(self._choose().name),
+            self.mix.max_in_flight,
+            self.drain_timeout,
+        )
+        return self.report(run)
+
+    def export_metrics(self) -> Dict[str, Any]:
+        """The run's metrics as plain data (see LoadMetrics.export)."""
+        return {"operations": self.operation_metrics.export(), "scenarios": self.scenario_metrics.export()}
+
+    def merge_metrics(self, exported: Dict[str, Any]) -> None:
+        """Add the metrics of another run of the same mix (see export_metrics)."""
+        self.operation_metrics.merge(exported["operations"])
+        self.scenario_metrics.merge(exported["scenarios"])
+
+    def report(self, run: Dict[str, Any]) -> Dict[str, Any]:
+        """The report of a run, given the result of tck.load.run_open_loop (see run)."""
+        elapsed = run["elapsed"]
+        scenarios = self.scenario_metrics.summaries(elapsed)
+        for name, share in self.mix.shares().items():
+            scenarios[name]["share"] = round(share, 4)
+        return {
+            "name": self.mix.name,
+            "target_rate": self.mix.rate,
+            "offered_rate": run["offered_rate"],
+            "achieved_rate": self.scenario_metrics.summary(elapsed)["throughput"],
+            "issued": run["issued"],
+            "dropped": self.scenario_metrics.dropped,
+            "unfinished": run["unfinished"],
+            "elapsed": round(elapsed, 3),
+            "all": self.operation_metrics.summary(elapsed),
+            "operations": self.operation_metrics.summaries(elapsed),
+            "scenarios": scenarios,
+        }
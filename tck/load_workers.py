@@ -0,0 +1,198 @@
+"""
+Open-loop load spread over several worker processes.
+
+One process cannot saturate a SUT: JSON encoding, protobuf conversion and validation
+in tck.transport are CPU-bound and share one interpreter lock. run_load_workers starts
+``workers`` processes, each with its own TransportManager, client and event loop,
+running the same load (tck.load.ConstantRateLoad, or a tck.load_scenarios mix) at
+``rate / workers``. The workers start together once all have discovered the SUT, and
+worker ``i`` shifts its schedule by ``i / rate`` so their arrivals interleave into one
+stream at the full rate.
+
+Each worker sends its metrics back as latency histograms (see tck.load.LoadMetrics.export);
+the coordinator merges them into one report with the same fields as a single-process
+run. Merging histograms loses nothing, so its percentiles are those of one histogram
+of all workers' calls.
+
+Worker processes are spawned rather than forked, so they do not inherit the parent's
+connection pools and threads; they read the TCK configuration from the environment.
+"""
+
+import asyncio
+import math
+import multiprocessing
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import tck.config  # noqa: F401  (must be imported before the transport modules)
+from tck.load import ConstantRateLoad
+from tck.load_scenarios import ScenarioLoad, load_mix_file
+from tck.transport.base_client import TransportType
+from tck.transport.transport_manager import TransportManager
+
+# Seconds workers wait for each other to be ready before giving up
+WORKER_START_TIMEOUT = 60.0
+
+
+def _make_load(spec: Dict[str, Any], client: Any, share: float = 1.0):
+    """
+    The load described by spec, scaled to a share of its rate and max_in_flight.
+
+    Workers run their share through their client; the coordinator's full-size copy,
+    without a client, only merges their metrics into the report.
+    """
+    if spec["scenario"]:
+        mix = load_mix_file(spec["scenario"])
+        for option in ("rate", "duration", "max_in_flight"):
+            if spec[option] is not None:
+                setattr(mix, option, spec[option])
+        mix.rate *= share
+        mix.max_in_flight = max(1, math.ceil(mix.max_in_flight * share))
+        return ScenarioLoad(client, mix, seed=spec["seed"])
+    return ConstantRateLoad(
+        client,
+        spec["operations"],
+        spec["rate"] * share,
+        spec["duration"],
+        max_in_flight=max(1, math.ceil((spec["max_in_flight"] or 1000) * share)),
+    )
+
+
+async def _run_worker(spec: Dict[str, Any], index: int, workers: int, barrier: Any) -> Dict[str, Any]:
+    manager = TransportManager(sut_base_url=spec["sut_url"])
+    try:
+        if not manager.discover_transports():
+            raise RuntimeError(f"Could not discover transports from {spec['sut_url']}")
+        transport = spec["transport"]
+        client = manager.get_transport_client(TransportType(transport) if transport else None)
+        if spec["seed"] is not None:
+            spec = dict(spec, seed=spec["seed"] + index)
+        load = _make_load(spec, client, 1 / workers)
+        total_rate = (load.mix.rate if isinstance(load, ScenarioLoad) else load.rate) * workers
+
+        async def before_start():
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, barrier.wait, WORKER_START_TIMEOUT)
+            # Interleave this worker's arrivals with the others'
+            await asyncio.sleep(index / total_rate)
+
+        try:
+            report = await load.run(before_start)
+        finally:
+            aclose = getattr(client, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        run = {key: report[key] for key in ("issued", "unfinished", "offered_rate", "elapsed")}
+        return {"run": run, "metrics": load.export_metrics()}
+    finally:
+        manager.close()
+
+
+def _worker_main(spec: Dict[str, Any], index: int, workers: int, barrier: Any, results: Any) -> None:
+    """Entry point of a worker process: run its share of the load and put its result on the queue."""
+    try:
+        result = asyncio.run(_run_worker(spec, index, workers, barrier))
+    except threading.BrokenBarrierError:
+        result = {"error": "the workers did not all get ready in time"}
+    except Exception as e:
+        # Release the workers waiting for this one
+        barrier.abort()
+        result = {"error": f"{type(e).__name__}: {e}"}
+    results.put((index, result))
+
+
+def merge_worker_runs(runs: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine the open-loop results of workers running at the same time (see tck.load.run_open_loop)."""
+    return {
+        "issued": sum(run["issued"] for run in runs),
+        "unfinished": sum(run["unfinished"] for run in runs),
+        "offered_rate": round(sum(run["offered_rate"] for run in runs), 2),
+        "elapsed": max(run["elapsed"] for run in runs),
+    }
+
+
+def run_load_workers(
+    sut_url: str,
+    workers: int,
+    transport: Optional[str] = None,
+    operations: Optional[List[str]] = None,
+    scenario: Optional[str] = None,
+    rate: Optional[float] = None,
+    duration: Optional[float] = None,
+    max_in_flight: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Run a load from several processes and merge their metrics.
+
+    Args:
+        sut_url: Base URL of the SUT
+        workers: Number of worker processes
+        transport: Transport to load (TransportType value; default: the selected one)
+        operations: Operations issued in turn, without a scenario (see ConstantRateLoad)
+        scenario: YAML traffic mix to run instead of operations (see tck.load_scenarios)
+        rate: Total target rate; defaults to the scenario file's (required without one)
+        duration: Seconds to issue calls for; defaults to the scenario file's
+        max_in_flight: Total outstanding calls above which arrivals are dropped
+        seed: Seed of the scenario choice (worker i uses seed + i)
+
+    Returns:
+        The merged report (see ConstantRateLoad.run or ScenarioLoad.run), with "workers"
+        set to the number of worker processes
+
+    Raises:
+        RuntimeError: If a worker fails
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if scenario is None and (not operations or rate is None or duration is None):
+        raise ValueError("Without a scenario, operations, rate and duration are required")
+    spec = {
+        "sut_url": sut_url,
+        "transport": transport,
+        "operations": list(operations or []),
+        "scenario": scenario,
+        "rate": rate,
+        "duration": duration,
+        "max_in_flight": max_in_flight,
+        "seed": seed,
+    }
+    # Validates the operations or scenario file before starting any process
+    coordinator = _make_load(spec, None)
+
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(workers)
+    results = context.Queue()
+    processes = [
+        context.Process(target=_worker_main, args=(spec, index, workers, barrier, results), daemon=True)
+        for index in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    load_duration = duration if duration is not None else coordinator.mix.duration
+    deadline = time.monotonic() + WORKER_START_TIMEOUT + load_duration + 2 * coordinator.drain_timeout
+    outcomes: Dict[int, Dict[str, Any]] = {}
+    try:
+        while len(outcomes) < workers:
+            try:
+                index, outcome = results.get(timeout=max(0.1, deadline - time.monotonic()))
+            except queue.Empty:
+                raise RuntimeError(f"{workers - len(outcomes)} load worker(s) did not report back in time") from None
+            outcomes[index] = outcome
+    finally:
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+    errors = [f"worker {index}: {o['error']}" for index, o in sorted(outcomes.items()) if "error" in o]
+    if errors:
+        raise RuntimeError("Load workers failed: " + "; ".join(errors))
+    for outcome in outcomes.values():
+        coordinator.merge_metrics(outcome["metrics"])
+    report = coordinator.report(merge_worker_runs([outcome["run"] for outcome in outcomes.values()]))
+    report["workers"] = workers
+    return report
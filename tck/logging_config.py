@@ -1,6 +1,9 @@
 import logging
 import sys
 
+from tck import config
+from tck.transport import wire_log
+
 LOG_FORMAT = "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
 LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
 
@@ -14,3 +17,15 @@ def setup_logging(level: str = "INFO"):
         stream=sys.stdout,
         force=True,  # Overwrite any existing logging config
     )
+
+    # Wire records (request/response bodies) are formatted and written by a background thread
+    wire_config = config.get_wire_log_config()
+    wire_handler = logging.StreamHandler(sys.stdout)
+    wire_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATEFMT))
+    wire_log.start_wire_logging(
+        wire_handler,
+        level=wire_config["level"] or level,
+        max_body_bytes=wire_config["max_body_bytes"],
+        sample_after=wire_config["sample_after"],
+        sample_every=wire_config["sample_every"],
+    )
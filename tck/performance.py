@@ -0,0 +1,167 @@
+"""
+Latency and throughput measurement of A2A methods against SLO thresholds.
+
+Used by the performance category (tests/optional/performance/): each A2A method is
+called many times in a row on every declared transport, and the latencies of the
+calls are summarized as p50/p95/p99/max and throughput (calls per second of wall
+time). The summary is checked against the SLO thresholds of the method
+(config.get_performance_config) and attached to the test's report as the
+``performance`` user property, which tck.result_sink copies into the results records
+the compliance report computes the performance score from.
+
+Latencies are counted in a tck.histogram.LatencyHistogram. Percentiles use the
+nearest-rank method and are the upper bound of the histogram bucket holding the
+sample, so they read up to 0.1% (3 significant digits) high. Summaries state this
+as ``precision_pct``, and check_slo only reports a latency above its threshold by
+more than that.
+"""
+
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+
+from tck import config
+from tck.histogram import LatencyHistogram
+
+# Summary keys an SLO threshold can apply to: latency upper bounds, then the others
+LATENCY_KEYS = ("p50_ms", "p95_ms", "p99_ms", "max_ms")
+
+
+def summarize_latencies(
+    latencies: Union[LatencyHistogram, Iterable[float]], elapsed: float, errors: int = 0, unfinished: int = 0
+) -> Dict[str, Any]:
+    """
+    Summarize the latencies of a series of calls.
+
+    Args:
+        latencies: Latencies of the calls that succeeded (and of unfinished ones): a
+            histogram, or durations in seconds
+        elapsed: Wall time of the whole series, in seconds
+        errors: Number of calls that failed
+        unfinished: Calls cut off before they finished, whose latency until then is among
+            ``latencies``: they weigh on the percentiles, and count as errors, not as throughput
+
+    Returns:
+        Dictionary with calls, errors, error_rate, p50_ms, p95_ms, p99_ms, max_ms (None
+        without a successful call), precision_pct (how far above the observed latencies
+        the percentiles can read, in percent) and throughput (successful calls per second)
+    """
+    if not isinstance(latencies, LatencyHistogram):
+        latencies = LatencyHistogram().record_all(latencies)
+    calls = latencies.count + errors
+    errors += unfinished
+    summary: Dict[str, Any] = {
+        "calls": calls,
+        "errors": errors,
+        "error_rate": round(errors / calls, 4) if calls else 0.0,
+    }
+    for key, value in zip(LATENCY_KEYS, latencies.percentiles((50, 95, 99, 100))):
+        summary[key] = round(value * 1000, 3) if value is not None else None
+    summary["precision_pct"] = round(latencies.relative_error * 100, 6)
+    summary["throughput"] = round((latencies.count - unfinished) / elapsed, 2) if elapsed > 0 else None
+    return summary
+
+
+def measure(
+    call: Callable[[], Any], iterations: int, warmup: int = 0, setup: Optional[Callable[[], Any]] = None
+) -> Dict[str, Any]:
+    """
+    Call ``call`` sequentially and summarize its latencies (see summarize_latencies).
+
+    A call that raises counts as an error; its latency is not part of the percentiles.
+
+    Args:
+        call: The operation to measure
+        iterations: Measured calls
+        warmup: Unmeasured calls made first
+        setup: Called before each call, outside its latency (e.g. to create what the call deletes)
+    """
+    for _ in range(warmup):
+        try:
+            if setup is not None:
+                setup()
+            call()
+        except Exception:
+            pass
+
+    latencies = LatencyHistogram()
+    errors = 0
+    # Setup time is left out of the throughput's wall time too
+    setup_time = 0.0
+    started = time.perf_counter()
+    for _ in range(iterations):
+        if setup is not None:
+            setup_started = time.perf_counter()
+            setup()
+            setup_time += time.perf_counter() - setup_started
+        call_started = time.perf_counter()
+        try:
+            call()
+        except Exception:
+            errors += 1
+            continue
+        latencies.record(time.perf_counter() - call_started)
+    return summarize_latencies(latencies, time.perf_counter() - started - setup_time, errors)
+
+
+async def ameasure(call: Callable[[], Awaitable[Any]], iterations: int, warmup: int = 0) -> Dict[str, Any]:
+    """Await ``call`` sequentially and summarize its latencies, like measure does for a synchronous call."""
+    for _ in range(warmup):
+        try:
+            await call()
+        except Exception:
+            pass
+
+    latencies = LatencyHistogram()
+    errors = 0
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        try:
+            await call()
+        except Exception:
+            errors += 1
+            continue
+        latencies.record(time.perf_counter() - call_started)
+    return summarize_latencies(latencies, time.perf_counter() - started, errors)
+
+
+def slo_for(method: str, slo_config: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    SLO thresholds of an A2A method: the "default" thresholds overridden by the method's own.
+
+    Args:
+        method: A2A method (client method name)
+        slo_config: Thresholds per method; defaults to config.get_performance_config()["slo"]
+    """
+    if slo_config is None:
+        slo_config = config.get_performance_config()["slo"]
+    return {**slo_config.get("default", {}), **slo_config.get(method, {})}
+
+
+def check_slo(summary: Dict[str, Any], slo: Dict[str, Any]) -> List[str]:
+    """
+    Check a summary against SLO thresholds.
+
+    Args:
+        summary: Summary from summarize_latencies
+        slo: Thresholds (see slo_for); thresholds that are None are not checked
+
+    Latencies are compared with the summary's precision: one reading above its threshold
+    by no more than precision_pct may have been observed at the threshold, so it passes.
+
+    Returns:
+        One message per violated threshold (empty if the SLO is met)
+    """
+    violations = []
+    precision = summary.get("precision_pct", 0.0)
+    for key in LATENCY_KEYS:
+        limit = slo.get(key)
+        if limit is not None and summary.get(key) is not None and summary[key] > limit * (1 + precision / 100):
+            violations.append(f"{key[:-3]} {summary[key]:.1f}ms (±{precision:g}%) exceeds {limit:.1f}ms")
+    limit = slo.get("min_throughput")
+    if limit is not None and (summary.get("throughput") or 0.0) < limit:
+        violations.append(f"throughput {summary.get('throughput') or 0.0:.2f}/s is below {limit:.2f}/s")
+    limit = slo.get("max_error_rate")
+    if limit is not None and summary["error_rate"] > limit:
+        violations.append(f"error rate {summary['error_rate']:.1%} exceeds {limit:.1%}")
+    return violations
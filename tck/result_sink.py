@@ -0,0 +1,183 @@
+"""
+Streaming JSONL result sink for the A2A TCK.
+
+A pytest plugin that appends one compact JSON record per test to a results file as
+soon as the test finishes, instead of building a whole report in memory and writing
+it at the end of the session. Records carry only what the runner and the compliance
+report need (outcome, duration, transport, markers and a truncated failure message),
+so result files stay small even for verbose runs with captured logs, and everything
+recorded before a crash is still on disk. With tck.call_timings, records also carry
+the test's SUT call timings, and performance tests add their latency measurements
+(see tck.performance).
+
+Usage:
+    pytest -p tck.result_sink --tck-results-jsonl reports/mandatory_results.jsonl ...
+
+The reader side (iter_result_records, aggregate_result_records) consumes the records
+as a stream.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+# Failure messages are truncated to keep records compact
+MAX_MESSAGE_CHARS = 2000
+
+# User property with a test's SUT call timings (set by tck.call_timings), copied into its record
+CALL_TIMINGS_PROPERTY = "call_timings"
+
+# User property with a performance test's latency measurements (see tck.performance), copied into its record
+PERFORMANCE_PROPERTY = "performance"
+
+
+class ResultSink:
+    """pytest plugin writing one JSONL record per finished test."""
+
+    def __init__(self, config, path: Path):
+        self.config = config
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Line buffered so every record reaches the file when it is written
+        self._file = open(self.path, "w", buffering=1)
+        self._transports = config.getoption("--transports", default=None)
+        self._items: Dict[str, Dict[str, Any]] = {}
+        self._pending: Dict[str, Dict[str, Any]] = {}
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        for item in items:
+            callspec = getattr(item, "callspec", None)
+            transport = callspec.params.get("transport") if callspec else None
+            self._items[item.nodeid] = {
+                "transport": str(transport) if transport is not None else self._transports,
+                "markers": sorted({marker.name for marker in item.iter_markers()}),
+            }
+
+    def pytest_runtest_logreport(self, report):
+        record = self._pending.setdefault(report.nodeid, {"outcome": "passed", "duration": 0.0, "message": None})
+        record["duration"] += report.duration or 0.0
+        for name, value in report.user_properties:
+            if name == CALL_TIMINGS_PROPERTY:
+                record["timings"] = value
+            elif name == PERFORMANCE_PROPERTY:
+                record["performance"] = value
+
+        if report.failed:
+            if record["outcome"] not in ("failed", "error"):
+                record["outcome"] = "failed" if report.when == "call" else "error"
+                record["message"] = report.longreprtext[:MAX_MESSAGE_CHARS]
+        elif report.skipped and record["outcome"] == "passed":
+            record["outcome"] = "xfailed" if hasattr(report, "wasxfail") else "skipped"
+        elif report.when == "call" and hasattr(report, "wasxfail"):
+            record["outcome"] = "xpassed"
+
+    def pytest_runtest_logfinish(self, nodeid, location):
+        record = self._pending.pop(nodeid, None)
+        if record is None:
+            return
+        item = self._items.get(nodeid, {})
+        self._file.write(
+            json.dumps(
+                {
+                    "nodeid": nodeid,
+                    "outcome": record["outcome"],
+                    "duration": round(record["duration"], 6),
+                    "transport": item.get("transport", self._transports),
+                    "markers": item.get("markers", []),
+                    "message": record["message"],
+                    **({"timings": record["timings"]} if "timings" in record else {}),
+                    **({"performance": record["performance"]} if "performance" in record else {}),
+                },
+                separators=(",", ":"),
+            )
+            + "\n"
+        )
+
+    def pytest_unconfigure(self, config):
+        self._file.close()
+
+
+def iter_result_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the records of a JSONL results file.
+
+    A truncated last line (e.g. from a crashed run) is skipped.
+
+    Args:
+        path: Results file written by the sink
+
+    Yields:
+        One record dictionary per test
+    """
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping unreadable result record in {path}")
+
+
+def aggregate_result_records(records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Aggregate result records into per-category statistics.
+
+    Args:
+        records: Result records (e.g. from iter_result_records)
+
+    Returns:
+        Dictionary with total, passed, failed (failures and errors), skipped, xfailed
+        and error counts, and per-test details keyed by test function name
+    """
+    counts = {"total": 0, "passed": 0, "failed": 0, "skipped": 0, "xfailed": 0, "xpassed": 0, "error": 0}
+    tests = {}
+    for record in records:
+        outcome = record.get("outcome", "unknown")
+        counts["total"] += 1
+        if outcome in counts:
+            counts[outcome] += 1
+
+        test_name = record.get("nodeid", "").split("::")[-1]  # Get just the test function name
+        tests[test_name] = {
+            "outcome": outcome.upper(),
+            "duration": record.get("duration", 0),
+            "error_message": record.get("message") if outcome == "failed" else None,
+            "markers": record.get("markers", []),
+        }
+        if "performance" in record:
+            tests[test_name]["performance"] = record["performance"]
+
+    return {
+        "total": counts["total"],
+        "passed": counts["passed"],
+        # Combine failed and error into one "failed" category
+        "failed": counts["failed"] + counts["error"],
+        "skipped": counts["skipped"],
+        "xfailed": counts["xfailed"],
+        "error": counts["error"],
+        "tests": tests,
+    }
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--tck-results-jsonl",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Append one JSON record per finished test to this file",
+    )
+
+
+def pytest_configure(config):
+    path: Optional[str] = config.getoption("--tck-results-jsonl")
+    if path:
+        config.pluginmanager.register(ResultSink(config, Path(path)), "tck_result_sink_plugin")
@@ -0,0 +1,227 @@
+"""
+Persistent run cache for incremental TCK sweeps.
+
+Records the outcome of every test together with a hash of its inputs: the SUT's
+Agent Card, the content of the test file (and the conftest.py files that apply to
+it) and the transport set under test. With ``--tck-incremental`` a test whose
+inputs are unchanged and that passed last time is not executed again; it is
+reported as passed straight from the cache. Failed tests, tests whose files
+changed and tests run against a different Agent Card or transport set run as usual.
+
+The cache is a SQLite database, so concurrent pytest processes (run_tck.py --jobs)
+can record into the same file.
+
+Usage:
+    pytest -p tck.run_cache --tck-run-cache .tck_cache/run_cache.sqlite --tck-incremental ...
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+# Marker property attached to reports of tests reused from the cache
+REUSED_PROPERTY = "tck_run_cache"
+
+
+def hash_agent_card(agent_card: Dict) -> str:
+    """Stable hash of an Agent Card (independent of key order)."""
+    canonical = json.dumps(agent_card, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class RunCache:
+    """SQLite-backed store of test outcomes keyed by node id and transport set."""
+
+    def __init__(self, path: Path):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Concurrent pytest processes wait for each other's write transactions
+        self._conn = sqlite3.connect(str(self.path), timeout=30)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS test_results ("
+                "nodeid TEXT NOT NULL, transports TEXT NOT NULL, input_hash TEXT NOT NULL, "
+                "outcome TEXT NOT NULL, recorded_at REAL NOT NULL, PRIMARY KEY (nodeid, transports))"
+            )
+
+    def passed_hashes(self, transports: str) -> Dict[str, str]:
+        """
+        Get the input hashes of tests that passed last time for a transport set.
+
+        Returns:
+            Mapping of node id to the input hash recorded with its passing run
+        """
+        rows = self._conn.execute(
+            "SELECT nodeid, input_hash FROM test_results WHERE transports = ? AND outcome = 'passed'",
+            (transports,),
+        )
+        return dict(rows.fetchall())
+
+    def record(self, transports: str, outcomes: Dict[str, tuple]) -> None:
+        """
+        Record test outcomes in a single transaction.
+
+        Args:
+            transports: Transport set the tests ran against
+            outcomes: Mapping of node id to (input hash, outcome)
+        """
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO test_results (nodeid, transports, input_hash, outcome, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(nodeid, transports, input_hash, outcome, now) for nodeid, (input_hash, outcome) in outcomes.items()],
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class RunCachePlugin:
+    """pytest plugin recording outcomes and replaying unchanged passing tests."""
+
+    def __init__(self, config, cache: RunCache, incremental: bool):
+        self.config = config
+        self.cache = cache
+        self.incremental = incremental
+        self.transports = self._transport_set(config)
+        self.agent_card_hash: Optional[str] = None
+        self._file_hashes: Dict[Path, str] = {}
+        self._input_hashes: Dict[str, str] = {}
+        self._reusable: Dict[str, str] = {}
+        self._outcomes: Dict[str, str] = {}
+        self.reused = 0
+
+    @staticmethod
+    def _transport_set(config) -> str:
+        transports = config.getoption("--transports", default=None) or ""
+        return ",".join(sorted(t.strip().lower() for t in transports.split(",") if t.strip()))
+
+    def _fetch_agent_card_hash(self) -> Optional[str]:
+        from tck.agent_card_utils import fetch_agent_card
+
+        sut_url = self.config.getoption("--sut-url", default=None) or os.getenv("SUT_URL")
+        if not sut_url:
+            return None
+        card = fetch_agent_card(sut_url)
+        return hash_agent_card(card) if card is not None else None
+
+    def _file_hash(self, path: Path) -> str:
+        if path not in self._file_hashes:
+            self._file_hashes[path] = hashlib.sha256(path.read_bytes()).hexdigest() if path.exists() else ""
+        return self._file_hashes[path]
+
+    def _input_hash(self, item) -> str:
+        """Hash of everything a test's outcome is assumed to depend on."""
+        test_file = Path(str(item.path))
+        digest = hashlib.sha256()
+        digest.update(self.agent_card_hash.encode("utf-8"))
+        digest.update(self.transports.encode("utf-8"))
+        digest.update(self._file_hash(test_file).encode("utf-8"))
+        # conftest.py files from the test's directory up to the rootdir affect it as well
+        rootdir = Path(str(self.config.rootpath))
+        for directory in test_file.parents:
+            digest.update(self._file_hash(directory / "conftest.py").encode("utf-8"))
+            if directory == rootdir or rootdir not in directory.parents:
+                break
+        return digest.hexdigest()
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        self.agent_card_hash = self._fetch_agent_card_hash()
+        if self.agent_card_hash is None:
+            logger.warning("Run cache disabled for this session: the Agent Card could not be fetched")
+            return
+
+        passed = self.cache.passed_hashes(self.transports) if self.incremental else {}
+        for item in items:
+            input_hash = self._input_hash(item)
+            self._input_hashes[item.nodeid] = input_hash
+            if passed.get(item.nodeid) == input_hash:
+                self._reusable[item.nodeid] = input_hash
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        if item.nodeid not in self._reusable:
+            return None
+
+        # Report the cached pass without running fixtures or the test itself
+        ihook = item.ihook
+        ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        keywords = {name: 1 for name in item.keywords}
+        for when in ("setup", "call", "teardown"):
+            report = pytest.TestReport(
+                item.nodeid,
+                item.location,
+                keywords,
+                "passed",
+                None,
+                when,
+                user_properties=[(REUSED_PROPERTY, "reused")],
+            )
+            ihook.pytest_runtest_logreport(report=report)
+        ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+        self.reused += 1
+        return True
+
+    def pytest_runtest_logreport(self, report):
+        if report.nodeid not in self._input_hashes or report.nodeid in self._reusable:
+            return
+        if report.failed:
+            self._outcomes[report.nodeid] = "failed"
+        elif report.when == "call" and self._outcomes.get(report.nodeid) != "failed":
+            self._outcomes[report.nodeid] = "skipped" if report.skipped else "passed"
+        elif report.skipped and report.nodeid not in self._outcomes:
+            self._outcomes[report.nodeid] = "skipped"
+
+    def pytest_sessionfinish(self, session):
+        outcomes = {nodeid: (self._input_hashes[nodeid], outcome) for nodeid, outcome in self._outcomes.items()}
+        if outcomes:
+            self.cache.record(self.transports, outcomes)
+        self.cache.close()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.incremental:
+            terminalreporter.write_line(f"tck run cache: {self.reused} unchanged passing test(s) reused")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("tck-run-cache", "TCK run cache")
+    group.addoption(
+        "--tck-run-cache",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Record test outcomes and their input hashes in this SQLite run cache",
+    )
+    group.addoption(
+        "--tck-incremental",
+        action="store_true",
+        default=False,
+        help="Skip tests that passed last time and whose inputs are unchanged (requires --tck-run-cache)",
+    )
+
+
+def pytest_configure(config):
+    cache_path = config.getoption("--tck-run-cache")
+    if not cache_path:
+        if config.getoption("--tck-incremental"):
+            raise pytest.UsageError("--tck-incremental requires --tck-run-cache")
+        return
+    plugin = RunCachePlugin(config, RunCache(Path(cache_path)), config.getoption("--tck-incremental"))
+    config.pluginmanager.register(plugin, "tck_run_cache_plugin")
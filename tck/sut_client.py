@@ -1,9 +1,10 @@
 import logging
 from typing import Any, Dict, Optional, Tuple, Union, cast
 
-import requests
+import httpx
 
 from tck import config
+from tck.transport.http_pool import pooled_client
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +12,8 @@ logger = logging.getLogger(__name__)
 class SUTClient:
     def __init__(self, base_url: Optional[str] = None):
         self.base_url = base_url or config.get_sut_url()
-        self.session = requests.Session()
+        # httpx client on the shared connection pool
+        self.session = pooled_client(follow_redirects=True)
 
     # Legacy send_json_rpc method removed - use transport-agnostic clients instead
     # See transport_helpers.py for modern alternatives
@@ -35,10 +37,10 @@ class SUTClient:
         logger.info(f"Sending raw data to {self.base_url}: {raw_data}")
 
         try:
-            response = self.session.post(self.base_url, data=raw_data, headers=headers, timeout=10)
+            response = self.session.post(self.base_url, content=raw_data, headers=headers, timeout=10)
             logger.info(f"SUT responded with {response.status_code}: {response.text}")
             return response.status_code, response.text
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"HTTP request failed: {e}")
             raise
 
@@ -65,7 +67,7 @@ class SUTClient:
             logger.info(f"SUT responded with {response.status_code}: {response.text}")
             response.raise_for_status()
             return cast(Dict[str, Any], response.json())
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"HTTP error communicating with SUT: {e}")
             raise
         except ValueError as e:
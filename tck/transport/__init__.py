@@ -7,15 +7,39 @@ Supports multiple transport protocols: JSON-RPC 2.0, gRPC, and HTTP+JSON/REST.
 The transport layer abstracts protocol-specific details while maintaining functional
 equivalence across all supported transports.
 
+Transport clients and the TransportManager are imported lazily on first access, so
+a JSON-RPC-only session never imports the gRPC/protobuf stack.
+
 Specification: A2A Protocol v0.3.0 §3 - Transport and Format
 """
 
+import importlib
+
 from .base_client import BaseTransportClient, TransportError, TransportType
-# from .transport_manager import TransportManager  # Will be added in Task 1.3
+
+# Lazily imported exports: name -> defining submodule
+_LAZY_EXPORTS = {
+    "JSONRPCClient": ".jsonrpc_client",
+    "GRPCClient": ".grpc_client",
+    "RESTClient": ".rest_client",
+    "TransportManager": ".transport_manager",
+}
 
 __all__ = [
     "BaseTransportClient",
     "TransportError",
     "TransportType",
-    # "TransportManager",  # Will be added in Task 1.3
+    "JSONRPCClient",
+    "GRPCClient",
+    "RESTClient",
+    "TransportManager",
 ]
+
+
+def __getattr__(name):
+    """Import transport clients on first access (PEP 562)."""
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
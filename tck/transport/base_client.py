@@ -8,12 +8,29 @@ transport protocols (JSON-RPC 2.0, gRPC, HTTP+JSON/REST).
 Specification Reference: A2A Protocol v0.3.0 §3.1 - Transport Layer Requirements
 """
 
+import asyncio
+import contextlib
+import functools
 import logging
+import time
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
+from urllib.parse import urlparse
 
 from tck import config
+from tck.transport.capture import ExchangeRecorder, ExchangeReplayer, get_recorder, get_replayer
+from tck.transport.retry_policy import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    get_circuit_breaker,
+    get_retry_policy,
+    http_failure,
+)
+from tck.transport.schema_registry import get_schema_registry
+from tck.transport.timing import CallTiming, get_timing_collector, timed_processing, timed_stream, timing_call
+from tck.transport.wire_log import WireLog, get_wire_log
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +74,45 @@ class TransportError(Exception):
         return base_msg
 
 
+class A2AValidationError(TransportError):
+    """Raised when a response doesn't conform to the A2A specification."""
+
+    pass
+
+
+# One network call of an exchange: (operation, target, keyword arguments), e.g.
+# ("post", url, {"json": ..., "headers": ...}) for HTTP or ("GetTask", request, {...}) for gRPC
+TransportCall = Tuple[str, Any, Dict[str, Any]]
+
+# Generator that yields the network calls of one A2A method and returns its result
+Exchange = Generator[TransportCall, Any, Any]
+
+
+def exchange_method(func: Callable[..., Exchange]) -> Callable[..., Any]:
+    """
+    Turn a generator method into an A2A method usable both synchronously and asynchronously.
+
+    The decorated body builds the request, yields each network call as a TransportCall
+    and receives its result (or has its exception raised at the yield), then maps the
+    response and errors. It performs no I/O itself: calling the method runs the body with
+    the client's blocking I/O, and the async API (asend_message, aget_task, ...) runs the
+    same body on the client's async I/O.
+
+    Args:
+        func: Generator method implementing the A2A method
+
+    Returns:
+        The synchronous method, with the generator method available as ``.exchange``
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        return self._run_exchange(func(self, *args, **kwargs), func.__name__)
+
+    wrapper.exchange = func
+    return wrapper
+
+
 class BaseTransportClient(ABC):
     """
     Abstract base class for A2A transport client implementations.
@@ -78,6 +134,8 @@ class BaseTransportClient(ABC):
         self.base_url = base_url
         self.transport_type = transport_type
         self.default_headers = {}
+        # Retry policy of this client's calls (None: the session's, see tck.transport.retry_policy)
+        self.retry_policy: Optional[RetryPolicy] = None
         self._logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
 
     @abstractmethod
@@ -353,6 +411,387 @@ class BaseTransportClient(ABC):
         """
         raise NotImplementedError(f"list_tasks is not supported by {self.transport_type.value} transport")
 
+    # Async API: the same A2A methods without blocking a thread
+
+    async def asend_message(
+        self,
+        message: Dict[str, Any],
+        configuration: Optional[Dict[str, Any]] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Async counterpart of send_message."""
+        return await self._acall("send_message", message, configuration, extra_headers=extra_headers)
+
+    async def aget_task(
+        self, task_id: str, history_length: Optional[int] = None, extra_headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Async counterpart of get_task."""
+        return await self._acall("get_task", task_id, history_length=history_length, extra_headers=extra_headers)
+
+    async def acancel_task(self, task_id: str, extra_headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Async counterpart of cancel_task."""
+        return await self._acall("cancel_task", task_id, extra_headers=extra_headers)
+
+    async def acreate_task_push_notification_config(
+        self, task_push_config: Dict[str, Any], extra_headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Async counterpart of create_task_push_notification_config."""
+        return await self._acall("create_task_push_notification_config", task_push_config, extra_headers=extra_headers)
+
+    async def aget_push_notification_config(
+        self, task_id: str, config_id: str, extra_headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Async counterpart of get_push_notification_config."""
+        return await self._acall("get_push_notification_config", task_id, config_id, extra_headers=extra_headers)
+
+    async def alist_push_notification_configs(
+        self, task_id: str, extra_headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Async counterpart of list_push_notification_configs."""
+        return await self._acall("list_push_notification_configs", task_id, extra_headers=extra_headers)
+
+    async def adelete_push_notification_config(
+        self, task_id: str, config_id: str, extra_headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Async counterpart of delete_push_notification_config."""
+        return await self._acall("delete_push_notification_config", task_id, config_id, extra_headers=extra_headers)
+
+    async def aget_extended_agent_card(self, extra_headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Async counterpart of get_extended_agent_card."""
+        return await self._acall("get_extended_agent_card", extra_headers=extra_headers)
+
+    async def alist_tasks(self, **filters: Any) -> Dict[str, Any]:
+        """Async counterpart of list_tasks (takes the same keyword arguments)."""
+        return await self._acall("list_tasks", **filters)
+
+    async def _acall(self, method_name: str, *args, **kwargs) -> Any:
+        """
+        Run an A2A method on the client's async I/O.
+
+        Methods declared with @exchange_method run natively on the event loop; others
+        fall back to running the blocking method in the loop's default executor.
+        """
+        body = getattr(getattr(type(self), method_name, None), "exchange", None)
+        if body is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, functools.partial(getattr(self, method_name), *args, **kwargs))
+        return await self._arun_exchange(body(self, *args, **kwargs), method_name)
+
+    # Exchange drivers (see exchange_method)
+
+    def _perform(self, call: TransportCall) -> Any:
+        """Perform one network call of an exchange with blocking I/O."""
+        raise NotImplementedError(f"{type(self).__name__} does not implement blocking exchange I/O")
+
+    async def _aperform(self, call: TransportCall) -> Any:
+        """Perform one network call of an exchange with async I/O."""
+        raise NotImplementedError(f"{type(self).__name__} does not implement async exchange I/O")
+
+    def _run_exchange(self, exchange: Exchange, method: Optional[str] = None) -> Any:
+        """
+        Drive an exchange to completion with _perform (or the replay archive) and return its result.
+
+        Args:
+            exchange: The exchange
+            method: A2A method (client method name) the exchange implements; calls of
+                    idempotent methods are retried on transient failures
+        """
+        wire = get_wire_log()
+        recorder, replayer = get_recorder(), get_replayer()
+        timings = get_timing_collector() if replayer is None else None
+        try:
+            call = next(exchange)
+            while True:
+                timing = None if timings is None else timings.start(self.transport_type.value, method, self._timing_label(call))
+                try:
+                    if replayer is None:
+                        result = self._perform_with_policy(call, method, wire, timing)
+                    else:
+                        result = self._replay_call(replayer, call)
+                except Exception as e:
+                    if recorder is not None:
+                        self._capture_call(recorder, call, None, e)
+                    with timed_processing(timings, timing):
+                        call = exchange.throw(e)
+                else:
+                    if recorder is not None:
+                        self._capture_call(recorder, call, result, None)
+                    with timed_processing(timings, timing):
+                        call = exchange.send(result)
+        except StopIteration as stop:
+            return stop.value
+
+    async def _arun_exchange(self, exchange: Exchange, method: Optional[str] = None) -> Any:
+        """Drive an exchange to completion with _aperform (or the replay archive) and return its result."""
+        wire = get_wire_log()
+        recorder, replayer = get_recorder(), get_replayer()
+        timings = get_timing_collector() if replayer is None else None
+        try:
+            call = next(exchange)
+            while True:
+                timing = None if timings is None else timings.start(self.transport_type.value, method, self._timing_label(call))
+                try:
+                    if replayer is None:
+                        result = await self._aperform_with_policy(call, method, wire, timing)
+                    else:
+                        result = self._replay_call(replayer, call)
+                except Exception as e:
+                    if recorder is not None:
+                        self._capture_call(recorder, call, None, e)
+                    with timed_processing(timings, timing):
+                        call = exchange.throw(e)
+                else:
+                    if recorder is not None:
+                        self._capture_call(recorder, call, result, None)
+                    with timed_processing(timings, timing):
+                        call = exchange.send(result)
+        except StopIteration as stop:
+            return stop.value
+
+    def _perform_with_policy(
+        self, call: TransportCall, method: Optional[str], wire: WireLog, timing: Optional[CallTiming] = None
+    ) -> Any:
+        """Perform one network call with _perform, under the retry policy and the endpoint's circuit breaker."""
+        policy, breaker = self.retry_policy or get_retry_policy(), self._circuit_breaker()
+        attempt = 1
+        while True:
+            probe = self._before_call(breaker)
+            started = time.perf_counter()
+            result, error = None, None
+            try:
+                with timing_call(timing):
+                    result = self._perform(call)
+            except Exception as e:
+                error = e
+            except BaseException:
+                if probe:
+                    breaker.release_probe()
+                raise
+            transient, sent = self._settle_attempt(call, result, error, started, wire, breaker)
+            if not policy.should_retry(attempt, method, transient, sent):
+                if error is not None:
+                    raise error
+                return result
+            self._logger.warning(f"{method or call[0]} attempt {attempt} failed transiently ({error or 'retryable status'}); retrying")
+            time.sleep(policy.backoff(attempt))
+            attempt += 1
+
+    async def _aperform_with_policy(
+        self, call: TransportCall, method: Optional[str], wire: WireLog, timing: Optional[CallTiming] = None
+    ) -> Any:
+        """Perform one network call with _aperform, under the retry policy and the endpoint's circuit breaker."""
+        policy, breaker = self.retry_policy or get_retry_policy(), self._circuit_breaker()
+        attempt = 1
+        while True:
+            probe = self._before_call(breaker)
+            started = time.perf_counter()
+            result, error = None, None
+            try:
+                with timing_call(timing):
+                    result = await self._aperform(call)
+            except Exception as e:
+                error = e
+            except BaseException:
+                # Cancelled: the call says nothing about the endpoint, so the next one probes it
+                if probe:
+                    breaker.release_probe()
+                raise
+            transient, sent = self._settle_attempt(call, result, error, started, wire, breaker)
+            if not policy.should_retry(attempt, method, transient, sent):
+                if error is not None:
+                    raise error
+                return result
+            self._logger.warning(f"{method or call[0]} attempt {attempt} failed transiently ({error or 'retryable status'}); retrying")
+            await asyncio.sleep(policy.backoff(attempt))
+            attempt += 1
+
+    def _settle_attempt(
+        self,
+        call: TransportCall,
+        result: Any,
+        error: Optional[BaseException],
+        started: float,
+        wire: WireLog,
+        breaker: CircuitBreaker,
+    ) -> Tuple[bool, bool]:
+        """
+        Log one attempt of a network call and update the circuit breaker with its outcome.
+
+        Returns:
+            Tuple of (transient, sent) for RetryPolicy.should_retry
+        """
+        if wire.enabled():
+            self._log_wire_call(call, result, error, time.perf_counter() - started)
+        transient, unreachable, sent = self._classify_failure(result, error)
+        if unreachable:
+            breaker.record_failure()
+        elif sent:
+            breaker.record_success()
+        return transient, sent
+
+    def _classify_failure(self, result: Any, error: Optional[BaseException]) -> Tuple[bool, bool, bool]:
+        """
+        Classify the outcome of one network call for the retry policy and circuit breaker.
+
+        The default handles HTTP calls (see retry_policy.http_failure).
+
+        Returns:
+            Tuple of (transient, unreachable, sent)
+        """
+        return http_failure(result, error)
+
+    def _before_call(self, breaker: CircuitBreaker) -> bool:
+        """
+        Ask the circuit breaker to let a call through.
+
+        Returns:
+            True if the call is the breaker's half-open probe (see CircuitBreaker.before_call)
+
+        Raises:
+            TransportError: If the endpoint's circuit is open (see _circuit_open_error)
+        """
+        try:
+            return breaker.before_call()
+        except CircuitOpenError as e:
+            raise self._circuit_open_error(e) from e
+
+    def _circuit_open_error(self, error: CircuitOpenError) -> TransportError:
+        """The error of a call refused by an open circuit; clients with their own TransportError override this."""
+        return TransportError("SUT endpoint unreachable, call not made", self.transport_type, original_error=error)
+
+    def _circuit_breaker(self) -> CircuitBreaker:
+        """Session-wide circuit breaker of this client's SUT endpoint."""
+        parsed = urlparse(self.base_url)
+        return get_circuit_breaker(f"{parsed.scheme}://{parsed.netloc}")
+
+    def _timing_label(self, call: TransportCall) -> str:
+        """Operation of a call in its CallTiming; the default handles HTTP calls ("POST /path")."""
+        operation, target, _ = call
+        return f"{operation.upper()} {urlparse(target).path or '/'}"
+
+    def _capture_call(self, recorder: ExchangeRecorder, call: TransportCall, result: Any, error: Optional[BaseException]) -> None:
+        """
+        Record one network call of an exchange in the capture archive.
+
+        The default handles HTTP calls answered by an httpx.Response.
+        """
+        recorder.record_http(self.transport_type.value, "call", call, result, error)
+
+    def _replay_call(self, replayer: ExchangeReplayer, call: TransportCall) -> Any:
+        """Answer one network call of an exchange from the replay archive (HTTP by default)."""
+        return replayer.replay_http(self.transport_type.value, "call", call)
+
+    @contextlib.asynccontextmanager
+    async def _open_http_stream(self, http_client, method: str, url: str, **kwargs):
+        """
+        Open a streaming HTTP response (e.g. Server-Sent Events) on http_client.
+
+        The stream is recorded when capturing, and answered from the archive instead of
+        http_client when replaying. Streams are not retried, but go through the circuit breaker.
+        """
+        call = (method, url, kwargs)
+        replayer = get_replayer()
+        if replayer is not None:
+            yield replayer.replay_http(self.transport_type.value, "stream", call)
+            return
+        recorder, timings = get_recorder(), get_timing_collector()
+        timing = None if timings is None else timings.start(self.transport_type.value, None, self._timing_label(call))
+        breaker = self._circuit_breaker()
+        probe = self._before_call(breaker)
+        opened = settled = False
+        try:
+            with timing_call(timing), timed_stream(timings, timing):
+                async with http_client.stream(method, url, **kwargs) as response:
+                    opened = settled = True
+                    breaker.record_success()
+                    if timing is not None:
+                        timing.first_response()
+                    if recorder is not None:
+                        recorder.record_http(self.transport_type.value, "stream", call, response, None)
+                    yield response
+        except Exception as e:
+            # Only a stream that failed to open is recorded as an error; later errors are the consumer's
+            if not opened:
+                # Settle the breaker as _settle_attempt does for other calls
+                _, unreachable, sent = self._classify_failure(None, e)
+                if unreachable:
+                    breaker.record_failure()
+                    settled = True
+                elif sent:
+                    breaker.record_success()
+                    settled = True
+                if recorder is not None:
+                    recorder.record_http(self.transport_type.value, "stream", call, None, e)
+            raise
+        finally:
+            # A probe cancelled or closed before it settled must not keep the circuit half-open
+            if probe and not settled:
+                breaker.release_probe()
+
+    def _log_wire_call(self, call: TransportCall, result: Any, error: Optional[BaseException], elapsed: float) -> None:
+        """
+        Record one network call of an exchange in the wire log.
+
+        The default handles HTTP calls: ("post", url, {"json": ...}) answered by an
+        httpx.Response. Bodies are passed on unrendered (see tck.transport.wire_log).
+        """
+        operation, target, kwargs = call
+        request = kwargs.get("json", kwargs.get("content"))
+        status = getattr(result, "status_code", None)
+        if status is None and error is not None:
+            status = getattr(getattr(error, "response", None), "status_code", None)
+        get_wire_log().call(
+            self.transport_type.value,
+            operation.upper(),
+            target,
+            request=request,
+            response=getattr(result, "content", None),
+            status=status,
+            elapsed=elapsed,
+            error=error,
+        )
+
+    def _validate_result(self, method_name: str, result: Any) -> None:
+        """
+        Validate the result of an A2A method against the A2A JSON schema.
+
+        Args:
+            method_name: Client method name (e.g. "get_task")
+            result: The method's decoded result
+
+        Raises:
+            A2AValidationError: If the result does not conform to the schema
+        """
+        errors = get_schema_registry().result_errors(method_name, result)
+        if errors:
+            more = f" (and {len(errors) - 3} more)" if len(errors) > 3 else ""
+            raise A2AValidationError(
+                f"{method_name} result does not conform to the A2A schema: {'; '.join(errors[:3])}{more}", self.transport_type
+            )
+
+    def probe(self, timeout: float) -> Dict[str, float]:
+        """
+        Check that the SUT endpoint answers, leaving a warm connection for later calls.
+
+        Any response counts: only a failure to connect or a timeout means the endpoint is
+        unreachable. The default handles HTTP clients, with a HEAD request on ``self.client``
+        (which takes its connection from the shared pool).
+
+        Args:
+            timeout: Seconds to wait for the endpoint
+
+        Returns:
+            Phases of the probe in seconds (connect, tls, ttfb; see tck.transport.timing);
+            connect and tls are missing if a pooled connection was reused
+
+        Raises:
+            Exception: If the endpoint could not be reached
+        """
+        timing = CallTiming(self.transport_type.value, None, f"HEAD {urlparse(self.base_url).path or '/'}")
+        with timing_call(timing):
+            self.client.head(self.base_url, timeout=timeout)
+        return dict(timing.phases)
+
     def supports_method(self, method_name: str) -> bool:
         """
         Check if this transport supports a specific method.
@@ -0,0 +1,523 @@
+"""
+Capture and replay of the exchanges between the TCK and the SUT.
+
+In capture mode, every network call of JSONRPCClient, RESTClient and GRPCClient is
+recorded in an exchange archive: HTTP request and response bodies, status and headers,
+the raw bytes of Server-Sent Event streams, and gRPC request and response messages,
+request metadata and error status. In replay mode the clients answer every call from
+the archive instead of the network, so the validators and the transport equivalence
+checks can be re-run against a recorded session without a live SUT.
+
+The archive is a SQLite file with one row per network call, keyed by transport set,
+test node id and sequence number; request and response bodies are stored
+zlib-compressed, and an index on the request content serves lookups outside the
+order of the recording. Capturing a test again replaces its earlier recording.
+
+Replay matches calls as follows:
+
+- the n-th call of a test with a given transport and operation (HTTP method and path,
+  plus the JSON-RPC method; or gRPC method) is answered by the n-th recorded call of
+  that test with the same transport and operation;
+- a call with no such recording (e.g. made by a session fixture recorded under
+  another test) is answered by a recorded call with identical request content;
+- string values generated by the TCK, such as JSON-RPC ids and message ids, differ
+  between the recorded and the replayed request; they are substituted in the replayed
+  response (in gRPC responses only where the length is unchanged, so that the
+  serialized message stays valid).
+
+Values of authentication headers and metadata are never written to the archive.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+from tck import config
+
+logger = logging.getLogger(__name__)
+
+# Headers whose values are replaced before a call is written to the archive
+_SECRET_HEADERS = {"authorization", "proxy-authorization", "cookie", "x-api-key"}
+
+# Response headers that describe the transfer rather than the recorded (decoded) body
+_TRANSFER_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+# Recorded request strings shorter than this are never substituted in responses
+_MIN_SUBSTITUTION_LENGTH = 8
+
+_REDACTED = "<redacted>"
+
+
+class ReplayMissError(LookupError):
+    """Raised on replay for a call that has no recorded exchange."""
+
+
+class ReplayedError(Exception):
+    """A recorded exception that has no equivalent exception class on replay."""
+
+
+def redact_headers(headers: Any) -> List[Tuple[str, str]]:
+    """
+    Header (or gRPC metadata) pairs with the values of authentication headers replaced.
+
+    Args:
+        headers: Mapping or sequence of (name, value) pairs, or None
+
+    Returns:
+        List of (name, value) pairs
+    """
+    if not headers:
+        return []
+    pairs = headers.items() if hasattr(headers, "items") else headers
+    secret = _SECRET_HEADERS | {name.lower() for name in config.get_auth_headers()}
+    return [(str(name), _REDACTED if str(name).lower() in secret else str(value)) for name, value in pairs]
+
+
+def pack_messages(messages: List[bytes]) -> bytes:
+    """Concatenate serialized messages, each prefixed with its 4-byte big-endian length."""
+    return b"".join(struct.pack(">I", len(message)) + message for message in messages)
+
+
+def unpack_messages(data: bytes) -> List[bytes]:
+    """Split data written by pack_messages back into messages."""
+    messages, offset = [], 0
+    while offset < len(data):
+        (size,) = struct.unpack_from(">I", data, offset)
+        offset += 4
+        messages.append(data[offset : offset + size])
+        offset += size
+    return messages
+
+
+def _canonical(value: Any) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _request_key(match_key: str, request: Any) -> str:
+    return hashlib.sha1(match_key.encode("utf-8") + b"\0" + _canonical(request)).hexdigest()
+
+
+def _http_request(call: Tuple[str, str, Dict[str, Any]]) -> Tuple[str, Any]:
+    """Match key and request document of an HTTP call."""
+    operation, url, kwargs = call
+    if "json" in kwargs:
+        body = kwargs["json"]
+    else:
+        body = kwargs.get("content")
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", errors="replace")
+    match_key = f"{operation.upper()} {urlparse(str(url)).path}"
+    if isinstance(body, dict) and isinstance(body.get("method"), str):
+        match_key += f" {body['method']}"
+    request = {"body": body}
+    if kwargs.get("params"):
+        request["params"] = kwargs["params"]
+    return match_key, request
+
+
+class ExchangeArchive:
+    """SQLite-backed archive of recorded exchanges keyed by transport set, node id and sequence."""
+
+    def __init__(self, path: Path):
+        """
+        Open (or create) the archive.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Concurrent pytest processes wait for each other's write transactions
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS exchanges ("
+                "transports TEXT NOT NULL, nodeid TEXT NOT NULL, seq INTEGER NOT NULL, transport TEXT NOT NULL, "
+                "kind TEXT NOT NULL, match_key TEXT NOT NULL, target TEXT NOT NULL, request_key TEXT NOT NULL, "
+                "request BLOB NOT NULL, response BLOB NOT NULL, meta TEXT NOT NULL, recorded_at REAL NOT NULL, "
+                "PRIMARY KEY (transports, nodeid, seq))"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS exchanges_by_request ON exchanges (transports, transport, kind, request_key)"
+            )
+            self._conn.execute("CREATE TABLE IF NOT EXISTS archive_info (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    def store(self, transports: str, nodeid: str, records: List[Dict[str, Any]]) -> None:
+        """
+        Replace the recording of one test in a single transaction.
+
+        Args:
+            transports: Transport set the test ran against
+            nodeid: Test node id
+            records: Recorded calls, in call order
+        """
+        now = time.time()
+        rows = []
+        for seq, record in enumerate(records):
+            response = record["response"]
+            if isinstance(response, list):
+                response = b"".join(response)
+            rows.append(
+                (
+                    transports,
+                    nodeid,
+                    seq,
+                    record["transport"],
+                    record["kind"],
+                    record["match_key"],
+                    record["target"],
+                    _request_key(record["match_key"], record["request"]),
+                    zlib.compress(_canonical(record["request"])),
+                    zlib.compress(response or b""),
+                    json.dumps(record["meta"], separators=(",", ":")),
+                    now,
+                )
+            )
+        with self._conn:
+            self._conn.execute("DELETE FROM exchanges WHERE transports = ? AND nodeid = ?", (transports, nodeid))
+            self._conn.executemany("INSERT INTO exchanges VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def test_records(self, transports: str, nodeid: str) -> List[Dict[str, Any]]:
+        """Recorded calls of one test, in call order."""
+        rows = self._conn.execute(
+            "SELECT transport, kind, match_key, target, request, response, meta FROM exchanges "
+            "WHERE transports = ? AND nodeid = ? ORDER BY seq",
+            (transports, nodeid),
+        )
+        return [self._decode(row) for row in rows.fetchall()]
+
+    def find(self, transports: str, transport: str, kind: str, match_key: str, request: Any) -> Optional[Dict[str, Any]]:
+        """Most recent recorded call with the given request content, from any test."""
+        row = self._conn.execute(
+            "SELECT transport, kind, match_key, target, request, response, meta FROM exchanges "
+            "WHERE transports = ? AND transport = ? AND kind = ? AND request_key = ? ORDER BY recorded_at DESC LIMIT 1",
+            (transports, transport, kind, _request_key(match_key, request)),
+        ).fetchone()
+        return self._decode(row) if row else None
+
+    def count(self, transports: Optional[str] = None) -> int:
+        """Number of recorded calls (of one transport set, or in total)."""
+        if transports is None:
+            return self._conn.execute("SELECT COUNT(*) FROM exchanges").fetchone()[0]
+        return self._conn.execute("SELECT COUNT(*) FROM exchanges WHERE transports = ?", (transports,)).fetchone()[0]
+
+    def set_info(self, key: str, value: Any) -> None:
+        """Store a JSON value describing the recording (e.g. the Agent Card)."""
+        with self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO archive_info (key, value) VALUES (?, ?)", (key, json.dumps(value)))
+
+    def info(self, key: str) -> Any:
+        """Get a value stored with set_info, or None."""
+        row = self._conn.execute("SELECT value FROM archive_info WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def close(self) -> None:
+        self._conn.close()
+
+    @staticmethod
+    def _decode(row) -> Dict[str, Any]:
+        transport, kind, match_key, target, request, response, meta = row
+        return {
+            "transport": transport,
+            "kind": kind,
+            "match_key": match_key,
+            "target": target,
+            "request": json.loads(zlib.decompress(request)),
+            "response": zlib.decompress(response),
+            "meta": json.loads(meta),
+        }
+
+
+class ExchangeRecorder:
+    """Buffers the calls of the running test and writes them to the archive when it ends."""
+
+    def __init__(self, archive: ExchangeArchive, transports: str):
+        self.archive = archive
+        self.transports = transports
+        self.recorded = 0
+        self._nodeid = ""
+        self._records: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def begin_test(self, nodeid: str) -> None:
+        with self._lock:
+            self._nodeid, self._records = nodeid, []
+
+    def end_test(self) -> None:
+        with self._lock:
+            nodeid, records = self._nodeid, self._records
+            self._nodeid, self._records = "", []
+        if records:
+            self.archive.store(self.transports, nodeid, records)
+            self.recorded += len(records)
+
+    def record(
+        self, transport: str, kind: str, match_key: str, target: str, request: Any, response: Any = b"", meta: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Record one call of the running test.
+
+        The record is written when the test ends, so a stream may still fill in its
+        response (a list of chunks) and its ``meta["error"]`` after this returns.
+
+        Args:
+            transport: Transport name
+            kind: "call" for unary calls, "stream" for streaming calls
+            match_key: Operation used to match the call on replay
+            target: URL or gRPC target
+            request: JSON-compatible request document
+            response: Response body, or a list of chunks to be joined
+            meta: JSON-compatible status, headers, metadata and error details
+
+        Returns:
+            The record
+        """
+        record = {
+            "transport": transport,
+            "kind": kind,
+            "match_key": match_key,
+            "target": str(target),
+            "request": request,
+            "response": response,
+            "meta": meta if meta is not None else {},
+        }
+        with self._lock:
+            self._records.append(record)
+        return record
+
+    def record_agent_card(self, agent_card: Dict[str, Any]) -> None:
+        self.archive.set_info("agent_card", agent_card)
+
+    def record_http(
+        self, transport: str, kind: str, call: Tuple[str, str, Dict[str, Any]], response: Optional[httpx.Response], error: Optional[BaseException]
+    ) -> Dict[str, Any]:
+        """
+        Record one HTTP call.
+
+        Unary responses are recorded with their body; streaming responses are recorded
+        when they open, and their body as the chunks read through aiter_bytes.
+        """
+        _, url, kwargs = call
+        match_key, request = _http_request(call)
+        meta: Dict[str, Any] = {"headers": redact_headers(kwargs.get("headers"))}
+        body: Any = b""
+        if response is not None:
+            meta["status"] = response.status_code
+            meta["response_headers"] = [
+                (name, value) for name, value in response.headers.multi_items() if name.lower() not in _TRANSFER_HEADERS
+            ]
+            if kind == "stream":
+                body = []
+                _tee_bytes(response, body)
+            else:
+                body = response.content
+        if error is not None:
+            meta["error"] = error_meta(error)
+        return self.record(transport, kind, match_key, url, request, body, meta)
+
+
+def _tee_bytes(response: httpx.Response, chunks: List[bytes]) -> None:
+    """Append the decoded chunks of a streaming response to chunks as they are read."""
+    aiter_bytes = response.aiter_bytes
+
+    async def recording_aiter_bytes(*args, **kwargs):
+        async for chunk in aiter_bytes(*args, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+
+    response.aiter_bytes = recording_aiter_bytes
+
+
+def error_meta(error: BaseException) -> Dict[str, Any]:
+    """JSON-compatible description of an exception raised by a call."""
+    return {"type": type(error).__name__, "message": str(error)}
+
+
+class ExchangeReplayer:
+    """Answers the calls of the running test from the archive."""
+
+    def __init__(self, archive: ExchangeArchive, transports: str):
+        self.archive = archive
+        self.transports = transports
+        self.replayed = 0
+        self.misses: List[str] = []
+        self._pending: Dict[Tuple[str, str, str], Deque[Dict[str, Any]]] = {}
+        self._substitutions: Dict[str, str] = {}
+        self._nodeid = ""
+        self._lock = threading.Lock()
+
+    def begin_test(self, nodeid: str) -> None:
+        pending: Dict[Tuple[str, str, str], Deque[Dict[str, Any]]] = {}
+        for record in self.archive.test_records(self.transports, nodeid):
+            pending.setdefault((record["transport"], record["kind"], record["match_key"]), deque()).append(record)
+        with self._lock:
+            self._nodeid, self._pending, self._substitutions = nodeid, pending, {}
+
+    def end_test(self) -> None:
+        with self._lock:
+            self._nodeid, self._pending = "", {}
+
+    def agent_card(self) -> Optional[Dict[str, Any]]:
+        return self.archive.info("agent_card")
+
+    def take(self, transport: str, kind: str, match_key: str, request: Any) -> Dict[str, Any]:
+        """
+        Get the recorded call answering a call of the running test.
+
+        Args:
+            transport: Transport name
+            kind: "call" or "stream"
+            match_key: Operation of the call
+            request: JSON-compatible request document
+
+        Returns:
+            The record
+
+        Raises:
+            ReplayMissError: If the archive has no matching call
+        """
+        with self._lock:
+            pending = self._pending.get((transport, kind, match_key))
+            record = pending.popleft() if pending else None
+            nodeid = self._nodeid
+        if record is None:
+            record = self.archive.find(self.transports, transport, kind, match_key, request)
+        if record is None:
+            self.misses.append(f"{nodeid}: {transport} {match_key}")
+            raise ReplayMissError(f"No recorded {transport} exchange for {match_key} in {self.archive.path} ({nodeid or 'outside a test'})")
+        self._learn(record["request"], request)
+        self.replayed += 1
+        return record
+
+    def substitute(self, data: bytes, same_length: bool = False) -> bytes:
+        """
+        Replace recorded request values in a recorded response with the current ones.
+
+        Args:
+            data: Recorded response body
+            same_length: Only substitute values of equal length (serialized protobuf)
+        """
+        with self._lock:
+            substitutions = list(self._substitutions.items())
+        for recorded, current in substitutions:
+            old, new = recorded.encode("utf-8"), current.encode("utf-8")
+            if same_length and len(old) != len(new):
+                continue
+            data = data.replace(old, new)
+        return data
+
+    def replay_http(self, transport: str, kind: str, call: Tuple[str, str, Dict[str, Any]]) -> httpx.Response:
+        """
+        Answer an HTTP call with its recorded response.
+
+        Raises:
+            The recorded transport error, if the call failed when it was recorded
+        """
+        operation, url, _ = call
+        match_key, request = _http_request(call)
+        record = self.take(transport, kind, match_key, request)
+        http_request = httpx.Request(operation.upper(), url)
+        meta = record["meta"]
+        if "status" not in meta:
+            raise _http_error(meta.get("error") or {}, http_request)
+        return httpx.Response(
+            meta["status"],
+            headers=meta.get("response_headers", []),
+            content=self.substitute(record["response"]),
+            request=http_request,
+        )
+
+    def _learn(self, recorded: Any, current: Any) -> None:
+        """Note the string values that differ between the recorded and the current request."""
+        if isinstance(recorded, dict) and isinstance(current, dict):
+            for key in recorded.keys() & current.keys():
+                self._learn(recorded[key], current[key])
+        elif isinstance(recorded, list) and isinstance(current, list):
+            for recorded_item, current_item in zip(recorded, current):
+                self._learn(recorded_item, current_item)
+        elif (
+            isinstance(recorded, str)
+            and isinstance(current, str)
+            and recorded != current
+            and len(recorded) >= _MIN_SUBSTITUTION_LENGTH
+        ):
+            with self._lock:
+                self._substitutions[recorded] = current
+
+
+def _http_error(error: Dict[str, Any], request: httpx.Request) -> Exception:
+    error_class = getattr(httpx, error.get("type", ""), None)
+    message = error.get("message", "")
+    if isinstance(error_class, type) and issubclass(error_class, httpx.RequestError):
+        return error_class(message, request=request)
+    return ReplayedError(f"{error.get('type', 'Error')}: {message}")
+
+
+_recorder: Optional[ExchangeRecorder] = None
+_replayer: Optional[ExchangeReplayer] = None
+
+
+def get_recorder() -> Optional[ExchangeRecorder]:
+    """Get the active recorder, or None when not capturing."""
+    return _recorder
+
+
+def get_replayer() -> Optional[ExchangeReplayer]:
+    """Get the active replayer, or None when not replaying."""
+    return _replayer
+
+
+def start_capture(path: Path, transports: str = "") -> ExchangeRecorder:
+    """
+    Record the calls of all transport clients into an archive.
+
+    Args:
+        path: Archive file (created if needed; tests recorded again are replaced)
+        transports: Transport set of the session (recordings are kept per set)
+    """
+    global _recorder
+    stop()
+    _recorder = ExchangeRecorder(ExchangeArchive(path), transports)
+    return _recorder
+
+
+def start_replay(path: Path, transports: str = "") -> ExchangeReplayer:
+    """
+    Answer the calls of all transport clients from an archive.
+
+    Args:
+        path: Archive file written by a capture session
+        transports: Transport set of the session
+
+    Raises:
+        FileNotFoundError: If the archive does not exist
+    """
+    global _replayer
+    if not Path(path).exists():
+        raise FileNotFoundError(f"Exchange archive not found: {path}")
+    stop()
+    _replayer = ExchangeReplayer(ExchangeArchive(path), transports)
+    return _replayer
+
+
+def stop() -> None:
+    """Write out the running test's calls and stop capturing or replaying."""
+    global _recorder, _replayer
+    if _recorder is not None:
+        _recorder.end_test()
+        _recorder.archive.close()
+        _recorder = None
+    if _replayer is not None:
+        _replayer.archive.close()
+        _replayer = None
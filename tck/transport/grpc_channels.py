@@ -0,0 +1,122 @@
+"""
+Shared gRPC channels for the A2A TCK.
+
+GRPCClient obtains its channels from the session-wide registry in this module:
+one sync channel and one ``grpc.aio`` channel per target, so unary, streaming and
+subscribe calls across hundreds of gRPC tests reuse the same HTTP/2 connections.
+Channels carry the keepalive and message size options from
+tck.config.get_grpc_channel_options().
+
+aio channels are bound to the event loop they were created in, so the registry keeps
+one per event loop and drops those of loops that have been closed.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+import grpc
+
+from tck import config
+
+logger = logging.getLogger(__name__)
+
+
+class GRPCChannelPool:
+    """Registry of shared sync and aio gRPC channels keyed by target and TLS mode."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._channels: Dict[Tuple[str, bool], grpc.Channel] = {}
+        self._aio_channels: Dict[Tuple[asyncio.AbstractEventLoop, str, bool], grpc.aio.Channel] = {}
+
+    def channel(self, target: str, use_tls: bool) -> grpc.Channel:
+        """
+        Get the shared sync channel for a target.
+
+        Args:
+            target: gRPC target (host:port)
+            use_tls: Whether to use a secure channel
+
+        Returns:
+            The shared channel
+        """
+        key = (target, use_tls)
+        with self._lock:
+            channel = self._channels.get(key)
+            if channel is None:
+                options = config.get_grpc_channel_options()
+                if use_tls:
+                    channel = grpc.secure_channel(target, grpc.ssl_channel_credentials(), options=options)
+                else:
+                    channel = grpc.insecure_channel(target, options=options)
+                self._channels[key] = channel
+                logger.debug(f"Created shared gRPC channel to {target} (TLS: {use_tls})")
+            return channel
+
+    def aio_channel(self, target: str, use_tls: bool) -> grpc.aio.Channel:
+        """
+        Get the shared aio channel for a target in the running event loop.
+
+        Args:
+            target: gRPC target (host:port)
+            use_tls: Whether to use a secure channel
+
+        Returns:
+            The shared aio channel for the running loop
+        """
+        loop = asyncio.get_running_loop()
+        key = (loop, target, use_tls)
+        with self._lock:
+            # Channels of closed loops are unusable; drop them
+            for stale in [k for k in self._aio_channels if k[0].is_closed()]:
+                del self._aio_channels[stale]
+
+            channel = self._aio_channels.get(key)
+            if channel is None:
+                options = config.get_grpc_channel_options()
+                if use_tls:
+                    channel = grpc.aio.secure_channel(target, grpc.ssl_channel_credentials(), options=options)
+                else:
+                    channel = grpc.aio.insecure_channel(target, options=options)
+                self._aio_channels[key] = channel
+                logger.debug(f"Created shared gRPC aio channel to {target} (TLS: {use_tls})")
+            return channel
+
+    def close(self) -> None:
+        """Close all shared sync channels and forget the aio channels."""
+        with self._lock:
+            channels = list(self._channels.values())
+            self._channels.clear()
+            # aio channels can only be closed from their (possibly already closed) loops
+            self._aio_channels.clear()
+        for channel in channels:
+            channel.close()
+
+
+_pool: Optional[GRPCChannelPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_grpc_channel_pool() -> GRPCChannelPool:
+    """
+    Get the session-wide gRPC channel registry.
+
+    Returns:
+        The shared GRPCChannelPool
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = GRPCChannelPool()
+        return _pool
+
+
+def close_grpc_channel_pool() -> None:
+    """Close the session-wide channels; the next get_grpc_channel_pool() call creates a new registry."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
@@ -9,158 +9,49 @@ Specification Reference: A2A Protocol v0.3.0 §4.2 - gRPC Transport
 
 import base64
 from datetime import datetime
-import json
 import logging
 import os
 import sys
 import tempfile
+import time
 import importlib
-from typing import Dict, List, Optional, Any, AsyncIterator, Union
+from typing import Dict, List, Optional, Any, AsyncIterator, Tuple, Union
 from urllib.parse import urlparse
 import asyncio
 
 import grpc
-from google.protobuf import json_format
+from google.protobuf import descriptor_pool, message_factory
 from google.protobuf.struct_pb2 import Struct
 from google.protobuf.timestamp_pb2 import Timestamp
-from google.protobuf.json_format import MessageToJson
 
-from tck.transport.base_client import BaseTransportClient, TransportType, TransportError
-from tests.optional.capabilities.test_streaming_methods import NON_EXISTENT_TASK_ID_PREFIX
+from tck.transport.base_client import (
+    A2AValidationError,
+    BaseTransportClient,
+    TransportCall,
+    TransportError,
+    TransportType,
+    exchange_method,
+)
+from tck.transport.capture import (
+    ExchangeRecorder,
+    ExchangeReplayer,
+    ReplayedError,
+    get_recorder,
+    get_replayer,
+    pack_messages,
+    redact_headers,
+    unpack_messages,
+)
+from tck.transport.grpc_channels import get_grpc_channel_pool
+from tck.transport.retry_policy import CircuitBreaker, get_circuit_breaker
+from tck.transport.proto_json import message_to_json
+from tck.transport.timing import get_timing_collector
+from tck.transport.wire_log import get_wire_log
 from tck import config
 
 logger = logging.getLogger(__name__)
 
 
-class A2AValidationError(TransportError):
-    """Raised when gRPC response doesn't conform to A2A specification."""
-
-    pass
-
-
-def _validate_task_object(task: Dict[str, Any]) -> None:
-    """
-    Validate that a Task object conforms to A2A specification.
-
-    Raises A2AValidationError if validation fails.
-    """
-    # Validate required fields per A2A specification
-    # Note: contextId is no longer required in the proto
-    required_fields = ["id", "status"]
-    for field in required_fields:
-        if field not in task:
-            raise A2AValidationError(f"Task missing required field '{field}'", TransportType.GRPC)
-        if not task[field]:  # Check for empty string or None
-            raise A2AValidationError(f"Task field '{field}' cannot be empty", TransportType.GRPC)
-
-    # Validate 'id' field (must be non-empty string)
-    if not isinstance(task["id"], str) or not task["id"].strip():
-        raise A2AValidationError(f"Task 'id' must be a non-empty string, got '{task['id']}'", TransportType.GRPC)
-
-    # Validate 'contextId' field if present (must be non-empty string when set)
-    if "contextId" in task and task["contextId"]:
-        if not isinstance(task["contextId"], str) or not task["contextId"].strip():
-            raise A2AValidationError(f"Task 'contextId' must be a non-empty string, got '{task['contextId']}'", TransportType.GRPC)
-
-    # Validate 'status' field
-    if not isinstance(task["status"], dict):
-        raise A2AValidationError(f"Task 'status' must be an object, got {type(task['status'])}", TransportType.GRPC)
-
-    # Validate TaskStatus object
-    status = task["status"]
-    if "state" not in status:
-        raise A2AValidationError("Task status missing required field 'state'", TransportType.GRPC)
-
-    valid_states = ["TASK_STATE_SUBMITTED", "TASK_STATE_WORKING", "TASK_STATE_COMPLETED", "TASK_STATE_FAILED", "TASK_STATE_CANCELED", "TASK_STATE_INPUT_REQUIRED", "TASK_STATE_REJECTED", "TASK_STATE_AUTH_REQUIRED"]
-    if status["state"] not in valid_states:
-        raise A2AValidationError(
-            f"Task status 'state' must be one of {valid_states}, got '{status['state']}'", TransportType.GRPC
-        )
-
-    # Validate optional fields
-    if "history" in task:
-        if not isinstance(task["history"], list):
-            raise A2AValidationError(f"Task 'history' must be an array, got {type(task['history'])}", TransportType.GRPC)
-        for i, message in enumerate(task["history"]):
-            _validate_message_object(message, f"history[{i}]")
-
-    if "artifacts" in task:
-        if not isinstance(task["artifacts"], list):
-            raise A2AValidationError(f"Task 'artifacts' must be an array, got {type(task['artifacts'])}", TransportType.GRPC)
-        for i, artifact in enumerate(task["artifacts"]):
-            _validate_artifact_object(artifact, f"artifacts[{i}]")
-
-
-def _validate_message_object(message: Dict[str, Any], context: str = "message") -> None:
-    """
-    Validate that a Message object conforms to A2A specification.
-    """
-    required_fields = ["role", "parts", "messageId"]
-    for field in required_fields:
-        if field not in message:
-            raise A2AValidationError(f"{context} missing required field '{field}'", TransportType.GRPC)
-
-    # Validate 'role' field
-    valid_roles = ["ROLE_USER", "ROLE_AGENT"]
-    if message["role"] not in valid_roles:
-        raise A2AValidationError(f"{context} 'role' must be one of {valid_roles}, got '{message['role']}'", TransportType.GRPC)
-
-    # Validate 'messageId' field
-    if not isinstance(message["messageId"], str) or not message["messageId"].strip():
-        raise A2AValidationError(f"{context} 'messageId' must be a non-empty string", TransportType.GRPC)
-
-    # Validate 'parts' field
-    if not isinstance(message["parts"], list):
-        raise A2AValidationError(f"{context} 'parts' must be an array", TransportType.GRPC)
-
-    for i, part in enumerate(message["parts"]):
-        _validate_part_object(part, f"{context}.parts[{i}]")
-
-
-def _validate_part_object(part: Dict[str, Any], context: str = "part") -> None:
-    """
-    Validate that a Part object conforms to A2A specification.
-    """
-
-    # Validate specific part types
-    if "text" in part:
-        if not isinstance(part["text"], str):
-            raise A2AValidationError(f"{context} TextPart 'text' must be a string", TransportType.GRPC)
-
-    elif "url" in part:
-        if not isinstance(part["url"], str):
-            raise A2AValidationError(f"{context} Part 'url' must be a string", TransportType.GRPC)
-
-    elif "raw" in part:
-        if not isinstance(part["raw"], str):
-            raise A2AValidationError(f"{context} Part 'raw' must be a base64-encoded string", TransportType.GRPC)
-
-    elif "data" in part:
-        if "data" not in part["data"]:
-            raise A2AValidationError(f"{context} DataPart missing required field 'data'", TransportType.GRPC)
-
-
-def _validate_artifact_object(artifact: Dict[str, Any], context: str = "artifact") -> None:
-    """
-    Validate that an Artifact object conforms to A2A specification.
-    """
-    required_fields = ["artifactId", "parts"]
-    for field in required_fields:
-        if field not in artifact:
-            raise A2AValidationError(f"{context} missing required field '{field}'", TransportType.GRPC)
-
-    # Validate 'artifactId' field
-    if not isinstance(artifact["artifactId"], str) or not artifact["artifactId"].strip():
-        raise A2AValidationError(f"{context} 'artifactId' must be a non-empty string", TransportType.GRPC)
-
-    # Validate 'parts' field
-    if not isinstance(artifact["parts"], list):
-        raise A2AValidationError(f"{context} 'parts' must be an array", TransportType.GRPC)
-
-    for i, part in enumerate(artifact["parts"]):
-        _validate_part_object(part, f"{context}.parts[{i}]")
-
-
 def _validate_agent_card_object(agent_card: Dict[str, Any]) -> None:
     """
     Validate that an AgentCard object conforms to A2A specification.
@@ -216,33 +107,19 @@ def _validate_push_notification_config_list(config_list: List[Dict[str, Any]]) -
                 )
 
 
-def _validate_a2a_response(response: Dict[str, Any], method_name: str) -> None:
+def _validate_a2a_response(response: Any, method_name: str) -> None:
     """
-    Validate gRPC response conforms to A2A specification based on the method.
+    Validate gRPC push notification config responses against the A2A specification.
+
+    Task and Message results are validated against the A2A JSON schema instead
+    (BaseTransportClient._validate_result).
 
     Args:
         response: The response object from gRPC call
-        method_name: The A2A method name (e.g., 'send_message', 'get_task', etc.)
+        method_name: The A2A method name (e.g., 'list_push_notification_configs')
     """
     try:
-        if method_name == "send_message":
-            if "task" in response:
-                _validate_task_object(response["task"])
-            elif "message" in response:
-                _validate_message_object(response["message"])
-        elif method_name in ["get_task", "cancel_task"]:
-            # These methods should return Task objects
-            _validate_task_object(response)
-
-        elif method_name == "get_extended_agent_card":
-            # This method should return AgentCard object
-            _validate_agent_card_object(response)
-
-        elif method_name == "send_message_response":
-            # When send_message returns a Message object instead of Task
-            _validate_message_object(response)
-
-        elif method_name == "list_push_notification_configs":
+        if method_name == "list_push_notification_configs":
             # This method should return a list of TaskPushNotificationConfig objects
             _validate_push_notification_config_list(response)
 
@@ -255,8 +132,6 @@ def _validate_a2a_response(response: Dict[str, Any], method_name: str) -> None:
                         f"Push notification config response missing required field '{field}'", TransportType.GRPC
                     )
 
-        # Add validation for other methods as needed
-
     except A2AValidationError:
         # Re-raise A2A validation errors
         raise
@@ -265,6 +140,28 @@ def _validate_a2a_response(response: Dict[str, Any], method_name: str) -> None:
         raise A2AValidationError(f"Unexpected validation error for {method_name}: {str(e)}", TransportType.GRPC)
 
 
+class ReplayedRpcError(grpc.RpcError):
+    """A gRPC error status answered from the capture archive on replay."""
+
+    def __init__(self, code: grpc.StatusCode, details: str, trailing_metadata: tuple = ()):
+        super().__init__(f"{code.name}: {details}")
+        self._code = code
+        self._details = details
+        self._trailing_metadata = trailing_metadata
+
+    def code(self) -> grpc.StatusCode:
+        return self._code
+
+    def details(self) -> str:
+        return self._details
+
+    def initial_metadata(self) -> tuple:
+        return ()
+
+    def trailing_metadata(self) -> tuple:
+        return self._trailing_metadata
+
+
 class GRPCClient(BaseTransportClient):
     """
     A2A gRPC transport client for real network communication.
@@ -309,21 +206,23 @@ class GRPCClient(BaseTransportClient):
 
         self._channel: Optional[grpc.Channel] = None
         self._stub = None
+        self._aio_stub = None
+        self._aio_stub_channel: Optional[grpc.aio.Channel] = None
 
         logger.info(f"Initialized gRPC client for target: {self.grpc_target} (TLS: {self.use_tls})")
 
     @property
     def channel(self) -> grpc.Channel:
-        """Get or create gRPC channel for real network communication."""
+        """Get the shared gRPC channel to the SUT for real network communication."""
         if self._channel is None:
-            if self.use_tls:
-                credentials = grpc.ssl_channel_credentials()
-                self._channel = grpc.secure_channel(self.grpc_target, credentials)
-            else:
-                self._channel = grpc.insecure_channel(self.grpc_target)
-            logger.debug(f"Created gRPC channel to {self.grpc_target}")
+            self._channel = get_grpc_channel_pool().channel(self.grpc_target, self.use_tls)
         return self._channel
 
+    @property
+    def aio_channel(self) -> grpc.aio.Channel:
+        """Get the shared gRPC aio channel to the SUT for the running event loop."""
+        return get_grpc_channel_pool().aio_channel(self.grpc_target, self.use_tls)
+
     @property
     def stub(self):
         """Get or create A2A service stub for real gRPC calls."""
@@ -333,6 +232,16 @@ class GRPCClient(BaseTransportClient):
             logger.debug("Created A2A service stub")
         return self._stub
 
+    @property
+    def aio_stub(self):
+        """Get the A2A service stub on the shared aio channel of the running event loop."""
+        channel = self.aio_channel
+        if self._aio_stub is None or self._aio_stub_channel is not channel:
+            self._load_static_stubs()
+            self._aio_stub = self._pb_grpc.A2AServiceStub(channel)
+            self._aio_stub_channel = channel
+        return self._aio_stub
+
     def _load_static_stubs(self) -> None:
         """Load pre-generated protobuf stubs. Instruct user to generate if missing."""
         if getattr(self, "_pb", None) and getattr(self, "_pb_grpc", None):
@@ -360,12 +269,186 @@ class GRPCClient(BaseTransportClient):
                 )
 
     def close(self):
-        """Close gRPC channel and cleanup resources."""
+        """Release the gRPC channel (the shared channel stays open for other clients)."""
         if self._channel:
-            self._channel.close()
             self._channel = None
             self._stub = None
-            logger.debug("Closed gRPC channel")
+            logger.debug("Released gRPC channel")
+        self._aio_stub = None
+        self._aio_stub_channel = None
+
+    def _perform(self, call: TransportCall) -> Any:
+        """Make one unary RPC of an exchange on the shared sync channel."""
+        rpc, request, kwargs = call
+        return getattr(self.stub, rpc)(request, **kwargs)
+
+    async def _aperform(self, call: TransportCall) -> Any:
+        """Make one unary RPC of an exchange on the shared aio channel."""
+        rpc, request, kwargs = call
+        return await getattr(self.aio_stub, rpc)(request, **kwargs)
+
+    def _log_wire_call(self, call: TransportCall, result: Any, error: Optional[BaseException], elapsed: float) -> None:
+        """Record one unary RPC of an exchange in the wire log."""
+        rpc, request, _ = call
+        if error is None:
+            status = "OK"
+        else:
+            status = error.code().name if isinstance(error, grpc.RpcError) and hasattr(error, "code") else None
+        get_wire_log().call(
+            self.transport_type.value,
+            rpc,
+            self.grpc_target,
+            request=request,
+            response=result,
+            status=status,
+            elapsed=elapsed,
+            error=error,
+        )
+
+    def _classify_failure(self, result: Any, error: Optional[BaseException]) -> Tuple[bool, bool, bool]:
+        """Classify the outcome of one RPC: UNAVAILABLE and DEADLINE_EXCEEDED are transient and count as unreachable."""
+        if error is None:
+            return False, False, True
+        if isinstance(error, grpc.RpcError) and hasattr(error, "code"):
+            if error.code() in (grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED):
+                return True, True, True
+        # Any other status is an answer from the SUT
+        return False, False, True
+
+    def probe(self, timeout: float) -> Dict[str, float]:
+        """
+        Check that the gRPC target answers by connecting the shared channel.
+
+        Args:
+            timeout: Seconds to wait for the channel to become ready
+
+        Returns:
+            Dictionary with the time to connect (DNS, TCP, TLS and HTTP/2 setup) in seconds
+
+        Raises:
+            grpc.FutureTimeoutError: If the channel did not connect in time
+        """
+        started = time.perf_counter()
+        grpc.channel_ready_future(self.channel).result(timeout=timeout)
+        return {"connect": time.perf_counter() - started}
+
+    def _circuit_breaker(self) -> CircuitBreaker:
+        """Session-wide circuit breaker of this client's gRPC target."""
+        return get_circuit_breaker(self.grpc_target)
+
+    def _timing_label(self, call: TransportCall) -> str:
+        """Operation of an RPC in its CallTiming: the RPC name."""
+        return call[0]
+
+    def _capture_call(self, recorder: ExchangeRecorder, call: TransportCall, result: Any, error: Optional[BaseException]) -> None:
+        """Record one unary RPC of an exchange in the capture archive."""
+        rpc, request, kwargs = call
+        meta: Dict[str, Any] = {"metadata": redact_headers(kwargs.get("metadata"))}
+        response = b""
+        if error is None:
+            meta["response_type"] = result.DESCRIPTOR.full_name
+            response = result.SerializeToString()
+        else:
+            meta["error"] = self._rpc_error_meta(error)
+        recorder.record(self.transport_type.value, "call", rpc, self.grpc_target, message_to_json(request), response, meta)
+
+    def _replay_call(self, replayer: ExchangeReplayer, call: TransportCall) -> Any:
+        """Answer one unary RPC of an exchange from the replay archive."""
+        rpc, request, _ = call
+        record = replayer.take(self.transport_type.value, "call", rpc, message_to_json(request))
+        meta = record["meta"]
+        if "error" in meta:
+            raise self._replayed_rpc_error(meta["error"])
+        message_class = self._message_class(meta["response_type"])
+        return message_class.FromString(replayer.substitute(record["response"], same_length=True))
+
+    async def _stream_rpc(self, rpc: str, request: Any, metadata: list) -> AsyncIterator[Any]:
+        """
+        Make a server-streaming RPC on the shared aio channel and yield its responses.
+
+        The stream is recorded when capturing, and answered from the archive when replaying.
+        Streams are not retried, but go through the circuit breaker of the target.
+        """
+        replayer = get_replayer()
+        if replayer is not None:
+            record = replayer.take(self.transport_type.value, "stream", rpc, message_to_json(request))
+            meta = record["meta"]
+            for data in unpack_messages(record["response"]):
+                yield self._message_class(meta["response_type"]).FromString(replayer.substitute(data, same_length=True))
+            if "error" in meta:
+                raise self._replayed_rpc_error(meta["error"])
+            return
+
+        breaker = self._circuit_breaker()
+        probe = self._before_call(breaker)
+        timings = get_timing_collector()
+        timing = None if timings is None else timings.start(self.transport_type.value, None, rpc)
+        if timing is not None:
+            timing.begin_attempt()
+        stream = getattr(self.aio_stub, rpc)(request, timeout=self.timeout, metadata=metadata)
+        recorder = get_recorder()
+        record = None
+        if recorder is not None:
+            meta = {"metadata": redact_headers(metadata)}
+            record = recorder.record(self.transport_type.value, "stream", rpc, self.grpc_target, message_to_json(request), [], meta)
+        answered = settled = False
+        try:
+            async for response in stream:
+                if not answered:
+                    answered = settled = True
+                    breaker.record_success()
+                    if timing is not None:
+                        timing.first_response()
+                if record is not None:
+                    record["meta"]["response_type"] = response.DESCRIPTOR.full_name
+                    record["response"].append(pack_messages([response.SerializeToString()]))
+                yield response
+        except Exception as e:
+            _, unreachable, sent = self._classify_failure(None, e)
+            if unreachable and not answered:
+                breaker.record_failure()
+                settled = True
+            elif sent:
+                breaker.record_success()
+                settled = True
+            if record is not None:
+                record["meta"]["error"] = self._rpc_error_meta(e)
+            raise
+        finally:
+            # A probe closed before its first message (GeneratorExit) or cancelled must not keep
+            # the circuit half-open
+            if probe and not settled:
+                breaker.release_probe()
+            # Cancel the call if the consumer stopped early; the shared channel stays open
+            stream.cancel()
+            if timing is not None:
+                timing.end_stream()
+                timings.add(timing)
+
+    @staticmethod
+    def _rpc_error_meta(error: BaseException) -> Dict[str, Any]:
+        """JSON-compatible description of an error raised by an RPC."""
+        if not (isinstance(error, grpc.RpcError) and hasattr(error, "code")):
+            return {"type": type(error).__name__, "message": str(error)}
+        return {
+            "type": "RpcError",
+            "code": error.code().name,
+            "details": error.details(),
+            "trailing_metadata": redact_headers(error.trailing_metadata() or []),
+        }
+
+    @staticmethod
+    def _replayed_rpc_error(error: Dict[str, Any]) -> Exception:
+        if error.get("type") != "RpcError":
+            return ReplayedError(f"{error.get('type', 'Error')}: {error.get('message', '')}")
+        return ReplayedRpcError(
+            grpc.StatusCode[error["code"]], error.get("details") or "", tuple(map(tuple, error.get("trailing_metadata", [])))
+        )
+
+    def _message_class(self, full_name: str) -> Any:
+        """Protobuf message class of a recorded response type."""
+        self._load_static_stubs()
+        return message_factory.GetMessageClass(descriptor_pool.Default().FindMessageTypeByName(full_name))
 
     def __enter__(self):
         return self
@@ -401,6 +484,7 @@ class GRPCClient(BaseTransportClient):
 
     # A2A Protocol Method Implementations - Real Network Calls
 
+    @exchange_method
     def send_message(
         self,
         message: Dict[str, Any],
@@ -432,33 +516,13 @@ class GRPCClient(BaseTransportClient):
             metadata = self._prepare_metadata(extra_headers)
 
             # Real gRPC call
-            response = self.stub.SendMessage(request, timeout=self.timeout, metadata=metadata)
-            if response.WhichOneof("payload") == "task":
-                t = response.task
-                logger.info(f"Received gRPC task for message {msg_id}: {t.id}")
-                result = {
-                    "task": {
-                        "id": t.id,
-                        "contextId": t.context_id,
-                        "status": {"state": self._map_state_enum_to_json(t.status.state)}
-                    }
-                }
-                # Validate response conforms to A2A specification
-                _validate_a2a_response(result, "send_message")
-                return result
-            else:
-                m = response.msg
-                logger.debug(f"Received gRPC message for message {msg_id}")
-                result = {
-                    "message": {
-                        "role": "agent",
-                        "messageId": m.message_id,
-                        "parts": ([{"text": m.parts[0].text}] if m.parts else []),
-                    }
-                }
-                # Validate response conforms to A2A specification
-                _validate_a2a_response(result, "send_message")
-                return result
+            response = yield ("SendMessage", request, {"timeout": self.timeout, "metadata": metadata})
+            # Wrapped as {"task": ...} or {"message": ...} after the payload oneof
+            result = self._payload_to_json(response)
+            logger.debug(f"Received gRPC {next(iter(result), 'empty response')} for message {msg_id}")
+            # Validate response conforms to A2A specification
+            self._validate_result("send_message", result)
+            return result
 
         except grpc.RpcError as e:
             error_msg = f"gRPC call failed: {e.code().name} - {e.details()}"
@@ -501,48 +565,19 @@ class GRPCClient(BaseTransportClient):
             request = self._json_to_send_message_request(message, configuration, default_return_immediately=True)
             metadata = self._prepare_metadata(extra_headers)
 
-            # Make real gRPC streaming call to live SUT
-            if self.use_tls:
-                credentials = grpc.ssl_channel_credentials()
-                channel = grpc.aio.secure_channel(self.grpc_target, credentials)
-            else:
-                channel = grpc.aio.insecure_channel(self.grpc_target)
-                
-            async with channel:
-                # Use the generated protobuf stub for streaming
-                stub = self._pb_grpc.A2AServiceStub(channel)
-                stream = stub.SendStreamingMessage(request, timeout=self.timeout, metadata=metadata)
-
-                async for response in stream:
-                    # Convert protobuf response to JSON format
-                    if response.WhichOneof("payload") == "task":
-                        t = response.task
-                        yield {
-                            "task": {
-                                "id": t.id,
-                                "contextId": t.context_id,
-                                "status": {"state": self._map_state_enum_to_json(t.status.state)},
-                            }
-                        }
-                    elif response.WhichOneof("payload") == "status_update":
-                        su = response.status_update
-                        yield {
-                            "status_update": {
-                                "taskId": su.task_id,
-                                "contextId": su.context_id,
-                                "status": {"state": self._map_state_enum_to_json(su.status.state)},
-                                "final": getattr(su, "final", False),
-                            }
-                        }
-                    elif response.WhichOneof("payload") == "msg":
-                        m = response.msg
-                        yield {
-                            "message": {
-                                "role": "ROLE_AGENT",
-                                "messageId": m.message_id,
-                                "parts": ([{"text": m.parts[0].text}] if m.parts else []),
-                            }
-                        }
+            # Make real gRPC streaming call to live SUT over the shared aio channel
+            responses = self._stream_rpc("SendStreamingMessage", request, metadata)
+            wire = get_wire_log()
+            wire.call(self.transport_type.value, "SendStreamingMessage", self.grpc_target, request=request)
+
+            try:
+                async for response in responses:
+                    wire.event(self.transport_type.value, self.grpc_target, response)
+                    # Wrapped as {"task"|"message"|"status_update"|"artifact_update": ...}
+                    yield self._payload_to_json(response)
+            finally:
+                # Close the stream (and cancel the call) if the consumer stopped early
+                await responses.aclose()
 
             logger.debug(f"Completed gRPC streaming for message {message.get('message_id')}")
 
@@ -557,6 +592,7 @@ class GRPCClient(BaseTransportClient):
                 logger.error(error_msg)
                 raise TransportError(error_msg, TransportType.GRPC)
 
+    @exchange_method
     def get_task(
         self, task_id: str, history_length: Optional[int] = None, extra_headers: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
@@ -591,27 +627,12 @@ class GRPCClient(BaseTransportClient):
             req = pb.GetTaskRequest(**req_kwargs)
             metadata = self._prepare_metadata(extra_headers)
 
-            resp = self.stub.GetTask(req, timeout=self.timeout, metadata=metadata)
-            result = {
-                "id": resp.id,
-                "contextId": resp.context_id,
-                "status": {"state": self._map_state_enum_to_json(resp.status.state)}
-            }
-            # Always include history if SUT returned it (regardless of history_length value)
-            if resp.history:
-                result["history"] = [
-                    {
-                        "role": ("ROLE_AGENT" if m.role == pb.ROLE_AGENT else "ROLE_USER"),
-                        "parts": ([{"text": m.parts[0].text}] if m.parts else []),
-                        "messageId": m.message_id,
-                        "taskId": resp.id,
-                        "contextId": resp.context_id,
-                    }
-                    for m in resp.history
-                ]
+            resp = yield ("GetTask", req, {"timeout": self.timeout, "metadata": metadata})
+            # Includes history and artifacts whenever the SUT returned them
+            result = self._protobuf_to_json(resp)
             logger.debug(f"Retrieved task via gRPC: {task_id}")
             # Validate response conforms to A2A specification
-            _validate_a2a_response(result, "get_task")
+            self._validate_result("get_task", result)
             return result
 
         except grpc.RpcError as e:
@@ -625,6 +646,7 @@ class GRPCClient(BaseTransportClient):
             logger.error(error_msg)
             raise TransportError(error_msg, TransportType.GRPC)
 
+    @exchange_method
     def cancel_task(self, task_id: str, extra_headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
         Cancel task via gRPC.
@@ -649,16 +671,11 @@ class GRPCClient(BaseTransportClient):
             req = pb.CancelTaskRequest(id=task_id)
             metadata = self._prepare_metadata(extra_headers)
 
-            resp = self.stub.CancelTask(req, timeout=self.timeout, metadata=metadata)
+            resp = yield ("CancelTask", req, {"timeout": self.timeout, "metadata": metadata})
             logger.debug(f"Cancelled task via gRPC: {task_id}")
-            result = {
-                "id": resp.id,
-                "contextId": resp.context_id,
-                #FIXME we should return the state from the response, not override it
-                "status": {"state": "TASK_STATE_CANCELED"}
-            }
+            result = self._protobuf_to_json(resp)
             # Validate response conforms to A2A specification
-            _validate_a2a_response(result, "cancel_task")
+            self._validate_result("cancel_task", result)
             return result
 
         except grpc.RpcError as e:
@@ -718,48 +735,19 @@ class GRPCClient(BaseTransportClient):
             request = pb.SubscribeToTaskRequest(id=task_id)
             metadata = self._prepare_metadata(extra_headers)
 
-            # Create appropriate channel based on TLS setting
-            if self.use_tls:
-                credentials = grpc.ssl_channel_credentials()
-                channel = grpc.aio.secure_channel(self.grpc_target, credentials)
-            else:
-                channel = grpc.aio.insecure_channel(self.grpc_target)
-                
-            async with channel:
-                # Use the generated protobuf stub for task subscription
-                stub = self._pb_grpc.A2AServiceStub(channel)
-                stream = stub.SubscribeToTask(request, timeout=self.timeout, metadata=metadata)
-                
-                async for response in stream:
-                    # Convert protobuf response to JSON format
-                    if response.WhichOneof("payload") == "task":
-                        t = response.task
-                        yield {
-                            "task": {
-                                "id": t.id,
-                                "contextId": t.context_id,
-                                "status": {"state": self._map_state_enum_to_json(t.status.state)},
-                            }
-                        }
-                    elif response.WhichOneof("payload") == "status_update":
-                        su = response.status_update
-                        yield {
-                            "status_update": {
-                                "taskId": su.task_id,
-                                "contextId": su.context_id,
-                                "status": {"state": self._map_state_enum_to_json(su.status.state)},
-                                "final": getattr(su, "final", False),
-                            }
-                        }
-                    elif response.WhichOneof("payload") == "error":
-                        # Handle error responses from the server
-                        error = response.error
-                        yield {
-                            "error": {
-                                "code": error.code,
-                                "message": error.message,
-                            }
-                        }
+            # Make real gRPC streaming call to live SUT over the shared aio channel
+            responses = self._stream_rpc("SubscribeToTask", request, metadata)
+            wire = get_wire_log()
+            wire.call(self.transport_type.value, "SubscribeToTask", self.grpc_target, request=request)
+
+            try:
+                async for response in responses:
+                    wire.event(self.transport_type.value, self.grpc_target, response)
+                    # Wrapped as {"task"|"message"|"status_update"|"artifact_update": ...}
+                    yield self._payload_to_json(response)
+            finally:
+                # Close the stream (and cancel the call) if the consumer stopped early
+                await responses.aclose()
 
             logger.debug(f"Completed gRPC subscription for task: {task_id}")
 
@@ -775,6 +763,7 @@ class GRPCClient(BaseTransportClient):
             raise TransportError(error_msg, TransportType.GRPC)
 
     # Optional method available on gRPC per spec mapping
+    @exchange_method
     def list_tasks(
         self,
         contextId: Optional[str] = None,
@@ -835,47 +824,20 @@ class GRPCClient(BaseTransportClient):
             req = pb.ListTasksRequest(**req_params)
             metadata = self._prepare_metadata(extra_headers)
             
-            resp = self.stub.ListTasks(req, timeout=self.timeout, metadata=metadata)
-
-            # Convert response to dict format
-            tasks_list = []
-            for task in resp.tasks:
-                task_dict = {
-                    "id": task.id,
-                    "contextId": task.context_id,
-                    "status": {"state": self._map_state_enum_to_json(task.status.state)},
-                }
-                # Include history if present
-                if task.history:
-                    task_dict["history"] = [
-                        {
-                            "role": ("agent" if m.role == pb.ROLE_AGENT else "user"),
-                            "parts": self._convert_parts_to_json(m.parts),
-                            "messageId": m.message_id,
-                        }
-                        for m in task.history
-                        ]
-                # Include artifacts if present
-                if hasattr(task, "artifacts") and task.artifacts:
-                    task_dict["artifacts"] = [
-                        {
-                            "artifactId": artifact.artifact_id,
-                            "name": artifact.name if artifact.name else "",
-                            "description": artifact.description if artifact.description else "",
-                            "parts": self._convert_parts_to_json(artifact.parts),
-                            "kind": "artifact",
-                        }
-                        for artifact in task.artifacts
-                        ]
-                tasks_list.append(task_dict)
-
-            return {
+            resp = yield ("ListTasks", req, {"timeout": self.timeout, "metadata": metadata})
+
+            # History and artifacts are included whenever the SUT returned them
+            tasks_list = [self._protobuf_to_json(task) for task in resp.tasks]
+
+            result = {
                 "tasks": tasks_list,
                 "totalSize": resp.total_size,
                 "pageSize": len(tasks_list),  # Number of tasks in current response
                 # Per A2A spec: nextPageToken MUST be empty string when no more results, not None
                 "nextPageToken": resp.next_page_token,
             }
+            self._validate_result("list_tasks", result)
+            return result
         except TransportError:
             # Re-raise TransportError as-is (from validation, etc.)
             raise
@@ -889,6 +851,7 @@ class GRPCClient(BaseTransportClient):
             logger.error(f"gRPC list_tasks failed: {str(e)}")
             raise TransportError(f"gRPC list_tasks failed: {str(e)}", TransportType.GRPC)
 
+    @exchange_method
     def get_extended_agent_card(self, extra_headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
         Get authenticated extended agent card via gRPC.
@@ -915,18 +878,10 @@ class GRPCClient(BaseTransportClient):
             metadata = self._prepare_metadata(extra_headers)
             
             # Make real gRPC call to live SUT with authentication metadata
-            if self.use_tls:
-                credentials = grpc.ssl_channel_credentials()
-                channel = grpc.secure_channel(self.grpc_target, credentials)
-            else:
-                channel = grpc.insecure_channel(self.grpc_target)
-                
-            with channel:
-                stub = self._pb_grpc.A2AServiceStub(channel)
-                resp = stub.GetExtendedAgentCard(req, metadata=metadata, timeout=self.timeout)
+            resp = yield ("GetExtendedAgentCard", req, {"timeout": self.timeout, "metadata": metadata})
 
-                # Convert protobuf response to JSON format using shared helper
-                extended_card = self._convert_agent_card_to_json(resp)
+            # Convert protobuf response to JSON format using shared helper
+            extended_card = self._convert_agent_card_to_json(resp)
 
             logger.debug("Retrieved authenticated extended agent card via gRPC")
             return extended_card
@@ -944,6 +899,7 @@ class GRPCClient(BaseTransportClient):
 
     # Push notification configuration methods
 
+    @exchange_method
     def create_task_push_notification_config(
         self, task_push_config: Dict[str, Any], extra_headers: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
@@ -977,7 +933,7 @@ class GRPCClient(BaseTransportClient):
             )
             metadata = self._prepare_metadata(extra_headers)
 
-            resp = self.stub.CreateTaskPushNotificationConfig(req, timeout=self.timeout, metadata=metadata)
+            resp = yield ("CreateTaskPushNotificationConfig", req, {"timeout": self.timeout, "metadata": metadata})
 
             # Convert response to JSON format that matches expected test format
             # Fields are now directly on TaskPushNotificationConfig (no nested push_notification_config)
@@ -1004,6 +960,7 @@ class GRPCClient(BaseTransportClient):
             logger.error(error_msg)
             raise TransportError(error_msg, TransportType.GRPC)
 
+    @exchange_method
     def get_push_notification_config(
         self, task_id: str, config_id: str = "default", extra_headers: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
@@ -1031,7 +988,7 @@ class GRPCClient(BaseTransportClient):
             req = pb.GetTaskPushNotificationConfigRequest(task_id=task_id, id=config_id)
             metadata = self._prepare_metadata(extra_headers)
 
-            resp = self.stub.GetTaskPushNotificationConfig(req, timeout=self.timeout, metadata=metadata)
+            resp = yield ("GetTaskPushNotificationConfig", req, {"timeout": self.timeout, "metadata": metadata})
 
             # Convert response to JSON format that matches expected test format
             # Fields are now directly on TaskPushNotificationConfig (no nested push_notification_config)
@@ -1058,6 +1015,7 @@ class GRPCClient(BaseTransportClient):
             logger.error(error_msg)
             raise TransportError(error_msg, TransportType.GRPC)
 
+    @exchange_method
     def list_push_notification_configs(self, task_id: str, extra_headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
         List push notification configs for a task via gRPC.
@@ -1084,12 +1042,11 @@ class GRPCClient(BaseTransportClient):
             metadata = self._prepare_metadata(extra_headers)
 
             # RPC method renamed from ListTaskPushNotificationConfig to ListTaskPushNotificationConfigs
-            resp = self.stub.ListTaskPushNotificationConfigs(req, timeout=self.timeout, metadata=metadata)
+            resp = yield ("ListTaskPushNotificationConfigs", req, {"timeout": self.timeout, "metadata": metadata})
 
             # Convert response to JSON format that matches expected test format
             # Fields are now directly on TaskPushNotificationConfig (no nested push_notification_config)
             configs_list = []
-            print(f"resp -> {resp.configs}")
             for config in resp.configs:
                 configs_list.append(
                     {
@@ -1118,6 +1075,7 @@ class GRPCClient(BaseTransportClient):
             logger.error(error_msg)
             raise TransportError(error_msg, TransportType.GRPC)
 
+    @exchange_method
     def delete_push_notification_config(
         self, task_id: str, config_id: str, extra_headers: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
@@ -1145,7 +1103,7 @@ class GRPCClient(BaseTransportClient):
             req = pb.DeleteTaskPushNotificationConfigRequest(task_id=task_id, id=config_id)
             metadata = self._prepare_metadata(extra_headers)
 
-            resp = self.stub.DeleteTaskPushNotificationConfig(req, timeout=self.timeout, metadata=metadata)
+            resp = yield ("DeleteTaskPushNotificationConfig", req, {"timeout": self.timeout, "metadata": metadata})
 
             # gRPC DeleteTaskPushNotificationConfig returns Empty response
             deletion_result = None
@@ -1174,8 +1132,7 @@ class GRPCClient(BaseTransportClient):
         Returns:
             Dict containing JSON representation of the AgentCard
         """
-        json_string = MessageToJson(resp)
-        return json.loads(json_string)
+        return self._protobuf_to_json(resp)
 
     def _json_to_send_message_request(
         self,
@@ -1270,54 +1227,6 @@ class GRPCClient(BaseTransportClient):
         logger.debug(f"Converted JSON message to protobuf: {msg_id}")
         return request
 
-    def _map_state_enum_to_json(self, state_enum: int) -> str:
-        """
-        Convert protobuf TaskState enum to protobuf enum name string.
-
-        Returns protobuf enum names for gRPC transport internal use.
-        """
-        try:
-            name = self._pb.TaskState.Name(state_enum)
-        except Exception:
-            return "TASK_STATE_UNSPECIFIED"
-        return name
-
-    def _convert_parts_to_json(self, parts) -> list:
-        """
-        Convert protobuf parts to JSON format, handling all part types.
-
-        Handles text, file, and data parts according to A2A v1.0 protobuf spec.
-        Part has oneof: text (string), file (FilePart), or data (DataPart).
-        """
-        if not parts:
-            return []
-
-        json_parts = []
-        for part in parts:
-            # Check which oneof field is set
-            if part.HasField('text'):
-                json_parts.append({"kind": "text", "text": part.text})
-            elif part.HasField('url'):
-                part_dict = {"url": part.url}
-                if part.filename:
-                    part_dict["filename"] = part.filename
-                if part.media_type:
-                    part_dict["mediaType"] = part.media_type
-                json_parts.append(part_dict)
-            elif part.HasField('raw'):
-                part_dict = {"raw": base64.b64encode(part.raw).decode('utf-8')}
-                if part.filename:
-                    part_dict["filename"] = part.filename
-                if part.media_type:
-                    part_dict["mediaType"] = part.media_type
-                json_parts.append(part_dict)
-            elif part.HasField('data'):
-                # data is google.protobuf.Value
-                data_dict = json_format.MessageToDict(part.data, preserving_proto_field_name=False)
-                json_parts.append({"data": data_dict})
-
-        return json_parts
-
     def _map_json_to_state_enum(self, state_json: str) -> int:
         """
         Convert JSON status string to protobuf TaskState enum.
@@ -1438,28 +1347,33 @@ class GRPCClient(BaseTransportClient):
 
     def _protobuf_to_json(self, pb_message) -> Dict[str, Any]:
         """
-        Convert protobuf message to JSON format.
+        Convert protobuf message to A2A JSON format.
 
         Args:
             pb_message: Protobuf message object to convert
 
         Returns:
-            Dict containing JSON representation of the protobuf message
+            Dict containing the A2A JSON representation of the protobuf message
         """
-        from google.protobuf.json_format import MessageToDict
-        
-        # Convert protobuf message to dictionary using the standard library
-        json_dict = MessageToDict(
-            pb_message,
-            including_default_value_fields=True,
-            preserving_proto_field_name=False,
-            use_integers_for_enums=False,
-            descriptor_pool=None,
-            float_precision=None
-        )
-        
-        logger.debug(f"Converted protobuf message to JSON: {type(pb_message).__name__}")
-        return json_dict
+        if pb_message is None:
+            return {}
+        return message_to_json(pb_message)
+
+    def _payload_to_json(self, response) -> Dict[str, Any]:
+        """
+        Convert a SendMessageResponse or StreamResponse to A2A JSON format.
+
+        Args:
+            response: Protobuf response whose "payload" oneof holds the result
+
+        Returns:
+            Dict with the converted payload under its field name (task, message,
+            status_update or artifact_update), or an empty dict if none is set
+        """
+        payload = response.WhichOneof("payload")
+        if payload is None:
+            return {}
+        return {payload: message_to_json(getattr(response, payload))}
 
     # Transport-specific capabilities
 
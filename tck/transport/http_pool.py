@@ -0,0 +1,352 @@
+"""
+Shared HTTP connection pool for the A2A TCK.
+
+Every HTTP-based client in the TCK (JSONRPCClient, RESTClient, SUTClient and Agent
+Card discovery) sends its requests through the session-wide pool in this module, so
+discovery and test traffic reuse warm keep-alive connections to the SUT instead of
+each client opening (and TLS-handshaking) its own.
+
+Clients keep their own lightweight ``httpx.Client`` with their own timeout, headers
+and redirect settings; only the transport, which owns the connection pool, is
+shared. Closing a client therefore never closes pooled connections; the pool is
+closed once at the end of the session (close_http_pool).
+
+Pool limits come from tck.config (get_http_pool_config). The pool counts how many
+requests reused a pooled connection (hits) and how many had to open a new one
+(misses); see HTTPConnectionPool.stats().
+"""
+
+import asyncio
+import logging
+import os
+import ssl
+import threading
+from typing import Any, Dict, Optional, Tuple, Union
+
+import httpx
+
+from tck import config
+from tck.transport.timing import active_timing
+
+logger = logging.getLogger(__name__)
+
+# TLS mode of the REST transport: no certificate verification, legacy ciphers allowed
+PERMISSIVE_TLS = "permissive"
+
+# Verification setting of a pooled transport: True, False or PERMISSIVE_TLS
+VerifyMode = Union[bool, str]
+
+
+def _opens_connection(event_name: str) -> bool:
+    """Whether an httpcore trace event marks a new connection being opened."""
+    return event_name.startswith("connection.connect_") and event_name.endswith(".started")
+
+
+def create_permissive_ssl_context() -> Union[ssl.SSLContext, bool]:
+    """
+    Create a robust SSL context that handles various SSL/TLS issues.
+
+    Returns:
+        A permissive SSL context, or False (no verification) if A2A_TCK_SIMPLE_SSL
+        is set or the context cannot be created
+    """
+    # Check if user wants to force simple SSL mode
+    if os.getenv("A2A_TCK_SIMPLE_SSL", "").lower() in config.TRUTHY_ENV_VALUES:
+        logger.info("Using simple SSL mode (verify=False) due to A2A_TCK_SIMPLE_SSL")
+        return False
+
+    try:
+        # Try the most permissive SSL context first
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+
+        # Additional SSL options to handle edge cases
+        ssl_context.set_ciphers("DEFAULT:@SECLEVEL=1")
+
+        logger.debug("Created enhanced SSL context with permissive settings")
+        return ssl_context
+    except Exception as e:
+        logger.warning(f"Failed to create custom SSL context: {e}, falling back to verify=False")
+        return False
+
+
+class _PoolCounters:
+    """Thread-safe request/hit/miss counters shared by the pooled transports."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, opened_connection: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            if opened_connection:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+
+class PooledTransport(httpx.BaseTransport):
+    """
+    Synchronous transport backed by a shared connection pool.
+
+    close() is a no-op: clients built on this transport may be closed freely, the
+    pool owns the underlying connections.
+    """
+
+    def __init__(self, transport: httpx.HTTPTransport, counters: _PoolCounters):
+        self._transport = transport
+        self._counters = counters
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        opened = []
+        previous_trace = request.extensions.get("trace")
+        # Phase timing of the call in progress, if timings are collected (see tck.transport.timing)
+        timing = active_timing()
+
+        def trace(event_name: str, info: Dict[str, Any]) -> None:
+            if _opens_connection(event_name):
+                opened.append(event_name)
+            if timing is not None:
+                timing.trace(event_name)
+            if previous_trace is not None:
+                previous_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        try:
+            return self._transport.handle_request(request)
+        finally:
+            self._counters.record(bool(opened))
+
+    def close(self) -> None:
+        pass
+
+    def _close_pool(self) -> None:
+        self._transport.close()
+
+
+class AsyncPooledTransport(httpx.AsyncBaseTransport):
+    """Asynchronous counterpart of PooledTransport."""
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport, counters: _PoolCounters):
+        self._transport = transport
+        self._counters = counters
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        opened = []
+        previous_trace = request.extensions.get("trace")
+        # Phase timing of the call in progress, if timings are collected (see tck.transport.timing)
+        timing = active_timing()
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            if _opens_connection(event_name):
+                opened.append(event_name)
+            if timing is not None:
+                timing.trace(event_name)
+            if previous_trace is not None:
+                await previous_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        try:
+            return await self._transport.handle_async_request(request)
+        finally:
+            self._counters.record(bool(opened))
+
+    async def aclose(self) -> None:
+        pass
+
+    async def _aclose_pool(self) -> None:
+        await self._transport.aclose()
+
+
+class HTTPConnectionPool:
+    """
+    Registry of pooled HTTP transports shared by all HTTP clients in a session.
+
+    One transport exists per TLS verification mode and retry count; connections
+    within it are reused per host (origin). Async transports are additionally
+    kept per event loop, since asyncio connections cannot outlive their loop.
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            max_connections: Maximum number of open connections per transport
+            max_keepalive_connections: Maximum number of idle keep-alive connections per transport
+            keepalive_expiry: Seconds an idle keep-alive connection is kept open
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._counters = _PoolCounters()
+        self._lock = threading.Lock()
+        self._permissive_ssl_context: Optional[Union[ssl.SSLContext, bool]] = None
+        self._transports: Dict[Tuple[VerifyMode, int], PooledTransport] = {}
+        self._async_transports: Dict[Tuple[Optional[asyncio.AbstractEventLoop], VerifyMode, int], AsyncPooledTransport] = {}
+
+    def _resolve_verify(self, verify: VerifyMode) -> Union[ssl.SSLContext, bool]:
+        if verify != PERMISSIVE_TLS:
+            return bool(verify)
+        if self._permissive_ssl_context is None:
+            self._permissive_ssl_context = create_permissive_ssl_context()
+        return self._permissive_ssl_context
+
+    def transport(self, verify: VerifyMode = True, retries: int = 0) -> PooledTransport:
+        """
+        Get the shared synchronous transport for a TLS mode and retry count.
+
+        Args:
+            verify: True (verify certificates), False, or PERMISSIVE_TLS
+            retries: Number of connection retries
+
+        Returns:
+            Transport to pass to ``httpx.Client(transport=...)``
+        """
+        key = (verify, retries)
+        with self._lock:
+            transport = self._transports.get(key)
+            if transport is None:
+                transport = PooledTransport(
+                    httpx.HTTPTransport(verify=self._resolve_verify(verify), limits=self.limits, retries=retries),
+                    self._counters,
+                )
+                self._transports[key] = transport
+                logger.debug(f"Created pooled HTTP transport (verify={verify}, retries={retries})")
+            return transport
+
+    def async_transport(self, verify: VerifyMode = True, retries: int = 0) -> AsyncPooledTransport:
+        """
+        Get the shared asynchronous transport for the running event loop.
+
+        Args:
+            verify: True (verify certificates), False, or PERMISSIVE_TLS
+            retries: Number of connection retries
+
+        Returns:
+            Transport to pass to ``httpx.AsyncClient(transport=...)``
+        """
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        key = (loop, verify, retries)
+        with self._lock:
+            # Connections of closed loops are unusable; drop them
+            for stale in [k for k in self._async_transports if k[0] is not None and k[0].is_closed()]:
+                del self._async_transports[stale]
+
+            transport = self._async_transports.get(key)
+            if transport is None:
+                transport = AsyncPooledTransport(
+                    httpx.AsyncHTTPTransport(verify=self._resolve_verify(verify), limits=self.limits, retries=retries),
+                    self._counters,
+                )
+                self._async_transports[key] = transport
+            return transport
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get pool usage counters.
+
+        Returns:
+            Dictionary with requests, hits (reused a pooled connection), misses
+            (opened a new connection) and hit_rate
+        """
+        counters = self._counters
+        with counters._lock:
+            requests, hits, misses = counters.requests, counters.hits, counters.misses
+        return {
+            "requests": requests,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / requests, 4) if requests else 0.0,
+        }
+
+    def close(self) -> None:
+        """Close all pooled synchronous connections."""
+        with self._lock:
+            transports = list(self._transports.values())
+            self._transports.clear()
+            # Async connections belong to their (possibly already closed) loops
+            self._async_transports.clear()
+        for transport in transports:
+            transport._close_pool()
+
+
+_pool: Optional[HTTPConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_http_pool() -> HTTPConnectionPool:
+    """
+    Get the session-wide HTTP connection pool, creating it from tck.config on first use.
+
+    Returns:
+        The shared HTTPConnectionPool
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = HTTPConnectionPool(**config.get_http_pool_config())
+            logger.debug(f"Created HTTP connection pool with {_pool.limits}")
+        return _pool
+
+
+def close_http_pool() -> Optional[Dict[str, Any]]:
+    """
+    Close the session-wide pool; the next get_http_pool() call creates a new one.
+
+    Returns:
+        Final pool statistics, or None if no pool was created
+    """
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is None:
+        return None
+    stats = pool.stats()
+    pool.close()
+    return stats
+
+
+def pooled_client(verify: VerifyMode = True, retries: int = 0, **kwargs) -> httpx.Client:
+    """
+    Create an ``httpx.Client`` on the shared pool.
+
+    Args:
+        verify: True (verify certificates), False, or PERMISSIVE_TLS
+        retries: Number of connection retries
+        **kwargs: Other ``httpx.Client`` options (timeout, headers, follow_redirects, ...)
+
+    Returns:
+        A client whose connections come from the shared pool
+    """
+    return httpx.Client(transport=get_http_pool().transport(verify, retries), **kwargs)
+
+
+def pooled_async_client(verify: VerifyMode = True, retries: int = 0, **kwargs) -> httpx.AsyncClient:
+    """
+    Create an ``httpx.AsyncClient`` on the shared pool for the running event loop.
+
+    Args:
+        verify: True (verify certificates), False, or PERMISSIVE_TLS
+        retries: Number of connection retries
+        **kwargs: Other ``httpx.AsyncClient`` options
+
+    Returns:
+        A client whose connections come from the shared pool
+    """
+    return httpx.AsyncClient(transport=get_http_pool().async_transport(verify, retries), **kwargs)
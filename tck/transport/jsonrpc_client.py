@@ -11,16 +11,22 @@ while maintaining 100% backward compatibility with existing tests.
 Specification Reference: A2A Protocol v0.3.0 §3.2.1 - JSON-RPC 2.0 Transport
 """
 
+import asyncio
 import json
 import logging
 import os
+import time
 import uuid
 from typing import Any, Dict, List, Optional, Tuple, Union, cast, Iterator, AsyncIterator
 
 import httpx
 
 from tck import message_utils
-from tck.transport.base_client import BaseTransportClient, TransportType, TransportError
+from tck.transport.base_client import BaseTransportClient, Exchange, TransportCall, TransportType, TransportError, exchange_method
+from tck.transport.http_pool import pooled_async_client, pooled_client
+from tck.transport.retry_policy import CircuitOpenError, RetryPolicy
+from tck.transport.sse import aiter_sse_events
+from tck.transport.wire_log import get_wire_log
 from tck import config
 
 logger = logging.getLogger(__name__)
@@ -52,30 +58,34 @@ class JSONRPCClient(BaseTransportClient):
     Specification Reference: A2A Protocol v0.3.0 §3.2.1 - JSON-RPC 2.0 Transport
     """
 
-    def __init__(self, base_url: str, timeout: float = 30.0, max_retries: int = 3):
+    def __init__(self, base_url: str, timeout: float = 30.0, max_retries: Optional[int] = None):
         """
         Initialize the JSON-RPC client for real network communication.
 
         Args:
             base_url: Base URL of the A2A SUT's JSON-RPC endpoint
             timeout: Request timeout in seconds
-            max_retries: Maximum number of retry attempts for failed requests
+            max_retries: Maximum number of retries of a failed idempotent request
+                         (default: the session's retry policy, see tck.transport.retry_policy)
         """
         super().__init__(base_url, TransportType.JSON_RPC)
 
         self.timeout = timeout
         self.max_retries = max_retries
+        if max_retries is not None:
+            retry_config = config.get_retry_config()
+            self.retry_policy = RetryPolicy(max_retries + 1, retry_config["base_delay"], retry_config["max_delay"])
         
         # Configure streaming timeout from environment or use reasonable default
         base_timeout = float(os.getenv("TCK_STREAMING_TIMEOUT", "30.0"))
         self.streaming_timeout = base_timeout * 2  # Double the base timeout for streaming
 
-        # Configure httpx client with retry strategy for reliable network communication
-        transport = httpx.HTTPTransport(retries=max_retries)
-        self.client = httpx.Client(
-            timeout=timeout,
-            transport=transport
-        )
+        # httpx client on the shared connection pool (retries are handled by the retry policy)
+        self.client = pooled_client(timeout=timeout)
+
+        # Long-lived async client for streaming and the async API, created on first use in an event loop
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
         self.default_headers = {
             "Content-Type": "application/json"
@@ -83,6 +93,34 @@ class JSONRPCClient(BaseTransportClient):
 
         self._logger.info(f"JSON-RPC client initialized for {base_url} (streaming timeout: {self.streaming_timeout}s)")
 
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        Get or create the async HTTP client used for streaming and the async API.
+
+        The client is bound to the event loop it was created in and reused by every
+        stream started from that loop, so streams share pooled connections instead of
+        each paying a new TCP/TLS handshake. If it is accessed from a different event
+        loop, a new client is created for that loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = pooled_async_client(timeout=self.streaming_timeout)
+            self._async_client_loop = loop
+            self._logger.debug(f"Created async HTTP client for {self.base_url}")
+        return self._async_client
+
+    def _perform(self, call: TransportCall) -> httpx.Response:
+        """Send one HTTP request of an exchange on the pooled sync client."""
+        operation, url, kwargs = call
+        return getattr(self.client, operation)(url, **kwargs)
+
+    async def _aperform(self, call: TransportCall) -> httpx.Response:
+        """Send one HTTP request of an exchange on the long-lived async client."""
+        operation, url, kwargs = call
+        # The async client's default timeout is the (longer) streaming timeout
+        return await getattr(self.async_client, operation)(url, timeout=self.timeout, **kwargs)
+
     def _generate_id(self) -> str:
         """Generate a unique request ID for JSON-RPC requests."""
         return f"tck-{uuid.uuid4()}"
@@ -111,18 +149,28 @@ class JSONRPCClient(BaseTransportClient):
         Raises:
             JSONRPCError: If the request fails or returns an error
         """
+        return self._run_exchange(self._jsonrpc_exchange(method, params, request_id, extra_headers))
+
+    def _circuit_open_error(self, error: CircuitOpenError) -> JSONRPCError:
+        """An open circuit fails JSON-RPC calls and batches as a JSONRPCError."""
+        return JSONRPCError(f"SUT at {self.base_url} unreachable, call not made", original_error=error)
+
+    def _jsonrpc_exchange(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        request_id: Optional[str] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> Exchange:
+        """Exchange behind _make_jsonrpc_request, for use with ``yield from`` in method helpers."""
         # Build JSON-RPC 2.0 request
         jsonrpc_request = {"jsonrpc": "2.0", "method": method, "params": params or {}, "id": request_id or self._generate_id()}
 
         headers = self._prepare_headers(extra_headers)
 
-        self._logger.info(f"Sending JSON-RPC request to {self.base_url}: {jsonrpc_request}")
-
         try:
-            # Make actual HTTP request to live SUT
-            response = self.client.post(self.base_url, json=jsonrpc_request, headers=headers)
-
-            self._logger.info(f"SUT responded with {response.status_code}: {response.text}")
+            # Make actual HTTP request to live SUT (request and response go to the wire log)
+            response = yield ("post", self.base_url, {"json": jsonrpc_request, "headers": headers})
             response.raise_for_status()
 
         except httpx.HTTPStatusError as e:
@@ -183,66 +231,54 @@ class JSONRPCClient(BaseTransportClient):
         headers = self._prepare_headers(extra_headers)
         headers["Accept"] = "text/event-stream"
 
-
-        self._logger.info(f"Sending streaming JSON-RPC request to {self.base_url}: {jsonrpc_request}")
+        wire = get_wire_log()
+        started = time.perf_counter()
 
         try:
-            # Use httpx.AsyncClient for streaming
-            async with httpx.AsyncClient(timeout=self.streaming_timeout) as async_client:
-                async with async_client.stream(
+            # Reuse the long-lived async client (and its pooled connections) for every stream
+            async with self._open_http_stream(
+                self.async_client,
+                "POST",
+                self.base_url,
+                json=jsonrpc_request,
+                headers=headers
+            ) as response:
+                wire.call(
+                    self.transport_type.value,
                     "POST",
                     self.base_url,
-                    json=jsonrpc_request,
-                    headers=headers
-                ) as response:
-                    
-                    self._logger.info(f"SUT responded with {response.status_code}, content-type: {response.headers.get('content-type')}")
-                    
-                    # Validate response status
-                    response.raise_for_status()
-                    # Validate content type for SSE
-                    content_type = response.headers.get("content-type", "")
-                    # FIXME a2a-java, regression likely caused by https://github.com/a2aproject/a2a-java/issues/486
-                    if not content_type.startswith("text/event-stream"):
-                        raise JSONRPCError(f"Expected text/event-stream content type for streaming, got: {content_type}")
-
-                    # Parse Server-Sent Events stream
-                    async for line in response.aiter_lines():
-                        if line is None:
-                            continue
-                            
-                        line = line.strip()
-                        
-                        if not line:
-                            continue
-                            
-                        # Parse SSE format: "data: {json}"
-                        if line.startswith("data: "):
-                            try:
-                                data_str = line[6:]  # Remove "data: " prefix
-                                if data_str == "[DONE]":
-                                    break
-                                self._logger.info(f"Received SSE data: {data_str}")
-                                event_data = json.loads(data_str)
-                                # Check for JSON-RPC error in the event
-                                if "error" in event_data:
-                                    error_msg = f"JSON-RPC error from streaming SUT: {event_data['error']}"
-                                    self._logger.error(error_msg)
-                                    raise JSONRPCError(error_msg, json_rpc_error=event_data["error"])
-                                
-                                yield event_data
-                                
-                            except json.JSONDecodeError as e:
-                                self._logger.warning(f"Failed to parse SSE data: {data_str}, error: {e}")
-                                continue
-                                
-                        # Handle other SSE events (id, event, retry)
-                        elif line.startswith("event: "):
-                            event_type = line[7:]
-                            self._logger.debug(f"Received SSE event type: {event_type}")
-                        elif line.startswith("id: "):
-                            event_id = line[4:]
-                            self._logger.debug(f"Received SSE event ID: {event_id}")
+                    request=jsonrpc_request,
+                    response=f"content-type: {response.headers.get('content-type')}",
+                    status=response.status_code,
+                    elapsed=time.perf_counter() - started,
+                )
+
+                # Validate response status
+                response.raise_for_status()
+                # Validate content type for SSE
+                content_type = response.headers.get("content-type", "")
+                # FIXME a2a-java, regression likely caused by https://github.com/a2aproject/a2a-java/issues/486
+                if not content_type.startswith("text/event-stream"):
+                    raise JSONRPCError(f"Expected text/event-stream content type for streaming, got: {content_type}")
+
+                # Decode the Server-Sent Events stream incrementally from the raw bytes
+                async for event in aiter_sse_events(response):
+                    if event.data == "[DONE]":
+                        break
+                    wire.event(self.transport_type.value, self.base_url, event.data, event.event, event.id)
+                    try:
+                        event_data = json.loads(event.data)
+                    except json.JSONDecodeError as e:
+                        self._logger.warning(f"Failed to parse SSE data: {event.data}, error: {e}")
+                        continue
+
+                    # Check for JSON-RPC error in the event
+                    if "error" in event_data:
+                        error_msg = f"JSON-RPC error from streaming SUT: {event_data['error']}"
+                        self._logger.error(error_msg)
+                        raise JSONRPCError(error_msg, json_rpc_error=event_data["error"])
+
+                    yield event_data
 
         except httpx.HTTPStatusError as e:
             error_msg = f"HTTP status error communicating with SUT at {self.base_url}: {e.response.status_code} {e.response.text}"
@@ -257,6 +293,7 @@ class JSONRPCClient(BaseTransportClient):
             self._logger.error(error_msg)
             raise JSONRPCError(error_msg, original_error=e)
 
+    @exchange_method
     def send_message(
         self,
         message: Dict[str, Any],
@@ -286,8 +323,10 @@ class JSONRPCClient(BaseTransportClient):
             if configuration is not None:
                 params["configuration"] = configuration
 
-            response = self._make_jsonrpc_request(method="SendMessage", params=params, extra_headers=extra_headers)
-            return response.get("result", {})
+            response = yield from self._jsonrpc_exchange(method="SendMessage", params=params, extra_headers=extra_headers)
+            result = response.get("result", {})
+            self._validate_result("send_message", result)
+            return result
 
         except Exception as e:
             if isinstance(e, JSONRPCError):
@@ -347,6 +386,7 @@ class JSONRPCClient(BaseTransportClient):
                 raise
             raise JSONRPCError(f"Failed to send streaming message: {e}", original_error=e)
 
+    @exchange_method
     def get_task(
         self, task_id: str, history_length: Optional[int] = None, extra_headers: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
@@ -373,14 +413,17 @@ class JSONRPCClient(BaseTransportClient):
             if history_length is not None:
                 params["historyLength"] = history_length
 
-            response = self._make_jsonrpc_request(method="GetTask", params=params, extra_headers=extra_headers)
-            return response.get("result", {})
+            response = yield from self._jsonrpc_exchange(method="GetTask", params=params, extra_headers=extra_headers)
+            result = response.get("result", {})
+            self._validate_result("get_task", result)
+            return result
 
         except Exception as e:
             if isinstance(e, JSONRPCError):
                 raise
             raise JSONRPCError(f"Failed to get task {task_id}: {e}", original_error=e)
 
+    @exchange_method
     def cancel_task(self, task_id: str, extra_headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
         Cancel a task using CancelTask method.
@@ -400,8 +443,10 @@ class JSONRPCClient(BaseTransportClient):
         Specification Reference: A2A Protocol v1.0 §3.1.5. Cancel Task
         """
         try:
-            response = self._make_jsonrpc_request(method="CancelTask", params={"id": task_id}, extra_headers=extra_headers)
-            return response.get("result", {})
+            response = yield from self._jsonrpc_exchange(method="CancelTask", params={"id": task_id}, extra_headers=extra_headers)
+            result = response.get("result", {})
+            self._validate_result("cancel_task", result)
+            return result
 
         except Exception as e:
             if isinstance(e, JSONRPCError):
@@ -465,6 +510,7 @@ class JSONRPCClient(BaseTransportClient):
         async for result in self.subscribe_task(task_id, extra_headers):
             yield result
 
+    @exchange_method
     def create_task_push_notification_config(
         self, task_push_config: Dict[str, Any], extra_headers: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
@@ -486,7 +532,7 @@ class JSONRPCClient(BaseTransportClient):
         Specification Reference: A2A Protocol v0.3.0 §7.3 - Push Notifications
         """
         try:
-            response = self._make_jsonrpc_request(
+            response = yield from self._jsonrpc_exchange(
                 method="CreateTaskPushNotificationConfig",
                 params=task_push_config,
                 extra_headers=extra_headers,
@@ -498,6 +544,7 @@ class JSONRPCClient(BaseTransportClient):
                 raise
             raise JSONRPCError(f"Failed to set push notification config for task {task_id}: {e}", original_error=e)
 
+    @exchange_method
     def get_push_notification_config(
         self, task_id: str, config_id: str, extra_headers: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
@@ -520,7 +567,7 @@ class JSONRPCClient(BaseTransportClient):
         Specification Reference: A2A Protocol v0.3.0 §7.3.2 - Get Push Notification Config
         """
         try:
-            response = self._make_jsonrpc_request(
+            response = yield from self._jsonrpc_exchange(
                 method="GetTaskPushNotificationConfig",
                 params={"task_id": task_id, "id": config_id},
                 extra_headers=extra_headers,
@@ -532,6 +579,7 @@ class JSONRPCClient(BaseTransportClient):
                 raise
             raise JSONRPCError(f"Failed to get push notification config {config_id} for task {task_id}: {e}", original_error=e)
 
+    @exchange_method
     def list_push_notification_configs(self, task_id: str, extra_headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
         List all push notification configurations for a task.
@@ -552,7 +600,7 @@ class JSONRPCClient(BaseTransportClient):
         """
         try:
             # Method renamed from ListTaskPushNotificationConfig to ListTaskPushNotificationConfigs
-            response = self._make_jsonrpc_request(
+            response = yield from self._jsonrpc_exchange(
                 method="ListTaskPushNotificationConfigs", params={"task_id": task_id}, extra_headers=extra_headers
             )
             return response.get("result", {})
@@ -562,6 +610,7 @@ class JSONRPCClient(BaseTransportClient):
                 raise
             raise JSONRPCError(f"Failed to list push notification configs for task {task_id}: {e}", original_error=e)
 
+    @exchange_method
     def delete_push_notification_config(
         self, task_id: str, config_id: str, extra_headers: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
@@ -584,7 +633,7 @@ class JSONRPCClient(BaseTransportClient):
         Specification Reference: A2A Protocol v0.3.0 §7.3.4 - Delete Push Notification Config
         """
         try:
-            response = self._make_jsonrpc_request(
+            response = yield from self._jsonrpc_exchange(
                 method="DeleteTaskPushNotificationConfig",
                 params={"task_id": task_id, "id": config_id},
                 extra_headers=extra_headers,
@@ -596,6 +645,7 @@ class JSONRPCClient(BaseTransportClient):
                 raise
             raise JSONRPCError(f"Failed to delete push notification config {config_id} for task {task_id}: {e}", original_error=e)
 
+    @exchange_method
     def get_extended_agent_card(self, extra_headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
         Get the extended agent card.
@@ -614,7 +664,7 @@ class JSONRPCClient(BaseTransportClient):
         Specification Reference: A2A Protocol v0.3.0 §5.6 - Extended Card
         """
         try:
-            response = self._make_jsonrpc_request(
+            response = yield from self._jsonrpc_exchange(
                 method="GetExtendedAgentCard", params={}, extra_headers=extra_headers
             )
             return response.get("result", {})
@@ -624,6 +674,132 @@ class JSONRPCClient(BaseTransportClient):
                 raise
             raise JSONRPCError(f"Failed to get authenticated extended card: {e}", original_error=e)
 
+    # JSON-RPC 2.0 batches
+
+    def build_batch_request(self, helper: str, **kwargs) -> Dict[str, Any]:
+        """
+        Build, without sending, the JSON-RPC request one of this client's method helpers would send.
+
+        Args:
+            helper: Name of a non-streaming method helper, e.g. "get_task" or "list_tasks"
+            **kwargs: Arguments of the helper (extra_headers is ignored; see send_batch)
+
+        Returns:
+            The JSON-RPC request object
+
+        Raises:
+            ValueError: If the helper does not exist or is not a single non-streaming request
+        """
+        body = getattr(getattr(type(self), helper, None), "exchange", None)
+        if body is None:
+            raise ValueError(f"'{helper}' is not a non-streaming JSON-RPC method helper of {type(self).__name__}")
+
+        # The first network call of the helper's exchange carries its request
+        exchange = body(self, **kwargs)
+        try:
+            _, _, request_kwargs = next(exchange)
+        finally:
+            exchange.close()
+        return cast(Dict[str, Any], request_kwargs["json"])
+
+    def send_batch(
+        self,
+        calls: List[Union[Tuple[str, Dict[str, Any]], Dict[str, Any]]],
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Send several requests to the SUT in one JSON-RPC 2.0 batch (a single HTTP POST).
+
+        Responses are correlated with the requests by id, so the SUT may answer in any order.
+
+        Args:
+            calls: Batch entries. Each entry is either a (helper name, kwargs) tuple naming one of
+                   this client's method helpers, e.g. ("get_task", {"task_id": "t1"}), or a
+                   ready JSON-RPC request dict. Entries without an id are given one
+            extra_headers: Optional HTTP headers for the batch request
+
+        Returns:
+            One dict per entry, in the order of calls, with id, method, result (None on error)
+            and error (the JSON-RPC error object, a {"message": ...} object if the SUT sent no
+            response for the entry, or None on success)
+
+        Raises:
+            ValueError: If the batch is empty, an entry cannot be built or ids are not unique
+            JSONRPCError: If the HTTP request fails or the SUT rejects the batch as a whole
+
+        Specification Reference: JSON-RPC 2.0 §6 - Batch
+        """
+        if not calls:
+            raise ValueError("A JSON-RPC batch must contain at least one request")
+
+        batch = []
+        for call in calls:
+            if isinstance(call, dict):
+                request = dict(call)
+            else:
+                helper, kwargs = call
+                request = dict(self.build_batch_request(helper, **kwargs))
+            if request.get("id") is None:
+                request["id"] = self._generate_id()
+            batch.append(request)
+
+        ids = [request["id"] for request in batch]
+        if len(set(ids)) != len(ids):
+            raise ValueError("JSON-RPC batch request ids must be unique to correlate responses")
+
+        headers = self._prepare_headers(extra_headers)
+        self._logger.info(f"Sending JSON-RPC batch of {len(batch)} requests to {self.base_url}")
+
+        try:
+            response = self._run_exchange(self._batch_exchange(batch, headers))
+            response.raise_for_status()
+            json_response = response.json()
+        except httpx.HTTPStatusError as e:
+            error_msg = f"HTTP status error sending JSON-RPC batch to {self.base_url}: {e.response.status_code} {e.response.text}"
+            self._logger.error(error_msg)
+            raise JSONRPCError(error_msg, original_error=e)
+        except httpx.RequestError as e:
+            error_msg = f"HTTP error sending JSON-RPC batch to {self.base_url}: {e}"
+            self._logger.error(error_msg)
+            raise JSONRPCError(error_msg, original_error=e)
+        except ValueError as e:
+            error_msg = f"Failed to parse JSON-RPC batch response from SUT: {e}"
+            self._logger.error(error_msg)
+            raise JSONRPCError(error_msg, original_error=e)
+
+        # A single error object means the SUT rejected the batch itself (e.g. batches unsupported)
+        if not isinstance(json_response, list):
+            error = json_response.get("error") if isinstance(json_response, dict) else None
+            error_msg = f"SUT did not answer the JSON-RPC batch with a batch response: {json_response}"
+            self._logger.error(error_msg)
+            raise JSONRPCError(error_msg, json_rpc_error=error)
+
+        responses_by_id = {item.get("id"): item for item in json_response if isinstance(item, dict)}
+        results = []
+        for request in batch:
+            item = responses_by_id.get(request["id"])
+            if item is None:
+                error = {"message": f"No response for request id {request['id']} in the batch response"}
+            else:
+                error = item.get("error")
+            results.append(
+                {
+                    "id": request["id"],
+                    "method": request.get("method"),
+                    "result": item.get("result") if item is not None and error is None else None,
+                    "error": error,
+                }
+            )
+
+        failed = sum(1 for entry in results if entry["error"] is not None)
+        if failed:
+            self._logger.warning(f"{failed} of {len(results)} JSON-RPC batch entries failed")
+        return results
+
+    def _batch_exchange(self, batch: List[Dict[str, Any]], headers: Dict[str, str]) -> Exchange:
+        """Exchange posting a JSON-RPC batch; returns the raw HTTP response."""
+        return (yield ("post", self.base_url, {"json": batch, "headers": headers}))
+
     # Legacy methods for backward compatibility with existing SUTClient usage
 
     def raw_send(self, raw_data: str) -> Tuple[int, str]:
@@ -640,16 +816,17 @@ class JSONRPCClient(BaseTransportClient):
         """
         headers = {"Content-Type": "application/json"}
 
-        self._logger.info(f"Sending raw data to {self.base_url}: {raw_data}")
-
         try:
-            response = self.client.post(self.base_url, content=raw_data, headers=headers)
-            self._logger.info(f"SUT responded with {response.status_code}: {response.text}")
+            response = self._run_exchange(self._raw_exchange(raw_data, headers))
             return response.status_code, response.text
         except httpx.RequestError as e:
             self._logger.error(f"HTTP request failed: {e}")
             raise
 
+    def _raw_exchange(self, raw_data: str, headers: Dict[str, str]) -> Exchange:
+        """Exchange behind raw_send; returns the raw HTTP response."""
+        return (yield ("post", self.base_url, {"content": raw_data, "headers": headers}))
+
     def send_raw_json_rpc(self, json_request: dict, extra_headers: Dict[str, Any] = {}) -> Dict[str, Any]:
         """
         Send a JSON-RPC request without validation.
@@ -662,13 +839,14 @@ class JSONRPCClient(BaseTransportClient):
         Returns:
             The JSON response from the SUT
         """
-        headers = self._prepare_headers(extra_headers)
+        return self._run_exchange(self._raw_jsonrpc_exchange(json_request, extra_headers))
 
-        self._logger.info(f"Sending raw JSON-RPC request to {self.base_url}: {json_request}")
+    def _raw_jsonrpc_exchange(self, json_request: dict, extra_headers: Optional[Dict[str, Any]] = None) -> Exchange:
+        """Exchange behind send_raw_json_rpc."""
+        headers = self._prepare_headers(extra_headers)
 
         try:
-            response = self.client.post(self.base_url, json=json_request, headers=headers)
-            self._logger.info(f"SUT responded with {response.status_code}: {response.text}")
+            response = yield ("post", self.base_url, {"json": json_request, "headers": headers})
             response.raise_for_status()
             return cast(Dict[str, Any], response.json())
         except httpx.HTTPStatusError as e:
@@ -681,6 +859,7 @@ class JSONRPCClient(BaseTransportClient):
             self._logger.error(f"Failed to parse JSON response from SUT: {e}")
             raise
 
+    @exchange_method
     def list_tasks(
         self,
         contextId: Optional[str] = None,
@@ -727,15 +906,29 @@ class JSONRPCClient(BaseTransportClient):
 
         # Make JSON-RPC request using spec-compliant method name
         json_req = message_utils.make_json_rpc_request("ListTasks", params=params)
-        response = self.send_raw_json_rpc(json_req)
+        response = yield from self._raw_jsonrpc_exchange(json_req)
+        if "result" in response:
+            self._validate_result("list_tasks", response["result"])
 
         # Return the full response (with "result" or "error" key)
         return response
 
     def close(self):
-        """Close the HTTP client."""
+        """Close the HTTP client (pooled connections stay open for other clients)."""
         if hasattr(self, "client"):
             self.client.close()
+        # The async client can only be closed from its event loop (see aclose); drop it
+        self._async_client = None
+        self._async_client_loop = None
+
+    async def aclose(self):
+        """Close the async streaming client and the HTTP client."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_client_loop = None
+            self._logger.debug("Closed async HTTP client")
+        self.close()
 
     def __enter__(self):
         return self
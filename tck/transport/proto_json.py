@@ -0,0 +1,181 @@
+"""
+Descriptor-driven conversion of protobuf messages to A2A JSON.
+
+gRPC responses are converted straight from protobuf messages to the ProtoJSON mapping
+of a2a.proto (camelCase JSON names, enum value names, unset fields omitted) in a single
+pass. The conversion plan of each message type (JSON name and value converter of every
+field) is built once from its descriptor and cached, so converting a Task with a long
+history and many artifacts only walks the fields that are actually set.
+
+Well-known types are mapped as in google.protobuf.json_format: Struct, Value and
+ListValue become plain JSON values, Timestamp and Duration RFC 3339 strings, wrappers
+their wrapped value. Any other google.protobuf type falls back to json_format.
+"""
+
+import base64
+import math
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+from google.protobuf import json_format
+from google.protobuf.descriptor import Descriptor, FieldDescriptor
+
+# Field number -> (JSON name, value converter)
+FieldPlan = Dict[int, Tuple[str, Callable[[Any], Any]]]
+
+_plans: Dict[str, FieldPlan] = {}
+_plans_lock = threading.Lock()
+
+_INT64_TYPES = frozenset(
+    {
+        FieldDescriptor.TYPE_INT64,
+        FieldDescriptor.TYPE_UINT64,
+        FieldDescriptor.TYPE_SINT64,
+        FieldDescriptor.TYPE_FIXED64,
+        FieldDescriptor.TYPE_SFIXED64,
+    }
+)
+_FLOAT_TYPES = frozenset({FieldDescriptor.TYPE_FLOAT, FieldDescriptor.TYPE_DOUBLE})
+
+_WRAPPER_TYPES = frozenset(
+    {
+        "google.protobuf.BoolValue",
+        "google.protobuf.BytesValue",
+        "google.protobuf.DoubleValue",
+        "google.protobuf.FloatValue",
+        "google.protobuf.Int32Value",
+        "google.protobuf.Int64Value",
+        "google.protobuf.StringValue",
+        "google.protobuf.UInt32Value",
+        "google.protobuf.UInt64Value",
+    }
+)
+
+
+def message_to_json(message) -> Dict[str, Any]:
+    """
+    Convert a protobuf message to its A2A JSON representation.
+
+    Args:
+        message: Protobuf message object to convert
+
+    Returns:
+        Dict containing the fields of the message that are set, keyed by JSON name
+    """
+    plan = _plans.get(message.DESCRIPTOR.full_name) or _field_plan(message.DESCRIPTOR)
+    result = {}
+    for field, value in message.ListFields():
+        name, convert = plan[field.number]
+        result[name] = convert(value)
+    return result
+
+
+def _field_plan(descriptor: Descriptor) -> FieldPlan:
+    """Build and cache the conversion plan of a message type."""
+    with _plans_lock:
+        plan = _plans.get(descriptor.full_name)
+        if plan is None:
+            plan = {field.number: (field.json_name, _field_converter(field)) for field in descriptor.fields}
+            _plans[descriptor.full_name] = plan
+    return plan
+
+
+def _is_repeated(field: FieldDescriptor) -> bool:
+    """Whether a field is repeated (``is_repeated`` since protobuf 5.29; ``label`` was removed in 7)."""
+    is_repeated = getattr(field, "is_repeated", None)
+    if is_repeated is not None:
+        return is_repeated
+    return field.label == FieldDescriptor.LABEL_REPEATED
+
+
+def _field_converter(field: FieldDescriptor) -> Callable[[Any], Any]:
+    """Converter of a field's value (the whole container for repeated and map fields)."""
+    if field.message_type is not None and field.message_type.GetOptions().map_entry:
+        key_field = field.message_type.fields_by_name["key"]
+        value_convert = _value_converter(field.message_type.fields_by_name["value"])
+        if key_field.type == FieldDescriptor.TYPE_BOOL:
+            return lambda entries: {("true" if k else "false"): value_convert(v) for k, v in entries.items()}
+        return lambda entries: {str(k): value_convert(v) for k, v in entries.items()}
+
+    convert = _value_converter(field)
+    if _is_repeated(field):
+        if convert is _identity:
+            return list
+        return lambda values: [convert(v) for v in values]
+    return convert
+
+
+def _value_converter(field: FieldDescriptor) -> Callable[[Any], Any]:
+    """Converter of a single (non-repeated) value of a field."""
+    if field.type == FieldDescriptor.TYPE_MESSAGE:
+        return _message_converter(field.message_type.full_name)
+    if field.type == FieldDescriptor.TYPE_ENUM:
+        names = {value.number: value.name for value in field.enum_type.values}
+        # Unknown values of open enums are kept as numbers, as json_format does
+        return lambda number: names.get(number, number)
+    if field.type == FieldDescriptor.TYPE_BYTES:
+        return _bytes_to_json
+    if field.type in _INT64_TYPES:
+        return str
+    if field.type in _FLOAT_TYPES:
+        return _float_to_json
+    return _identity
+
+
+def _message_converter(full_name: str) -> Callable[[Any], Any]:
+    """Converter of a message-typed value, handling the well-known types."""
+    if full_name == "google.protobuf.Struct":
+        return _struct_to_json
+    if full_name == "google.protobuf.Value":
+        return _value_to_json
+    if full_name == "google.protobuf.ListValue":
+        return _list_value_to_json
+    if full_name in ("google.protobuf.Timestamp", "google.protobuf.Duration", "google.protobuf.FieldMask"):
+        return lambda message: message.ToJsonString()
+    if full_name in _WRAPPER_TYPES:
+        wrapped = _value_converter(_wrapper_value_field(full_name))
+        return lambda message: wrapped(message.value)
+    if full_name.startswith("google.protobuf."):
+        return lambda message: json_format.MessageToDict(message, preserving_proto_field_name=False)
+    return message_to_json
+
+
+def _wrapper_value_field(full_name: str) -> FieldDescriptor:
+    from google.protobuf import wrappers_pb2
+
+    return getattr(wrappers_pb2, full_name.rsplit(".", 1)[1]).DESCRIPTOR.fields_by_name["value"]
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _bytes_to_json(value: bytes) -> str:
+    return base64.b64encode(value).decode("utf-8")
+
+
+def _float_to_json(value: float) -> Any:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "Infinity" if value > 0 else "-Infinity"
+    return value
+
+
+def _struct_to_json(struct) -> Dict[str, Any]:
+    return {key: _value_to_json(value) for key, value in struct.fields.items()}
+
+
+def _list_value_to_json(list_value) -> list:
+    return [_value_to_json(value) for value in list_value.values]
+
+
+def _value_to_json(value) -> Any:
+    kind = value.WhichOneof("kind")
+    if kind == "struct_value":
+        return _struct_to_json(value.struct_value)
+    if kind == "list_value":
+        return _list_value_to_json(value.list_value)
+    if kind is None or kind == "null_value":
+        return None
+    return getattr(value, kind)
@@ -7,10 +7,11 @@ This client makes actual HTTP requests to live SUTs - NO MOCKING.
 Specification Reference: A2A Protocol v0.3.0 §4.3 - HTTP+JSON/REST Transport
 """
 
+import asyncio
 import json
 import logging
-import os
 import ssl
+import time
 import traceback
 from typing import Dict, Optional, Any, AsyncIterator
 from urllib.parse import urljoin
@@ -20,7 +21,10 @@ from httpx import AsyncClient, Client
 
 from tck.message_utils import convert_a2a_message_to_protobuf_json, handle_http_error_response, \
     convert_protobuf_response_to_a2a_json
-from tck.transport.base_client import BaseTransportClient, TransportType, TransportError
+from tck.transport.base_client import BaseTransportClient, TransportCall, TransportType, TransportError, exchange_method
+from tck.transport.http_pool import PERMISSIVE_TLS, get_http_pool
+from tck.transport.sse import aiter_sse_events
+from tck.transport.wire_log import get_wire_log
 from tck import config
 
 logger = logging.getLogger(__name__)
@@ -64,6 +68,7 @@ class RESTClient(BaseTransportClient):
         # HTTP client configuration
         self._client: Optional[Client] = None
         self._async_client: Optional[AsyncClient] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
         # Default headers for all requests
         self.default_headers = {
@@ -74,58 +79,42 @@ class RESTClient(BaseTransportClient):
 
         logger.info(f"Initialized REST client for endpoint: {self.base_url}")
 
-    def _create_ssl_context(self):
-        """Create a robust SSL context that handles various SSL/TLS issues."""
-        # Check if user wants to force simple SSL mode
-        if os.getenv('A2A_TCK_SIMPLE_SSL', '').lower() in ('true', '1', 'yes'):
-            logger.info("Using simple SSL mode (verify=False) due to A2A_TCK_SIMPLE_SSL")
-            return False
-
-        try:
-            # Try the most permissive SSL context first
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            
-            # Additional SSL options to handle edge cases
-            ssl_context.set_ciphers('DEFAULT:@SECLEVEL=1')
-
-            logger.debug("Created enhanced SSL context with permissive settings")
-            return ssl_context
-        except Exception as e:
-            logger.warning(f"Failed to create custom SSL context: {e}, falling back to verify=False")
-            return False
-
     @property
     def client(self) -> Client:
         """Get or create synchronous HTTP client for real network communication."""
         if self._client is None:
-            # Try SSL context first, fall back to verify=False
-            verify_setting = self._create_ssl_context()
-            
+            # Connections (and the permissive SSL context) come from the shared pool
             self._client = Client(
-                timeout=self.timeout, 
-                headers=self.default_headers, 
-                follow_redirects=True, 
-                verify=verify_setting
+                timeout=self.timeout,
+                headers=self.default_headers,
+                follow_redirects=True,
+                transport=get_http_pool().transport(PERMISSIVE_TLS),
             )
-            logger.debug(f"Created HTTP client for {self.base_url} with verify={type(verify_setting).__name__}")
+            logger.debug(f"Created pooled HTTP client for {self.base_url}")
         return self._client
 
     @property
     def async_client(self) -> AsyncClient:
-        """Get or create asynchronous HTTP client for real network communication."""
-        if self._async_client is None:
-            # Try SSL context first, fall back to verify=False
-            verify_setting = self._create_ssl_context()
-            
+        """
+        Get or create asynchronous HTTP client for real network communication.
+
+        The client is bound to the event loop it was created in; accessed from a
+        different event loop, a new client is created for that loop.
+        """
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client_loop = loop
+            # Connections (and the permissive SSL context) come from the shared pool
             self._async_client = AsyncClient(
-                verify=verify_setting, 
-                timeout=self.timeout, 
-                headers=self.default_headers, 
-                follow_redirects=True
+                timeout=self.timeout,
+                headers=self.default_headers,
+                follow_redirects=True,
+                transport=get_http_pool().async_transport(PERMISSIVE_TLS),
             )
-            logger.debug(f"Created async HTTP client for {self.base_url} with verify={type(verify_setting).__name__}")
+            logger.debug(f"Created pooled async HTTP client for {self.base_url}")
         return self._async_client
 
     def close(self):
@@ -148,12 +137,23 @@ class RESTClient(BaseTransportClient):
             self._async_client = None
             logger.debug("Closed async HTTP client")
 
+    def _perform(self, call: TransportCall) -> httpx.Response:
+        """Send one HTTP request of an exchange on the sync client."""
+        operation, url, kwargs = call
+        return getattr(self.client, operation)(url, **kwargs)
+
+    async def _aperform(self, call: TransportCall) -> httpx.Response:
+        """Send one HTTP request of an exchange on the async client."""
+        operation, url, kwargs = call
+        return await getattr(self.async_client, operation)(url, **kwargs)
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
+    @exchange_method
     def send_message(
         self,
         message: Dict[str, Any],
@@ -194,8 +194,7 @@ class RESTClient(BaseTransportClient):
                 payload["configuration"] = configuration
 
             # Make real HTTP request to live SUT
-            logger.debug(f"Sending REST request with payload: {payload}")
-            response = self.client.post(url, json=payload, headers=headers)
+            response = yield ("post", url, {"json": payload, "headers": headers})
 
             # Handle HTTP errors
             if response.status_code >= 400:
@@ -207,8 +206,9 @@ class RESTClient(BaseTransportClient):
 
             # Convert protobuf response back to A2A JSON format
             a2a_response = convert_protobuf_response_to_a2a_json(response_data)
+            self._validate_result("send_message", a2a_response)
 
-            logger.debug(f"Received REST response {response_data} for message {message.get('message_id')}")
+            logger.debug(f"Received REST response for message {message.get('message_id')}")
             return a2a_response
 
         except httpx.RequestError as e:
@@ -280,41 +280,35 @@ class RESTClient(BaseTransportClient):
                 payload["configuration"] = configuration
 
             # Make real HTTP streaming request to live SUT
-            async with self.async_client.stream("POST", url, json=payload, headers=headers) as response:
+            wire = get_wire_log()
+            started = time.perf_counter()
+            async with self._open_http_stream(self.async_client, "POST", url, json=payload, headers=headers) as response:
+                wire.call(
+                    self.transport_type.value,
+                    "POST",
+                    url,
+                    request=payload,
+                    response=f"content-type: {response.headers.get('content-type')}",
+                    status=response.status_code,
+                    elapsed=time.perf_counter() - started,
+                )
                 # Handle HTTP errors
                 if response.status_code >= 400:
                     error_msg = f"HTTP {response.status_code}: {await response.aread()}"
                     logger.error(f"REST streaming request failed: {error_msg}")
                     raise TransportError(f"REST streaming error: {error_msg}", TransportType.REST)
 
-                # Parse Server-Sent Events stream
-                async for line in response.aiter_lines():
-                    line = line.strip()
-
-                    if not line:
+                # Decode the Server-Sent Events stream incrementally from the raw bytes
+                async for event in aiter_sse_events(response):
+                    if event.data == "[DONE]":
+                        break
+                    wire.event(self.transport_type.value, url, event.data, event.event, event.id)
+                    try:
+                        event_data = json.loads(event.data)
+                    except json.JSONDecodeError as e:
+                        logger.warning(f"Failed to parse SSE data: {event.data}, error: {e}")
                         continue
-
-                    # Parse SSE format: "data: {json}"
-                    if line.startswith("data: "):
-                        try:
-                            data_str = line[6:]  # Remove "data: " prefix
-                            if data_str == "[DONE]":
-                                break
-
-                            event_data = json.loads(data_str)
-                            yield event_data
-
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"Failed to parse SSE data: {data_str}, error: {e}")
-                            continue
-
-                    # Handle other SSE events (id, event, retry)
-                    elif line.startswith("event: "):
-                        event_type = line[7:]
-                        logger.debug(f"Received SSE event type: {event_type}")
-                    elif line.startswith("id: "):
-                        event_id = line[4:]
-                        logger.debug(f"Received SSE event ID: {event_id}")
+                    yield event_data
 
             logger.debug(f"Completed REST streaming for message {message.get('message_id')}")
 
@@ -327,6 +321,7 @@ class RESTClient(BaseTransportClient):
             logger.error(error_msg)
             raise TransportError(error_msg, TransportType.REST)
 
+    @exchange_method
     def get_task(self, task_id: str, **kwargs) -> Dict[str, Any]:
         """
         Get task status via HTTP GET.
@@ -357,7 +352,7 @@ class RESTClient(BaseTransportClient):
                     params["historyLength"] = kwargs["history_length"]
 
             # Make real HTTP request to live SUT
-            response = self.client.get(url, params=params, headers=headers)
+            response = yield ("get", url, {"params": params, "headers": headers})
 
             # Handle HTTP errors
             if response.status_code >= 400:
@@ -369,6 +364,7 @@ class RESTClient(BaseTransportClient):
 
             # Convert protobuf response back to A2A JSON format
             a2a_response = convert_protobuf_response_to_a2a_json(task_data)
+            self._validate_result("get_task", a2a_response)
 
             logger.debug(f"Retrieved task via REST: {task_id}")
             return a2a_response
@@ -382,6 +378,7 @@ class RESTClient(BaseTransportClient):
             logger.error(error_msg)
             raise TransportError(error_msg, TransportType.REST)
 
+    @exchange_method
     def cancel_task(self, task_id: str, **kwargs) -> Dict[str, Any]:
         """
         Cancel task via HTTP POST.
@@ -410,7 +407,7 @@ class RESTClient(BaseTransportClient):
             request_body = kwargs.get("metadata", {})
 
             # Make real HTTP request to live SUT
-            response = self.client.post(url, json=request_body, headers=headers)
+            response = yield ("post", url, {"json": request_body, "headers": headers})
 
             # Handle HTTP errors
             if response.status_code >= 400:
@@ -422,6 +419,7 @@ class RESTClient(BaseTransportClient):
 
             # Convert protobuf response back to A2A JSON format
             a2a_response = convert_protobuf_response_to_a2a_json(cancelled_task)
+            self._validate_result("cancel_task", a2a_response)
 
             logger.debug(f"Cancelled task via REST: {task_id}")
             return a2a_response
@@ -479,41 +477,34 @@ class RESTClient(BaseTransportClient):
             headers["Accept"] = "text/event-stream"  # SSE format
 
             # Make real HTTP streaming request to live SUT
-            async with self.async_client.stream("POST", url, headers=headers) as response:
+            wire = get_wire_log()
+            started = time.perf_counter()
+            async with self._open_http_stream(self.async_client, "POST", url, headers=headers) as response:
+                wire.call(
+                    self.transport_type.value,
+                    "POST",
+                    url,
+                    response=f"content-type: {response.headers.get('content-type')}",
+                    status=response.status_code,
+                    elapsed=time.perf_counter() - started,
+                )
                 # Handle HTTP errors
                 if response.status_code >= 400:
                     error_msg = f"HTTP {response.status_code}: {await response.aread()}"
                     logger.error(f"REST task subscription failed: {error_msg}")
                     raise TransportError(f"REST streaming error: {error_msg}", TransportType.REST)
 
-                # Parse Server-Sent Events stream
-                async for line in response.aiter_lines():
-                    line = line.strip()
-
-                    if not line:
+                # Decode the Server-Sent Events stream incrementally from the raw bytes
+                async for event in aiter_sse_events(response):
+                    if event.data == "[DONE]":
+                        break
+                    wire.event(self.transport_type.value, url, event.data, event.event, event.id)
+                    try:
+                        event_data = json.loads(event.data)
+                    except json.JSONDecodeError as e:
+                        logger.warning(f"Failed to parse SSE data: {event.data}, error: {e}")
                         continue
-
-                    # Parse SSE format: "data: {json}"
-                    if line.startswith("data: "):
-                        try:
-                            data_str = line[6:]  # Remove "data: " prefix
-                            if data_str == "[DONE]":
-                                break
-
-                            event_data = json.loads(data_str)
-                            yield event_data
-
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"Failed to parse SSE data: {data_str}, error: {e}")
-                            continue
-
-                    # Handle other SSE events
-                    elif line.startswith("event: "):
-                        event_type = line[7:]
-                        logger.debug(f"Received SSE event type: {event_type}")
-                    elif line.startswith("id: "):
-                        event_id = line[4:]
-                        logger.debug(f"Received SSE event ID: {event_id}")
+                    yield event_data
 
             logger.debug(f"Completed REST subscription for task: {task_id}")
 
@@ -526,6 +517,7 @@ class RESTClient(BaseTransportClient):
             logger.error(error_msg)
             raise TransportError(error_msg, TransportType.REST)
 
+    @exchange_method
     def get_extended_agent_card(self, extra_headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
         Get authenticated extended agent card via HTTP GET.
@@ -545,7 +537,7 @@ class RESTClient(BaseTransportClient):
             headers = self._prepare_headers(extra_headers)
 
             # Make real HTTP request to live SUT (with authentication headers)
-            response = self.client.get(url, headers=headers)
+            response = yield ("get", url, {"headers": headers})
 
             # Handle HTTP errors
             if response.status_code >= 400:
@@ -570,6 +562,7 @@ class RESTClient(BaseTransportClient):
 
     # Push notification configuration methods
 
+    @exchange_method
     def create_task_push_notification_config(self, task_push_config: Dict[str, Any], extra_headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
         Set push notification config for a task via HTTP POST.
@@ -598,7 +591,7 @@ class RESTClient(BaseTransportClient):
 
             logger.debug(f"Set push notification config via REST: {task_push_config}")
             # Make real HTTP request to live SUT
-            response = self.client.post(url, json=task_push_config, headers=headers)
+            response = yield ("post", url, {"json": task_push_config, "headers": headers})
 
             # Handle HTTP errors
             if response.status_code >= 400:
@@ -621,6 +614,7 @@ class RESTClient(BaseTransportClient):
             logger.error(error_msg)
             raise TransportError(error_msg, TransportType.REST)
 
+    @exchange_method
     def get_push_notification_config(self, task_id: str, config_id: str, **kwargs) -> Dict[str, Any]:
         """
         Get push notification config via HTTP GET.
@@ -646,7 +640,7 @@ class RESTClient(BaseTransportClient):
             headers = self._prepare_headers(kwargs.get("extra_headers", {}))
 
             # Make real HTTP request to live SUT
-            response = self.client.get(url, headers=headers)
+            response = yield ("get", url, {"headers": headers})
 
             # Handle HTTP errors
             if response.status_code >= 400:
@@ -669,6 +663,7 @@ class RESTClient(BaseTransportClient):
             logger.error(error_msg)
             raise TransportError(error_msg, TransportType.REST)
 
+    @exchange_method
     def list_push_notification_configs(self, task_id: str, **kwargs) -> Dict[str, Any]:
         """
         List push notification configs for a task via HTTP GET.
@@ -693,7 +688,7 @@ class RESTClient(BaseTransportClient):
             headers = self._prepare_headers(kwargs.get("extra_headers", {}))
 
             # Make real HTTP request to live SUT
-            response = self.client.get(url, headers=headers)
+            response = yield ("get", url, {"headers": headers})
 
             # Handle HTTP errors
             if response.status_code >= 400:
@@ -729,6 +724,7 @@ class RESTClient(BaseTransportClient):
             logger.error(error_msg)
             raise TransportError(error_msg, TransportType.REST)
 
+    @exchange_method
     def delete_push_notification_config(self, task_id: str, config_id: str, **kwargs) -> Dict[str, Any]:
         """
         Delete push notification config via HTTP DELETE.
@@ -754,7 +750,7 @@ class RESTClient(BaseTransportClient):
             headers = self._prepare_headers(kwargs.get("extra_headers", {}))
 
             # Make real HTTP request to live SUT
-            response = self.client.delete(url, headers=headers)
+            response = yield ("delete", url, {"headers": headers})
 
             # Handle HTTP errors
             if response.status_code >= 400:
@@ -785,6 +781,7 @@ class RESTClient(BaseTransportClient):
 
     # Optional REST-specific methods
 
+    @exchange_method
     def list_tasks(
         self,
         contextId: Optional[str] = None,
@@ -842,7 +839,7 @@ class RESTClient(BaseTransportClient):
                 params["includeArtifacts"] = str(includeArtifacts).lower()  # Convert boolean to string
 
             # Make real HTTP request to live SUT
-            response = self.client.get(url, params=params, headers=headers)
+            response = yield ("get", url, {"params": params, "headers": headers})
 
             # Handle HTTP errors
             if response.status_code >= 400:
@@ -851,6 +848,7 @@ class RESTClient(BaseTransportClient):
 
             # Parse JSON response
             tasks_result = response.json()
+            self._validate_result("list_tasks", tasks_result)
 
             logger.debug("Listed tasks via REST")
             return tasks_result
@@ -0,0 +1,253 @@
+"""
+Retry, backoff and circuit-breaker policy shared by all transports.
+
+Every network call of an exchange (see base_client.exchange_method) goes through the
+session's RetryPolicy and the CircuitBreaker of its SUT endpoint:
+
+- Transient failures (connection errors and timeouts, HTTP 502/503/504, gRPC
+  UNAVAILABLE and DEADLINE_EXCEEDED) are retried with exponential backoff and full
+  jitter, but only for idempotent A2A methods (get/list methods and the extended
+  Agent Card), so that a retry never sends a message or cancels a task twice. A
+  connection that could not be opened is retried for every method, since the request
+  never reached the SUT.
+- After ``breaker_threshold`` consecutive calls that could not reach an endpoint, its
+  circuit opens: further calls fail immediately (with CircuitOpenError, which transport
+  clients raise as their TransportError) instead of each waiting out its timeout. After ``breaker_reset`` seconds one call is let through to
+  probe the endpoint; if it gets an answer the circuit closes again.
+
+Policies are configured with config.set_retry_config or the A2A_RETRY_* and
+A2A_CIRCUIT_BREAKER_* environment variables. Streaming calls are not retried, but do
+go through the circuit breaker.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+import httpx
+
+from tck import config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# A2A methods (client method names) that are safe to send again
+IDEMPOTENT_METHODS = frozenset(
+    {
+        "get_task",
+        "list_tasks",
+        "get_push_notification_config",
+        "list_push_notification_configs",
+        "get_extended_agent_card",
+        "get_agent_card",
+    }
+)
+
+# HTTP statuses of a gateway or server that is temporarily unable to answer
+TRANSIENT_HTTP_STATUSES = frozenset({502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of making a call to an endpoint whose circuit is open."""
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for transient failures of idempotent calls."""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.25, max_delay: float = 4.0, jitter: bool = True):
+        """
+        Args:
+            max_attempts: Attempts per call, including the first (1 disables retries)
+            base_delay: Backoff before the first retry, in seconds
+            max_delay: Upper bound of any backoff, in seconds
+            jitter: Draw each backoff uniformly between 0 and its bound (full jitter)
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number ``attempt`` (1 for the first retry), in seconds."""
+        bound = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, bound) if self.jitter else bound
+
+    def should_retry(self, attempt: int, method: Optional[str], transient: bool, sent: bool = True) -> bool:
+        """
+        Whether a failed attempt is retried.
+
+        Args:
+            attempt: Number of the attempt that failed (1 for the first)
+            method: A2A method (client method name) the call belongs to, if known
+            transient: Whether the failure is transient
+            sent: Whether the request may have reached the SUT
+        """
+        if attempt >= self.max_attempts or not transient:
+            return False
+        return not sent or method in IDEMPOTENT_METHODS
+
+    def run(self, func: Callable[[], T], retry_on: Tuple[Type[BaseException], ...] = (Exception,), description: str = "call") -> T:
+        """
+        Call func, retrying it with backoff when it raises one of retry_on.
+
+        For idempotent operations outside the transport clients (e.g. downloads).
+        """
+        attempt = 1
+        while True:
+            try:
+                return func()
+            except retry_on as e:
+                if attempt >= self.max_attempts:
+                    logger.error(f"{description} failed after {attempt} attempts: {e}")
+                    raise
+                delay = self.backoff(attempt)
+                logger.warning(f"{description} attempt {attempt}/{self.max_attempts} failed: {e}. Retrying in {delay:.2f}s")
+                time.sleep(delay)
+                attempt += 1
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker of one SUT endpoint."""
+
+    def __init__(self, name: str, threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Args:
+            name: Endpoint the breaker protects (for messages)
+            threshold: Consecutive unreachable calls that open the circuit (0 disables the breaker)
+            reset_timeout: Seconds the circuit stays open before a probe call is let through
+        """
+        self.name = name
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.rejected = 0
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """"closed", "open" or "half-open"."""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            return "half-open" if time.monotonic() - self._opened_at >= self.reset_timeout else "open"
+
+    def before_call(self) -> bool:
+        """
+        Admit a call, or reject it while the circuit is open.
+
+        Returns:
+            True if the call is the half-open probe: it must end with record_success,
+            record_failure or release_probe, or no other call is let through
+
+        Raises:
+            CircuitOpenError: If the endpoint was found unreachable and is not being probed yet
+        """
+        if self.threshold <= 0:
+            return False
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            waited = time.monotonic() - self._opened_at
+            if waited >= self.reset_timeout and not self._probing:
+                # Half-open: let one call through to probe the endpoint
+                self._probing = True
+                return True
+            self.rejected += 1
+            failures = self._failures
+        raise CircuitOpenError(
+            f"Circuit open for {self.name}: {failures} consecutive calls could not reach it "
+            f"(next probe in {max(0.0, self.reset_timeout - waited):.0f}s)"
+        )
+
+    def record_success(self) -> None:
+        """Note that a call got an answer from the endpoint."""
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info(f"Circuit closed for {self.name}: endpoint is answering again")
+            self._failures, self._opened_at, self._probing = 0, None, False
+
+    def release_probe(self) -> None:
+        """Note that the probe call ended without an outcome (e.g. cancelled); the next call probes instead."""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """Note that a call could not reach the endpoint."""
+        if self.threshold <= 0:
+            return
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self._failures < self.threshold:
+                return
+            if self._opened_at is None:
+                logger.error(
+                    f"Circuit opened for {self.name} after {self._failures} consecutive unreachable calls; "
+                    f"failing calls to it for {self.reset_timeout:.0f}s"
+                )
+            # A failed probe keeps the circuit open for another reset_timeout
+            self._opened_at = time.monotonic()
+
+
+def http_failure(result: Any, error: Optional[BaseException]) -> Tuple[bool, bool, bool]:
+    """
+    Classify the outcome of an HTTP call.
+
+    Args:
+        result: httpx.Response, or None if the call raised
+        error: Exception raised by the call, or None
+
+    Returns:
+        Tuple of (transient, unreachable, sent): whether the failure is worth retrying,
+        whether the endpoint could not be reached at all, and whether the request may
+        have reached it
+    """
+    if error is None:
+        return getattr(result, "status_code", None) in TRANSIENT_HTTP_STATUSES, False, True
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+        return True, True, False
+    if isinstance(error, httpx.TimeoutException):
+        return True, True, True
+    if isinstance(error, httpx.TransportError):
+        return True, False, True
+    return False, False, True
+
+
+_policy: Optional[RetryPolicy] = None
+_breakers: Dict[str, CircuitBreaker] = {}
+_state_lock = threading.Lock()
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Get the session's retry policy (built from config.get_retry_config on first use)."""
+    global _policy
+    if _policy is None:
+        retry_config = config.get_retry_config()
+        _policy = RetryPolicy(retry_config["max_attempts"], retry_config["base_delay"], retry_config["max_delay"])
+    return _policy
+
+
+def get_circuit_breaker(endpoint: str) -> CircuitBreaker:
+    """Get the session-wide circuit breaker of a SUT endpoint (URL origin or gRPC target)."""
+    breaker = _breakers.get(endpoint)
+    if breaker is None:
+        with _state_lock:
+            breaker = _breakers.get(endpoint)
+            if breaker is None:
+                retry_config = config.get_retry_config()
+                breaker = CircuitBreaker(endpoint, retry_config["breaker_threshold"], retry_config["breaker_reset"])
+                _breakers[endpoint] = breaker
+    return breaker
+
+
+def reset_retry_policy() -> None:
+    """Forget the session's retry policy and circuit breakers (they are rebuilt from config on next use)."""
+    global _policy
+    with _state_lock:
+        _policy = None
+        _breakers.clear()
@@ -0,0 +1,257 @@
+"""
+Precompiled JSON Schema validators for A2A responses.
+
+All transport clients validate the results of A2A methods through the session-wide
+registry in this module. The A2A JSON schema (``spec_analysis/a2a_schema.json``) is
+loaded once, and one validator per definition (Task, Message, Artifact, AgentCard,
+...) is compiled on first use and cached, so thousands of responses do not each pay
+jsonschema's schema checking and reference resolution setup.
+
+The schema file describes the earlier JSON-RPC wire format (lowercase enum values and
+``kind`` discriminators), while SUTs now answer with the ProtoJSON mapping of
+a2a.proto. Definitions are therefore compiled with a small compatibility overlay
+(see _adapt_definitions): enums accept their proto names as well, ``kind`` and
+``contextId`` are optional, and a Part may use the proto ``text``/``raw``/``url``/``data``
+shape. Everything else is validated as the schema states.
+
+Results of send_message, get_task, cancel_task and list_tasks are validated on every
+transport. Deliberately left unvalidated, because their proto shapes differ structurally
+from the schema rather than by enum names or optional fields:
+
+- the AgentCard (the schema requires ``url``, a2a.proto lists supportedInterfaces);
+- push notification configs (flat in a2a.proto, nested in the schema);
+- streaming and subscribe events: the proto StreamResponse wraps each event by type
+  (task, message, statusUpdate, artifactUpdate), and ProtoJSON omits ``final: false``,
+  which the schema's update events require.
+
+The registry records how often each definition was validated, how long validation
+took and how many instances failed; see SchemaRegistry.timings().
+"""
+
+import copy
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCHEMA_PATH = Path(__file__).resolve().parent.parent.parent / "spec_analysis" / "a2a_schema.json"
+
+# Proto enum name prefixes accepted next to the schema's values
+_PROTO_ENUM_PREFIXES = {"TaskState": "TASK_STATE_"}
+_PROTO_ROLE_PREFIX = "ROLE_"
+
+# Part in the ProtoJSON mapping: exactly one of text, raw, url or data
+_PROTO_PART = {
+    "type": "object",
+    "properties": {
+        "text": {"type": "string"},
+        "raw": {"type": "string"},
+        "url": {"type": "string"},
+        "data": {},
+        "filename": {"type": "string"},
+        "mediaType": {"type": "string"},
+        "metadata": {"type": "object"},
+    },
+    "oneOf": [{"required": [field]} for field in ("text", "raw", "url", "data")],
+}
+
+# Result definitions of the A2A methods whose result is a single schema object
+_METHOD_RESULT_DEFINITIONS = {
+    "get_task": "Task",
+    "cancel_task": "Task",
+}
+
+
+def _proto_enum_names(values: List[str], prefix: str) -> List[str]:
+    """Proto enum names of schema enum values, e.g. input-required -> TASK_STATE_INPUT_REQUIRED."""
+    return [prefix + value.upper().replace("-", "_") for value in values]
+
+
+def _adapt_definitions(definitions: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Apply the ProtoJSON compatibility overlay to the schema definitions.
+
+    Args:
+        definitions: The ``definitions`` of the A2A schema (not modified)
+
+    Returns:
+        Adapted copy of the definitions
+    """
+    definitions = copy.deepcopy(definitions)
+    for definition in definitions.values():
+        required = definition.get("required")
+        if required and "kind" in required:
+            definition["required"] = [field for field in required if field != "kind"]
+
+    for name, prefix in _PROTO_ENUM_PREFIXES.items():
+        enum = definitions[name]["enum"]
+        enum.extend(_proto_enum_names(enum, prefix))
+
+    role = definitions["Message"]["properties"]["role"]
+    role["enum"].extend(_proto_enum_names(role["enum"], _PROTO_ROLE_PREFIX))
+
+    # context_id is optional in a2a.proto
+    definitions["Task"]["required"] = [field for field in definitions["Task"]["required"] if field != "contextId"]
+
+    definitions["Part"]["anyOf"].append(_PROTO_PART)
+    return definitions
+
+
+class SchemaRegistry:
+    """Registry of compiled validators, one per definition of the A2A schema."""
+
+    def __init__(self, schema_path: Union[str, Path] = DEFAULT_SCHEMA_PATH):
+        """
+        Initialize the registry; the schema is loaded on first use.
+
+        Args:
+            schema_path: Path of the A2A JSON schema
+        """
+        self.schema_path = Path(schema_path)
+        self._lock = threading.Lock()
+        self._schema: Optional[Dict[str, Any]] = None
+        self._validators: Dict[str, Any] = {}
+        self._timings: Dict[str, Dict[str, float]] = {}
+
+    def _load(self) -> Dict[str, Any]:
+        if self._schema is None:
+            with open(self.schema_path, "r") as f:
+                schema = json.load(f)
+            schema["definitions"] = _adapt_definitions(schema["definitions"])
+            self._schema = schema
+            logger.debug(f"Loaded A2A schema with {len(schema['definitions'])} definitions from {self.schema_path}")
+        return self._schema
+
+    def definitions(self) -> List[str]:
+        """
+        Get the names of all definitions in the schema.
+
+        Returns:
+            Sorted definition names
+        """
+        with self._lock:
+            return sorted(self._load()["definitions"])
+
+    def validator(self, definition: str) -> Any:
+        """
+        Get the compiled validator for a schema definition.
+
+        Args:
+            definition: Definition name (e.g. "Task")
+
+        Returns:
+            A jsonschema validator, compiled on first use
+
+        Raises:
+            KeyError: If the schema has no such definition
+        """
+        validator = self._validators.get(definition)
+        if validator is not None:
+            return validator
+
+        from jsonschema.validators import validator_for
+
+        with self._lock:
+            validator = self._validators.get(definition)
+            if validator is None:
+                schema = self._load()
+                if definition not in schema["definitions"]:
+                    raise KeyError(f"A2A schema has no definition '{definition}'")
+                # References (#/definitions/...) resolve against this root, which shares the loaded definitions
+                root = {"$schema": schema["$schema"], "definitions": schema["definitions"], "$ref": f"#/definitions/{definition}"}
+                cls = validator_for(root)
+                if not self._validators:
+                    cls.check_schema(schema)
+                validator = self._validators[definition] = cls(root)
+        return validator
+
+    def errors(self, definition: str, instance: Any, path: str = "") -> List[str]:
+        """
+        Validate an instance against a schema definition.
+
+        Args:
+            definition: Definition name (e.g. "Task")
+            instance: Decoded JSON value to validate
+            path: Location of the instance in the response, prefixed to error locations
+
+        Returns:
+            Error messages ("location: message"), empty if the instance is valid
+        """
+        validator = self.validator(definition)
+        start = time.perf_counter()
+        messages = []
+        for error in validator.iter_errors(instance):
+            location = ".".join(str(p) for p in (path, *error.absolute_path) if p != "") or definition
+            messages.append(f"{location}: {error.message}")
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            timing = self._timings.setdefault(definition, {"count": 0, "failures": 0, "total_ms": 0.0, "max_ms": 0.0})
+            timing["count"] += 1
+            timing["failures"] += bool(messages)
+            timing["total_ms"] += elapsed * 1000
+            timing["max_ms"] = max(timing["max_ms"], elapsed * 1000)
+        return messages
+
+    def result_errors(self, method_name: str, result: Any) -> List[str]:
+        """
+        Validate the result of an A2A method.
+
+        Args:
+            method_name: Client method name (e.g. "send_message", "get_task")
+            result: The method's decoded result
+
+        Returns:
+            Error messages, empty if the result is valid or the method's result is not covered by the schema
+        """
+        if method_name == "send_message":
+            if isinstance(result, dict):
+                if "task" in result:
+                    return self.errors("Task", result["task"], "task")
+                if "message" in result:
+                    return self.errors("Message", result["message"], "message")
+            # Unwrapped Task or Message
+            return self.errors("Task" if isinstance(result, dict) and "status" in result else "Message", result)
+        if method_name == "list_tasks":
+            tasks = result.get("tasks", []) if isinstance(result, dict) else result
+            if not isinstance(tasks, list):
+                return [f"tasks: {tasks!r} is not of type 'array'"]
+            return [message for i, task in enumerate(tasks) for message in self.errors("Task", task, f"tasks.{i}")]
+        definition = _METHOD_RESULT_DEFINITIONS.get(method_name)
+        return self.errors(definition, result) if definition else []
+
+    def timings(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get validation statistics per definition.
+
+        Returns:
+            For each validated definition: count, failures, total_ms, mean_ms and max_ms,
+            ordered by total time spent
+        """
+        with self._lock:
+            timings = {name: dict(timing) for name, timing in self._timings.items()}
+        for timing in timings.values():
+            timing["mean_ms"] = timing["total_ms"] / timing["count"]
+        return dict(sorted(timings.items(), key=lambda item: item[1]["total_ms"], reverse=True))
+
+
+_registry: Optional[SchemaRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_schema_registry() -> SchemaRegistry:
+    """
+    Get the session-wide schema registry.
+
+    Returns:
+        The shared SchemaRegistry
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = SchemaRegistry()
+        return _registry
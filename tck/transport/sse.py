@@ -0,0 +1,175 @@
+"""
+Incremental Server-Sent Events decoder for the A2A TCK.
+
+JSONRPCClient and RESTClient decode their ``text/event-stream`` responses with
+SSEDecoder: it is fed raw bytes as they arrive (``response.aiter_bytes()``), splits
+lines on CRLF, LF or CR at the bytes level, and reassembles events following the
+event stream interpretation rules of the HTML Living Standard (§9.2.6):
+
+- multiple ``data:`` lines of one event are joined with newlines;
+- ``event:`` sets the event type (default ``message``);
+- ``id:`` sets the last event id, which is kept across events for resumption;
+- ``retry:`` sets the reconnection time in milliseconds;
+- lines starting with ``:`` are comments; an event without data is not dispatched;
+- an incomplete event at the end of the stream is discarded.
+
+Event data is decoded from UTF-8 once per event, not once per line.
+"""
+
+from typing import AsyncIterator, Dict, List, Optional
+
+import httpx
+
+
+class SSEEvent:
+    """A dispatched Server-Sent Event."""
+
+    __slots__ = ("data", "event", "id", "retry")
+
+    def __init__(self, data: str, event: str = "message", id: Optional[str] = None, retry: Optional[int] = None):
+        """
+        Initialize the event.
+
+        Args:
+            data: Event data (data lines joined with newlines)
+            event: Event type
+            id: Last event id when the event was dispatched, or None if the stream has set none
+            retry: Reconnection time in milliseconds last announced by the stream, if any
+        """
+        self.data = data
+        self.event = event
+        self.id = id
+        self.retry = retry
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, SSEEvent):
+            return NotImplemented
+        return (self.data, self.event, self.id, self.retry) == (other.data, other.event, other.id, other.retry)
+
+    def __repr__(self) -> str:
+        return f"SSEEvent(data={self.data!r}, event={self.event!r}, id={self.id!r}, retry={self.retry!r})"
+
+
+class SSEDecoder:
+    """
+    Incremental decoder turning chunks of an event stream into SSEEvent objects.
+
+    Chunks may split lines, line breaks (CR LF) and multi-byte characters anywhere;
+    only complete events (terminated by a blank line) are interpreted.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._skip_lf = False
+        self._started = False
+        self._event_types: Dict[bytes, str] = {}
+        self._last_event_id_raw: Optional[bytes] = None
+        self.last_event_id: Optional[str] = None
+        self.retry: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> List[SSEEvent]:
+        """
+        Decode the next chunk of the stream.
+
+        Args:
+            chunk: Raw bytes as received
+
+        Returns:
+            Events completed by this chunk, in stream order
+        """
+        if self._skip_lf and chunk:
+            # The previous chunk ended in CR; a LF starting this one belongs to the same line break
+            self._skip_lf = False
+            if chunk[:1] == b"\n":
+                chunk = chunk[1:]
+        if not chunk:
+            return []
+        if not self._started:
+            # A UTF-8 byte order mark may precede the first line
+            self._started = True
+            if chunk[:3] == b"\xef\xbb\xbf":
+                chunk = chunk[3:]
+        if b"\r" in chunk:
+            # Normalize CRLF and CR line breaks to LF
+            self._skip_lf = chunk[-1:] == b"\r"
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+        # Only complete events (ending in a blank line) are interpreted
+        buffer = self._buffer
+        if not buffer and chunk[-2:] == b"\n\n":
+            # Common case: the chunk ends on an event boundary, so it is split without buffering
+            complete = chunk
+        else:
+            # Only the new bytes (and the LF before them) can complete an event
+            start = max(len(buffer) - 1, 0)
+            buffer += chunk
+            end = buffer.rfind(b"\n\n", start)
+            if end < 0:
+                return []
+            with memoryview(buffer) as view:
+                complete = bytes(view[: end + 2])
+            del buffer[: end + 2]
+
+        events: List[SSEEvent] = []
+        for block in complete.split(b"\n\n"):
+            if block[:6] == b"data: " and b"\n" not in block:
+                # Fast path: an event consisting of a single data line
+                events.append(SSEEvent(block[6:].decode("utf-8", "replace"), "message", self.last_event_id, self.retry))
+                continue
+
+            data: List[bytes] = []
+            event_type = b""
+            for line in block.split(b"\n"):
+                # A line without a colon is a field with an empty value; one starting with a colon is a comment
+                field, _, value = line.partition(b":")
+                if value[:1] == b" ":
+                    value = value[1:]
+                if field == b"data":
+                    data.append(value)
+                elif field == b"event":
+                    event_type = value
+                elif field == b"id":
+                    if value != self._last_event_id_raw and b"\x00" not in value:
+                        self._last_event_id_raw = value
+                        self.last_event_id = value.decode("utf-8", "replace")
+                elif field == b"retry":
+                    if value.isdigit():
+                        self.retry = int(value)
+                # Blank lines, comments and unknown fields are ignored
+
+            # Events without data are not dispatched
+            if data:
+                events.append(
+                    SSEEvent(
+                        (data[0] if len(data) == 1 else b"\n".join(data)).decode("utf-8", "replace"),
+                        self._decode_event_type(event_type),
+                        self.last_event_id,
+                        self.retry,
+                    )
+                )
+        return events
+
+    def _decode_event_type(self, event_type: bytes) -> str:
+        if not event_type:
+            return "message"
+        decoded = self._event_types.get(event_type)
+        if decoded is None:
+            decoded = self._event_types[event_type] = event_type.decode("utf-8", "replace")
+        return decoded
+
+
+async def aiter_sse_events(response: httpx.Response, decoder: Optional[SSEDecoder] = None) -> AsyncIterator[SSEEvent]:
+    """
+    Iterate over the events of a streaming ``text/event-stream`` response.
+
+    Args:
+        response: Streaming httpx response
+        decoder: Decoder to use, e.g. to read its last_event_id afterwards (default: a new one)
+
+    Yields:
+        Dispatched events, in stream order
+    """
+    decoder = decoder if decoder is not None else SSEDecoder()
+    async for chunk in response.aiter_bytes():
+        for event in decoder.feed(chunk):
+            yield event
@@ -0,0 +1,222 @@
+"""
+Per-call timing breakdown of the requests exchanged with the SUT.
+
+When collection is started (see tck.call_timings), every network call of an exchange
+(see base_client.exchange_method) and every stream gets a CallTiming splitting its
+duration into phases, in seconds:
+
+- ``connect``: opening a new connection, including DNS resolution (HTTP only; 0 when a
+  pooled connection was reused)
+- ``tls``: the TLS handshake of a new connection (HTTP only)
+- ``ttfb``: from sending the request to the first byte of the response, i.e. network
+  round trip plus the SUT's processing time. gRPC exposes no wire-level events, so for
+  gRPC this is the whole RPC (unary) or the time to the first message (streams)
+- ``transfer``: receiving the response body (or the rest of a stream)
+- ``tck``: the TCK's own work on the response: parsing, schema validation and, for
+  gRPC, protobuf to JSON conversion
+
+HTTP phases come from the httpcore trace extension of the shared pooled transport
+(http_pool), which reads the CallTiming of the call in progress from a context
+variable, so every HTTP client on the pool is covered without per-client hooks.
+Retried calls keep the phases of their last attempt, and ``total`` includes the
+backoff waits. Collection is off by default and costs nothing then.
+"""
+
+import contextlib
+import contextvars
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+# Phases of a call, in the order they happen
+PHASES = ("connect", "tls", "ttfb", "transfer", "tck")
+
+# httpcore trace event (without its .started/.complete suffix) → phase it belongs to
+_TRACE_PHASES = {
+    "connection.connect_tcp": "connect",
+    "connection.connect_unix_socket": "connect",
+    "connection.start_tls": "tls",
+    "http11.receive_response_body": "transfer",
+    "http2.receive_response_body": "transfer",
+}
+
+
+class CallTiming:
+    """Timing breakdown of one call to the SUT."""
+
+    __slots__ = ("transport", "method", "operation", "attempts", "phases", "started", "total", "_attempt_started", "_marks")
+
+    def __init__(self, transport: str, method: Optional[str], operation: str):
+        """
+        Args:
+            transport: Transport of the call ("jsonrpc", "grpc", "rest")
+            method: A2A method (client method name) the call belongs to, if known
+            operation: The call's operation (HTTP method or RPC name)
+        """
+        self.transport = transport
+        self.method = method
+        self.operation = operation
+        self.attempts = 0
+        self.phases: Dict[str, float] = {}
+        self.started = time.perf_counter()
+        self.total = 0.0
+        self._attempt_started = self.started
+        self._marks: Dict[str, float] = {}
+
+    def begin_attempt(self) -> None:
+        """Start a (new) attempt of the call, discarding the phases of the previous one."""
+        self.attempts += 1
+        self.phases.clear()
+        self._marks.clear()
+        self._attempt_started = time.perf_counter()
+
+    def trace(self, event_name: str) -> None:
+        """Note an httpcore trace event of the current attempt."""
+        now = time.perf_counter()
+        name, _, stage = event_name.rpartition(".")
+        if stage == "started":
+            self._marks[name] = now
+            if name.endswith(".send_request_headers"):
+                self._marks["request"] = now
+            return
+        if stage != "complete":
+            return
+        phase = _TRACE_PHASES.get(name)
+        if phase is not None and name in self._marks:
+            self.phases[phase] = self.phases.get(phase, 0.0) + now - self._marks[name]
+        elif name.endswith(".receive_response_headers") and "request" in self._marks:
+            self.phases["ttfb"] = now - self._marks["request"]
+
+    def end_attempt(self) -> None:
+        """Finish the current attempt; time not covered by trace events counts as ttfb."""
+        elapsed = time.perf_counter() - self._attempt_started
+        if "ttfb" not in self.phases:
+            self.phases["ttfb"] = max(0.0, elapsed - sum(self.phases.values()))
+
+    def first_response(self) -> None:
+        """Note the first response (headers or message) of a stream: what follows is transfer."""
+        now = time.perf_counter()
+        if "ttfb" not in self.phases:
+            self.phases["ttfb"] = max(0.0, now - self._attempt_started - sum(self.phases.values()))
+        self._marks["transfer"] = now
+
+    def end_stream(self) -> None:
+        """Finish a stream."""
+        if "transfer" in self._marks:
+            self.phases["transfer"] = time.perf_counter() - self._marks["transfer"]
+        else:
+            self.end_attempt()
+
+    def add_tck_time(self, seconds: float) -> None:
+        """Add time the TCK spent processing the response."""
+        self.phases["tck"] = self.phases.get("tck", 0.0) + seconds
+
+    def finish(self) -> None:
+        """Fix the call's total duration."""
+        self.total = time.perf_counter() - self.started
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form of the timing (durations in milliseconds)."""
+        return {
+            "transport": self.transport,
+            "method": self.method,
+            "operation": self.operation,
+            "attempts": self.attempts,
+            "total_ms": round(self.total * 1000, 3),
+            **{f"{phase}_ms": round(self.phases[phase] * 1000, 3) for phase in PHASES if phase in self.phases},
+        }
+
+
+class CallTimingCollector:
+    """Collects the CallTimings of finished calls until they are drained."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timings: List[CallTiming] = []
+
+    def start(self, transport: str, method: Optional[str], operation: str) -> CallTiming:
+        """Create the timing of a call that is about to be made."""
+        return CallTiming(transport, method, operation)
+
+    def add(self, timing: CallTiming) -> None:
+        """Collect the timing of a finished call."""
+        timing.finish()
+        with self._lock:
+            self._timings.append(timing)
+
+    def drain(self) -> List[CallTiming]:
+        """Take the timings collected since the last drain."""
+        with self._lock:
+            timings, self._timings = self._timings, []
+        return timings
+
+
+_collector: Optional[CallTimingCollector] = None
+
+# Timing of the call the current thread or task is making
+_active_timing: contextvars.ContextVar[Optional[CallTiming]] = contextvars.ContextVar("tck_call_timing", default=None)
+
+
+def get_timing_collector() -> Optional[CallTimingCollector]:
+    """Get the active collector, or None if timings are not being collected."""
+    return _collector
+
+
+def start_call_timing() -> CallTimingCollector:
+    """Start collecting call timings."""
+    global _collector
+    _collector = CallTimingCollector()
+    return _collector
+
+
+def stop_call_timing() -> None:
+    """Stop collecting call timings."""
+    global _collector
+    _collector = None
+
+
+def active_timing() -> Optional[CallTiming]:
+    """Get the timing of the call in progress in this context (for transport trace hooks)."""
+    return _active_timing.get()
+
+
+@contextlib.contextmanager
+def timing_call(timing: Optional[CallTiming]) -> Iterator[None]:
+    """Make timing the active timing of one attempt of a call while it runs."""
+    if timing is None:
+        yield
+        return
+    timing.begin_attempt()
+    token = _active_timing.set(timing)
+    try:
+        yield
+    finally:
+        _active_timing.reset(token)
+        timing.end_attempt()
+
+
+@contextlib.contextmanager
+def timed_processing(collector: Optional[CallTimingCollector], timing: Optional[CallTiming]) -> Iterator[None]:
+    """Count the block as the TCK's processing of a call's response, then collect the call's timing."""
+    if timing is None or collector is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing.add_tck_time(time.perf_counter() - started)
+        collector.add(timing)
+
+
+@contextlib.contextmanager
+def timed_stream(collector: Optional[CallTimingCollector], timing: Optional[CallTiming]) -> Iterator[None]:
+    """Collect the timing of a stream once the block consuming it is done."""
+    if timing is None or collector is None:
+        yield
+        return
+    try:
+        yield
+    finally:
+        timing.end_stream()
+        collector.add(timing)
@@ -9,8 +9,11 @@ Specification Reference: A2A Protocol v0.3.0 §3.4 - Transport Compliance and In
 """
 
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Any, Dict, List, Optional, Set, Union
 
+import httpx
 import requests
 
 from tck.agent_card_utils import (
@@ -23,6 +26,8 @@ from tck.agent_card_utils import (
     validate_transport_consistency,
 )
 from tck.transport.base_client import BaseTransportClient, TransportType, TransportError
+from tck.transport.capture import get_replayer
+from tck.transport.http_pool import pooled_client
 from tck import config as tck_config
 
 logger = logging.getLogger(__name__)
@@ -57,6 +62,7 @@ class TransportManager:
     - Selecting appropriate transport clients based on strategy
     - Coordinating multi-transport testing scenarios
     - Managing client lifecycle and connection pooling
+    - Probing the declared endpoints before the first test (probe_endpoints)
 
     Specification Reference: A2A Protocol v0.3.0 §3.4.2 - Transport Selection and Negotiation
     """
@@ -64,26 +70,31 @@ class TransportManager:
     def __init__(
         self,
         sut_base_url: str,
-        session: Optional[requests.Session] = None,
+        session: Optional[Union[httpx.Client, requests.Session]] = None,
         selection_strategy: str = TransportSelectionStrategy.AGENT_PREFERRED,
+        agent_card: Optional[Dict[str, Any]] = None,
     ):
         """
         Initialize the TransportManager.
 
         Args:
             sut_base_url: Base URL of the SUT
-            session: Optional requests session for HTTP operations
+            session: Optional HTTP client for discovery; defaults to a client on the
+                     shared connection pool
             selection_strategy: Strategy for transport selection
+            agent_card: Optional Agent Card already fetched from the SUT; discovery uses it
+                        instead of fetching the card again (unless force_refresh is set)
         """
         self.sut_base_url = sut_base_url
-        self.session = session or requests.Session()
+        self.session = session or pooled_client(follow_redirects=True)
         self.selection_strategy = selection_strategy
 
         # Initialize internal state
-        self._agent_card: Optional[Dict[str, Any]] = None
+        self._agent_card: Optional[Dict[str, Any]] = agent_card
         self._supported_transports: List[TransportType] = []
         self._transport_endpoints: Dict[TransportType, str] = {}
         self._client_cache: Dict[TransportType, BaseTransportClient] = {}
+        self._endpoint_health: Dict[TransportType, Dict[str, Any]] = {}
         self._discovery_completed = False
 
         logger.info(f"TransportManager initialized for {sut_base_url} with strategy: {selection_strategy}")
@@ -107,8 +118,9 @@ class TransportManager:
         logger.info(f"Discovering transports for SUT: {self.sut_base_url}")
 
         try:
-            # Fetch the Agent Card
-            self._agent_card = fetch_agent_card(self.sut_base_url, self.session)
+            # Fetch the Agent Card (reuse a prefetched card unless a refresh is forced)
+            if self._agent_card is None or force_refresh:
+                self._agent_card = fetch_agent_card(self.sut_base_url, self.session)
             if not self._agent_card:
                 raise TransportManagerError("Failed to fetch Agent Card from SUT")
 
@@ -146,6 +158,77 @@ class TransportManager:
                 raise
             raise TransportManagerError(f"Transport discovery failed: {e}") from e
 
+    def probe_endpoints(self, budget: Optional[float] = None) -> Dict[TransportType, Dict[str, Any]]:
+        """
+        Probe the endpoints of all discovered transports concurrently.
+
+        Each transport's client is created and connects to its endpoint (see
+        BaseTransportClient.probe), so an unreachable interface is known before the first
+        test instead of after its first timeout, and reachable ones leave a warm
+        connection for the tests. Probes that have not answered when the budget is spent
+        count as unreachable. Nothing is probed when replaying a capture archive.
+
+        Args:
+            budget: Bound of the whole probing phase in seconds (default: config.get_endpoint_probe_config())
+
+        Returns:
+            Dictionary mapping each TransportType to its health: endpoint, reachable,
+            latency_ms (whole probe), connect_ms (new connection incl. TLS, None if one was
+            reused) and error
+
+        Raises:
+            TransportManagerError: If discovery fails
+        """
+        if not self._discovery_completed:
+            if not self.discover_transports():
+                raise TransportManagerError("Cannot probe endpoints: transport discovery failed")
+        if get_replayer() is not None:
+            return {}
+        if budget is None:
+            budget = tck_config.get_endpoint_probe_config()["budget"]
+
+        started = time.monotonic()
+        transports = list(self._supported_transports)
+        pool = ThreadPoolExecutor(max_workers=max(1, len(transports)), thread_name_prefix="tck-probe")
+        futures = {pool.submit(self._probe_endpoint, transport_type, budget): transport_type for transport_type in transports}
+        done, _ = wait(futures, timeout=budget)
+        # A probe still waiting on its endpoint is abandoned, not awaited
+        pool.shutdown(wait=False)
+
+        for future, transport_type in futures.items():
+            if future in done:
+                health = future.result()
+            else:
+                health = self._endpoint_health_record(transport_type, error=f"no answer within the {budget:g}s probe budget")
+            self._endpoint_health[transport_type] = health
+            if health["reachable"]:
+                logger.info(
+                    f"{transport_type.value} endpoint {health['endpoint']} reachable in {health['latency_ms']:.1f}ms"
+                    + (f" (connect {health['connect_ms']:.1f}ms)" if health["connect_ms"] is not None else "")
+                )
+            else:
+                logger.warning(f"{transport_type.value} endpoint {health['endpoint']} is unreachable: {health['error']}")
+        logger.info(f"Probed {len(transports)} endpoint(s) in {time.monotonic() - started:.2f}s")
+        return dict(self._endpoint_health)
+
+    def get_endpoint_health(self) -> Dict[TransportType, Dict[str, Any]]:
+        """
+        Get the results of the last probe_endpoints call.
+
+        Returns:
+            Dictionary mapping each probed TransportType to its health (empty if not probed)
+        """
+        return dict(self._endpoint_health)
+
+    def get_agent_card(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the Agent Card used for transport discovery.
+
+        Returns:
+            The Agent Card dictionary, or None if it has not been fetched
+        """
+        return self._agent_card
+
     def get_supported_transports(self) -> List[TransportType]:
         """
         Get list of supported transport types.
@@ -301,6 +384,7 @@ class TransportManager:
             "is_multi_transport": self.is_multi_transport_sut(),
             "selection_strategy": self.selection_strategy,
             "discovery_completed": self._discovery_completed,
+            "endpoint_health": {t.value: health for t, health in self._endpoint_health.items()},
         }
 
     def _select_transport_by_strategy(self) -> Optional[TransportType]:
@@ -340,6 +424,36 @@ class TransportManager:
             # Default: return first supported transport
             return self._supported_transports[0]
 
+    def _probe_endpoint(self, transport_type: TransportType, timeout: float) -> Dict[str, Any]:
+        """Probe one transport's endpoint with its (cached) client and describe its health."""
+        started = time.perf_counter()
+        try:
+            phases = self.get_transport_client(transport_type).probe(timeout)
+        except Exception as e:
+            return self._endpoint_health_record(transport_type, error=f"{type(e).__name__}: {e}")
+        connect = phases.get("connect", 0.0) + phases.get("tls", 0.0) if "connect" in phases else None
+        return self._endpoint_health_record(
+            transport_type,
+            latency_ms=round((time.perf_counter() - started) * 1000, 3),
+            connect_ms=round(connect * 1000, 3) if connect is not None else None,
+        )
+
+    def _endpoint_health_record(
+        self,
+        transport_type: TransportType,
+        latency_ms: Optional[float] = None,
+        connect_ms: Optional[float] = None,
+        error: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Health of a transport's endpoint; reachable unless an error is given."""
+        return {
+            "endpoint": self._transport_endpoints.get(transport_type),
+            "reachable": error is None,
+            "latency_ms": latency_ms,
+            "connect_ms": connect_ms,
+            "error": error,
+        }
+
     def _create_transport_client(self, transport_type: TransportType) -> BaseTransportClient:
         """
         Create a transport client for the specified transport type.
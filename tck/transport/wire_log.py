@@ -0,0 +1,263 @@
+"""
+Wire logging of the requests, responses and stream events exchanged with the SUT.
+
+All transports record their network traffic through the WireLog of this module on the
+dedicated "tck.wire" logger, so that logging the traffic stays off the request path:
+
+- Records are only built when the logger is enabled, and bodies are rendered lazily:
+  a request dict, response bytes or protobuf message is kept as is and only serialized
+  (and truncated to ``max_body_bytes``) when a handler formats the record.
+- Under load, only the first ``sample_after`` records of each second are logged in
+  full; after that one record in ``sample_every`` is, and the number of records
+  sampled out is reported once the second is over.
+- Once set up with start_wire_logging (done by logging_config.setup_logging), records
+  are handed to a queue and formatted and written by a background thread.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+from typing import Any, Dict, Optional
+
+WIRE_LOGGER_NAME = "tck.wire"
+
+wire_logger = logging.getLogger(WIRE_LOGGER_NAME)
+
+# Level above CRITICAL, used to turn wire logging off
+_OFF = logging.CRITICAL + 10
+
+
+class WireBody:
+    """Body of a wire record, rendered and truncated only when the record is formatted."""
+
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value: Any, limit: int):
+        self.value = value
+        self.limit = limit
+
+    def __str__(self) -> str:
+        value = self.value
+        if value is None:
+            return "-"
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            size = len(value)
+            text = bytes(value[: self.limit]).decode("utf-8", errors="replace")
+        else:
+            if isinstance(value, str):
+                text = value
+            elif isinstance(value, BaseException):
+                text = f"{type(value).__name__}: {value}"
+            elif hasattr(value, "SerializeToString"):
+                from google.protobuf import text_format
+
+                text = text_format.MessageToString(value, as_one_line=True)
+            else:
+                text = json.dumps(value, default=str, ensure_ascii=False)
+            size = len(text)
+            text = text[: self.limit]
+        if size > self.limit:
+            return f"{text}... [{size - self.limit} more bytes]"
+        return text
+
+
+class _Sampler:
+    """Admits every record up to a per-second budget, then one in every N."""
+
+    def __init__(self, sample_after: int, sample_every: int):
+        self.sample_after = sample_after
+        self.sample_every = sample_every
+        self.sampled_out = 0
+        self._window = 0
+        self._count = 0
+        self._dropped = 0
+        self._lock = threading.Lock()
+
+    def admit(self) -> bool:
+        if self.sample_every <= 1:
+            return True
+        window = int(time.monotonic())
+        with self._lock:
+            dropped = 0
+            if window != self._window:
+                self._window, self._count = window, 0
+                dropped, self._dropped = self._dropped, 0
+            self._count += 1
+            over = self._count - self.sample_after
+            admitted = over <= 0 or over % self.sample_every == 0
+            if not admitted:
+                self._dropped += 1
+                self.sampled_out += 1
+        if dropped:
+            wire_logger.warning("%d wire records sampled out under load", dropped)
+        return admitted
+
+
+class WireLog:
+    """
+    Records network traffic with the SUT on the "tck.wire" logger.
+
+    Each record carries a ``wire`` attribute with its structured fields (transport,
+    kind, operation, target, status, elapsed_ms) for handlers that want them.
+    """
+
+    def __init__(self, max_body_bytes: int = 4096, sample_after: int = 200, sample_every: int = 100):
+        """
+        Args:
+            max_body_bytes: Maximum logged size of a request or response body
+            sample_after: Records per second logged in full before sampling starts
+            sample_every: Log one record in this many once sampling has started
+        """
+        self.max_body_bytes = max_body_bytes
+        self._sampler = _Sampler(sample_after, sample_every)
+
+    @property
+    def sampled_out(self) -> int:
+        """Total number of records dropped by sampling."""
+        return self._sampler.sampled_out
+
+    def enabled(self) -> bool:
+        """Whether wire records are currently logged at all."""
+        return wire_logger.isEnabledFor(logging.INFO)
+
+    def call(
+        self,
+        transport: str,
+        operation: str,
+        target: str,
+        request: Any = None,
+        response: Any = None,
+        status: Any = None,
+        elapsed: Optional[float] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Record one request/response round trip.
+
+        Args:
+            transport: Transport name (e.g. "jsonrpc")
+            operation: HTTP method or RPC name
+            target: URL or gRPC target
+            request: Request body (dict, str, bytes or protobuf message)
+            response: Response body (dict, str, bytes or protobuf message)
+            status: HTTP status code or gRPC status name
+            elapsed: Round trip time in seconds
+            error: Exception raised by the call, if any
+        """
+        if not wire_logger.isEnabledFor(logging.INFO) or not self._sampler.admit():
+            return
+        elapsed_ms = round(elapsed * 1000, 3) if elapsed is not None else None
+        fields: Dict[str, Any] = {
+            "transport": transport,
+            "kind": "call",
+            "operation": operation,
+            "target": target,
+            "status": status if error is None else f"{status or type(error).__name__}",
+            "elapsed_ms": elapsed_ms,
+        }
+        wire_logger.info(
+            "%s %s %s -> %s in %s ms | request: %s | response: %s",
+            transport,
+            operation,
+            target,
+            fields["status"],
+            elapsed_ms,
+            WireBody(request, self.max_body_bytes),
+            WireBody(response if error is None else error, self.max_body_bytes),
+            extra={"wire": fields},
+        )
+
+    def event(self, transport: str, target: str, data: Any, event_type: Optional[str] = None, event_id: Optional[str] = None) -> None:
+        """
+        Record one streamed event.
+
+        Args:
+            transport: Transport name
+            target: URL or gRPC target of the stream
+            data: Event payload (str, bytes, dict or protobuf message)
+            event_type: SSE event type, if any
+            event_id: SSE event id, if any
+        """
+        if not wire_logger.isEnabledFor(logging.INFO) or not self._sampler.admit():
+            return
+        fields = {"transport": transport, "kind": "event", "target": target, "event": event_type, "id": event_id}
+        wire_logger.info(
+            "%s event %s (event: %s, id: %s) | data: %s",
+            transport,
+            target,
+            event_type,
+            event_id,
+            WireBody(data, self.max_body_bytes),
+            extra={"wire": fields},
+        )
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting (and body rendering) to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_wire_log = WireLog()
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.Lock()
+_atexit_registered = False
+
+
+def get_wire_log() -> WireLog:
+    """Get the session-wide wire log."""
+    return _wire_log
+
+
+def start_wire_logging(
+    *handlers: logging.Handler,
+    level: Optional[str] = "INFO",
+    max_body_bytes: int = 4096,
+    sample_after: int = 200,
+    sample_every: int = 100,
+) -> None:
+    """
+    Route the "tck.wire" logger through a queue to handlers run by a background thread.
+
+    Replaces any previous wire logging setup.
+
+    Args:
+        *handlers: Handlers that format and write the records (none: write synchronously
+                   through the root logger's handlers)
+        level: Level of the wire logger, or "OFF" to disable wire logging
+        max_body_bytes: Maximum logged size of a request or response body
+        sample_after: Records per second logged in full before sampling starts
+        sample_every: Log one record in this many once sampling has started
+    """
+    global _wire_log, _listener, _atexit_registered
+    stop_wire_logging()
+    with _listener_lock:
+        _wire_log = WireLog(max_body_bytes, sample_after, sample_every)
+        level_name = (level or "INFO").upper()
+        wire_logger.handlers = []
+        wire_logger.setLevel(_OFF if level_name == "OFF" else getattr(logging, level_name, logging.INFO))
+        # Without handlers of its own the wire logger writes through the root logger's
+        wire_logger.propagate = not handlers
+        if level_name == "OFF" or not handlers:
+            return
+        records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        wire_logger.handlers = [_DeferredQueueHandler(records)]
+        _listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+        _listener.start()
+        if not _atexit_registered:
+            atexit.register(stop_wire_logging)
+            _atexit_registered = True
+
+
+def stop_wire_logging() -> None:
+    """Write out queued wire records and stop the background thread."""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
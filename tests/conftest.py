@@ -1,7 +1,8 @@
+import json
 import os
+import sys
 import pytest
 import tck.config
-import requests
 import uuid
 import logging
 from tck import agent_card_utils
@@ -35,6 +36,12 @@ def pytest_addoption(parser):
         default=True,
         help="Enable transport equivalence testing for multi-transport SUTs",
     )
+    parser.addoption(
+        "--agent-card-output",
+        action="store",
+        default=None,
+        help="Write the Agent Card fetched for this session to the given JSON file",
+    )
 
 
 def pytest_configure(config):
@@ -78,6 +85,32 @@ def pytest_configure(config):
 
     tck.config.set_enable_transport_equivalence_testing(enable_equivalence)
 
+
+def pytest_sessionfinish(session, exitstatus):
+    """Close the shared HTTP connection pool and gRPC channels, and log connection reuse and schema validation timings."""
+    from tck.transport.http_pool import close_http_pool
+
+    # Only a session that used gRPC has imported the channel registry
+    grpc_channels = sys.modules.get("tck.transport.grpc_channels")
+    if grpc_channels is not None:
+        grpc_channels.close_grpc_channel_pool()
+
+    stats = close_http_pool()
+    if stats and stats["requests"]:
+        logger.info(
+            f"HTTP connection pool: {stats['requests']} requests, {stats['hits']} reused a connection, "
+            f"{stats['misses']} opened a new one (hit rate {stats['hit_rate']:.0%})"
+        )
+
+    schema_registry = sys.modules.get("tck.transport.schema_registry")
+    if schema_registry is not None:
+        for definition, timing in schema_registry.get_schema_registry().timings().items():
+            logger.info(
+                f"A2A schema validation of {definition}: {timing['count']} responses ({timing['failures']} invalid), "
+                f"{timing['mean_ms']:.2f} ms mean, {timing['max_ms']:.2f} ms max, {timing['total_ms']:.1f} ms total"
+            )
+
+
 @pytest.fixture(scope="session")
 def agent_card_url(request):
     """
@@ -94,6 +127,42 @@ def agent_card_url(request):
 
     return sut_url + "/.well-known/agent-card.json"
 
+
+@pytest.fixture(scope="session")
+def sut_agent_card(request):
+    """
+    Session-scoped Agent Card fetched once from the SUT.
+
+    Shared by the agent_card_data and transport_manager fixtures so a session
+    (including a multi-category session) fetches the card a single time.
+    Returns None if the card cannot be fetched.
+    """
+    sut_url = request.config.getoption("--sut-url") or os.getenv("SUT_URL")
+    if not sut_url:
+        return None
+
+    from tck.transport import capture
+
+    replayer = capture.get_replayer()
+    if replayer is not None:
+        # Replaying a captured session: the card recorded with it, no live SUT
+        card = replayer.agent_card()
+    else:
+        # Fetched on the shared connection pool, so test traffic reuses the connection
+        card = agent_card_utils.fetch_agent_card(sut_url)
+        recorder = capture.get_recorder()
+        if recorder is not None and card is not None:
+            recorder.record_agent_card(card)
+
+    # Let the runner reuse the card (e.g. for the compliance report) without fetching it again
+    snapshot_path = request.config.getoption("--agent-card-output")
+    if card is not None and snapshot_path:
+        with open(snapshot_path, "w") as f:
+            json.dump(card, f)
+
+    return card
+
+
 @pytest.fixture(scope="session")
 def agent_card_data(request):
     """
@@ -109,12 +178,10 @@ def agent_card_data(request):
         # This case should ideally be caught earlier, but as a fallback:
         pytest.fail("SUT URL not provided. Cannot fetch Agent Card.")
 
-    # Use a session to potentially reuse connections
-    with requests.Session() as session:
-        card = agent_card_utils.fetch_agent_card(sut_url, session)
-        if card is None:
-            pytest.fail("Failed to fetch or parse Agent Card from the SUT. Check SUT URL and Agent Card endpoint.")
-        return card
+    card = request.getfixturevalue("sut_agent_card")
+    if card is None:
+        pytest.fail("Failed to fetch or parse Agent Card from the SUT. Check SUT URL and Agent Card endpoint.")
+    return card
 
 
 def pytest_generate_tests(metafunc):
@@ -193,7 +260,7 @@ def valid_data_message_params():
 
 
 @pytest.fixture(scope="session")
-def transport_manager(request):
+def transport_manager(request, sut_agent_card):
     """
     Create a TransportManager instance for the test session.
 
@@ -215,7 +282,7 @@ def transport_manager(request):
     # Get transport strategy from configuration
     strategy = tck.config.get_transport_selection_strategy()
 
-    manager = TransportManager(sut_base_url=sut_url, selection_strategy=strategy)
+    manager = TransportManager(sut_base_url=sut_url, selection_strategy=strategy, agent_card=sut_agent_card)
 
     # Perform transport discovery during session setup
     try:
@@ -234,6 +301,10 @@ def transport_manager(request):
     except Exception as e:
         pytest.fail(f"Transport discovery failed: {e}")
 
+    # Connect to every declared endpoint up front: unreachable ones are reported now, reachable ones stay warm
+    if tck.config.get_endpoint_probe_config()["enabled"]:
+        manager.probe_endpoints()
+
     yield manager
 
     # Cleanup: Close all transport clients
@@ -24,9 +24,6 @@ import pytest
 from typing import Dict, Any, List, Optional, Union
 
 from tck.transport.base_client import BaseTransportClient
-from tck.transport.jsonrpc_client import JSONRPCClient
-from tck.transport.grpc_client import GRPCClient
-from tck.transport.rest_client import RESTClient
 from tests.markers import mandatory_protocol, optional_capability, a2a_v030
 from tests.utils.transport_helpers import (
     transport_send_message,
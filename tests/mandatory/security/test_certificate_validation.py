@@ -22,7 +22,6 @@ from typing import Dict, Any, List, Optional, Tuple
 
 import pytest
 import requests
-from OpenSSL import crypto as OpenSSL_crypto
 
 from tck import config
 from tests.markers import mandatory
@@ -141,9 +140,11 @@ def test_certificate_chain_trust_validation(certificate_validation_info):
     # The fact that we successfully connected means basic chain validation passed
     assert certificate_validation_info["validation_successful"], "Certificate chain validation failed during TLS handshake"
 
-    # Enhanced certificate chain analysis with OpenSSL
+    # Enhanced certificate chain analysis with OpenSSL (imported only when there is a certificate to analyze)
     if cert_der:
         try:
+            from OpenSSL import crypto as OpenSSL_crypto
+
             x509_cert = OpenSSL_crypto.load_certificate(OpenSSL_crypto.FILETYPE_DER, cert_der)
 
             # Check certificate extensions for CA information
@@ -21,7 +21,6 @@ from typing import Dict, Any, List, Optional, Tuple
 
 import pytest
 import requests
-from OpenSSL import crypto as OpenSSL_crypto
 
 from tck import config
 from tests.markers import mandatory
@@ -393,9 +392,11 @@ def test_certificate_chain_validation(tls_connection_info):
     except ValueError as e:
         logger.warning(f"Could not parse certificate dates: {e}")
 
-    # Enhanced certificate analysis using OpenSSL
+    # Enhanced certificate analysis using OpenSSL (imported only when there is a certificate to analyze)
     if cert_der:
         try:
+            from OpenSSL import crypto as OpenSSL_crypto
+
             x509_cert = OpenSSL_crypto.load_certificate(OpenSSL_crypto.FILETYPE_DER, cert_der)
 
             # Check public key algorithm and strength
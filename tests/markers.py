@@ -19,6 +19,9 @@ quality_basic = pytest.mark.quality_basic  # Basic implementation quality
 quality_production = pytest.mark.quality_production  # Production-ready quality
 quality_advanced = pytest.mark.quality_advanced  # Advanced features
 
+# Performance markers
+performance = pytest.mark.performance  # Latency and throughput against SLO thresholds
+
 # Transport equivalence markers
 transport_equivalence = pytest.mark.transport_equivalence  # Multi-transport functional equivalence
 
@@ -3,7 +3,6 @@ import uuid
 import time
 import asyncio
 from threading import Thread
-from aiohttp import web
 
 import pytest
 
@@ -44,6 +43,8 @@ def push_notification_webhook():
     """
     from threading import Event as ThreadingEvent
 
+    from aiohttp import web
+
     notifications = []
     server_ready = ThreadingEvent()
 
@@ -11,14 +11,22 @@ Specification Reference: A2A Protocol v0.3.0 §3 - Transport Implementations
 import logging
 import json
 import asyncio
+import time
 from typing import Dict, Any, Optional, List
 import pytest
 import httpx
 
 from tests.markers import optional_capability, a2a_v030
-from tests.utils.transport_helpers import is_transport_client, get_client_transport_type, generate_test_message_id
+from tests.utils.transport_helpers import (
+    is_transport_client,
+    get_client_transport_type,
+    generate_test_message_id,
+    is_json_rpc_success_response,
+    transport_send_message,
+)
 from tck import config, message_utils
 from tck.transport.base_client import BaseTransportClient
+from tck.transport.jsonrpc_client import JSONRPCError
 
 logger = logging.getLogger(__name__)
 
@@ -92,6 +100,59 @@ class TestJSONRPCSpecificFeatures:
         except Exception as e:
             logger.warning(f"Could not test JSON-RPC batch requests: {e}")
 
+    @optional_capability
+    @a2a_v030
+    def test_json_rpc_batch_throughput(self, sut_client: BaseTransportClient):
+        """
+        A2A v0.3.0 §3.1 - JSON-RPC Batch Throughput
+
+        Compares the throughput of N GetTask calls sent as one JSON-RPC batch
+        against the same calls sent sequentially, and checks that every batch
+        response is correlated with its request.
+        """
+        if not is_transport_client(sut_client):
+            pytest.skip("Test requires transport-aware client")
+
+        transport_type = get_client_transport_type(sut_client)
+
+        if transport_type != "jsonrpc":
+            pytest.skip("Test specific to JSON-RPC transport")
+
+        message_params = {
+            "message": {
+                "messageId": generate_test_message_id("batch-throughput"),
+                "role": "ROLE_USER",
+                "parts": [{"text": "Task for batch throughput test"}],
+            }
+        }
+        resp = transport_send_message(sut_client, message_params)
+        if not is_json_rpc_success_response(resp) or "task" not in resp["result"]:
+            pytest.skip("SUT did not create a task to query")
+        task_id = resp["result"]["task"]["id"]
+
+        calls = 10
+        try:
+            start = time.perf_counter()
+            results = sut_client.send_batch([("get_task", {"task_id": task_id}) for _ in range(calls)])
+            batch_elapsed = time.perf_counter() - start
+        except JSONRPCError as e:
+            pytest.skip(f"JSON-RPC batch requests not supported (optional): {e}")
+
+        assert len(results) == calls, "Every batch entry should have a result"
+        for entry in results:
+            assert entry["error"] is None, f"Batched GetTask {entry['id']} failed: {entry['error']}"
+            assert entry["result"].get("id") == task_id, f"Batch response {entry['id']} not correlated with its request"
+
+        start = time.perf_counter()
+        for _ in range(calls):
+            sut_client.get_task(task_id)
+        sequential_elapsed = time.perf_counter() - start
+
+        logger.info(
+            f"✅ JSON-RPC batch of {calls} GetTask calls: {calls / batch_elapsed:.1f} calls/s batched vs "
+            f"{calls / sequential_elapsed:.1f} calls/s sequential ({sequential_elapsed / batch_elapsed:.2f}x)"
+        )
+
     @optional_capability
     @a2a_v030
     def test_json_rpc_notification_requests(self, sut_client: BaseTransportClient):
@@ -0,0 +1,203 @@
+"""
+Per-Method Latency and Throughput Tests
+
+Calls each A2A method many times in a row on every declared transport and checks the
+p50/p95/p99/max latency, throughput and error rate of the calls against the method's
+SLO thresholds (see tck.performance; configured with config.set_performance_config or
+A2A_PERF_ITERATIONS, A2A_PERF_WARMUP and A2A_PERF_SLO).
+
+Methods behind an optional capability (streaming, push notifications, the extended
+Agent Card) are measured only when the Agent Card declares it. Streaming is measured
+to the first event. Push notification configs are measured on one task: get and list
+on a config created first, and each delete on a config created outside its latency.
+Each cancel_task call cancels a task sent outside its latency. A SUT that completes
+tasks before the cancel arrives answers TaskNotCancelableError (-32002); that is a
+complete answer, so it counts as a successful call, but the latency then measures the
+rejection rather than an actual cancellation.
+
+The measurements of each test are recorded as its ``performance`` property, from
+which the compliance report computes the performance score.
+"""
+
+import asyncio
+import logging
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pytest
+
+from tck import config
+from tck.performance import ameasure, check_slo, measure, slo_for
+from tck.result_sink import PERFORMANCE_PROPERTY
+from tests.capability_validator import CapabilityValidator
+from tests.markers import performance
+from tests.utils.transport_helpers import (
+    extract_task_id_from_response,
+    generate_test_message_id,
+    transport_cancel_task,
+)
+
+logger = logging.getLogger(__name__)
+
+# A2A error answering the cancellation of a task in a terminal state
+TASK_NOT_CANCELABLE = -32002
+
+
+def _new_message() -> Dict[str, Any]:
+    return {
+        "messageId": generate_test_message_id("performance"),
+        "role": "ROLE_USER",
+        "parts": [{"text": "Performance test message"}],
+    }
+
+
+def _checked(result: Any) -> Any:
+    """Turn an error returned as a result into an exception, so it counts as a failed call."""
+    if isinstance(result, dict) and "error" in result:
+        raise RuntimeError(f"SUT returned an error: {result['error']}")
+    return result
+
+
+def _push_config(task_id: str) -> Dict[str, Any]:
+    return {"taskId": task_id, "id": f"performance-{uuid.uuid4()}", "url": "https://example.com/webhook"}
+
+
+def _first_event(client: Any) -> Callable[[], Any]:
+    async def call():
+        stream = client.send_streaming_message(_new_message())
+        try:
+            async for event in stream:
+                return _checked(event)
+            raise RuntimeError("Stream ended without an event")
+        finally:
+            await stream.aclose()
+
+    return call
+
+
+def _config_call(client: Any, task_id: str, method: str) -> Callable[[], Any]:
+    """get/list of a push notification config created on the task before measuring."""
+    push_config = _push_config(task_id)
+    _checked(client.create_task_push_notification_config(push_config))
+    config_id = push_config["id"]
+    if method == "get_push_notification_config":
+        return lambda: _checked(client.get_push_notification_config(task_id, config_id))
+    return lambda: _checked(client.list_push_notification_configs(task_id))
+
+
+def _delete_config(client: Any, task_id: str) -> Tuple[Callable[[], Any], Callable[[], Any]]:
+    """Delete call, and its setup creating the config each call deletes."""
+    created: List[str] = []
+
+    def setup():
+        push_config = _push_config(task_id)
+        _checked(client.create_task_push_notification_config(push_config))
+        created.append(push_config["id"])
+
+    return lambda: _checked(client.delete_push_notification_config(task_id, created.pop())), setup
+
+
+def _cancel_task(client: Any) -> Tuple[Callable[[], Any], Callable[[], Any]]:
+    """Cancel call, and its setup sending the message whose task each call cancels."""
+    created: List[Optional[str]] = []
+
+    def setup():
+        created.append(extract_task_id_from_response({"result": _checked(client.send_message(_new_message()))}))
+
+    def call():
+        # transport_cancel_task turns every transport's errors into a JSON-RPC error object
+        response = transport_cancel_task(client, created.pop())
+        if response.get("error", {}).get("code") != TASK_NOT_CANCELABLE:
+            _checked(response)
+        return response
+
+    return call, setup
+
+
+# A2A method → factory of the measured call (async for streaming) and its untimed setup (or None),
+# for a client and a task ID created on it
+METHOD_CALLS: Dict[str, Callable[[Any, str], Tuple[Callable[[], Any], Optional[Callable[[], Any]]]]] = {
+    "send_message": lambda client, task_id: (lambda: _checked(client.send_message(_new_message())), None),
+    "send_streaming_message": lambda client, task_id: (_first_event(client), None),
+    "get_task": lambda client, task_id: (lambda: _checked(client.get_task(task_id)), None),
+    "list_tasks": lambda client, task_id: (lambda: _checked(client.list_tasks(pageSize=10)), None),
+    "cancel_task": lambda client, task_id: _cancel_task(client),
+    "get_extended_agent_card": lambda client, task_id: (lambda: _checked(client.get_extended_agent_card()), None),
+    "create_task_push_notification_config": lambda client, task_id: (
+        lambda: _checked(client.create_task_push_notification_config(_push_config(task_id))),
+        None,
+    ),
+    "get_push_notification_config": lambda client, task_id: (
+        _config_call(client, task_id, "get_push_notification_config"),
+        None,
+    ),
+    "list_push_notification_configs": lambda client, task_id: (
+        _config_call(client, task_id, "list_push_notification_configs"),
+        None,
+    ),
+    "delete_push_notification_config": lambda client, task_id: _delete_config(client, task_id),
+}
+
+# Agent Card capability a method needs to be measured
+METHOD_CAPABILITIES = {
+    "send_streaming_message": "streaming",
+    "get_extended_agent_card": "extendedAgentCard",
+    "create_task_push_notification_config": "pushNotifications",
+    "get_push_notification_config": "pushNotifications",
+    "list_push_notification_configs": "pushNotifications",
+    "delete_push_notification_config": "pushNotifications",
+}
+
+# Methods measured on the task created first
+TASK_METHODS = frozenset({"get_task"}) | {
+    method for method, capability in METHOD_CAPABILITIES.items() if capability == "pushNotifications"
+}
+
+
+@performance
+@pytest.mark.parametrize("method", list(METHOD_CALLS))
+def test_method_latency_slo(all_transport_clients, agent_card_data, record_property, method):
+    """
+    PERFORMANCE: Per-Method Latency SLO
+
+    Measures the method on every declared transport and checks p50/p95/p99/max
+    latency, throughput and error rate against the method's SLO thresholds.
+    Skipped for methods whose capability the Agent Card does not declare.
+    """
+    capability = METHOD_CAPABILITIES.get(method)
+    if capability and not CapabilityValidator(agent_card_data or {}).is_capability_declared(capability):
+        pytest.skip(f"{capability} capability not declared - {method} not measured")
+
+    perf_config = config.get_performance_config()
+    slo = slo_for(method, perf_config["slo"])
+
+    measurements = []
+    violations = []
+    for transport_type, client in all_transport_clients.items():
+        transport = transport_type.value
+        try:
+            task_id = extract_task_id_from_response({"result": _checked(client.send_message(_new_message()))})
+        except Exception as e:
+            pytest.fail(f"[{transport}] Cannot create a task to measure {method} with: {e}")
+        if method in TASK_METHODS and not task_id:
+            logger.warning(f"[{transport}] SendMessage returned no task; skipping {method}")
+            continue
+
+        try:
+            call, setup = METHOD_CALLS[method](client, task_id)
+        except Exception as e:
+            pytest.fail(f"[{transport}] Cannot prepare the measurement of {method}: {e}")
+        if asyncio.iscoroutinefunction(call):
+            summary = asyncio.run(ameasure(call, perf_config["iterations"], perf_config["warmup"]))
+        else:
+            summary = measure(call, perf_config["iterations"], perf_config["warmup"], setup)
+        failed = check_slo(summary, slo)
+        logger.info(f"[{transport}] {method}: {summary}")
+        measurements.append({"method": method, "transport": transport, **summary, "slo": slo, "violations": failed})
+        violations.extend(f"[{transport}] {violation}" for violation in failed)
+
+    if not measurements:
+        pytest.skip(f"No transport could be measured for {method}")
+    record_property(PERFORMANCE_PROPERTY, measurements)
+
+    assert not violations, f"{method} misses its SLO: " + "; ".join(violations)
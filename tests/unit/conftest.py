@@ -0,0 +1,16 @@
+"""
+Fixtures shared by all unit tests.
+"""
+
+import pytest
+
+import tck.config  # noqa: F401  (must be imported before the transport modules)
+from tck.transport import retry_policy
+
+
+@pytest.fixture(autouse=True)
+def reset_retry_policy():
+    """Give every test fresh circuit breakers, so calls failing in one test cannot open a circuit for the next."""
+    retry_policy.reset_retry_policy()
+    yield
+    retry_policy.reset_retry_policy()
@@ -139,6 +139,75 @@ class TestTransportConfiguration:
             rest_config = config.get_transport_specific_config(TransportType.REST)
             assert rest_config["auth_header"] == "Bearer token123"
 
+    def test_grpc_channel_options(self):
+        """Test gRPC channel options defaults and transport-specific overrides."""
+        options = dict(config.get_grpc_channel_options())
+        assert options["grpc.keepalive_time_ms"] == 300000
+        assert options["grpc.max_receive_message_length"] == 16 * 1024 * 1024
+
+        config.set_transport_specific_config(TransportType.GRPC, {"keepalive_time_ms": "60000"})
+        with patch.dict(os.environ, {"A2A_GRPC_MAX_MESSAGE_SIZE": "4MB"}):
+            options = dict(config.get_grpc_channel_options())
+        assert options["grpc.keepalive_time_ms"] == 60000
+        assert options["grpc.max_send_message_length"] == 4 * 1024 * 1024
+        assert options["grpc.max_receive_message_length"] == 4 * 1024 * 1024
+
+    def test_wire_log_config(self):
+        """Test wire logging defaults, setters and environment overrides."""
+        wire_config = config.get_wire_log_config()
+        assert wire_config["level"] is None
+        assert wire_config["max_body_bytes"] == 4096
+
+        config.set_wire_log_config(level="DEBUG", sample_every=10)
+        with patch.dict(os.environ, {"A2A_WIRE_LOG_MAX_BODY": "16KB", "A2A_WIRE_LOG_SAMPLE_AFTER": "not-a-number"}):
+            wire_config = config.get_wire_log_config()
+        assert wire_config["level"] == "DEBUG"
+        assert wire_config["max_body_bytes"] == 16 * 1024
+        assert wire_config["sample_after"] == 200
+        assert wire_config["sample_every"] == 10
+
+    def test_retry_config(self):
+        """Test retry and circuit-breaker defaults, setters and environment overrides."""
+        retry_config = config.get_retry_config()
+        assert retry_config["max_attempts"] == 3
+        assert retry_config["breaker_threshold"] == 5
+
+        config.set_retry_config(max_attempts=1, breaker_reset=5.0)
+        with patch.dict(os.environ, {"A2A_RETRY_BASE_DELAY": "0.5", "A2A_CIRCUIT_BREAKER_THRESHOLD": "not-a-number"}):
+            retry_config = config.get_retry_config()
+        assert retry_config["max_attempts"] == 1
+        assert retry_config["base_delay"] == 0.5
+        assert retry_config["breaker_threshold"] == 5
+        assert retry_config["breaker_reset"] == 5.0
+
+    def test_endpoint_probe_config(self):
+        """Test endpoint probing defaults, setters and environment overrides."""
+        assert config.get_endpoint_probe_config() == {"enabled": True, "budget": 5.0}
+
+        config.set_endpoint_probe_config(budget=2.0)
+        with patch.dict(os.environ, {"A2A_ENDPOINT_PROBE": "false"}):
+            assert config.get_endpoint_probe_config() == {"enabled": False, "budget": 2.0}
+        with patch.dict(os.environ, {"A2A_ENDPOINT_PROBE": "ON"}):
+            assert config.get_endpoint_probe_config()["enabled"] is True
+
+    def test_performance_config(self):
+        """Test performance defaults, SLO merging and environment overrides."""
+        perf_config = config.get_performance_config()
+        assert (perf_config["iterations"], perf_config["warmup"]) == (50, 3)
+
+        config.set_performance_config(iterations=10, slo={"get_task": {"p95_ms": 100.0}})
+        slo_json = '{"default": {"p99_ms": 800}, "list_tasks": {"max_ms": 900}}'
+        with patch.dict(os.environ, {"A2A_PERF_WARMUP": "0", "A2A_PERF_SLO": slo_json}):
+            perf_config = config.get_performance_config()
+        assert (perf_config["iterations"], perf_config["warmup"]) == (10, 0)
+        assert perf_config["slo"]["get_task"] == {"p95_ms": 100.0}
+        assert perf_config["slo"]["list_tasks"] == {"max_ms": 900}
+        assert perf_config["slo"]["default"]["p99_ms"] == 800
+        assert perf_config["slo"]["default"]["p50_ms"] == 250.0
+
+        config.reset_transport_config()
+        assert "get_task" not in config.get_performance_config()["slo"]
+
     def test_transport_equivalence_testing(self):
         """Test transport equivalence testing configuration."""
         # Test default
@@ -0,0 +1,59 @@
+"""
+Unit tests for test duration history and duration-balanced sharding.
+"""
+
+import pytest
+
+from tck.duration_history import DurationHistory, estimate_durations, parse_shard, plan_shards
+
+
+@pytest.mark.core
+class TestShardPlanning:
+    """Test shard parsing and planning."""
+
+    def test_parse_shard(self):
+        """Test parsing valid and invalid shard specifications."""
+        assert parse_shard("2/4") == (2, 4)
+        for value in ("0/4", "5/4", "1/0", "2", "a/b"):
+            with pytest.raises(ValueError):
+                parse_shard(value)
+
+    def test_plan_shards_is_balanced_and_complete(self):
+        """Test that slow files are spread across shards and every file is assigned once."""
+        durations = {"streaming.py": 30.0, "resilience.py": 25.0, "tls.py": 20.0, "a.py": 5.0, "b.py": 5.0, "c.py": 5.0}
+
+        shards = plan_shards(durations, 3)
+
+        assert sorted(f for shard in shards for f in shard) == sorted(durations)
+        loads = [sum(durations[f] for f in shard) for shard in shards]
+        assert max(loads) - min(loads) <= 5.0
+        # The three slow files land in different shards
+        assert {shard[0] for shard in shards} == {"streaming.py", "resilience.py", "tls.py"}
+
+    def test_plan_shards_is_deterministic(self):
+        """Test that equal estimates produce the same plan on every call."""
+        durations = {f"test_{i}.py": 1.0 for i in range(7)}
+
+        assert plan_shards(durations, 3) == plan_shards(dict(reversed(list(durations.items()))), 3)
+
+    def test_estimate_durations_uses_mean_for_unknown_tests(self):
+        """Test that tests without history are estimated with the mean recorded duration."""
+        estimates = estimate_durations(["t.py::a", "t.py::new"], {"t.py::a": 4.0, "t.py::b": 2.0})
+
+        assert estimates == {"t.py::a": 4.0, "t.py::new": 3.0}
+
+
+@pytest.mark.core
+class TestDurationHistory:
+    """Test the SQLite-backed duration history."""
+
+    def test_record_averages_recent_runs(self, tmp_path):
+        """Test that repeated runs fold into a running mean per transport set."""
+        history = DurationHistory(tmp_path / "durations.sqlite")
+        history.record("jsonrpc", {"t.py::a": 2.0})
+        history.record("jsonrpc", {"t.py::a": 4.0})
+        history.record("grpc", {"t.py::a": 10.0})
+
+        assert history.durations("jsonrpc") == {"t.py::a": 3.0}
+        assert history.durations("grpc") == {"t.py::a": 10.0}
+        history.close()
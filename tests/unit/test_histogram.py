@@ -0,0 +1,67 @@
+"""
+Unit tests for the fixed-memory latency histogram.
+"""
+
+import json
+import math
+import random
+
+import pytest
+
+from tck.histogram import LatencyHistogram
+
+
+def _nearest_rank(samples, q):
+    ordered = sorted(samples)
+    return ordered[max(1, math.ceil(q / 100 * len(ordered))) - 1]
+
+
+@pytest.mark.core
+class TestLatencyHistogram:
+    """Test recording, percentiles, merging and serialization."""
+
+    def test_percentiles_within_precision(self):
+        """Test that percentiles are within the relative precision of 3 significant digits, never below."""
+        rng = random.Random(3)
+        samples = [rng.lognormvariate(-4, 1.5) for _ in range(20000)]
+        histogram = LatencyHistogram().record_all(samples)
+
+        for q, value in zip((50, 90, 99, 99.9), histogram.percentiles((50, 90, 99, 99.9))):
+            exact = _nearest_rank(samples, q)
+            assert exact - 1e-6 <= value <= exact * 1.001 + 1e-6
+        assert histogram.count == len(histogram) == 20000
+        assert histogram.value_at_percentile(100) == histogram.max == round(max(samples), 6)
+
+    def test_memory_does_not_grow_with_samples(self):
+        """Test that the counts array keeps its size whatever is recorded, clamping out-of-range values."""
+        histogram = LatencyHistogram(significant_digits=2, highest_seconds=60)
+        assert (histogram.to_dict()["counts"], histogram.percentiles([50]), histogram.max) == ({}, [None], None)
+        buckets = len(histogram._counts)
+        for i in range(10000):
+            histogram.record(i / 100)
+        histogram.record(-1)
+        histogram.record(3600)
+
+        assert len(histogram._counts) == buckets
+        assert (histogram.min, histogram.max) == (0.0, 60.0)
+
+    def test_merge_equals_recording_everything(self):
+        """Test that merged histograms match one histogram of all values, and layouts must match."""
+        values = [i / 997 for i in range(1, 3000)]
+        merged = LatencyHistogram().record_all(values[:1000]).merge(LatencyHistogram().record_all(values[1000:]))
+        together = LatencyHistogram().record_all(values)
+
+        assert merged.to_dict() == together.to_dict()
+        assert merged.percentiles((50, 99)) == together.percentiles((50, 99))
+        with pytest.raises(ValueError, match="cannot be merged"):
+            merged.merge(LatencyHistogram(significant_digits=2))
+
+    def test_serialization_round_trip(self):
+        """Test that a histogram survives to_dict, JSON and from_dict."""
+        histogram = LatencyHistogram().record_all([0.001, 0.0125, 0.25, 0.25, 2.0])
+
+        restored = LatencyHistogram.from_dict(json.loads(json.dumps(histogram.to_dict())))
+
+        assert restored.to_dict() == histogram.to_dict()
+        assert (restored.count, restored.min, restored.max) == (5, 0.001, 2.0)
+        assert restored.percentiles((0, 50, 100)) == histogram.percentiles((0, 50, 100))
@@ -0,0 +1,95 @@
+"""
+Unit tests for the open-loop constant-rate load generator.
+"""
+
+import asyncio
+
+import pytest
+
+from tck.load import ConstantRateLoad, format_load_report
+
+
+class FakeAsyncClient:
+    """Async client answering after a fixed service time, optionally one call at a time."""
+
+    def __init__(self, service_time=0.0, serial=False, fail_every=0):
+        self.service_time = service_time
+        self.serial = serial
+        self.fail_every = fail_every
+        self.calls = []
+        self._lock = None
+
+    async def _answer(self, method, result):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        self.calls.append(method)
+        call = len(self.calls)
+        if self.serial:
+            async with self._lock:
+                await asyncio.sleep(self.service_time)
+        else:
+            await asyncio.sleep(self.service_time)
+        if self.fail_every and call % self.fail_every == 0:
+            raise RuntimeError("boom")
+        return result
+
+    async def asend_message(self, message):
+        return await self._answer("send_message", {"id": f"task-{len(self.calls)}", "kind": "task"})
+
+    async def aget_task(self, task_id):
+        return await self._answer("get_task", {"id": task_id})
+
+
+@pytest.mark.core
+class TestConstantRateLoad:
+    """Test arrival scheduling, latency accounting and the report."""
+
+    def test_calls_are_issued_in_turn_at_the_target_rate(self):
+        """Test that every arrival is issued and operations alternate after the seeding task."""
+        client = FakeAsyncClient()
+        report = asyncio.run(ConstantRateLoad(client, ["send_message", "get_task"], rate=200, duration=0.1).run())
+
+        assert client.calls[0] == "send_message"  # seeds a task for get_task
+        assert client.calls[1:5] == ["send_message", "get_task", "send_message", "get_task"]
+        assert (report["issued"], report["dropped"], report["unfinished"]) == (20, 0, 0)
+        assert report["operations"]["get_task"]["calls"] == 10
+        assert report["offered_rate"] == pytest.approx(200, rel=0.25)
+
+    def test_latency_includes_queueing_behind_a_slow_sut(self):
+        """Test that latency counts from the intended send time, so queueing delay is not omitted."""
+        client = FakeAsyncClient(service_time=0.02, serial=True)
+        report = asyncio.run(ConstantRateLoad(client, ["send_message"], rate=100, duration=0.2).run())
+
+        summary = report["all"]
+        # Twice the rate the SUT can serve: a closed loop would see 20ms per call, the last calls wait behind ~10 others
+        assert summary["p50_ms"] > 50
+        assert summary["max_ms"] > 150
+        assert report["achieved_rate"] < report["target_rate"]
+
+    def test_failures_and_drops_are_counted(self):
+        """Test that failed calls are errors and arrivals over max_in_flight are dropped."""
+        client = FakeAsyncClient(service_time=0.05, fail_every=3)
+        load = ConstantRateLoad(client, ["send_message"], rate=200, duration=0.05, max_in_flight=4)
+        report = asyncio.run(load.run())
+
+        assert report["issued"] == 4
+        assert report["dropped"] == 6
+        assert report["all"]["errors"] == 1
+        assert "send_message" in format_load_report(report)
+
+    def test_calls_cut_off_at_the_drain_count_in_latencies_and_errors(self):
+        """Test that calls still running after drain_timeout are errors whose latency until then is kept."""
+        client = FakeAsyncClient(service_time=1.0)
+        load = ConstantRateLoad(client, ["send_message"], rate=100, duration=0.05, drain_timeout=0.1)
+        report = asyncio.run(load.run())
+
+        summary = report["operations"]["send_message"]
+        assert report["unfinished"] == summary["unfinished"] == 5
+        assert (summary["calls"], summary["errors"], summary["error_rate"]) == (5, 5, 1.0)
+        assert summary["max_ms"] >= 100
+        assert summary["throughput"] == 0.0
+
+    def test_unknown_operation_is_rejected(self):
+        """Test that operations must be known load operations."""
+        with pytest.raises(ValueError, match="Unknown load operations"):
+            ConstantRateLoad(FakeAsyncClient(), ["send_mesage"], rate=1, duration=1)
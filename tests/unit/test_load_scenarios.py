@@ -0,0 +1,114 @@
+"""
+Unit tests for weighted mixed-workload load scenarios.
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from tck.load import format_load_report
+from tck.load_scenarios import ScenarioLoad, load_mix_file, parse_load_mix
+
+MIXED_WORKLOAD = Path(__file__).resolve().parents[2] / "load_scenarios" / "mixed_workload.yaml"
+
+
+class FakeScenarioClient:
+    """Async client creating a task per message, in the message's context or a new one."""
+
+    def __init__(self):
+        self.calls = []
+        self.contexts = []
+
+    async def asend_message(self, message):
+        self.calls.append("send_message")
+        context_id = message.get("contextId") or f"ctx-{len(self.calls)}"
+        self.contexts.append(context_id)
+        return {"id": f"task-{len(self.calls)}", "contextId": context_id, "kind": "task"}
+
+    async def aget_task(self, task_id):
+        self.calls.append("get_task")
+        return {"id": task_id}
+
+    async def acancel_task(self, task_id):
+        self.calls.append("cancel_task")
+        return {"error": {"code": -32002, "message": "Task cannot be canceled"}}
+
+
+@pytest.mark.core
+class TestLoadMixParsing:
+    """Test the scenario file format."""
+
+    def test_example_mix(self):
+        """Test that the shipped example parses with the documented shares."""
+        mix = load_mix_file(MIXED_WORKLOAD)
+
+        assert mix.shares() == {
+            "send_message": 0.6,
+            "poll_task": 0.2,
+            "streaming": 0.1,
+            "cancel": 0.05,
+            "push_config_crud": 0.05,
+        }
+        poll = mix.scenarios[1]
+        assert (poll.steps[0].operation, poll.steps[0].repeat, poll.steps[0].think) == ("get_task", 3, 0.5)
+
+    @pytest.mark.parametrize(
+        "scenario, message",
+        [
+            ({"name": "a", "steps": ["send_mesage"]}, "Unknown operation"),
+            ({"name": "a", "steps": []}, "has no steps"),
+            ({"name": "a", "weight": 0, "steps": ["get_task"]}, "positive weight"),
+            ({"name": "a", "context": "global", "steps": ["get_task"]}, "context 'global'"),
+            ({"name": "a", "steps": [{"op": "get_task", "wait": 1}]}, "unknown keys"),
+        ],
+    )
+    def test_invalid_scenarios_are_rejected(self, scenario, message):
+        """Test that invalid scenarios raise ValueError naming the problem."""
+        with pytest.raises(ValueError, match=message):
+            parse_load_mix({"rate": 1, "duration": 1, "scenarios": [scenario]})
+
+
+@pytest.mark.core
+class TestScenarioLoad:
+    """Test scenario runs, context reuse and per-scenario metrics."""
+
+    def test_scenarios_share_contexts_and_report_per_scenario(self):
+        """Test that runs follow their steps and that "scenario" runs reuse their pool of contexts."""
+        mix = parse_load_mix(
+            {
+                "rate": 200,
+                "duration": 0.1,
+                "scenarios": [
+                    {"name": "chat", "weight": 3, "context": "scenario", "contexts": 2, "steps": ["send_message"]},
+                    {"name": "poll", "weight": 1, "steps": [{"op": "get_task", "repeat": 2}]},
+                ],
+            }
+        )
+        client = FakeScenarioClient()
+        report = asyncio.run(ScenarioLoad(client, mix, seed=7).run())
+
+        chat = report["scenarios"]["chat"]
+        poll = report["scenarios"]["poll"]
+        assert chat["calls"] + poll["calls"] == report["issued"] == 20
+        assert report["operations"]["get_task"]["calls"] == 2 * poll["calls"]
+        assert chat["share"] == 0.75 and chat["calls"] > poll["calls"]
+        # One seeding message, then at most 2 new conversations for all chat runs
+        assert len(set(client.contexts[1:])) <= 2
+        assert "poll" in format_load_report(report)
+
+    def test_failed_step_ends_the_run(self):
+        """Test that a step returning an error fails its scenario run and skips the remaining steps."""
+        mix = parse_load_mix(
+            {
+                "rate": 100,
+                "duration": 0.05,
+                "scenarios": [{"name": "cancel", "steps": ["send_message", "cancel_task", "get_task"]}],
+            }
+        )
+        client = FakeScenarioClient()
+        report = asyncio.run(ScenarioLoad(client, mix).run())
+
+        assert report["scenarios"]["cancel"]["errors"] == 5
+        assert report["operations"]["cancel_task"]["errors"] == 5
+        assert "get_task" not in client.calls
@@ -0,0 +1,78 @@
+"""
+Unit tests for merging the metrics of multi-process load workers.
+"""
+
+import pytest
+
+from tck.load import LoadMetrics
+from tck.load_workers import _make_load, merge_worker_runs, run_load_workers
+
+
+def _spec(**overrides):
+    spec = {
+        "sut_url": "http://localhost:9999",
+        "transport": None,
+        "operations": ["send_message", "get_task"],
+        "scenario": None,
+        "rate": 300.0,
+        "duration": 10.0,
+        "max_in_flight": 1000,
+        "seed": None,
+    }
+    spec.update(overrides)
+    return spec
+
+
+@pytest.mark.core
+class TestWorkerMerge:
+    """Test that worker metrics merge into the report of one run."""
+
+    def test_merged_histograms_lose_nothing(self):
+        """Test that merging exported metrics gives the summaries of one run recording all samples."""
+        together = LoadMetrics()
+        workers = [LoadMetrics(), LoadMetrics()]
+        for i in range(1, 201):
+            latency = i / 1000
+            together.record("get_task", latency, latency / 2)
+            workers[i % 2].record("get_task", latency, latency / 2)
+        workers[0].error("get_task")
+        together.error("get_task")
+        workers[1].drop("send_message")
+        together.drop("send_message")
+
+        merged = LoadMetrics()
+        for worker in workers:
+            merged.merge(worker.export())
+
+        assert merged.summaries(2.0) == together.summaries(2.0)
+        assert merged.summary(2.0)["p99_ms"] == pytest.approx(198.0, rel=1e-3)
+
+    def test_worker_runs_and_report(self):
+        """Test that concurrent worker runs add up their calls and rates and keep the longest elapsed time."""
+        runs = [
+            {"issued": 100, "unfinished": 0, "offered_rate": 100.0, "elapsed": 1.2},
+            {"issued": 99, "unfinished": 1, "offered_rate": 99.5, "elapsed": 1.4},
+        ]
+        coordinator = _make_load(_spec(), None)
+        worker = LoadMetrics()
+        worker.record("send_message", 0.01, 0.01)
+        coordinator.merge_metrics({"operations": worker.export()})
+
+        report = coordinator.report(merge_worker_runs(runs))
+
+        assert (report["issued"], report["unfinished"], report["offered_rate"]) == (199, 1, 199.5)
+        assert report["elapsed"] == 1.4
+        assert report["target_rate"] == 300.0
+        assert report["operations"]["send_message"]["calls"] == 1
+
+    def test_workers_get_a_share_of_the_load(self):
+        """Test that each worker runs its share of the rate and of max_in_flight."""
+        load = _make_load(_spec(), object(), 1 / 4)
+        assert (load.rate, load.duration, load.max_in_flight) == (75.0, 10.0, 250)
+
+    def test_invalid_load_is_rejected_before_starting_workers(self):
+        """Test that bad arguments fail in the coordinator."""
+        with pytest.raises(ValueError, match="at least 1"):
+            run_load_workers("http://localhost:9999", 0, operations=["send_message"], rate=1, duration=1)
+        with pytest.raises(ValueError, match="Unknown load operations"):
+            run_load_workers("http://localhost:9999", 2, operations=["send_mesage"], rate=1, duration=1)
@@ -0,0 +1,133 @@
+"""
+Unit tests for the performance category's latency summaries and SLO checks.
+"""
+
+import asyncio
+
+import pytest
+
+from tck import performance
+from tck.performance import ameasure, check_slo, measure, slo_for, summarize_latencies
+from util_scripts.generate_compliance_report import ComplianceReportGenerator
+
+
+@pytest.mark.core
+class TestLatencySummary:
+    """Test summaries and measuring."""
+
+    def test_summarize_latencies(self):
+        """Test the summary of a series with a failed call, to the histogram's 3 significant digits."""
+        summary = summarize_latencies([0.010, 0.020, 0.030, 0.040], elapsed=0.5, errors=1)
+
+        assert summary == {
+            "calls": 5,
+            "errors": 1,
+            "error_rate": 0.2,
+            "p50_ms": 20.015,  # highest value of the 20.000-20.015ms bucket
+            "p95_ms": 40.0,
+            "p99_ms": 40.0,
+            "max_ms": 40.0,
+            "precision_pct": 0.1,
+            "throughput": 8.0,
+        }
+
+    def test_measure_counts_exceptions_as_errors(self, monkeypatch):
+        """Test that warm-up calls are not measured and raising calls are errors."""
+        now = [0.0]
+        monkeypatch.setattr(performance.time, "perf_counter", lambda: now[0])
+        calls = []
+
+        def call():
+            calls.append(1)
+            now[0] += 0.01
+            if len(calls) == 4:
+                raise RuntimeError("boom")
+
+        summary = measure(call, iterations=4, warmup=1)
+
+        assert len(calls) == 5
+        assert (summary["calls"], summary["errors"], summary["max_ms"]) == (4, 1, 10.0)
+
+    def test_measure_leaves_setup_out_of_latencies(self, monkeypatch):
+        """Test that setup runs before every call without counting in its latency or the throughput."""
+        now = [0.0]
+        monkeypatch.setattr(performance.time, "perf_counter", lambda: now[0])
+        created = []
+
+        def setup():
+            created.append(1)
+            now[0] += 1.0
+
+        def call():
+            created.pop()
+            now[0] += 0.01
+
+        summary = measure(call, iterations=2, warmup=1, setup=setup)
+
+        assert (summary["calls"], summary["max_ms"], summary["throughput"]) == (2, 10.0, 100.0)
+        assert created == []
+
+    def test_ameasure_awaits_each_call(self, monkeypatch):
+        """Test that async calls are measured like synchronous ones."""
+        now = [0.0]
+        monkeypatch.setattr(performance.time, "perf_counter", lambda: now[0])
+
+        async def call():
+            now[0] += 0.02
+
+        summary = asyncio.run(ameasure(call, iterations=3, warmup=1))
+
+        assert (summary["calls"], summary["errors"], summary["max_ms"]) == (3, 0, 20.0)
+
+
+@pytest.mark.core
+class TestSloCheck:
+    """Test SLO thresholds and the performance score."""
+
+    def test_method_thresholds_override_the_default(self):
+        """Test that a method's thresholds override the default ones key by key."""
+        slo_config = {"default": {"p95_ms": 100.0, "p99_ms": 200.0}, "send_message": {"p99_ms": 500.0}}
+
+        assert slo_for("send_message", slo_config) == {"p95_ms": 100.0, "p99_ms": 500.0}
+        assert slo_for("get_task", slo_config) == {"p95_ms": 100.0, "p99_ms": 200.0}
+
+    def test_check_slo_reports_each_violation(self):
+        """Test that every missed threshold is reported and unset thresholds are ignored."""
+        summary = summarize_latencies([0.1] * 9 + [0.9], elapsed=2.0, errors=1)
+        slo = {"p50_ms": 150.0, "p99_ms": 500.0, "max_ms": None, "min_throughput": 10.0, "max_error_rate": 0.05}
+
+        violations = check_slo(summary, slo)
+
+        assert [violation.split()[0] for violation in violations] == ["p99", "throughput", "error"]
+        assert check_slo(summary, {"p50_ms": 150.0}) == []
+
+    def test_check_slo_allows_the_histogram_precision(self):
+        """Test that a latency reading above its threshold by less than the precision passes."""
+        summary = summarize_latencies([0.020, 0.030], elapsed=1.0)
+
+        assert summary["p50_ms"] == 20.015
+        assert check_slo(summary, {"p50_ms": 20.0}) == []
+        assert check_slo(summary, {"p50_ms": 19.9}) == ["p50 20.0ms (±0.1%) exceeds 19.9ms"]
+
+    def test_performance_score_in_compliance_report(self):
+        """Test that the report scores the share of measurements meeting their SLO, apart from the overall score."""
+        measurements = [
+            {"method": "get_task", "transport": "jsonrpc", "violations": []},
+            {"method": "get_task", "transport": "grpc", "violations": ["p95 1200.0ms exceeds 1000.0ms"]},
+        ]
+        results = {
+            "performance": {
+                "total": 1,
+                "passed": 0,
+                "failed": 1,
+                "skipped": 0,
+                "tests": {"test_method_latency_slo[get_task]": {"outcome": "FAILED", "performance": measurements}},
+            }
+        }
+
+        report = ComplianceReportGenerator(results).generate_report()
+
+        assert report["summary"]["performance_score"] == 50.0
+        assert report["categories"]["performance"]["performance"]["slo_met"] == 1
+        assert report["categories"]["performance"]["status"] == "ATTENTION_NEEDED"
+        assert ComplianceReportGenerator({}).generate_report()["summary"]["performance_score"] is None
@@ -0,0 +1,47 @@
+"""
+Unit tests for the streaming JSONL result sink.
+"""
+
+import json
+
+import pytest
+
+from tck.result_sink import aggregate_result_records, iter_result_records
+
+
+@pytest.mark.core
+class TestResultSink:
+    """Test reading and aggregating JSONL result records."""
+
+    def test_iter_result_records_skips_truncated_line(self, tmp_path):
+        """Test that a partially written last record (e.g. after a crash) is skipped."""
+        results_file = tmp_path / "mandatory_results.jsonl"
+        records = [
+            {"nodeid": "tests/mandatory/test_a.py::test_ok", "outcome": "passed"},
+            {"nodeid": "tests/mandatory/test_a.py::test_bad", "outcome": "failed"},
+        ]
+        results_file.write_text("".join(json.dumps(r) + "\n" for r in records) + '{"nodeid": "tests/mand')
+
+        assert list(iter_result_records(results_file)) == records
+
+    def test_aggregate_result_records(self):
+        """Test that records aggregate into the runner's per-category statistics."""
+        records = [
+            {"nodeid": "t.py::test_pass", "outcome": "passed", "duration": 0.1, "markers": ["mandatory"]},
+            {"nodeid": "t.py::test_fail", "outcome": "failed", "duration": 0.2, "message": "boom"},
+            {"nodeid": "t.py::test_error", "outcome": "error", "message": "setup failed"},
+            {"nodeid": "t.py::test_skip", "outcome": "skipped"},
+            {"nodeid": "t.py::test_xfail", "outcome": "xfailed"},
+        ]
+
+        stats = aggregate_result_records(iter(records))
+
+        assert stats["total"] == 5
+        assert stats["passed"] == 1
+        assert stats["failed"] == 2  # failures and errors combined
+        assert stats["error"] == 1
+        assert stats["skipped"] == 1
+        assert stats["xfailed"] == 1
+        assert stats["tests"]["test_pass"]["markers"] == ["mandatory"]
+        assert stats["tests"]["test_fail"]["outcome"] == "FAILED"
+        assert stats["tests"]["test_fail"]["error_message"] == "boom"
@@ -0,0 +1,49 @@
+"""
+Unit tests for the run cache used by incremental TCK sweeps.
+"""
+
+import pytest
+
+from tck.run_cache import RunCache, hash_agent_card
+
+
+@pytest.mark.core
+class TestRunCache:
+    """Test the SQLite-backed run cache."""
+
+    def test_agent_card_hash_ignores_key_order(self):
+        """Test that equal Agent Cards hash the same regardless of key order."""
+        card_a = {"name": "agent", "url": "http://localhost:9999", "capabilities": {"streaming": True}}
+        card_b = {"capabilities": {"streaming": True}, "url": "http://localhost:9999", "name": "agent"}
+
+        assert hash_agent_card(card_a) == hash_agent_card(card_b)
+        assert hash_agent_card(card_a) != hash_agent_card({**card_a, "version": "2"})
+
+    def test_only_passed_outcomes_are_reusable(self, tmp_path):
+        """Test that only passing tests are offered for reuse."""
+        cache = RunCache(tmp_path / "cache" / "run_cache.sqlite")
+        cache.record("jsonrpc", {"test_a.py::test_ok": ("h1", "passed"), "test_a.py::test_bad": ("h2", "failed")})
+
+        assert cache.passed_hashes("jsonrpc") == {"test_a.py::test_ok": "h1"}
+        cache.close()
+
+    def test_outcomes_are_scoped_by_transport_set(self, tmp_path):
+        """Test that results recorded for one transport set are not reused for another."""
+        cache = RunCache(tmp_path / "run_cache.sqlite")
+        cache.record("grpc", {"test_a.py::test_ok": ("h1", "passed")})
+
+        assert cache.passed_hashes("jsonrpc") == {}
+        assert cache.passed_hashes("grpc") == {"test_a.py::test_ok": "h1"}
+        cache.close()
+
+    def test_latest_outcome_replaces_previous(self, tmp_path):
+        """Test that a new failure invalidates an earlier pass."""
+        path = tmp_path / "run_cache.sqlite"
+        cache = RunCache(path)
+        cache.record("jsonrpc", {"test_a.py::test_ok": ("h1", "passed")})
+        cache.close()
+
+        reopened = RunCache(path)
+        reopened.record("jsonrpc", {"test_a.py::test_ok": ("h1", "failed")})
+        assert reopened.passed_hashes("jsonrpc") == {}
+        reopened.close()
@@ -11,7 +11,7 @@ import pytest
 from abc import ABC
 from typing import Any, Dict, Optional
 
-from tck.transport.base_client import BaseTransportClient, TransportError, TransportType
+from tck.transport.base_client import BaseTransportClient, TransportError, TransportType, exchange_method
 
 # Import the core marker
 pytestmark = pytest.mark.core
@@ -215,5 +215,60 @@ class TestBaseTransportClient:
             assert callable(getattr(client, method_name))
 
 
+class ExchangeTransportClient(MockTransportClient):
+    """Mock client whose get_task is an exchange over a scripted fake network."""
+
+    def __init__(self, responses):
+        super().__init__("https://example.com", TransportType.REST)
+        self.responses = list(responses)
+        self.calls = []
+
+    def _perform(self, call):
+        self.calls.append(call)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    async def _aperform(self, call):
+        return self._perform(call)
+
+    @exchange_method
+    def get_task(self, task_id, history_length=None, extra_headers=None):
+        try:
+            task = yield ("get", f"/tasks/{task_id}", {"headers": extra_headers})
+        except ConnectionError as e:
+            raise TransportError(f"get_task failed: {e}", self.transport_type, original_error=e)
+        return {"task": task, "history_length": history_length}
+
+
+class TestExchangeMethods:
+    """Test running exchange-based methods with blocking and async I/O."""
+
+    def test_sync_call_runs_exchange(self):
+        """Test that calling an exchange method performs its network call and returns the result."""
+        client = ExchangeTransportClient([{"id": "t1"}])
+
+        assert client.get_task("t1", history_length=2) == {"task": {"id": "t1"}, "history_length": 2}
+        assert client.calls == [("get", "/tasks/t1", {"headers": None})]
+
+    async def test_async_call_runs_same_exchange(self):
+        """Test that the async API runs the same exchange, including its error mapping."""
+        client = ExchangeTransportClient([{"id": "t1"}, ConnectionError("reset")])
+
+        assert await client.aget_task("t1") == {"task": {"id": "t1"}, "history_length": None}
+        with pytest.raises(TransportError, match="get_task failed: reset"):
+            await client.aget_task("t2")
+
+    async def test_async_fallback_runs_blocking_method_in_executor(self):
+        """Test that methods without an exchange run the blocking method off the event loop."""
+        client = MockTransportClient("https://example.com", TransportType.JSON_RPC)
+
+        result = await client.acancel_task("t1", extra_headers={"X-Test": "1"})
+
+        assert result == {"mocked": True, "method": "cancel_task"}
+        assert client.method_calls[-1]["kwargs"] == {"task_id": "t1", "extra_headers": {"X-Test": "1"}}
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
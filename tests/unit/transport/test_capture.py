@@ -0,0 +1,189 @@
+"""
+Unit tests for capture and replay of SUT exchanges.
+"""
+
+import httpx
+import pytest
+
+import tck.config  # noqa: F401  (must be imported before the transport modules)
+from tck.transport import capture, retry_policy
+from tck.transport.capture import ExchangeArchive, ReplayMissError, pack_messages, redact_headers, unpack_messages
+from tck.transport.jsonrpc_client import JSONRPCClient
+from tck.transport.rest_client import RESTClient
+
+SUT_URL = "https://example.com/jsonrpc"
+
+
+def _echo_sut(call):
+    """Fake SUT answering a JSON-RPC request with its own id and a generated message id."""
+    operation, url, kwargs = call
+    request = kwargs["json"]
+    result = {"id": "task-1", "history": [{"messageId": request["params"].get("messageId")}]}
+    return httpx.Response(
+        200,
+        json={"jsonrpc": "2.0", "id": request["id"], "result": result},
+        headers={"X-Sut": "1"},
+        request=httpx.Request(operation.upper(), url),
+    )
+
+
+@pytest.fixture
+def client():
+    client = JSONRPCClient(SUT_URL, max_retries=0)
+    yield client
+    capture.stop()
+    retry_policy.reset_retry_policy()
+    client.close()
+
+
+def _request(request_id, message_id="msg-11111111", method="SendMessage"):
+    return {"jsonrpc": "2.0", "id": request_id, "method": method, "params": {"messageId": message_id}}
+
+
+@pytest.mark.core
+class TestExchangeArchive:
+    """Test the SQLite exchange archive."""
+
+    def test_recording_a_test_again_replaces_it(self, tmp_path):
+        """Test that a test's calls are stored in order and replaced by a new recording."""
+        archive = ExchangeArchive(tmp_path / "archive" / "exchanges.sqlite")
+        record = {"transport": "rest", "kind": "call", "match_key": "GET /tasks/t1", "target": "u", "meta": {"status": 200}}
+        archive.store("rest", "test_a.py::test_x", [{**record, "request": {"body": None}, "response": b"one"}] * 2)
+        archive.store("rest", "test_a.py::test_x", [{**record, "request": {"body": None}, "response": [b"tw", b"o"]}])
+
+        records = archive.test_records("rest", "test_a.py::test_x")
+        assert [r["response"] for r in records] == [b"two"]
+        assert archive.test_records("jsonrpc", "test_a.py::test_x") == []
+        assert archive.find("rest", "rest", "call", "GET /tasks/t1", {"body": None})["meta"] == {"status": 200}
+        archive.close()
+
+    def test_pack_messages_round_trip(self):
+        """Test framing of serialized gRPC stream messages."""
+        messages = [b"", b"\x00\x01", b"x" * 300]
+
+        assert unpack_messages(pack_messages(messages)) == messages
+
+    def test_auth_header_values_are_redacted(self):
+        """Test that credentials are never written to the archive."""
+        headers = redact_headers({"Authorization": "Bearer secret", "Content-Type": "application/json"})
+
+        assert headers == [("Authorization", "<redacted>"), ("Content-Type", "application/json")]
+
+
+@pytest.mark.core
+class TestCaptureAndReplay:
+    """Test recording client calls and answering them from the archive."""
+
+    def test_replay_answers_without_network(self, client, tmp_path, monkeypatch):
+        """Test that a replayed call returns the recorded response with current request values."""
+        path = tmp_path / "exchanges.sqlite"
+        monkeypatch.setattr(client, "_perform", _echo_sut)
+        recorder = capture.start_capture(path, "jsonrpc")
+        recorder.begin_test("test_a.py::test_send")
+        recorded = client.send_raw_json_rpc(_request("tck-recorded-id"))
+        capture.stop()
+        assert recorded["id"] == "tck-recorded-id"
+
+        def offline(call):
+            raise AssertionError("replay must not use the network")
+
+        monkeypatch.setattr(client, "_perform", offline)
+        replayer = capture.start_replay(path, "jsonrpc")
+        replayer.begin_test("test_a.py::test_send")
+        replayed = client.send_raw_json_rpc(_request("tck-replayed-id", message_id="msg-22222222"))
+
+        assert replayed["id"] == "tck-replayed-id"
+        assert replayed["result"]["history"] == [{"messageId": "msg-22222222"}]
+        assert replayer.replayed == 1
+
+    def test_replay_matches_calls_by_operation_and_order(self, client, tmp_path, monkeypatch):
+        """Test that the n-th call of a method gets the n-th recorded answer, and misses are reported."""
+        path = tmp_path / "exchanges.sqlite"
+        monkeypatch.setattr(client, "_perform", _echo_sut)
+        recorder = capture.start_capture(path, "jsonrpc")
+        recorder.begin_test("test_a.py::test_order")
+        for message_id in ("msg-first-1", "msg-second-2"):
+            client.send_raw_json_rpc(_request("tck-id-1", message_id=message_id))
+        client.send_raw_json_rpc(_request("tck-id-2", method="GetTask"))
+        capture.stop()
+
+        replayer = capture.start_replay(path, "jsonrpc")
+        replayer.begin_test("test_a.py::test_order")
+        get_task = client.send_raw_json_rpc(_request("tck-id-2", method="GetTask"))
+        first = client.send_raw_json_rpc(_request("tck-id-1", message_id="msg-first-1"))
+        second = client.send_raw_json_rpc(_request("tck-id-1", message_id="msg-second-2"))
+
+        assert get_task["result"]["history"] == [{"messageId": "msg-11111111"}]
+        assert [first["result"]["history"][0]["messageId"], second["result"]["history"][0]["messageId"]] == [
+            "msg-first-1",
+            "msg-second-2",
+        ]
+        with pytest.raises(ReplayMissError):
+            client.send_raw_json_rpc(_request("tck-id-3", method="CancelTask"))
+        assert len(replayer.misses) == 1
+
+    def test_recorded_transport_errors_are_replayed(self, client, tmp_path, monkeypatch):
+        """Test that a call that failed to connect fails the same way on replay."""
+        path = tmp_path / "exchanges.sqlite"
+
+        def unreachable(call):
+            raise httpx.ConnectError("connection refused", request=httpx.Request("POST", SUT_URL))
+
+        monkeypatch.setattr(client, "_perform", unreachable)
+        recorder = capture.start_capture(path, "jsonrpc")
+        recorder.begin_test("test_a.py::test_down")
+        with pytest.raises(httpx.ConnectError):
+            client.send_raw_json_rpc(_request("tck-id-1"))
+        capture.stop()
+
+        replayer = capture.start_replay(path, "jsonrpc")
+        replayer.begin_test("test_a.py::test_down")
+        with pytest.raises(httpx.ConnectError, match="connection refused"):
+            client.send_raw_json_rpc(_request("tck-id-1"))
+
+    async def test_sse_stream_is_replayed(self, tmp_path, monkeypatch):
+        """Test that a recorded Server-Sent Events stream is replayed event by event."""
+        client = RESTClient("https://example.com")
+        body = b'data: {"task": {"id": "task-1"}}\n\ndata: {"statusUpdate": {"taskId": "task-1"}}\n\n'
+
+        class FakeStreamClient:
+            def stream(self, method, url, **kwargs):
+                response = httpx.Response(200, headers={"content-type": "text/event-stream"}, content=body)
+
+                class Opened:
+                    async def __aenter__(self):
+                        return response
+
+                    async def __aexit__(self, *exc):
+                        return False
+
+                return Opened()
+
+        monkeypatch.setattr(RESTClient, "async_client", FakeStreamClient())
+        path = tmp_path / "exchanges.sqlite"
+        capture.start_capture(path, "rest").begin_test("test_a.py::test_stream")
+        message = {"messageId": "msg-1", "role": "ROLE_USER", "parts": [{"text": "hi"}]}
+        recorded = [event async for event in client.send_streaming_message(message)]
+        capture.stop()
+
+        monkeypatch.setattr(RESTClient, "async_client", None)
+        capture.start_replay(path, "rest").begin_test("test_a.py::test_stream")
+        try:
+            replayed = [event async for event in client.send_streaming_message(message)]
+        finally:
+            capture.stop()
+
+        assert replayed == recorded == [{"task": {"id": "task-1"}}, {"statusUpdate": {"taskId": "task-1"}}]
+
+    def test_agent_card_is_archived(self, tmp_path):
+        """Test that the Agent Card recorded with a session is available on replay."""
+        path = tmp_path / "exchanges.sqlite"
+        capture.start_capture(path, "jsonrpc").record_agent_card({"name": "agent"})
+        capture.stop()
+
+        try:
+            assert capture.start_replay(path, "jsonrpc").agent_card() == {"name": "agent"}
+        finally:
+            capture.stop()
+        with pytest.raises(FileNotFoundError):
+            capture.start_replay(tmp_path / "missing.sqlite")
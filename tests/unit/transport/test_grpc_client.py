@@ -9,14 +9,24 @@ make real network calls to live SUTs without mocking.
 """
 
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, patch, AsyncMock, PropertyMock
 import asyncio
 from typing import Dict, Any
 
+from tck.config import get_grpc_channel_options
 from tck.transport.grpc_client import GRPCClient
+from tck.transport.grpc_channels import close_grpc_channel_pool
 from tck.transport.base_client import TransportType, TransportError
 
 
+@pytest.fixture(autouse=True)
+def fresh_channel_pool():
+    """Give every test its own shared-channel registry, so patched channel factories are used."""
+    close_grpc_channel_pool()
+    yield
+    close_grpc_channel_pool()
+
+
 @pytest.mark.core
 class TestGRPCClientInitialization:
     """Test GRPCClient initialization and configuration."""
@@ -116,7 +126,7 @@ class TestGRPCClientChannelManagement:
         client = GRPCClient("grpc://example.com:9000")
         channel = client.channel
 
-        mock_insecure_channel.assert_called_once_with("example.com:9000")
+        mock_insecure_channel.assert_called_once_with("example.com:9000", options=get_grpc_channel_options())
         assert channel == mock_channel
 
     @patch("grpc.secure_channel")
@@ -132,7 +142,7 @@ class TestGRPCClientChannelManagement:
         channel = client.channel
 
         mock_ssl_creds.assert_called_once()
-        mock_secure_channel.assert_called_once_with("example.com:9000", mock_creds)
+        mock_secure_channel.assert_called_once_with("example.com:9000", mock_creds, options=get_grpc_channel_options())
         assert channel == mock_channel
 
     def test_channel_caching(self):
@@ -152,8 +162,19 @@ class TestGRPCClientChannelManagement:
             assert mock_insecure.call_count == 1  # Not called again
             assert channel1 == channel2
 
+    def test_channel_shared_between_clients(self):
+        """Test clients for the same target share one channel."""
+        with patch("grpc.insecure_channel") as mock_insecure:
+            mock_insecure.return_value = Mock()
+
+            first = GRPCClient("grpc://example.com:9000")
+            second = GRPCClient("grpc://example.com:9000")
+
+            assert first.channel is second.channel
+            assert mock_insecure.call_count == 1
+
     def test_close_cleans_up_channel(self):
-        """Test close() properly cleans up gRPC channel."""
+        """Test close() releases the channel and the shared channel is closed with the registry."""
         with patch("grpc.insecure_channel") as mock_insecure:
             mock_channel = Mock()
             mock_insecure.return_value = mock_channel
@@ -164,12 +185,16 @@ class TestGRPCClientChannelManagement:
             _ = client.channel
             assert client._channel is not None
 
-            # Close should cleanup
+            # Close releases the client's reference but keeps the shared channel open
             client.close()
-            mock_channel.close.assert_called_once()
+            mock_channel.close.assert_not_called()
             assert client._channel is None
             assert client._stub is None
 
+            # Closing the registry closes the shared channel
+            close_grpc_channel_pool()
+            mock_channel.close.assert_called_once()
+
     def test_context_manager(self):
         """Test client works as context manager."""
         with patch("grpc.insecure_channel") as mock_insecure:
@@ -179,8 +204,9 @@ class TestGRPCClientChannelManagement:
             with GRPCClient("grpc://example.com:9000") as client:
                 _ = client.channel  # Trigger channel creation
 
-            # Should auto-close on exit
-            mock_channel.close.assert_called_once()
+            # Should release the channel on exit, leaving the shared channel open
+            assert client._channel is None
+            mock_channel.close.assert_not_called()
 
 
 @pytest.mark.core
@@ -214,7 +240,7 @@ class TestGRPCClientSendMessage:
         assert result["task"]["status"]["state"] == "TASK_STATE_SUBMITTED"
 
         # Verify gRPC channel was used
-        mock_channel_fn.assert_called_once_with("example.com:9000")
+        mock_channel_fn.assert_called_once_with("example.com:9000", options=get_grpc_channel_options())
 
     @patch("grpc.insecure_channel")
     def test_send_message_with_grpc_error(self, mock_channel_fn):
@@ -302,7 +328,7 @@ class TestGRPCClientStreamingMessage:
         assert responses[2]["status_update"]["final"] is True
 
         # Verify async gRPC channel was used
-        mock_channel_fn.assert_called_once_with("example.com:9000")
+        mock_channel_fn.assert_called_once_with("example.com:9000", options=get_grpc_channel_options())
 
     @patch("grpc.aio.insecure_channel")
     @pytest.mark.asyncio
@@ -320,10 +346,9 @@ class TestGRPCClientStreamingMessage:
             def details(self):
                 return "Service unavailable"
 
-        # Mock gRPC error
-        mock_channel = AsyncMock()
-        mock_channel.__aenter__ = AsyncMock(side_effect=MockAioGrpcError())
-        mock_channel.__aexit__ = AsyncMock(return_value=None)
+        # Mock gRPC error raised by the streaming call on the shared aio channel
+        mock_channel = Mock()
+        mock_channel.unary_stream.return_value = Mock(side_effect=MockAioGrpcError())
         mock_channel_fn.return_value = mock_channel
 
         client = GRPCClient("grpc://example.com:9000")
@@ -488,3 +513,36 @@ def test_grpc_client_configuration_options():
     # Test custom timeout
     client_custom = GRPCClient("grpc://example.com:9000", timeout=120.0)
     assert client_custom.timeout == 120.0
+
+
+@pytest.mark.core
+class TestGRPCClientAsyncAPI:
+    """Test the async counterparts of the unary gRPC methods."""
+
+    async def test_aget_task_uses_aio_stub(self):
+        """Test that aget_task makes its RPC on the aio stub and maps the response."""
+        client = GRPCClient("grpc://example.com:9000")
+        client._load_static_stubs()
+        stub = Mock()
+        pb = client._pb
+        task = pb.Task(id="task-123", context_id="ctx-1", status=pb.TaskStatus(state=pb.TASK_STATE_COMPLETED))
+        stub.GetTask = AsyncMock(return_value=task)
+
+        with patch.object(GRPCClient, "aio_stub", new_callable=PropertyMock, return_value=stub):
+            result = await client.aget_task("task-123", history_length=2)
+
+        assert result["id"] == "task-123"
+        assert result["contextId"] == "ctx-1"
+        request = stub.GetTask.call_args[0][0]
+        assert request.id == "task-123" and request.history_length == 2
+        assert stub.GetTask.call_args[1]["timeout"] == client.timeout
+
+    async def test_aio_stub_follows_event_loop_channel(self):
+        """Test that the aio stub is built on the shared aio channel of the running loop."""
+        client = GRPCClient("grpc://example.com:9000")
+
+        with patch("grpc.aio.insecure_channel") as mock_channel_fn:
+            stub = client.aio_stub
+            assert client.aio_stub is stub
+
+        mock_channel_fn.assert_called_once()
@@ -0,0 +1,83 @@
+"""
+Unit tests for the shared HTTP connection pool.
+
+Uses a local keep-alive HTTP server to check that clients on the pool reuse
+connections and that hits and misses are counted.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import tck.config
+from tck.transport.http_pool import HTTPConnectionPool, PERMISSIVE_TLS, close_http_pool, get_http_pool
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.core
+class TestHTTPConnectionPool:
+    """Test the HTTP connection pool registry."""
+
+    def test_clients_share_connections(self, server_url):
+        """Test that separate clients on the pool reuse one keep-alive connection."""
+        import httpx
+
+        pool = HTTPConnectionPool(max_connections=10, max_keepalive_connections=5, keepalive_expiry=30.0)
+        with httpx.Client(transport=pool.transport()) as first:
+            assert first.get(server_url + "/a").status_code == 200
+        # Closing a client leaves the pooled connection open
+        with httpx.Client(transport=pool.transport()) as second:
+            assert second.get(server_url + "/b").status_code == 200
+            assert second.get(server_url + "/c").status_code == 200
+
+        assert pool.stats() == {"requests": 3, "hits": 2, "misses": 1, "hit_rate": round(2 / 3, 4)}
+        pool.close()
+
+    def test_transports_are_keyed_by_tls_mode_and_retries(self):
+        """Test that the registry returns one transport per TLS mode and retry count."""
+        pool = HTTPConnectionPool()
+
+        assert pool.transport() is pool.transport(True, 0)
+        assert pool.transport(PERMISSIVE_TLS) is not pool.transport()
+        assert pool.transport(retries=3) is not pool.transport()
+        pool.close()
+
+    def test_session_pool_uses_config_limits(self, monkeypatch):
+        """Test that the session pool is built from tck.config, including env overrides."""
+        close_http_pool()
+        monkeypatch.setenv("A2A_HTTP_MAX_KEEPALIVE_CONNECTIONS", "7")
+        tck.config.set_http_pool_config(max_connections=42, keepalive_expiry=5.0)
+        try:
+            pool = get_http_pool()
+            assert pool is get_http_pool()
+            assert pool.limits.max_connections == 42
+            assert pool.limits.max_keepalive_connections == 7
+            assert pool.limits.keepalive_expiry == 5.0
+        finally:
+            close_http_pool()
+            tck.config.reset_transport_config()
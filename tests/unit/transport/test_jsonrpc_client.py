@@ -6,8 +6,10 @@ but do not make actual network calls (since we need a real SUT for that).
 The actual network functionality is tested in the TCK integration test suite.
 """
 
+import asyncio
+
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from typing import Dict, Any
 
 from tck.transport.jsonrpc_client import JSONRPCClient, JSONRPCError
@@ -230,3 +232,137 @@ class TestJSONRPCError:
         assert error.json_rpc_error == json_error
         assert "JSONRPC" in str(error)
         assert "Test error message" in str(error)
+
+
+@pytest.mark.core
+class TestJSONRPCClientAsyncClient:
+    """Test cases for the long-lived async client used for streaming."""
+
+    async def test_async_client_reused_within_event_loop(self):
+        """Test that streams started from one event loop share one async client."""
+        client = JSONRPCClient("https://example.com/jsonrpc")
+
+        first = client.async_client
+        assert client.async_client is first
+
+        await client.aclose()
+        assert client._async_client is None
+        assert first.is_closed
+
+    def test_async_client_recreated_for_new_event_loop(self):
+        """Test that a client bound to a finished event loop is not reused."""
+        client = JSONRPCClient("https://example.com/jsonrpc")
+
+        async def get_async_client():
+            return client.async_client
+
+        first = asyncio.run(get_async_client())
+        second = asyncio.run(get_async_client())
+
+        assert first is not second
+        client.close()
+        assert client._async_client is None
+
+    async def test_async_api_posts_on_async_client(self):
+        """Test that async method helpers send their request on the async client with the unary timeout."""
+        client = JSONRPCClient("https://example.com/jsonrpc", timeout=12.0)
+        mock_response = Mock()
+        mock_response.status_code = 200
+        task = {"id": "task-123", "status": {"state": "TASK_STATE_COMPLETED"}}
+        mock_response.json.return_value = {"jsonrpc": "2.0", "id": "req-1", "result": task}
+
+        with patch.object(client.async_client, "post", AsyncMock(return_value=mock_response)) as mock_post:
+            result = await client.aget_task("task-123", history_length=5)
+
+        assert result == task
+        assert mock_post.call_args[1]["json"]["method"] == "GetTask"
+        assert mock_post.call_args[1]["json"]["params"] == {"id": "task-123", "historyLength": 5}
+        assert mock_post.call_args[1]["timeout"] == 12.0
+        await client.aclose()
+
+
+@pytest.mark.core
+class TestJSONRPCClientBatch:
+    """Test JSON-RPC 2.0 batch requests."""
+
+    def setup_method(self):
+        """Set up test client."""
+        self.client = JSONRPCClient("https://example.com/jsonrpc")
+
+    def teardown_method(self):
+        """Clean up after test."""
+        self.client.close()
+
+    def _mock_post(self, json_response):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.text = str(json_response)
+        mock_response.json.return_value = json_response
+        mock_response.raise_for_status.return_value = None
+        return patch.object(self.client.client, "post", return_value=mock_response)
+
+    def test_build_batch_request_does_not_send(self):
+        """Test that building a batch entry captures the helper's request without posting it."""
+        with patch.object(self.client.client, "post") as mock_post:
+            request = self.client.build_batch_request("get_task", task_id="task-1", history_length=2)
+
+        mock_post.assert_not_called()
+        assert request["method"] == "GetTask"
+        assert request["params"] == {"id": "task-1", "historyLength": 2}
+        assert request["id"]
+
+    def test_build_batch_request_rejects_streaming_helpers(self):
+        """Test that helpers without a single non-streaming request cannot be batched."""
+        with pytest.raises(ValueError):
+            self.client.build_batch_request("send_streaming_message", message={})
+        with pytest.raises(ValueError):
+            self.client.build_batch_request("send_batch", calls=[])
+
+    def test_send_batch_correlates_responses_by_id(self):
+        """Test that out-of-order batch responses are matched to their requests."""
+        calls = [
+            ("get_task", {"task_id": "task-1"}),
+            ("cancel_task", {"task_id": "task-2"}),
+            {"jsonrpc": "2.0", "method": "ListTasks", "params": {}, "id": "raw-1"},
+        ]
+        with patch.object(self.client, "_generate_id", side_effect=["req-1", "req-2"]):
+            batch_response = [
+                {"jsonrpc": "2.0", "id": "raw-1", "result": {"tasks": []}},
+                {"jsonrpc": "2.0", "id": "req-2", "error": {"code": -32002, "message": "Task cannot be canceled"}},
+                {"jsonrpc": "2.0", "id": "req-1", "result": {"id": "task-1"}},
+            ]
+            with self._mock_post(batch_response) as mock_post:
+                results = self.client.send_batch(calls)
+
+        sent = mock_post.call_args[1]["json"]
+        assert [request["id"] for request in sent] == ["req-1", "req-2", "raw-1"]
+        assert [entry["method"] for entry in results] == ["GetTask", "CancelTask", "ListTasks"]
+        assert results[0]["result"] == {"id": "task-1"} and results[0]["error"] is None
+        assert results[1]["result"] is None and results[1]["error"]["code"] == -32002
+        assert results[2]["result"] == {"tasks": []}
+
+    def test_send_batch_reports_missing_responses(self):
+        """Test that an entry without a response is reported as an error."""
+        with self._mock_post([{"jsonrpc": "2.0", "id": "a", "result": {}}]):
+            results = self.client.send_batch(
+                [{"jsonrpc": "2.0", "method": "GetTask", "params": {"id": "t"}, "id": i} for i in ("a", "b")]
+            )
+
+        assert results[0]["error"] is None
+        assert "No response" in results[1]["error"]["message"]
+
+    def test_send_batch_rejected_as_a_whole(self):
+        """Test that a single error response to a batch raises JSONRPCError."""
+        error = {"code": -32600, "message": "Invalid Request"}
+        with self._mock_post({"jsonrpc": "2.0", "id": None, "error": error}):
+            with pytest.raises(JSONRPCError) as exc_info:
+                self.client.send_batch([("get_task", {"task_id": "task-1"})])
+
+        assert exc_info.value.json_rpc_error == error
+
+    def test_send_batch_validation(self):
+        """Test that empty batches and duplicate ids are rejected before sending."""
+        with pytest.raises(ValueError):
+            self.client.send_batch([])
+        with pytest.raises(ValueError):
+            self.client.send_batch([{"method": "GetTask", "id": 1}, {"method": "GetTask", "id": 1}])
@@ -0,0 +1,39 @@
+"""
+Unit tests for lazy transport client imports.
+
+The gRPC/protobuf stack must only be imported when the gRPC client is used.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+CHECK_LAZY_GRPC = """
+import sys
+import tck.config
+import tck.transport as transport
+assert transport.JSONRPCClient.__name__ == "JSONRPCClient"
+assert transport.TransportManager.__name__ == "TransportManager"
+assert "grpc" not in sys.modules, "grpc imported before GRPCClient was accessed"
+assert transport.GRPCClient.__name__ == "GRPCClient"
+assert "grpc" in sys.modules
+"""
+
+
+@pytest.mark.core
+class TestLazyTransportImports:
+    """Test the lazy exports of tck.transport."""
+
+    def test_grpc_stack_imported_on_first_access(self):
+        """Test that grpc is not imported until GRPCClient is accessed."""
+        # A fresh interpreter, since this test session may already have imported grpc
+        result = subprocess.run([sys.executable, "-c", CHECK_LAZY_GRPC], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown names still raise AttributeError."""
+        import tck.transport as transport
+
+        with pytest.raises(AttributeError):
+            transport.NoSuchClient
@@ -0,0 +1,128 @@
+"""
+Unit tests for the descriptor-driven protobuf to A2A JSON conversion.
+"""
+
+import pytest
+from google.protobuf import json_format
+from google.protobuf.struct_pb2 import Struct, Value
+
+import tck.config  # noqa: F401  (must be imported before the transport modules)
+from tck.transport.grpc_client import GRPCClient
+from tck.transport.proto_json import message_to_json
+
+
+@pytest.fixture(scope="module")
+def client():
+    client = GRPCClient("grpc://example.com:9000")
+    client._load_static_stubs()
+    return client
+
+
+@pytest.fixture(scope="module")
+def pb(client):
+    return client._pb
+
+
+def _task(pb):
+    metadata = Struct()
+    metadata.update({"source": "tck", "attempt": 2, "tags": ["a", "b"], "extra": None, "nested": {"ok": True}})
+    data = Value()
+    data.struct_value.update({"rows": [1, 2.5, "three"]})
+    history = [
+        pb.Message(
+            message_id=f"msg-{i}",
+            context_id="ctx-1",
+            task_id="task-1",
+            role=pb.ROLE_USER if i % 2 == 0 else pb.ROLE_AGENT,
+            parts=[pb.Part(text=f"hello {i}")],
+            reference_task_ids=["task-0"],
+        )
+        for i in range(4)
+    ]
+    artifacts = [
+        pb.Artifact(
+            artifact_id="artifact-1",
+            name="report",
+            parts=[
+                pb.Part(raw=b"\x00\x01binary", filename="report.bin", media_type="application/octet-stream"),
+                pb.Part(url="https://example.com/report.pdf", media_type="application/pdf"),
+                pb.Part(data=data),
+            ],
+            metadata=metadata,
+        )
+    ]
+    task = pb.Task(
+        id="task-1",
+        context_id="ctx-1",
+        status=pb.TaskStatus(state=pb.TASK_STATE_WORKING, message=history[-1]),
+        history=history,
+        artifacts=artifacts,
+        metadata=metadata,
+    )
+    task.status.timestamp.FromJsonString("2025-01-02T03:04:05.678Z")
+    return task
+
+
+@pytest.mark.core
+class TestMessageToJson:
+    """Test conversion of A2A protobuf messages."""
+
+    def test_matches_json_format(self, pb):
+        """Test that the result equals json_format.MessageToDict with JSON names."""
+        task = _task(pb)
+
+        assert message_to_json(task) == json_format.MessageToDict(task, preserving_proto_field_name=False)
+
+    def test_a2a_json_shape(self, pb):
+        """Test JSON names, enum names, bytes, timestamps and Struct/Value fields."""
+        result = message_to_json(_task(pb))
+
+        assert result["contextId"] == "ctx-1"
+        assert result["status"]["state"] == "TASK_STATE_WORKING"
+        assert result["status"]["timestamp"] == "2025-01-02T03:04:05.678Z"
+        assert result["history"][1]["role"] == "ROLE_AGENT"
+        assert result["history"][0]["referenceTaskIds"] == ["task-0"]
+        raw, url, data = result["artifacts"][0]["parts"]
+        assert raw == {"raw": "AAFiaW5hcnk=", "filename": "report.bin", "mediaType": "application/octet-stream"}
+        assert url == {"url": "https://example.com/report.pdf", "mediaType": "application/pdf"}
+        assert data == {"data": {"rows": [1, 2.5, "three"]}}
+        assert result["metadata"]["nested"] == {"ok": True}
+        assert result["metadata"]["extra"] is None
+
+    def test_unset_fields_are_omitted(self, pb):
+        """Test that fields left at their default are not emitted."""
+        result = message_to_json(pb.Message(message_id="msg-1", parts=[pb.Part(text="")]))
+
+        assert result == {"messageId": "msg-1", "parts": [{"text": ""}]}
+
+    def test_map_fields(self, pb):
+        """Test that map fields become JSON objects."""
+        flow = pb.ClientCredentialsOAuthFlow(token_url="https://example.com/token", scopes={"read": "Read access"})
+
+        assert message_to_json(flow) == {"tokenUrl": "https://example.com/token", "scopes": {"read": "Read access"}}
+
+
+@pytest.mark.core
+class TestGRPCClientConversion:
+    """Test the GRPCClient conversion helpers built on message_to_json."""
+
+    def test_payload_to_json(self, client, pb):
+        """Test that stream payloads are wrapped under their oneof field name."""
+        status_update = pb.TaskStatusUpdateEvent(
+            task_id="task-1", context_id="ctx-1", status=pb.TaskStatus(state=pb.TASK_STATE_COMPLETED)
+        )
+
+        result = client._payload_to_json(pb.StreamResponse(status_update=status_update))
+
+        assert result == {
+            "status_update": {"taskId": "task-1", "contextId": "ctx-1", "status": {"state": "TASK_STATE_COMPLETED"}}
+        }
+        assert client._payload_to_json(pb.StreamResponse()) == {}
+
+    def test_send_message_response_message(self, client, pb):
+        """Test that a direct message reply is returned under "message"."""
+        message = pb.Message(message_id="reply-1", role=pb.ROLE_AGENT, parts=[pb.Part(text="hi")])
+
+        result = client._payload_to_json(pb.SendMessageResponse(message=message))
+
+        assert result == {"message": {"messageId": "reply-1", "role": "ROLE_AGENT", "parts": [{"text": "hi"}]}}
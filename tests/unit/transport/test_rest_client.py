@@ -14,8 +14,11 @@ import asyncio
 import json
 from typing import Dict, Any
 
+import httpx
+
 from tck.transport.rest_client import RESTClient
 from tck.transport.base_client import TransportType, TransportError
+from tck.transport.http_pool import PERMISSIVE_TLS, get_http_pool
 
 
 @pytest.mark.core
@@ -115,7 +118,12 @@ class TestRESTClientHttpClients:
         client = RESTClient("https://example.com:8080")
         http_client = client.client
 
-        mock_client_class.assert_called_once_with(timeout=30.0, headers=client.default_headers, follow_redirects=True)
+        mock_client_class.assert_called_once_with(
+            timeout=30.0,
+            headers=client.default_headers,
+            follow_redirects=True,
+            transport=get_http_pool().transport(PERMISSIVE_TLS),
+        )
         assert http_client == mock_client
 
     @patch("tck.transport.rest_client.AsyncClient")
@@ -127,7 +135,12 @@ class TestRESTClientHttpClients:
         client = RESTClient("https://example.com:8080")
         async_client = client.async_client
 
-        mock_async_client_class.assert_called_once_with(timeout=30.0, headers=client.default_headers, follow_redirects=True)
+        mock_async_client_class.assert_called_once_with(
+            timeout=30.0,
+            headers=client.default_headers,
+            follow_redirects=True,
+            transport=get_http_pool().async_transport(PERMISSIVE_TLS),
+        )
         assert async_client == mock_async_client
 
     def test_client_caching(self):
@@ -351,17 +364,19 @@ class TestRESTClientStreamingMessage:
             'data: {"status_update": {"task_id": "task-stream-1", "status": {"state": "TASK_STATE_COMPLETED"}, "final": true}}',
             "",
             "data: [DONE]",
+            "",
         ]
 
-        # Create async iterator for lines
-        async def async_iter_lines():
-            for line in sse_lines:
-                yield line
+        # Create async iterator for the raw stream, split across chunk boundaries
+        async def async_iter_bytes():
+            stream = "\n".join(sse_lines).encode() + b"\n"
+            for i in range(0, len(stream), 16):
+                yield stream[i : i + 16]
 
         # Mock async context manager for streaming
         mock_response = AsyncMock()
         mock_response.status_code = 200
-        mock_response.aiter_lines = async_iter_lines
+        mock_response.aiter_bytes = async_iter_bytes
 
         mock_stream_context = AsyncMock()
         mock_stream_context.__aenter__ = AsyncMock(return_value=mock_response)
@@ -437,21 +452,21 @@ class TestRESTClientStreamingMessage:
     async def test_send_streaming_message_invalid_sse_data(self, mock_async_client_class):
         """Test streaming message handles invalid SSE data gracefully."""
         # Mock SSE response with invalid JSON
-        sse_lines = [
+        sse_events = [
             'data: {"task": {"id": "task-1"}}',  # Valid
             "data: invalid-json",  # Invalid - should be skipped
             'data: {"status_update": {"task_id": "task-1", "final": true}}',  # Valid
             "data: [DONE]",
         ]
 
-        # Create async iterator for lines
-        async def async_iter_lines():
-            for line in sse_lines:
-                yield line
+        # Create async iterator for the raw stream (one chunk per event)
+        async def async_iter_bytes():
+            for event in sse_events:
+                yield f"{event}\r\n\r\n".encode()
 
         mock_response = AsyncMock()
         mock_response.status_code = 200
-        mock_response.aiter_lines = async_iter_lines
+        mock_response.aiter_bytes = async_iter_bytes
 
         mock_stream_context = AsyncMock()
         mock_stream_context.__aenter__ = AsyncMock(return_value=mock_response)
@@ -906,3 +921,30 @@ def test_rest_client_configuration_options():
     # Test custom timeout
     client_custom = RESTClient("https://example.com:8080", timeout=120.0)
     assert client_custom.timeout == 120.0
+
+
+@pytest.mark.core
+class TestRESTClientAsyncAPI:
+    """Test the async counterparts of the REST methods."""
+
+    async def test_aget_task_uses_async_client(self):
+        """Test that aget_task sends its GET on the async client and converts the response."""
+        client = RESTClient("https://example.com:8080")
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"id": "task-123", "status": {"state": "TASK_STATE_COMPLETED"}}
+
+        with patch.object(client.async_client, "get", AsyncMock(return_value=mock_response)) as mock_get:
+            result = await client.aget_task("task-123", history_length=3)
+
+        assert result["id"] == "task-123"
+        assert mock_get.call_args[0][0] == "https://example.com:8080/tasks/task-123"
+        assert mock_get.call_args[1]["params"] == {"historyLength": 3}
+
+    async def test_async_request_error_is_mapped(self):
+        """Test that HTTP errors on the async client surface as TransportError."""
+        client = RESTClient("https://example.com:8080")
+
+        with patch.object(client.async_client, "post", AsyncMock(side_effect=httpx.ConnectError("refused"))):
+            with pytest.raises(TransportError, match="refused"):
+                await client.acancel_task("task-123")
@@ -0,0 +1,233 @@
+"""
+Unit tests for the shared retry, backoff and circuit-breaker policy.
+"""
+
+import asyncio
+import contextlib
+
+import httpx
+import pytest
+
+import tck.config  # noqa: F401  (must be imported before the transport modules)
+from tck.transport import retry_policy
+from tck.transport.jsonrpc_client import JSONRPCClient, JSONRPCError
+from tck.transport.retry_policy import CircuitBreaker, CircuitOpenError, RetryPolicy, http_failure
+
+SUT_URL = "https://example.com/jsonrpc"
+
+
+class FakeSut:
+    """Fake SUT answering calls from a script of responses and exceptions."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def __call__(self, call):
+        operation, url, kwargs = call
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        status, result = outcome
+        return httpx.Response(
+            status,
+            json={"jsonrpc": "2.0", "id": kwargs["json"]["id"], "result": result},
+            request=httpx.Request(operation.upper(), url),
+        )
+
+
+class FailingStreamClient:
+    """httpx.AsyncClient stand-in whose streams fail with an error before any response."""
+
+    def __init__(self, error):
+        self.error = error
+
+    @contextlib.asynccontextmanager
+    async def stream(self, method, url, **kwargs):
+        raise self.error
+        yield
+
+
+async def open_stream(client, http_client):
+    async with client._open_http_stream(http_client, "POST", SUT_URL):
+        pass
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = JSONRPCClient(SUT_URL)
+    client.retry_policy = RetryPolicy(max_attempts=3, jitter=False, base_delay=0.0)
+    monkeypatch.setattr(client, "_validate_result", lambda method_name, result: None)
+    yield client
+    retry_policy.reset_retry_policy()
+    client.close()
+
+
+@pytest.mark.core
+class TestRetryPolicy:
+    """Test backoff and retry decisions."""
+
+    def test_backoff_is_exponential_and_bounded(self):
+        """Test the backoff bound doubles per retry up to max_delay, and jitter stays within it."""
+        policy = RetryPolicy(base_delay=0.5, max_delay=3.0, jitter=False)
+        assert [policy.backoff(attempt) for attempt in (1, 2, 3, 4)] == [0.5, 1.0, 2.0, 3.0]
+
+        jittered = RetryPolicy(base_delay=0.5, max_delay=3.0)
+        assert all(0 <= jittered.backoff(4) <= 3.0 for _ in range(100))
+
+    def test_only_idempotent_methods_are_retried_once_sent(self):
+        """Test that a request that may have reached the SUT is only sent again for idempotent methods."""
+        policy = RetryPolicy(max_attempts=3)
+
+        assert policy.should_retry(1, "get_task", transient=True)
+        assert not policy.should_retry(1, "send_message", transient=True)
+        assert policy.should_retry(1, "send_message", transient=True, sent=False)
+        assert not policy.should_retry(1, "get_task", transient=False)
+        assert not policy.should_retry(3, "get_task", transient=True)
+
+    def test_http_failure_classification(self):
+        """Test which HTTP outcomes are transient, unreachable or unsent."""
+        request = httpx.Request("POST", SUT_URL)
+
+        assert http_failure(httpx.Response(503, request=request), None) == (True, False, True)
+        assert http_failure(httpx.Response(500, request=request), None) == (False, False, True)
+        assert http_failure(None, httpx.ConnectError("refused", request=request)) == (True, True, False)
+        assert http_failure(None, httpx.ReadTimeout("slow", request=request)) == (True, True, True)
+
+    def test_run_retries_until_success(self, monkeypatch):
+        """Test the helper for idempotent operations outside the transport clients."""
+        monkeypatch.setattr(retry_policy.time, "sleep", lambda delay: None)
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise ConnectionError("down")
+            return "ok"
+
+        assert RetryPolicy(max_attempts=3).run(flaky, retry_on=(ConnectionError,)) == "ok"
+        attempts.clear()
+        with pytest.raises(ConnectionError):
+            RetryPolicy(max_attempts=2).run(flaky, retry_on=(ConnectionError,))
+        assert len(attempts) == 2
+
+
+@pytest.mark.core
+class TestCircuitBreaker:
+    """Test opening, probing and closing of an endpoint's circuit."""
+
+    def test_circuit_opens_probes_and_closes(self, monkeypatch):
+        """Test that consecutive unreachable calls open the circuit until a probe succeeds."""
+        now = [100.0]
+        monkeypatch.setattr(retry_policy.time, "monotonic", lambda: now[0])
+        breaker = CircuitBreaker("sut", threshold=2, reset_timeout=10.0)
+
+        breaker.record_failure()
+        breaker.before_call()
+        breaker.record_failure()
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        now[0] += 10.0
+        assert breaker.state == "half-open"
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()  # only one probe at a time
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.rejected == 2
+
+    def test_zero_threshold_disables_the_breaker(self):
+        """Test that a breaker with threshold 0 never opens."""
+        breaker = CircuitBreaker("sut", threshold=0)
+        for _ in range(10):
+            breaker.record_failure()
+        breaker.before_call()
+        assert breaker.state == "closed"
+
+
+@pytest.mark.core
+class TestClientRetries:
+    """Test the policy applied to transport client calls."""
+
+    def test_idempotent_call_is_retried_on_transient_status(self, client, monkeypatch):
+        """Test that get_task is sent again after a 503."""
+        sut = FakeSut((503, None), (200, {"id": "task-1"}))
+        monkeypatch.setattr(client, "_perform", sut)
+
+        assert client.get_task("task-1") == {"id": "task-1"}
+        assert sut.calls == 2
+
+    def test_non_idempotent_call_is_not_sent_twice(self, client, monkeypatch):
+        """Test that send_message is not sent again after a timeout, but is after a refused connection."""
+        request = httpx.Request("POST", SUT_URL)
+        sut = FakeSut(httpx.ReadTimeout("slow", request=request))
+        monkeypatch.setattr(client, "_perform", sut)
+        with pytest.raises(JSONRPCError):
+            client.send_message({"messageId": "msg-1", "role": "ROLE_USER", "parts": [{"text": "hi"}]})
+        assert sut.calls == 1
+
+        sut = FakeSut(httpx.ConnectError("refused", request=request), (200, {"id": "task-1"}))
+        monkeypatch.setattr(client, "_perform", sut)
+        assert client.send_message({"messageId": "msg-2", "role": "ROLE_USER", "parts": [{"text": "hi"}]}) == {"id": "task-1"}
+        assert sut.calls == 2
+
+    def test_unreachable_endpoint_opens_its_circuit(self, client, monkeypatch):
+        """Test that calls fail fast once the endpoint's circuit is open."""
+        tck.config.set_retry_config(breaker_threshold=2)
+        retry_policy.reset_retry_policy()
+        client.retry_policy = RetryPolicy(max_attempts=1)
+        sut = FakeSut(*[httpx.ConnectError("refused", request=httpx.Request("POST", SUT_URL))] * 2)
+        monkeypatch.setattr(client, "_perform", sut)
+        try:
+            for _ in range(2):
+                with pytest.raises(JSONRPCError):
+                    client.get_task("task-1")
+            with pytest.raises(JSONRPCError, match="Circuit open") as exc_info:
+                client.get_task("task-1")
+            assert isinstance(exc_info.value.original_error, CircuitOpenError)
+            assert sut.calls == 2
+        finally:
+            tck.config.reset_transport_config()
+
+    def test_open_circuit_fails_raw_requests_and_batches_as_jsonrpc_errors(self, client, monkeypatch):
+        """Test that calls outside the method helpers also fail with a JSONRPCError when the circuit is open."""
+        breaker = retry_policy.get_circuit_breaker("https://example.com")
+        for _ in range(breaker.threshold):
+            breaker.record_failure()
+        sut = FakeSut()
+        monkeypatch.setattr(client, "_perform", sut)
+
+        with pytest.raises(JSONRPCError) as exc_info:
+            client._make_jsonrpc_request("GetTask", {"id": "task-1"})
+        assert isinstance(exc_info.value.original_error, CircuitOpenError)
+        with pytest.raises(JSONRPCError):
+            client.send_batch([("get_task", {"task_id": "task-1"})])
+        assert sut.calls == 0
+
+    @pytest.mark.parametrize(
+        "error, state",
+        [
+            (httpx.RemoteProtocolError("peer closed connection"), "closed"),
+            (httpx.ConnectError("refused"), "open"),
+            (asyncio.CancelledError(), "half-open"),
+        ],
+    )
+    def test_half_open_stream_probe_always_settles(self, client, monkeypatch, error, state):
+        """Test that a probe stream failing to open closes, reopens or releases the circuit, never holds it."""
+        now = [100.0]
+        monkeypatch.setattr(retry_policy.time, "monotonic", lambda: now[0])
+        breaker = retry_policy.get_circuit_breaker("https://example.com")
+        for _ in range(breaker.threshold):
+            breaker.record_failure()
+        now[0] += breaker.reset_timeout
+
+        with pytest.raises(type(error)):
+            asyncio.run(open_stream(client, FailingStreamClient(error)))
+
+        assert breaker.state == state
+        if state == "half-open":
+            # The cancelled probe was released: the next call probes the endpoint
+            assert breaker.before_call() is True
@@ -0,0 +1,123 @@
+"""
+Unit tests for the precompiled A2A JSON Schema validator registry.
+"""
+
+import pytest
+
+import tck.config  # noqa: F401  (must be imported before the transport modules)
+from tck.transport.base_client import A2AValidationError, TransportType
+from tck.transport.schema_registry import SchemaRegistry
+
+PROTO_TASK = {
+    "id": "task-1",
+    "status": {
+        "state": "TASK_STATE_COMPLETED",
+        "message": {"messageId": "m-1", "role": "ROLE_AGENT", "parts": [{"text": "done"}]},
+    },
+    "history": [{"messageId": "m-0", "role": "ROLE_USER", "parts": [{"text": "hi"}, {"data": {"a": 1}}]}],
+    "artifacts": [{"artifactId": "a-1", "parts": [{"url": "https://example.com/a.txt", "mediaType": "text/plain"}]}],
+}
+
+JSONRPC_TASK = {
+    "kind": "task",
+    "id": "task-1",
+    "contextId": "ctx-1",
+    "status": {"state": "completed"},
+    "history": [{"kind": "message", "messageId": "m-0", "role": "user", "parts": [{"kind": "text", "text": "hi"}]}],
+}
+
+
+@pytest.mark.core
+class TestSchemaRegistry:
+    """Test compiling, caching and running schema validators."""
+
+    def setup_method(self):
+        """Set up a fresh registry."""
+        self.registry = SchemaRegistry()
+
+    def test_validators_are_compiled_once(self):
+        """Test that a definition's validator is compiled on first use and then reused."""
+        assert self.registry.validator("Task") is self.registry.validator("Task")
+        assert self.registry.validator("Task") is not self.registry.validator("Message")
+        assert "AgentCard" in self.registry.definitions()
+
+        with pytest.raises(KeyError):
+            self.registry.validator("NoSuchDefinition")
+
+    @pytest.mark.parametrize("task", [PROTO_TASK, JSONRPC_TASK], ids=["proto_json", "jsonrpc_wire"])
+    def test_valid_tasks(self, task):
+        """Test that both ProtoJSON and the schema's own wire format validate."""
+        assert self.registry.errors("Task", task) == []
+
+    def test_errors_locate_violations(self):
+        """Test that errors name the location of each violation."""
+        task = {"id": "task-1", "status": {"state": "TASK_STATE_UNSPECIFIED"}, "history": [{"role": "ROLE_USER", "parts": [{}]}]}
+
+        errors = self.registry.result_errors("send_message", {"task": task})
+
+        assert any(error.startswith("task.status.state: 'TASK_STATE_UNSPECIFIED' is not one of") for error in errors)
+        assert "task.history.0: 'messageId' is a required property" in errors
+        assert any(error.startswith("task.history.0.parts.0:") for error in errors)
+
+    def test_result_errors_by_method(self):
+        """Test that method results are validated against the matching definition."""
+        message = {"messageId": "m-1", "role": "ROLE_AGENT", "parts": [{"text": "hi"}]}
+
+        assert self.registry.result_errors("send_message", {"message": message}) == []
+        assert self.registry.result_errors("send_message", message) == []
+        assert self.registry.result_errors("get_task", PROTO_TASK) == []
+        assert self.registry.result_errors("list_tasks", {"tasks": [PROTO_TASK, {"id": "task-2"}]}) == [
+            "tasks.1: 'status' is a required property"
+        ]
+        # Methods whose results are not covered by the schema are not validated
+        assert self.registry.result_errors("list_push_notification_configs", {"configs": []}) == []
+
+    def test_timings_per_definition(self):
+        """Test that validation counts, failures and durations are recorded per definition."""
+        self.registry.errors("Task", PROTO_TASK)
+        self.registry.errors("Task", {})
+        self.registry.errors("Message", {"messageId": "m", "role": "ROLE_USER", "parts": []})
+
+        timings = self.registry.timings()
+
+        assert timings["Task"]["count"] == 2
+        assert timings["Task"]["failures"] == 1
+        assert timings["Message"]["count"] == 1
+        assert timings["Task"]["mean_ms"] == pytest.approx(timings["Task"]["total_ms"] / 2)
+        assert timings["Task"]["max_ms"] <= timings["Task"]["total_ms"]
+
+
+@pytest.mark.core
+class TestResultValidation:
+    """Test schema validation of results in the transport clients."""
+
+    def test_invalid_result_raises_validation_error(self):
+        """Test that a non-conforming result raises A2AValidationError for the client's transport."""
+        from tck.transport.jsonrpc_client import JSONRPCClient
+
+        client = JSONRPCClient("https://example.com/jsonrpc")
+        client._validate_result("get_task", PROTO_TASK)
+
+        with pytest.raises(A2AValidationError) as exc_info:
+            client._validate_result("get_task", {"id": "task-1", "status": {"state": "bogus"}})
+
+        assert exc_info.value.transport_type == TransportType.JSON_RPC
+        assert "status.state" in str(exc_info.value)
+        client.close()
+
+    def test_grpc_task_lists_are_validated(self, monkeypatch):
+        """Test that gRPC list_tasks validates every task of the page like the other transports."""
+        from tck.transport.grpc_client import GRPCClient
+
+        client = GRPCClient("grpc://example.com:9000")
+        client._load_static_stubs()
+        pb = client._pb
+        completed = pb.TaskStatus(state=pb.TASK_STATE_COMPLETED)
+        monkeypatch.setattr(client, "_perform", lambda call: pb.ListTasksResponse(tasks=[pb.Task(id="t-1", status=completed)]))
+        assert client.list_tasks()["tasks"] == [{"id": "t-1", "status": {"state": "TASK_STATE_COMPLETED"}}]
+
+        monkeypatch.setattr(client, "_perform", lambda call: pb.ListTasksResponse(tasks=[pb.Task(id="t-1")]))
+        with pytest.raises(A2AValidationError, match="tasks.0: 'status' is a required property") as exc_info:
+            client.list_tasks()
+        assert exc_info.value.transport_type == TransportType.GRPC
+        client.close()
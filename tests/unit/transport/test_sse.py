@@ -0,0 +1,77 @@
+"""
+Unit tests for the incremental Server-Sent Events decoder.
+"""
+
+import httpx
+import pytest
+
+import tck.config  # noqa: F401  (must be imported before the transport modules)
+from tck.transport.sse import SSEDecoder, SSEEvent, aiter_sse_events
+
+STREAM = (
+    b"\xef\xbb\xbf: comment\r\n"
+    b"retry: 1500\r\n"
+    b"id: 7\r\n"
+    b"event: status-update\r\n"
+    b'data: {"a":\r\n'
+    b"data:  1}\r\n"
+    b"\r\n"
+    b"data: \xc3\xa9t\xc3\xa9\n"
+    b"\n"
+    b"event: no-data\r"
+    b"\r"
+    b"data: incomplete"
+)
+
+EXPECTED = [
+    SSEEvent(data='{"a":\n 1}', event="status-update", id="7", retry=1500),
+    SSEEvent(data="été", event="message", id="7", retry=1500),
+]
+
+
+@pytest.mark.core
+class TestSSEDecoder:
+    """Test decoding of event streams."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, len(STREAM)])
+    def test_events_independent_of_chunking(self, chunk_size):
+        """Test that events are reassembled identically however the stream is chunked."""
+        decoder = SSEDecoder()
+        events = []
+        for i in range(0, len(STREAM), chunk_size):
+            events.extend(decoder.feed(STREAM[i : i + chunk_size]))
+
+        # The trailing event without a blank line is never dispatched
+        assert events == EXPECTED
+        assert decoder.last_event_id == "7"
+        assert decoder.retry == 1500
+
+    def test_event_ids_persist_and_reset(self):
+        """Test that the last event id carries over to later events until reset by an empty id."""
+        decoder = SSEDecoder()
+        events = decoder.feed(b"id: 1\ndata: a\n\ndata: b\n\nid\ndata: c\n\nid: x\x00y\ndata: d\n\n")
+
+        assert [(event.data, event.id) for event in events] == [("a", "1"), ("b", "1"), ("c", ""), ("d", "")]
+
+    def test_field_edge_cases(self):
+        """Test empty data fields, values without a space after the colon and unknown fields."""
+        decoder = SSEDecoder()
+        events = decoder.feed(b"data\ndata:x\nfoo: bar\nretry: soon\n\n")
+
+        assert events == [SSEEvent(data="\nx")]
+        assert decoder.retry is None
+
+    async def test_aiter_sse_events_reads_raw_bytes(self):
+        """Test iterating over the events of a streaming httpx response."""
+
+        async def body():
+            yield b"data: [1"
+            yield b"]\n\nid: 2\ndata: [2]\n\n"
+
+        response = httpx.Response(200, content=body())
+        decoder = SSEDecoder()
+
+        events = [event async for event in aiter_sse_events(response, decoder)]
+
+        assert [event.data for event in events] == ["[1]", "[2]"]
+        assert decoder.last_event_id == "2"
@@ -0,0 +1,121 @@
+"""
+Unit tests for the per-call timing breakdown.
+"""
+
+import httpx
+import pytest
+
+import tck.config  # noqa: F401  (must be imported before the transport modules)
+from tck.call_timings import format_call_timings
+from tck.transport import timing
+from tck.transport.jsonrpc_client import JSONRPCClient
+from tck.transport.timing import CallTiming, active_timing, timing_call
+
+SUT_URL = "https://example.com/jsonrpc"
+
+
+class FakeClock:
+    """perf_counter replacement advancing by a fixed step on every reading."""
+
+    def __init__(self, step):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+@pytest.fixture
+def collector():
+    collector = timing.start_call_timing()
+    yield collector
+    timing.stop_call_timing()
+
+
+@pytest.mark.core
+class TestCallTiming:
+    """Test splitting a call into phases."""
+
+    def test_http_trace_events_are_split_into_phases(self, monkeypatch):
+        """Test that httpcore trace events of a new TLS connection map onto connect, tls, ttfb and transfer."""
+        monkeypatch.setattr(timing.time, "perf_counter", FakeClock(0.01))
+        call = CallTiming("jsonrpc", "get_task", "POST /jsonrpc")
+
+        with timing_call(call):
+            assert active_timing() is call
+            for event in (
+                "connection.connect_tcp.started",
+                "connection.connect_tcp.complete",
+                "connection.start_tls.started",
+                "connection.start_tls.complete",
+                "http11.send_request_headers.started",
+                "http11.send_request_headers.complete",
+                "http11.receive_response_headers.started",
+                "http11.receive_response_headers.complete",
+                "http11.receive_response_body.started",
+                "http11.receive_response_body.complete",
+            ):
+                call.trace(event)
+        assert active_timing() is None
+
+        phases = {phase: round(seconds, 3) for phase, seconds in call.phases.items()}
+        assert phases == {"connect": 0.01, "tls": 0.01, "ttfb": 0.03, "transfer": 0.01}
+        assert call.attempts == 1
+
+    def test_untraced_call_counts_as_ttfb(self, monkeypatch):
+        """Test that a call without trace events (e.g. gRPC) is all time to first byte."""
+        monkeypatch.setattr(timing.time, "perf_counter", FakeClock(0.5))
+        call = CallTiming("grpc", "get_task", "GetTask")
+
+        with timing_call(call):
+            pass
+
+        assert call.phases == {"ttfb": 0.5}
+
+    def test_format_call_timings(self):
+        """Test the report section table."""
+        table = format_call_timings(
+            [{"transport": "grpc", "method": None, "operation": "SubscribeToTask", "attempts": 1, "total_ms": 12.5, "ttfb_ms": 2.0}]
+        )
+
+        header, row = table.splitlines()
+        assert header.split()[-5:] == ["connect", "tls", "ttfb", "transfer", "tck"]
+        assert row.split() == ["grpc", "SubscribeToTask", "1", "12.5", "-", "-", "2.0", "-", "-"]
+
+
+@pytest.mark.core
+class TestClientTimings:
+    """Test timings collected from transport client calls."""
+
+    def test_exchange_call_is_timed_with_tck_processing(self, collector, monkeypatch):
+        """Test that a client call yields one timing with the SUT and TCK parts separated."""
+        client = JSONRPCClient(SUT_URL)
+        monkeypatch.setattr(client, "_validate_result", lambda method_name, result: None)
+
+        def sut(call):
+            operation, url, kwargs = call
+            return httpx.Response(
+                200,
+                json={"jsonrpc": "2.0", "id": kwargs["json"]["id"], "result": {"id": "task-1"}},
+                request=httpx.Request(operation.upper(), url),
+            )
+
+        monkeypatch.setattr(client, "_perform", sut)
+        try:
+            client.get_task("task-1")
+        finally:
+            client.close()
+
+        (call,) = collector.drain()
+        record = call.to_dict()
+        assert (record["transport"], record["method"], record["operation"]) == ("jsonrpc", "get_task", "POST /jsonrpc")
+        assert {"ttfb_ms", "tck_ms"} <= set(record)
+        assert record["total_ms"] >= record["ttfb_ms"]
+        assert collector.drain() == []
+
+    def test_nothing_is_timed_when_collection_is_off(self):
+        """Test that calls are not timed without a collector."""
+        assert timing.get_timing_collector() is None
+        with timing_call(None):
+            assert active_timing() is None
@@ -5,6 +5,8 @@ Tests the transport discovery, selection, and client management functionality
 of the TransportManager class.
 """
 
+import threading
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from typing import Dict, Any
@@ -114,6 +116,23 @@ class TestTransportManager:
         assert TransportType.GRPC in transport_manager._supported_transports
         assert TransportType.REST in transport_manager._supported_transports
 
+    @patch("tck.transport.transport_manager.fetch_agent_card")
+    @patch("tck.transport.transport_manager.validate_transport_consistency")
+    def test_discover_transports_reuses_prefetched_agent_card(self, mock_validate, mock_fetch, sample_agent_card):
+        """Test transport discovery uses a prefetched Agent Card instead of fetching it again."""
+        mock_validate.return_value = []
+        manager = TransportManager("https://example.com", agent_card=sample_agent_card)
+
+        assert manager.discover_transports() is True
+        mock_fetch.assert_not_called()
+        assert manager.get_agent_card() is sample_agent_card
+        assert len(manager._supported_transports) == 3
+
+        # A forced refresh still goes back to the SUT
+        mock_fetch.return_value = sample_agent_card
+        manager.discover_transports(force_refresh=True)
+        mock_fetch.assert_called_once()
+
     @patch("tck.transport.transport_manager.fetch_agent_card")
     def test_discover_transports_fetch_failure(self, mock_fetch, transport_manager):
         """Test transport discovery when Agent Card fetch fails."""
@@ -281,6 +300,42 @@ class TestTransportManager:
         assert info["is_multi_transport"] is True
         assert info["discovery_completed"] is True
 
+    def test_probe_endpoints(self, transport_manager):
+        """Test that endpoints are probed concurrently and slow or failing ones are reported unreachable."""
+        release = threading.Event()
+
+        def slow(timeout):
+            release.wait(5)
+            return {}
+
+        def refused(timeout):
+            raise ConnectionError("connection refused")
+
+        probes = {
+            TransportType.JSON_RPC: lambda timeout: {"connect": 0.002, "tls": 0.003, "ttfb": 0.001},
+            TransportType.GRPC: slow,
+            TransportType.REST: refused,
+        }
+        transport_manager._supported_transports = list(probes)
+        transport_manager._discovery_completed = True
+        for transport_type, probe in probes.items():
+            transport_manager._transport_endpoints[transport_type] = f"https://example.com/{transport_type.value}"
+            client = MockTransportClient(transport_manager._transport_endpoints[transport_type], transport_type)
+            client.probe = probe
+            transport_manager._client_cache[transport_type] = client
+
+        try:
+            health = transport_manager.probe_endpoints(budget=0.2)
+        finally:
+            release.set()
+
+        assert health[TransportType.JSON_RPC]["reachable"] is True
+        assert health[TransportType.JSON_RPC]["connect_ms"] == 5.0
+        assert health[TransportType.GRPC]["reachable"] is False
+        assert "probe budget" in health[TransportType.GRPC]["error"]
+        assert health[TransportType.REST]["error"] == "ConnectionError: connection refused"
+        assert transport_manager.get_transport_info()["endpoint_health"]["rest"]["reachable"] is False
+
     def test_clear_client_cache(self, transport_manager):
         """Test clearing client cache."""
         # Add some mock clients to cache
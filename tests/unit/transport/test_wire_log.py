@@ -0,0 +1,106 @@
+"""
+Unit tests for wire logging.
+"""
+
+import logging
+
+import pytest
+
+import tck.config  # noqa: F401  (must be imported before the transport modules)
+from tck.transport import wire_log
+from tck.transport.wire_log import WireBody, WireLog, start_wire_logging, stop_wire_logging
+
+
+class _CountingDict(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.items_calls = 0
+
+    def items(self):
+        self.items_calls += 1
+        return super().items()
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.messages = []
+
+    def emit(self, record):
+        self.records.append(record)
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def handler():
+    handler = _ListHandler()
+    yield handler
+    stop_wire_logging()
+    start_wire_logging(level="OFF")
+
+
+@pytest.mark.core
+class TestWireBody:
+    """Test lazy rendering and truncation of bodies."""
+
+    def test_truncates_long_bodies(self):
+        """Test that bodies over the limit are cut and the remainder reported."""
+        assert str(WireBody(b"x" * 10, 4)) == "xxxx... [6 more bytes]"
+        assert str(WireBody("short", 10)) == "short"
+        assert str(WireBody({"a": 1}, 100)) == '{"a": 1}'
+        assert str(WireBody(None, 10)) == "-"
+        assert str(WireBody(ValueError("boom"), 100)) == "ValueError: boom"
+
+
+@pytest.mark.core
+class TestWireLog:
+    """Test recording calls and events."""
+
+    def test_disabled_logger_builds_nothing(self, handler):
+        """Test that bodies are not rendered when wire logging is off."""
+        start_wire_logging(handler, level="OFF")
+        body = _CountingDict(a=1)
+
+        wire_log.get_wire_log().call("jsonrpc", "POST", "http://sut", request=body)
+
+        assert handler.records == []
+        assert body.items_calls == 0
+
+    def test_records_are_written_by_the_listener(self, handler):
+        """Test that records reach the handler with their structured fields."""
+        start_wire_logging(handler, level="INFO", max_body_bytes=8)
+        wire = wire_log.get_wire_log()
+
+        wire.call("jsonrpc", "POST", "http://sut", request={"id": 1}, response=b'{"result": "long body"}', status=200, elapsed=0.01)
+        wire.event("jsonrpc", "http://sut", "data", "message", "7")
+        stop_wire_logging()
+
+        assert [record.wire["kind"] for record in handler.records] == ["call", "event"]
+        assert handler.records[0].wire["status"] == 200
+        assert handler.records[0].wire["elapsed_ms"] == 10.0
+        assert 'response: {"result... [15 more bytes]' in handler.messages[0]
+        assert "(event: message, id: 7) | data: data" in handler.messages[1]
+
+    def test_sampling_under_load(self, handler, monkeypatch):
+        """Test that only the budget and then one in N records are logged per second."""
+        monkeypatch.setattr(wire_log.time, "monotonic", lambda: 100.0)
+        start_wire_logging(handler, level="INFO", sample_after=3, sample_every=5)
+        wire = wire_log.get_wire_log()
+
+        for _ in range(13):
+            wire.event("rest", "http://sut", "x")
+        monkeypatch.setattr(wire_log.time, "monotonic", lambda: 101.0)
+        wire.event("rest", "http://sut", "x")
+        stop_wire_logging()
+
+        # 3 in full, then records 8 and 13; the next second reports the 8 sampled out
+        assert wire.sampled_out == 8
+        assert handler.messages[-2] == "8 wire records sampled out under load"
+        assert len([record for record in handler.records if hasattr(record, "wire")]) == 6
+
+    def test_standalone_wire_log_without_sampling(self):
+        """Test that sample_every <= 1 disables sampling."""
+        wire = WireLog(sample_after=0, sample_every=1)
+        assert all(wire._sampler.admit() for _ in range(1000))
+        assert wire.sampled_out == 0
@@ -13,14 +13,17 @@ References:
 - A2A v0.3.0 Specification §3.4.1: Functional Equivalence Requirements
 """
 
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Union, Tuple
 from dataclasses import dataclass
 import re
 
-from tck.transport.base_client import BaseTransportClient
-from tck.transport.jsonrpc_client import JSONRPCClient
-from tck.transport.grpc_client import GRPCClient
-from tck.transport.rest_client import RESTClient
+from tck.transport.base_client import BaseTransportClient, TransportType
+
+if TYPE_CHECKING:
+    # Annotations only: importing the gRPC client pulls in grpc and protobuf
+    from tck.transport.jsonrpc_client import JSONRPCClient
+    from tck.transport.grpc_client import GRPCClient
+    from tck.transport.rest_client import RESTClient
 
 
 @dataclass
@@ -238,16 +241,12 @@ class MethodMappingValidator:
 
     def _get_transport_type(self, client: BaseTransportClient) -> str:
         """Determine the transport type of a client."""
-        if isinstance(client, JSONRPCClient):
-            return "jsonrpc"
-        elif isinstance(client, GRPCClient):
-            return "grpc"
-        elif isinstance(client, RESTClient):
-            return "rest"
-        else:
-            return "unknown"
+        transport_type = getattr(client, "transport_type", None)
+        if isinstance(transport_type, TransportType):
+            return transport_type.value
+        return "unknown"
 
-    def _validate_jsonrpc_naming(self, client: JSONRPCClient) -> Dict[str, Any]:
+    def _validate_jsonrpc_naming(self, client: "JSONRPCClient") -> Dict[str, Any]:
         """
         Validate JSON-RPC method naming conventions (§3.5.1).
 
@@ -273,7 +272,7 @@ class MethodMappingValidator:
 
         return results
 
-    def _validate_grpc_naming(self, client: GRPCClient) -> Dict[str, Any]:
+    def _validate_grpc_naming(self, client: "GRPCClient") -> Dict[str, Any]:
         """
         Validate gRPC method naming conventions (§3.5.2).
 
@@ -299,7 +298,7 @@ class MethodMappingValidator:
 
         return results
 
-    def _validate_rest_naming(self, client: RESTClient) -> Dict[str, Any]:
+    def _validate_rest_naming(self, client: "RESTClient") -> Dict[str, Any]:
         """
         Validate REST endpoint naming conventions (§3.5.3).
 
@@ -345,18 +344,18 @@ class MethodMappingValidator:
         pattern = r"^/[a-z]+(/\{[a-zA-Z]+\}|:[a-z]+)?$"
         return bool(re.match(pattern, endpoint))
 
-    def _get_available_jsonrpc_methods(self, client: JSONRPCClient) -> List[str]:
+    def _get_available_jsonrpc_methods(self, client: "JSONRPCClient") -> List[str]:
         """Get list of available JSON-RPC methods."""
         # This would need to be implemented based on how the client exposes methods
         # For now, return the standard A2A methods
         return [mapping.jsonrpc_method for mapping in self.CORE_METHOD_MAPPINGS]
 
-    def _get_available_grpc_methods(self, client: GRPCClient) -> List[str]:
+    def _get_available_grpc_methods(self, client: "GRPCClient") -> List[str]:
         """Get list of available gRPC methods."""
         # This would need to be implemented based on how the client exposes methods
         return [mapping.grpc_method for mapping in self.CORE_METHOD_MAPPINGS]
 
-    def _get_available_rest_endpoints(self, client: RESTClient) -> List[str]:
+    def _get_available_rest_endpoints(self, client: "RESTClient") -> List[str]:
         """Get list of available REST endpoints."""
         # Extract URL patterns from REST mappings
         endpoints = []
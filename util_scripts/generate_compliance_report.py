@@ -37,12 +37,14 @@ class ComplianceReportGenerator:
         capability_results = self.test_results.get("capabilities", {})
         quality_results = self.test_results.get("quality", {})
         feature_results = self.test_results.get("features", {})
+        performance_results = self.test_results.get("performance", {})
 
         # Calculate compliance scores
         mandatory_compliance = self._calculate_compliance(mandatory_results)
         capability_compliance = self._calculate_compliance(capability_results)
         quality_compliance = self._calculate_compliance(quality_results)
         feature_compliance = self._calculate_compliance(feature_results)
+        performance = self._calculate_performance(performance_results)
 
         # Overall compliance (mandatory tests determine this)
         is_compliant = mandatory_compliance["passed"] == mandatory_compliance["total"] and mandatory_compliance["total"] > 0
@@ -62,6 +64,8 @@ class ComplianceReportGenerator:
                 "overall_score": self._calculate_overall_score(
                     mandatory_compliance, capability_compliance, quality_compliance, feature_compliance
                 ),
+                # Separate from the overall score: SLOs are deployment-specific
+                "performance_score": performance["score"],
             },
             "categories": {
                 "mandatory": {
@@ -92,9 +96,17 @@ class ComplianceReportGenerator:
                     "failures": self._analyze_failures(feature_results),
                     "status": "BASIC" if feature_compliance["success_rate"] >= 70 else "MINIMAL",
                 },
+                "performance": {
+                    "compliance": self._calculate_compliance(performance_results),
+                    "performance": performance,
+                    "description": "Per-method latency and throughput against SLO thresholds",
+                    "impact": "Failures indicate SLO misses under the measured load",
+                    "failures": self._analyze_failures(performance_results),
+                    "status": self._performance_status(performance["score"]),
+                },
             },
             "recommendations": self._generate_recommendations(
-                mandatory_compliance, capability_compliance, quality_compliance, feature_compliance
+                mandatory_compliance, capability_compliance, quality_compliance, feature_compliance, performance["score"]
             ),
             "capability_analysis": self._analyze_capabilities(),
             "next_steps": self._generate_next_steps(compliance_level, mandatory_compliance, capability_compliance),
@@ -127,6 +139,33 @@ class ComplianceReportGenerator:
             "failure_rate": round(failure_rate, 1),
         }
 
+    def _calculate_performance(self, results: Dict) -> Dict:
+        """
+        Calculate the performance score: the share of (method, transport) measurements meeting their SLO.
+
+        Measurements come from the ``performance`` records of the performance tests
+        (see tck.performance). Without measurements the score falls back to the tests'
+        success rate, or is None if the category was not run.
+        """
+        measurements = [
+            measurement
+            for test_result in results.get("tests", {}).values()
+            for measurement in test_result.get("performance", [])
+        ]
+        if measurements:
+            met = sum(1 for measurement in measurements if not measurement.get("violations"))
+            score = round(met / len(measurements) * 100, 1)
+        else:
+            met = 0
+            score = self._calculate_compliance(results)["success_rate"] if results.get("total") else None
+        return {"score": score, "measured": len(measurements), "slo_met": met, "measurements": measurements}
+
+    def _performance_status(self, score: Optional[float]) -> str:
+        """Status of the performance category from its score."""
+        if score is None:
+            return "NOT_RUN"
+        return "PASSED" if score >= 90 else "ATTENTION_NEEDED"
+
     def _determine_compliance_level(self, mandatory, capability, quality, feature) -> Dict:
         """Determine the overall compliance level."""
         # Handle imports for both standalone execution and module import.
@@ -197,7 +236,7 @@ class ComplianceReportGenerator:
 
         return analysis
 
-    def _generate_recommendations(self, mandatory, capability, quality, feature) -> List[str]:
+    def _generate_recommendations(self, mandatory, capability, quality, feature, performance_score=None) -> List[str]:
         """Generate actionable recommendations."""
         recommendations = []
 
@@ -214,6 +253,9 @@ class ComplianceReportGenerator:
         if feature["success_rate"] < 70:
             recommendations.append("📈 LOW: Consider implementing more optional features for completeness")
 
+        if performance_score is not None and performance_score < 90:
+            recommendations.append("⏱️ MEDIUM: Review methods missing their latency SLOs in the performance results")
+
         return recommendations
 
     def _generate_next_steps(self, compliance_level, mandatory, capability) -> List[str]:
@@ -285,12 +327,42 @@ class ComplianceReportGenerator:
         return "See test documentation for requirements"
 
 
-def generate_report_from_file(results_file: str, output_file: str, agent_card_file: str = None):
-    """Generate compliance report from test results file."""
+def load_results_from_jsonl(results_files: Dict[str, Path]) -> Dict:
+    """
+    Aggregate per-category JSONL results files into test results organized by category.
+
+    Records are streamed one at a time (see tck.result_sink), so memory use does not
+    grow with the size of the captured test output.
+
+    Args:
+        results_files: Mapping of category name to its JSONL results file
+
+    Returns:
+        Dictionary of test results organized by category
+    """
+    from tck.result_sink import aggregate_result_records, iter_result_records
+
+    return {
+        category: aggregate_result_records(iter_result_records(Path(path)))
+        for category, path in results_files.items()
+        if Path(path).exists()
+    }
+
+
+def generate_report_from_file(
+    results_file: Optional[str],
+    output_file: str,
+    agent_card_file: str = None,
+    results_jsonl: Optional[Dict[str, str]] = None,
+):
+    """Generate compliance report from a test results file or per-category JSONL results files."""
 
     # Load test results
-    with open(results_file, "r") as f:
-        test_results = json.load(f)
+    if results_jsonl:
+        test_results = load_results_from_jsonl(results_jsonl)
+    else:
+        with open(results_file, "r") as f:
+            test_results = json.load(f)
 
     # Load agent card if provided
     agent_card = None
@@ -312,15 +384,31 @@ def generate_report_from_file(results_file: str, output_file: str, agent_card_fi
 def main():
     """Command line interface for compliance report generation."""
     parser = argparse.ArgumentParser(description="Generate A2A compliance report")
-    parser.add_argument("--results", required=True, help="Test results JSON file")
+    results = parser.add_mutually_exclusive_group(required=True)
+    results.add_argument("--results", help="Test results JSON file")
+    results.add_argument(
+        "--results-jsonl",
+        action="append",
+        metavar="CATEGORY=PATH",
+        help="JSONL results file for a category (e.g. mandatory=reports/mandatory_results.jsonl); repeatable",
+    )
     parser.add_argument("--output", required=True, help="Output report file")
     parser.add_argument("--agent-card", help="Agent card JSON file")
     parser.add_argument("--format", choices=["json", "html", "markdown"], default="json", help="Output format")
 
     args = parser.parse_args()
 
+    results_jsonl = None
+    if args.results_jsonl:
+        results_jsonl = {}
+        for value in args.results_jsonl:
+            category, _, path = value.partition("=")
+            if not category or not path:
+                parser.error(f"Invalid --results-jsonl value '{value}', expected CATEGORY=PATH")
+            results_jsonl[category] = path
+
     try:
-        report = generate_report_from_file(args.results, args.output, args.agent_card)
+        report = generate_report_from_file(args.results, args.output, args.agent_card, results_jsonl)
 
         print(f"✅ Compliance report generated: {args.output}")
         print(f"📊 Overall compliance: {report['summary']['compliance_level']}")
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for TCK startup.
+
+Collects the test suite under ``python -X importtime`` for a given transport set,
+prints a summary of where import time goes, and fails (exit code 1) if the session
+imported a stack it should not need, such as gRPC/protobuf in a JSON-RPC-only run
+or the TLS-analysis (pyOpenSSL) and aiohttp stacks during collection, or if the
+total import time exceeds an optional budget. Intended to be run in CI.
+
+Usage:
+    util_scripts/import_time_benchmark.py --transports jsonrpc
+    util_scripts/import_time_benchmark.py --transports jsonrpc --max-ms 1500 --json reports/import_time.json
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List
+
+# Modules that only a gRPC session needs
+GRPC_STACK = ["grpc", "google.protobuf", "a2a_pb2", "a2a_pb2_grpc", "tck.transport.grpc_client"]
+
+# Modules that are only needed while specific tests run, never for startup/collection
+RUNTIME_ONLY_STACKS = ["OpenSSL", "aiohttp"]
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$")
+
+
+def parse_import_times(stderr: str) -> List[Dict]:
+    """
+    Parse ``-X importtime`` output.
+
+    Returns:
+        List of dicts with module, self_us, cumulative_us and depth (0 = top-level import)
+    """
+    entries = []
+    for line in stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append(
+                {
+                    "module": module,
+                    "self_us": int(self_us),
+                    "cumulative_us": int(cumulative_us),
+                    "depth": (len(indent) - 1) // 2,
+                }
+            )
+    return entries
+
+
+def forbidden_modules(transports: List[str]) -> List[str]:
+    """Module prefixes a collection run for the given transports must not import."""
+    forbidden = list(RUNTIME_ONLY_STACKS)
+    if "grpc" not in transports:
+        forbidden.extend(GRPC_STACK)
+    return forbidden
+
+
+def find_violations(entries: List[Dict], forbidden: List[str]) -> List[str]:
+    """Forbidden module prefixes that were imported (e.g. "grpc" for any grpc.* module)."""
+    return [
+        prefix
+        for prefix in forbidden
+        if any(entry["module"] == prefix or entry["module"].startswith(prefix + ".") for entry in entries)
+    ]
+
+
+def main():
+    """Command line interface for the import-time benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark TCK startup import time")
+    parser.add_argument("--transports", default="jsonrpc", help="Comma-separated transports to collect for (default: jsonrpc)")
+    parser.add_argument("--paths", nargs="+", default=["tests/mandatory", "tests/optional"], help="Test paths to collect")
+    parser.add_argument("--top", type=int, default=15, help="Number of top-level imports to show (default: 15)")
+    parser.add_argument("--max-ms", type=float, help="Fail if the total import time exceeds this many milliseconds")
+    parser.add_argument("--json", metavar="FILENAME", help="Also write the summary as JSON")
+    args = parser.parse_args()
+
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    transports = [t.strip().lower() for t in args.transports.split(",") if t.strip()]
+
+    cmd = [
+        sys.executable,
+        "-X",
+        "importtime",
+        "-m",
+        "pytest",
+        "--collect-only",
+        "-q",
+        "-s",  # importtime writes to stderr, which pytest would otherwise capture
+        "-p",
+        "no:cacheprovider",
+        *args.paths,
+        "--sut-url=http://localhost:9999",
+        f"--transports={','.join(transports)}",
+    ]
+    result = subprocess.run(cmd, cwd=project_root, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    if result.returncode != 0:
+        print(f"❌ Test collection failed with exit code {result.returncode}")
+        print(result.stderr[-2000:])
+        sys.exit(1)
+
+    entries = parse_import_times(result.stderr)
+    total_ms = sum(entry["self_us"] for entry in entries) / 1000
+    top_level = sorted((e for e in entries if e["depth"] == 0), key=lambda e: -e["cumulative_us"])[: args.top]
+    violations = find_violations(entries, forbidden_modules(transports))
+
+    print(f"📦 Import time for collecting {' '.join(args.paths)} with --transports {','.join(transports)}")
+    print(f"   {len(entries)} modules, {total_ms:.1f} ms total")
+    print()
+    print(f"{'cumulative ms':>14}  module")
+    for entry in top_level:
+        print(f"{entry['cumulative_us'] / 1000:>14.1f}  {entry['module']}")
+    print()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "transports": transports,
+                    "modules": len(entries),
+                    "total_ms": round(total_ms, 1),
+                    "top_level": [{"module": e["module"], "cumulative_ms": e["cumulative_us"] / 1000} for e in top_level],
+                    "violations": violations,
+                },
+                f,
+                indent=2,
+            )
+
+    failed = False
+    if violations:
+        print(f"❌ Imported stacks this session should not need: {', '.join(violations)}")
+        failed = True
+    if args.max_ms is not None and total_ms > args.max_ms:
+        print(f"❌ Total import time {total_ms:.1f} ms exceeds the budget of {args.max_ms:.1f} ms")
+        failed = True
+    if not failed:
+        print("✅ Import-time check passed")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
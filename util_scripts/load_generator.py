@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Open-loop load generator for sizing SUT deployments.
+
+Issues A2A calls to a SUT at a constant target rate through one of its declared
+transports (see tck/load.py). Every call is started on schedule whether or not the
+previous ones have completed, and its latency is measured from its scheduled send
+time, so queueing delay in the SUT shows up in the percentiles instead of slowing
+the generator down. The report compares the target, offered and achieved rates.
+
+Raise ``--rate`` until the achieved rate stops following it or p99 leaves its budget
+to find what one SUT replica sustains.
+
+With ``--scenario`` the calls follow a weighted traffic mix of multi-step scenarios
+described in YAML (see load_scenarios/ and tck/load_scenarios.py) instead of
+``--operations``, and the report adds one latency summary per scenario.
+
+One process runs out of CPU (JSON, protobuf and validation work) before a large SUT
+deployment saturates. ``--workers N`` spreads the load over N processes, each with its
+own transport client and event loop, and merges their latency histograms into one
+report (see tck/load_workers.py).
+
+Usage:
+    util_scripts/load_generator.py --sut-url http://localhost:9999 --rate 50 --duration 60
+    util_scripts/load_generator.py --sut-url http://localhost:9999 --transport grpc \\
+        --operations send_message,get_task --rate 200 --json reports/load.json
+    util_scripts/load_generator.py --sut-url http://localhost:9999 \\
+        --scenario load_scenarios/mixed_workload.yaml --duration 300
+    util_scripts/load_generator.py --sut-url http://localhost:9999 --rate 2000 --workers 8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tck import config  # noqa: E402,F401  (must be imported before the transport modules)
+from tck.load import LOAD_OPERATIONS, ConstantRateLoad, format_load_report  # noqa: E402
+from tck.load_scenarios import ScenarioLoad, load_mix_file  # noqa: E402
+from tck.load_workers import run_load_workers  # noqa: E402
+from tck.transport.base_client import TransportType  # noqa: E402
+from tck.transport.transport_manager import TransportManager  # noqa: E402
+
+
+async def run_load(manager: TransportManager, transport: str, args) -> dict:
+    """Run the load through the chosen transport's client and close its async resources."""
+    client = manager.get_transport_client(TransportType(transport) if transport else None)
+    if args.mix is not None:
+        load = ScenarioLoad(client, args.mix, seed=args.seed)
+    else:
+        load = ConstantRateLoad(
+            client, args.operations.split(","), args.rate, args.duration, max_in_flight=args.max_in_flight
+        )
+    try:
+        return await load.run()
+    finally:
+        aclose = getattr(client, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def main():
+    """Command line interface for the load generator."""
+    parser = argparse.ArgumentParser(description="Open-loop constant-rate load against an A2A SUT")
+    parser.add_argument("--sut-url", required=True, help="Base URL of the SUT (its Agent Card declares the transports)")
+    parser.add_argument(
+        "--transport",
+        choices=[t.value for t in TransportType],
+        help="Transport to load (default: the one the selection strategy picks)",
+    )
+    parser.add_argument(
+        "--operations",
+        default="send_message,get_task",
+        help=f"Comma-separated operations issued in turn (default: send_message,get_task; available: {', '.join(LOAD_OPERATIONS)})",
+    )
+    parser.add_argument(
+        "--scenario",
+        metavar="FILENAME",
+        help="YAML traffic mix of weighted scenarios to run instead of --operations (see load_scenarios/)",
+    )
+    parser.add_argument("--seed", type=int, help="Seed of the scenario choice, for a repeatable --scenario mix")
+    parser.add_argument(
+        "--rate", type=float, help="Target calls (scenario runs with --scenario) per second (default: 10, or the file's)"
+    )
+    parser.add_argument("--duration", type=float, help="Seconds to issue calls for (default: 30, or the file's)")
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        help="Outstanding calls above which arrivals are dropped instead of queued in the generator (default: 1000)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes sharing the load, each with its own client and event loop (default: 1)",
+    )
+    parser.add_argument("--json", metavar="FILENAME", help="Also write the report as JSON")
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    args.mix = None
+    if args.scenario:
+        try:
+            args.mix = load_mix_file(args.scenario)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not load scenario file {args.scenario}: {e}")
+            sys.exit(1)
+        # Command line options override the file's
+        for option in ("rate", "duration", "max_in_flight"):
+            if getattr(args, option) is not None:
+                setattr(args.mix, option, getattr(args, option))
+    args.rate = 10.0 if args.rate is None else args.rate
+    args.duration = 30.0 if args.duration is None else args.duration
+    args.max_in_flight = 1000 if args.max_in_flight is None else args.max_in_flight
+
+    manager = TransportManager(sut_base_url=args.sut_url)
+    try:
+        if not manager.discover_transports():
+            print(f"❌ Could not discover transports from {args.sut_url}")
+            sys.exit(1)
+        if args.workers == 1:
+            report = asyncio.run(run_load(manager, args.transport, args))
+    finally:
+        manager.close()
+    if args.workers > 1:
+        try:
+            report = run_load_workers(
+                args.sut_url,
+                args.workers,
+                transport=args.transport,
+                operations=args.operations.split(","),
+                scenario=args.scenario,
+                rate=args.mix.rate if args.mix is not None else args.rate,
+                duration=args.mix.duration if args.mix is not None else args.duration,
+                max_in_flight=args.mix.max_in_flight if args.mix is not None else args.max_in_flight,
+                seed=args.seed,
+            )
+        except (RuntimeError, ValueError) as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+
+    mix = f", mix {args.mix.name}" if args.mix is not None else ""
+    workers = f", {args.workers} workers" if args.workers > 1 else ""
+    print(f"🚦 Open-loop load on {args.sut_url} ({args.transport or 'selected transport'}{mix}{workers})")
+    print(format_load_report(report))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {"url": args.sut_url, "transport": args.transport, "scenario": args.scenario, "report": report},
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
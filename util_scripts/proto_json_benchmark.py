@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Conversions-per-second microbenchmark for protobuf to A2A JSON conversion.
+
+Builds large synthetic Task messages (long histories, many artifacts with text, raw,
+url and data parts, Struct metadata) and a series of StreamResponse events, and
+converts them once with the generic approach (``json_format.MessageToDict`` followed by
+a dict walk renaming fields, as ``message_utils.convert_protobuf_task_to_a2a`` does)
+and once with the descriptor-driven ``message_to_json`` used by GRPCClient. Reports
+conversions/sec for each workload.
+
+Usage:
+    util_scripts/proto_json_benchmark.py
+    util_scripts/proto_json_benchmark.py --history 500 --artifacts 100 --parts 8 --events 20000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from google.protobuf import json_format  # noqa: E402
+from google.protobuf.struct_pb2 import Struct, Value  # noqa: E402
+
+from tck import config  # noqa: E402,F401  (must be imported before the transport modules)
+from tck import message_utils  # noqa: E402
+from tck.transport.grpc_client import GRPCClient  # noqa: E402
+from tck.transport.proto_json import message_to_json  # noqa: E402
+
+
+def _load_pb():
+    client = GRPCClient("grpc://localhost:50051")
+    client._load_static_stubs()
+    return client._pb
+
+
+def _parts(pb, count: int, text_size: int) -> list:
+    data = Value()
+    data.struct_value.update({"rows": list(range(10)), "label": "x" * 16})
+    kinds = [
+        lambda: pb.Part(text="x" * text_size),
+        lambda: pb.Part(raw=b"\x00" * text_size, filename="blob.bin", media_type="application/octet-stream"),
+        lambda: pb.Part(url="https://example.com/file.pdf", media_type="application/pdf"),
+        lambda: pb.Part(data=data),
+    ]
+    return [kinds[i % len(kinds)]() for i in range(count)]
+
+
+def build_task(pb, history: int, artifacts: int, parts: int, text_size: int):
+    """
+    Build a large synthetic Task.
+
+    Args:
+        pb: The a2a_pb2 module
+        history: Number of history messages
+        artifacts: Number of artifacts
+        parts: Parts per message and per artifact
+        text_size: Size of text and raw parts in bytes
+
+    Returns:
+        The Task message
+    """
+    metadata = Struct()
+    metadata.update({"source": "benchmark", "attempt": 1, "tags": ["a", "b", "c"]})
+    task = pb.Task(
+        id="task-bench",
+        context_id="ctx-bench",
+        status=pb.TaskStatus(state=pb.TASK_STATE_COMPLETED),
+        history=[
+            pb.Message(
+                message_id=f"msg-{i}",
+                context_id="ctx-bench",
+                task_id="task-bench",
+                role=pb.ROLE_USER if i % 2 == 0 else pb.ROLE_AGENT,
+                parts=_parts(pb, parts, text_size),
+            )
+            for i in range(history)
+        ],
+        artifacts=[
+            pb.Artifact(artifact_id=f"artifact-{i}", name=f"artifact {i}", parts=_parts(pb, parts, text_size), metadata=metadata)
+            for i in range(artifacts)
+        ],
+        metadata=metadata,
+    )
+    task.status.timestamp.GetCurrentTime()
+    return task
+
+
+def build_events(pb, events: int, text_size: int) -> list:
+    """Build StreamResponse events alternating status and artifact updates."""
+    result = []
+    for i in range(events):
+        if i % 2 == 0:
+            message = pb.Message(message_id=f"msg-{i}", role=pb.ROLE_AGENT, parts=[pb.Part(text="x" * text_size)])
+            update = pb.TaskStatusUpdateEvent(
+                task_id="task-bench", context_id="ctx-bench", status=pb.TaskStatus(state=pb.TASK_STATE_WORKING, message=message)
+            )
+            result.append(pb.StreamResponse(status_update=update))
+        else:
+            artifact = pb.Artifact(artifact_id=f"artifact-{i}", parts=[pb.Part(text="x" * text_size)])
+            update = pb.TaskArtifactUpdateEvent(task_id="task-bench", context_id="ctx-bench", artifact=artifact, append=True)
+            result.append(pb.StreamResponse(artifact_update=update))
+    return result
+
+
+def convert_generic(message) -> Dict[str, Any]:
+    """Generic approach: MessageToDict with proto field names, then a second pass renaming fields."""
+    as_dict = json_format.MessageToDict(message, preserving_proto_field_name=True)
+    if "history" in as_dict or "status" in as_dict:
+        return message_utils.convert_protobuf_task_to_a2a(as_dict)
+    return as_dict
+
+
+def convert_event_generic(event) -> Dict[str, Any]:
+    payload = event.WhichOneof("payload")
+    return {payload: convert_generic(getattr(event, payload))}
+
+
+def convert_event_descriptor(event) -> Dict[str, Any]:
+    payload = event.WhichOneof("payload")
+    return {payload: message_to_json(getattr(event, payload))}
+
+
+def _measure(messages: list, convert: Callable, repeat: int) -> Dict[str, float]:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for message in messages:
+            convert(message)
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    return {
+        "conversions": len(messages),
+        "seconds": round(best, 4),
+        "conversions_per_sec": round(len(messages) / best, 1),
+    }
+
+
+def main():
+    """Command line interface for the protobuf conversion benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark protobuf to A2A JSON conversion throughput")
+    parser.add_argument("--tasks", type=int, default=20, help="Number of large tasks converted per run (default: 20)")
+    parser.add_argument("--history", type=int, default=200, help="History messages per task (default: 200)")
+    parser.add_argument("--artifacts", type=int, default=50, help="Artifacts per task (default: 50)")
+    parser.add_argument("--parts", type=int, default=4, help="Parts per message and artifact (default: 4)")
+    parser.add_argument("--text-size", type=int, default=256, help="Size of text and raw parts in bytes (default: 256)")
+    parser.add_argument("--events", type=int, default=10000, help="Number of streaming events (default: 10000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per converter; the best is reported (default: 3)")
+    parser.add_argument("--json", metavar="FILENAME", help="Also write the results as JSON")
+    args = parser.parse_args()
+
+    pb = _load_pb()
+    task = build_task(pb, args.history, args.artifacts, args.parts, args.text_size)
+    workloads = {
+        "tasks": ([task] * args.tasks, {"generic": convert_generic, "descriptor": message_to_json}),
+        "events": (
+            build_events(pb, args.events, args.text_size),
+            {"generic": convert_event_generic, "descriptor": convert_event_descriptor},
+        ),
+    }
+    results = {
+        workload: {name: _measure(messages, convert, args.repeat) for name, convert in converters.items()}
+        for workload, (messages, converters) in workloads.items()
+    }
+
+    print(
+        f"⏱️  Converting tasks with {args.history} history messages and {args.artifacts} artifacts "
+        f"({task.ByteSize() / 1e6:.2f} MB each) and {args.events} streaming events"
+    )
+    print(f"{'workload':>10}  {'converter':>12}  {'conversions/s':>14}")
+    for workload, by_converter in results.items():
+        for name, result in by_converter.items():
+            print(f"{workload:>10}  {name:>12}  {result['conversions_per_sec']:>14.1f}")
+    for workload, by_converter in results.items():
+        speedup = by_converter["descriptor"]["conversions_per_sec"] / max(by_converter["generic"]["conversions_per_sec"], 1e-9)
+        print(f"\n🚀 {workload}: descriptor-driven conversion is {speedup:.2f}x the generic approach")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"args": vars(args), "task_bytes": task.ByteSize(), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
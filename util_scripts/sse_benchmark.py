@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Events-per-second microbenchmark for Server-Sent Events decoding.
+
+Decodes a large synthetic ``text/event-stream`` (A2A status-update events, as a
+SUT would stream them) from an in-memory httpx response, once with the previous
+line-based approach (``aiter_lines()`` plus ``data: `` prefix matching) and once
+with the incremental bytes-level SSEDecoder, and reports events/sec and MB/s.
+
+Usage:
+    util_scripts/sse_benchmark.py
+    util_scripts/sse_benchmark.py --events 200000 --payload-size 2048 --chunk-size 65536 --ids --multiline
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import AsyncIterator, Callable, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import httpx  # noqa: E402
+
+from tck import config  # noqa: E402,F401  (must be imported before the transport modules)
+from tck.transport.sse import aiter_sse_events  # noqa: E402
+
+
+def build_stream(events: int, payload_size: int, multiline: bool, ids: bool = False) -> bytes:
+    """
+    Build a synthetic event stream.
+
+    Args:
+        events: Number of events
+        payload_size: Approximate size of each event's JSON payload in bytes
+        multiline: Split each payload over several data lines (pretty-printed JSON)
+        ids: Precede each event's data with ``id:`` and ``event:`` lines
+
+    Returns:
+        The encoded stream
+    """
+    parts = []
+    for i in range(events):
+        event = {
+            "jsonrpc": "2.0",
+            "id": "bench",
+            "result": {
+                "kind": "status-update",
+                "taskId": "task-bench",
+                "status": {"state": "working", "message": {"parts": [{"kind": "text", "text": "x" * payload_size}]}},
+                "final": False,
+            },
+        }
+        data = json.dumps(event, indent=1) if multiline else json.dumps(event)
+        lines = "".join(f"data: {line}\n" for line in data.split("\n"))
+        header = f"id: {i}\nevent: status-update\n" if ids else ""
+        parts.append(f"{header}{lines}\n")
+    return "".join(parts).encode()
+
+
+def _response(stream: bytes, chunk_size: int) -> httpx.Response:
+    async def body() -> AsyncIterator[bytes]:
+        for i in range(0, len(stream), chunk_size):
+            yield stream[i : i + chunk_size]
+
+    return httpx.Response(200, content=body())
+
+
+async def decode_line_based(response: httpx.Response) -> int:
+    """Previous client approach: one string operation per line, single-line data only."""
+    count = 0
+    async for line in response.aiter_lines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("data: "):
+            data_str = line[6:]
+            if data_str == "[DONE]":
+                break
+            count += 1
+        elif line.startswith("event: ") or line.startswith("id: "):
+            pass
+    return count
+
+
+async def decode_sse_decoder(response: httpx.Response) -> int:
+    """Incremental bytes-level SSEDecoder."""
+    count = 0
+    async for _ in aiter_sse_events(response):
+        count += 1
+    return count
+
+
+async def _measure(stream: bytes, chunk_size: int, decode: Callable, repeat: int) -> Dict[str, float]:
+    timings: List[float] = []
+    count = 0
+    for _ in range(repeat):
+        response = _response(stream, chunk_size)
+        start = time.perf_counter()
+        count = await decode(response)
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    return {
+        "events": count,
+        "seconds": round(best, 4),
+        "events_per_sec": round(count / best, 1),
+        "mb_per_sec": round(len(stream) / best / 1e6, 2),
+    }
+
+
+def main():
+    """Command line interface for the SSE decoding benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark Server-Sent Events decoding throughput")
+    parser.add_argument("--events", type=int, default=50000, help="Number of events in the stream (default: 50000)")
+    parser.add_argument("--payload-size", type=int, default=256, help="Text size per event payload in bytes (default: 256)")
+    parser.add_argument("--chunk-size", type=int, default=16384, help="Bytes per received chunk (default: 16384)")
+    parser.add_argument("--ids", action="store_true", help="Give every event an id and an event type")
+    parser.add_argument("--multiline", action="store_true", help="Spread each event's JSON over multiple data lines")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per decoder; the best is reported (default: 3)")
+    parser.add_argument("--json", metavar="FILENAME", help="Also write the results as JSON")
+    args = parser.parse_args()
+
+    stream = build_stream(args.events, args.payload_size, args.multiline, args.ids)
+    decoders = {"line_based": decode_line_based, "sse_decoder": decode_sse_decoder}
+    results = {
+        name: asyncio.run(_measure(stream, args.chunk_size, decode, args.repeat)) for name, decode in decoders.items()
+    }
+
+    print(f"⏱️  Decoding {args.events} events ({len(stream) / 1e6:.1f} MB, {args.chunk_size} byte chunks)")
+    print(f"{'decoder':>12}  {'events':>8}  {'events/s':>12}  {'MB/s':>8}")
+    for name, result in results.items():
+        print(f"{name:>12}  {result['events']:>8}  {result['events_per_sec']:>12.1f}  {result['mb_per_sec']:>8.2f}")
+    if args.multiline:
+        # The line-based approach counts data lines, not events, for multi-line events
+        print("\n⚠️  line_based counts each data line as an event; multi-line events are not reassembled")
+    # Bytes decoded per second is comparable across decoders even when they count events differently
+    speedup = results["sse_decoder"]["mb_per_sec"] / max(results["line_based"]["mb_per_sec"], 1e-9)
+    print(f"\n🚀 SSEDecoder: {speedup:.2f}x the throughput of line-based parsing")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"args": vars(args), "stream_bytes": len(stream), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Time-to-first-event benchmark for JSON-RPC streaming.
+
+Opens a number of sequential ``SendStreamingMessage`` streams and measures the time
+from starting the request to receiving the first SSE event, once with a new
+``httpx.AsyncClient`` per stream and once with JSONRPCClient's long-lived async
+client, which reuses pooled connections across streams.
+
+By default the streams go to a local SSE server started by this script; pass
+``--sut-url`` to measure against a real SUT (where TLS handshakes make the
+difference larger).
+
+Usage:
+    util_scripts/streaming_benchmark.py
+    util_scripts/streaming_benchmark.py --sut-url https://localhost:9999 --streams 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Awaitable, Callable, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import httpx  # noqa: E402
+
+from tck import config  # noqa: E402,F401  (must be imported before the transport modules)
+from tck.transport.jsonrpc_client import JSONRPCClient  # noqa: E402
+
+
+class _SSEHandler(BaseHTTPRequestHandler):
+    """Answers every POST with a short keep-alive SSE stream of two JSON-RPC results."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        events = [
+            {"jsonrpc": "2.0", "id": request.get("id"), "result": {"kind": "task", "id": "bench", "status": {"state": state}}}
+            for state in ("submitted", "completed")
+        ]
+        body = "".join(f"data: {json.dumps(event)}\n\n" for event in events).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _streaming_request() -> Dict:
+    message = {
+        "kind": "message",
+        "messageId": f"bench-{uuid.uuid4()}",
+        "role": "user",
+        "parts": [{"kind": "text", "text": "streaming benchmark"}],
+    }
+    return {"jsonrpc": "2.0", "method": "SendStreamingMessage", "params": {"message": message}, "id": f"tck-{uuid.uuid4()}"}
+
+
+async def _first_event_per_call_client(url: str, timeout: float) -> None:
+    """Time to first event with a fresh AsyncClient per stream."""
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        async with client.stream("POST", url, json=_streaming_request(), headers={"Accept": "text/event-stream"}) as response:
+            async for line in response.aiter_lines():
+                if line.startswith("data: "):
+                    return
+
+
+async def _measure(streams: int, first_event: Callable[[], Awaitable[None]]) -> List[float]:
+    timings = []
+    for _ in range(streams):
+        start = time.perf_counter()
+        await first_event()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _summary(timings: List[float]) -> Dict[str, float]:
+    ordered = sorted(timings)
+    return {
+        "mean_ms": round(statistics.mean(ordered), 3),
+        "p50_ms": round(ordered[len(ordered) // 2], 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+    }
+
+
+async def run_benchmark(url: str, streams: int, timeout: float) -> Dict[str, Dict[str, float]]:
+    """
+    Measure time to first event for both client strategies.
+
+    Returns:
+        Summary (mean/p50/p95 in ms) per strategy
+    """
+    client = JSONRPCClient(url)
+
+    async def first_event_persistent_client() -> None:
+        async for _ in client._make_streaming_jsonrpc_request("SendStreamingMessage", _streaming_request()["params"]):
+            return
+
+    try:
+        per_call = await _measure(streams, lambda: _first_event_per_call_client(url, timeout))
+        persistent = await _measure(streams, first_event_persistent_client)
+    finally:
+        await client.aclose()
+    return {"per_call_client": _summary(per_call), "persistent_client": _summary(persistent)}
+
+
+def main():
+    """Command line interface for the streaming benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark JSON-RPC streaming time to first event")
+    parser.add_argument("--sut-url", help="JSON-RPC endpoint of a real SUT (default: built-in local SSE server)")
+    parser.add_argument("--streams", type=int, default=100, help="Number of sequential streams per strategy (default: 100)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-stream timeout in seconds (default: 30)")
+    parser.add_argument("--json", metavar="FILENAME", help="Also write the results as JSON")
+    args = parser.parse_args()
+
+    server = None
+    url = args.sut_url
+    if not url:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _SSEHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    try:
+        results = asyncio.run(run_benchmark(url, args.streams, args.timeout))
+    finally:
+        if server:
+            server.shutdown()
+            server.server_close()
+
+    print(f"⏱️  Time to first event over {args.streams} sequential streams to {url}")
+    print(f"{'client':>20}  {'mean ms':>9}  {'p50 ms':>9}  {'p95 ms':>9}")
+    for name, summary in results.items():
+        print(f"{name:>20}  {summary['mean_ms']:>9.3f}  {summary['p50_ms']:>9.3f}  {summary['p95_ms']:>9.3f}")
+    speedup = results["per_call_client"]["mean_ms"] / max(results["persistent_client"]["mean_ms"], 1e-9)
+    print(f"\n🚀 Persistent client is {speedup:.2f}x faster to first event on average")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"url": url, "streams": args.streams, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()